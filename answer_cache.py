@@ -0,0 +1,135 @@
+"""
+HooAah Yacht - 정형 답변 캐시
+카탈로그 데이터만으로 만드는 Markdown 답변 (치수, 돛 면적, 엔진, 정비, 전체 정보 등)을
+프로세스 전체에서 공유하는 메모리 캐시
+
+- 키 = (요트 ID, 답변 종류), 값 = (요트 데이터 버전, 답변)
+  → 요트 데이터 버전이 다르면 다시 만들어 교체 (카탈로그가 바뀌어도 다른 요트의 답변은 유지)
+- invalidate(yacht_id): 요트 등록/수정 시 해당 요트의 답변 삭제
+- warm(): 서버 시작 시 전체 요트의 답변을 미리 생성
+- 항목 수가 한도를 넘으면 가장 오래 사용하지 않은 항목부터 삭제
+
+환경 변수:
+    ANSWER_CACHE_MAX: 최대 항목 수 (기본: 5000)
+"""
+
+import os
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, Iterable, Optional, Tuple
+
+
+DEFAULT_MAX_ENTRIES = int(os.getenv('ANSWER_CACHE_MAX', 5000))
+
+
+class AnswerCache:
+    """(요트 ID, 답변 종류, 요트 데이터 버전) 기준 답변 캐시 (LRU)"""
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES):
+        """
+        Args:
+            max_entries: 최대 항목 수
+        """
+        self.max_entries = max_entries
+        self._entries: 'OrderedDict[Tuple[str, str], Tuple[str, str]]' = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_build(self, yacht_id: str, kind: str, version: str, build: Callable[[], str]) -> str:
+        """
+        캐시된 답변 반환 (없거나 버전이 다르면 build()로 만들어 저장)
+
+        Args:
+            yacht_id: 요트 ID
+            kind: 답변 종류 ('dimensions', 'engine' 등)
+            version: 요트 데이터 버전 (YachtCatalog.yacht_version)
+            build: 답변 생성 함수
+        """
+        key = (yacht_id, kind)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == version:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+
+        answer = build()
+        with self._lock:
+            self._entries[key] = (version, answer)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return answer
+
+    def invalidate(self, yacht_id: Optional[str] = None) -> int:
+        """
+        답변 삭제
+
+        Args:
+            yacht_id: 삭제할 요트 ID (None이면 전체)
+
+        Returns:
+            삭제된 항목 수
+        """
+        with self._lock:
+            if yacht_id is None:
+                count = len(self._entries)
+                self._entries.clear()
+                return count
+            keys = [key for key in self._entries if key[0] == yacht_id]
+            for key in keys:
+                del self._entries[key]
+            return len(keys)
+
+    def warm(self, items: Iterable[Tuple[str, str]], kinds: Dict[str, Callable[[], str]]) -> int:
+        """
+        답변 미리 생성
+
+        Args:
+            items: (요트 ID, 요트 데이터 버전) 목록
+            kinds: 답변 종류 → 요트 ID를 받아 답변을 만드는 함수
+
+        Returns:
+            새로 만든 답변 수
+        """
+        built = 0
+        for yacht_id, version in items:
+            for kind, build in kinds.items():
+                # 공유 misses 카운터는 요청 스레드도 올리므로 여기서 실제로 만든 횟수만 셈
+                calls = []
+
+                def build_once(build=build, yacht_id=yacht_id):
+                    calls.append(1)
+                    return build(yacht_id)
+
+                try:
+                    self.get_or_build(yacht_id, kind, version, build_once)
+                except Exception as e:
+                    print(f"⚠️ 답변 미리 생성 실패 ({yacht_id}, {kind}): {e}")
+                    continue
+                built += len(calls)
+        return built
+
+    def stats(self) -> Dict[str, int]:
+        """캐시 항목 수와 적중/실패 횟수"""
+        with self._lock:
+            return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_shared_cache: Optional[AnswerCache] = None
+_shared_cache_lock = threading.Lock()
+
+
+def get_shared_answer_cache() -> AnswerCache:
+    """프로세스 전체에서 공유하는 답변 캐시 (모든 세션이 같은 답변을 재사용)"""
+    global _shared_cache
+    if _shared_cache is None:
+        with _shared_cache_lock:
+            if _shared_cache is None:
+                _shared_cache = AnswerCache()
+    return _shared_cache
@@ -5,6 +5,10 @@
 - 사용자 입력 없이 자동 실행
 - 20개 요트 매뉴얼 일괄 분석
 - JSON 파일 자동 업데이트
+- 텍스트/분석 결과는 .cache에 캐시 (같은 매뉴얼은 다시 분석하지 않음)
+- 추출/분석은 batch_runner로 동시에 처리, 파일별 결과는 analysis_results/에 체크포인트
+  (중간에 중단되어도 다시 실행하면 끝난 파일은 건너뜀, --force 로 전체 재분석)
+- DOCUMENT_ANALYSIS_CACHE_MODE=replay 로 실행하면 AI 호출 없이 캐시만 사용
 """
 
 import os
@@ -16,6 +20,7 @@ from pathlib import Path
 
 # chatbot_unified 임포트
 from chatbot_unified import UnifiedYachtChatbot
+from batch_runner import STATUS_DONE, STATUS_FAILED, STATUS_SKIPPED, chatbot_runner, summarize
 
 # ============================================================================
 # 설정
@@ -65,52 +70,11 @@ def main():
     chatbot = UnifiedYachtChatbot(api_key=API_KEY)
     print("✅ 준비 완료!\n")
     
-    # 4. 분석 실행
-    results = []
-    success = 0
-    failed = 0
-    
-    for i, pdf_file in enumerate(pdf_files, 1):
-        pdf_path = os.path.join(PDF_DIR, pdf_file)
-        
-        print(f"{'='*80}")
-        print(f"[{i}/{len(pdf_files)}] 📄 {pdf_file}")
-        print(f"{'='*80}")
-        
-        try:
-            # 텍스트 추출
-            print("📖 텍스트 추출...", end=" ", flush=True)
-            text = chatbot._extract_text_from_pdf(pdf_path)
-            
-            if not text or len(text.strip()) < 100:
-                print(f"❌ 실패 (텍스트: {len(text)}자)")
-                failed += 1
-                continue
-            
-            print(f"✅ ({len(text)}자)")
-            
-            # AI 분석
-            print("🤖 AI 분석...", end=" ", flush=True)
-            result = chatbot._analyze_document_directly(pdf_path, text)
-            
-            if "error" in result:
-                print(f"❌ 실패: {result.get('error')}")
-                failed += 1
-                continue
-            
-            # ID 개수 세기
-            id_count = count_ids(result)
-            print(f"✅ (ID: {id_count}개)")
-            
-            results.append(result)
-            success += 1
-            
-            # 진행률
-            print(f"진행률: {i}/{len(pdf_files)} (성공: {success}, 실패: {failed})\n")
-            
-        except Exception as e:
-            print(f"❌ 오류: {e}\n")
-            failed += 1
+    # 4. 분석 실행 (추출/분석 동시 처리, 이미 분석한 파일은 건너뜀)
+    pdf_paths = [os.path.join(PDF_DIR, pdf_file) for pdf_file in pdf_files]
+    outcomes = chatbot_runner(chatbot).run(pdf_paths, force='--force' in sys.argv[1:])
+    results = [outcome["result"] for outcome in outcomes if outcome["status"] != STATUS_FAILED]
+    summary = summarize(outcomes)
     
     # 5. JSON 업데이트
     if results:
@@ -132,7 +96,8 @@ def main():
     print("✅ 작업 완료!")
     print(f"{'='*80}")
     print(f"⏱️ 소요 시간: {duration:.1f}초 ({duration/60:.1f}분)")
-    print(f"📊 성공: {success}개 / 실패: {failed}개 / 전체: {len(pdf_files)}개")
+    print(f"📊 성공: {summary[STATUS_DONE]}개 / 건너뜀: {summary[STATUS_SKIPPED]}개 / "
+          f"실패: {summary[STATUS_FAILED]}개 / 전체: {len(pdf_files)}개")
     print(f"💾 백업: {backup_dir}")
     print(f"📅 {end_time.strftime('%Y-%m-%d %H:%M:%S')}\n")
 
@@ -177,19 +142,6 @@ def get_pdf_files():
     return yacht_pdfs
 
 
-def count_ids(obj, count=0):
-    """ID 개수 세기"""
-    if isinstance(obj, dict):
-        if "id" in obj:
-            count += 1
-        for v in obj.values():
-            count = count_ids(v, count)
-    elif isinstance(obj, list):
-        for item in obj:
-            count = count_ids(item, count)
-    return count
-
-
 def update_all_json_files(results):
     """모든 JSON 파일 업데이트"""
     
@@ -4,6 +4,10 @@
 - 실제 요트 매뉴얼만 분석 (멘토링, 디자인 문서 제외)
 - 새로운 Schema 5.0으로 분석
 - 모든 JSON 파일 업데이트
+- 텍스트/분석 결과는 .cache에 캐시 (같은 매뉴얼은 다시 분석하지 않음)
+- 추출/분석은 batch_runner로 동시에 처리, 파일별 결과는 analysis_results/에 체크포인트
+  (중간에 중단되어도 다시 실행하면 끝난 파일은 건너뜀, --force 로 전체 재분석)
+- DOCUMENT_ANALYSIS_CACHE_MODE=replay 로 실행하면 AI 호출 없이 캐시만 사용
 """
 
 import os
@@ -12,6 +16,7 @@ import json
 import shutil
 from datetime import datetime
 from chatbot_unified import UnifiedYachtChatbot
+from batch_runner import STATUS_DONE, STATUS_FAILED, STATUS_SKIPPED, chatbot_runner, summarize
 
 # 제외할 파일 목록 (요트 매뉴얼이 아닌 문서들)
 EXCLUDED_FILES = [
@@ -91,66 +96,6 @@ def get_yacht_pdf_files():
     return yacht_pdfs
 
 
-def analyze_pdf(chatbot, pdf_path, index, total):
-    """단일 PDF 분석"""
-    pdf_name = os.path.basename(pdf_path)
-    
-    print(f"\n{'='*80}")
-    print(f"[{index}/{total}] 📄 {pdf_name}")
-    print(f"{'='*80}\n")
-    
-    try:
-        # 1. 텍스트 추출
-        print("📖 텍스트 추출 중...")
-        extracted_text = chatbot._extract_text_from_pdf(pdf_path)
-        
-        if not extracted_text or len(extracted_text.strip()) < 100:
-            print(f"❌ 텍스트 추출 실패 (길이: {len(extracted_text)})")
-            return None
-        
-        print(f"✅ 텍스트 추출 완료 (길이: {len(extracted_text)} 문자)")
-        
-        # 2. AI 분석
-        print("🤖 AI 분석 중...")
-        result = chatbot._analyze_document_directly(pdf_path, extracted_text)
-        
-        if "error" in result:
-            print(f"❌ 분석 실패: {result.get('error')}")
-            return None
-        
-        # 3. ID 개수 세기
-        id_count = count_ids(result)
-        print(f"✅ 분석 완료! (생성된 ID: {id_count}개)")
-        
-        # 4. 결과 저장
-        output_file = f"analysis_results/{pdf_name.replace('.pdf', '')}.json"
-        os.makedirs("analysis_results", exist_ok=True)
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(result, f, ensure_ascii=False, indent=2)
-        print(f"💾 결과 저장: {output_file}")
-        
-        return result
-        
-    except Exception as e:
-        print(f"❌ 오류 발생: {e}")
-        import traceback
-        traceback.print_exc()
-        return None
-
-
-def count_ids(obj, count=0):
-    """재귀적으로 JSON에서 ID 개수 세기"""
-    if isinstance(obj, dict):
-        if "id" in obj:
-            count += 1
-        for value in obj.values():
-            count = count_ids(value, count)
-    elif isinstance(obj, list):
-        for item in obj:
-            count = count_ids(item, count)
-    return count
-
-
 def update_json_files(results):
     """분석 결과로 JSON 파일들 업데이트"""
     print(f"\n{'='*80}")
@@ -357,23 +302,11 @@ def main():
     chatbot = UnifiedYachtChatbot(api_key=API_KEY)
     print(f"✅ 초기화 완료!")
     
-    # 5. PDF 분석
-    results = []
-    success_count = 0
-    failed_count = 0
-    
-    for i, pdf_file in enumerate(pdf_files, 1):
-        pdf_path = os.path.join(PDF_DIR, pdf_file)
-        result = analyze_pdf(chatbot, pdf_path, i, len(pdf_files))
-        
-        if result:
-            results.append(result)
-            success_count += 1
-        else:
-            failed_count += 1
-        
-        # 진행 상황 출력
-        print(f"\n진행 상황: {i}/{len(pdf_files)} (성공: {success_count}, 실패: {failed_count})")
+    # 5. PDF 분석 (추출/분석 동시 처리, 이미 분석한 파일은 건너뜀)
+    pdf_paths = [os.path.join(PDF_DIR, pdf_file) for pdf_file in pdf_files]
+    outcomes = chatbot_runner(chatbot).run(pdf_paths, force='--force' in sys.argv[1:])
+    results = [outcome["result"] for outcome in outcomes if outcome["status"] != STATUS_FAILED]
+    summary = summarize(outcomes)
     
     # 6. JSON 파일 업데이트
     if results:
@@ -388,8 +321,9 @@ def main():
     print(f"📅 종료 시간: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     print(f"📊 분석 결과:")
     print(f"  - 전체: {len(pdf_files)}개")
-    print(f"  - 성공: {success_count}개")
-    print(f"  - 실패: {failed_count}개")
+    print(f"  - 성공: {summary[STATUS_DONE]}개")
+    print(f"  - 건너뜀 (변경 없음): {summary[STATUS_SKIPPED]}개")
+    print(f"  - 실패: {summary[STATUS_FAILED]}개")
     print(f"\n💾 백업 위치: {BACKUP_DIR}")
     print(f"📁 분석 결과: analysis_results/")
     print()
@@ -0,0 +1,375 @@
+"""
+HooAah Yacht - 매뉴얼 일괄 분석 엔진
+data/yachtpdf 전체를 분석하는 스크립트 (batch_analyze_yachts.py, auto_analyze_yachts.py,
+YachtDocumentAnalyzer.analyze_multiple_pdfs)가 함께 사용하는 배치 실행기
+
+기존 방식:
+    PDF를 한 개씩 추출 → 분석 → 다음 PDF 순서로 처리하고, 중간에 실패하면 처음부터 다시 실행
+
+새 방식:
+- 텍스트 추출 (CPU)과 AI 분석 (I/O)을 파이프라인으로 겹쳐 처리
+  - 추출: 파일 단위 스레드가 pdf_extraction 프로세스 풀에 페이지 범위를 나눠 맡김
+  - 분석: 제한된 수의 스레드로 동시에 분석, 분석 시작 간격은 분당 요청 수로 제한
+- 파일별 결과를 끝나는 즉시 결과 JSON + 매니페스트에 기록 (체크포인트)
+- 다시 실행하면 내용(SHA-256)과 분석 버전이 같고 이미 성공한 파일은 건너뜀
+  (저장된 결과를 그대로 사용)
+
+사용법:
+    runner = BatchRunner(extract=chatbot._extract_text_from_file,
+                         analyze=chatbot._analyze_document_directly,
+                         version=analysis_version(chatbot))
+    outcomes = runner.run(pdf_paths)
+    results = [o["result"] for o in outcomes if o["status"] in ("done", "skipped")]
+
+명령줄:
+    python batch_runner.py [pdf_dir] [--force]
+
+환경 변수:
+    BATCH_EXTRACT_WORKERS: 동시에 추출할 파일 수 (기본: 2)
+    BATCH_ANALYZE_WORKERS: 동시에 분석할 파일 수 (기본: 4)
+    BATCH_RATE_PER_MINUTE: 분당 최대 분석 시작 수 (기본: 30, 0이면 제한 없음)
+"""
+
+import os
+import sys
+import json
+import time
+import hashlib
+import tempfile
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+
+from document_cache import file_sha256
+
+
+DEFAULT_PDF_DIR = os.path.join('data', 'yachtpdf')
+DEFAULT_OUTPUT_DIR = 'analysis_results'
+# 결과 파일 이름 ("<이름>-<해시>.json")과 겹칠 수 없는 이름
+MANIFEST_FILE = '_manifest.json'
+
+DEFAULT_EXTRACT_WORKERS = int(os.getenv('BATCH_EXTRACT_WORKERS', 2))
+DEFAULT_ANALYZE_WORKERS = int(os.getenv('BATCH_ANALYZE_WORKERS', 4))
+DEFAULT_RATE_PER_MINUTE = float(os.getenv('BATCH_RATE_PER_MINUTE', 30))
+
+# 이보다 짧은 추출 결과는 실패로 봄 (스캔 이미지 PDF 등)
+MIN_TEXT_CHARS = 100
+
+STATUS_DONE = 'done'
+STATUS_SKIPPED = 'skipped'
+STATUS_FAILED = 'failed'
+
+
+def count_ids(obj, count: int = 0) -> int:
+    """재귀적으로 JSON에서 ID 개수 세기"""
+    if isinstance(obj, dict):
+        if "id" in obj:
+            count += 1
+        for value in obj.values():
+            count = count_ids(value, count)
+    elif isinstance(obj, list):
+        for item in obj:
+            count = count_ids(item, count)
+    return count
+
+
+class BatchManifest:
+    """
+    파일별 분석 상태 매니페스트 (JSON)
+
+    {"files": {"파일명": {"sha256", "version", "status", "resultFile", "ids", ...}}}
+    항목이 바뀔 때마다 임시 파일에 쓴 뒤 교체하므로, 중간에 중단되어도 깨지지 않습니다.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._files: Dict[str, Dict] = {}
+        if os.path.exists(path):
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    self._files = json.load(f).get('files', {})
+            except (json.JSONDecodeError, OSError) as e:
+                print(f"⚠️ 매니페스트를 읽을 수 없어 새로 시작합니다: {e}")
+
+    def get(self, file_name: str) -> Optional[Dict]:
+        """파일 항목 (없으면 None)"""
+        with self._lock:
+            entry = self._files.get(file_name)
+            return dict(entry) if entry else None
+
+    def update(self, file_name: str, entry: Dict):
+        """파일 항목 갱신 후 즉시 저장"""
+        with self._lock:
+            self._files[file_name] = entry
+            self._save()
+
+    def files(self) -> Dict[str, Dict]:
+        """전체 항목 (복사본)"""
+        with self._lock:
+            return {name: dict(entry) for name, entry in self._files.items()}
+
+    def _save(self):
+        directory = os.path.dirname(self.path) or '.'
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump({"updatedAt": datetime.now().isoformat(), "files": self._files},
+                          f, ensure_ascii=False, indent=2)
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+
+class RateLimiter:
+    """분당 최대 호출 수 제한 (호출 시작 간격을 고르게 유지)"""
+
+    def __init__(self, per_minute: float):
+        self.interval = 60.0 / per_minute if per_minute and per_minute > 0 else 0.0
+        self._next = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """다음 호출 가능 시각까지 대기"""
+        if not self.interval:
+            return
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next)
+            self._next = start + self.interval
+        if start > now:
+            time.sleep(start - now)
+
+
+class BatchRunner:
+    """추출/분석 파이프라인 + 체크포인트 배치 실행기"""
+
+    def __init__(self, extract: Callable[[str], str], analyze: Callable[[str, str], Dict],
+                 output_dir: str = DEFAULT_OUTPUT_DIR, version: str = '',
+                 extract_workers: Optional[int] = None, analyze_workers: Optional[int] = None,
+                 rate_per_minute: Optional[float] = None):
+        """
+        Args:
+            extract: 파일 경로 → 추출 텍스트
+            analyze: (파일 경로, 추출 텍스트) → 분석 결과 dict (실패 시 "error" 항목)
+            output_dir: 파일별 결과 JSON과 매니페스트를 저장할 디렉토리
+            version: 분석 버전 (추출기/프롬프트가 바뀌면 달라지는 값, 다르면 다시 분석)
+            extract_workers: 동시에 추출할 파일 수
+            analyze_workers: 동시에 분석할 파일 수
+            rate_per_minute: 분당 최대 분석 시작 수 (0이면 제한 없음)
+        """
+        self.extract = extract
+        self.analyze = analyze
+        self.output_dir = output_dir
+        self.version = version
+        self.extract_workers = max(1, extract_workers or DEFAULT_EXTRACT_WORKERS)
+        self.analyze_workers = max(1, analyze_workers or DEFAULT_ANALYZE_WORKERS)
+        self.rate_limiter = RateLimiter(DEFAULT_RATE_PER_MINUTE if rate_per_minute is None else rate_per_minute)
+        self.manifest = BatchManifest(os.path.join(output_dir, MANIFEST_FILE))
+
+    def result_path(self, file_name: str) -> str:
+        """
+        파일별 결과 JSON 경로
+
+        확장자까지 포함한 파일명 전체의 해시를 붙임 → A.pdf / A.PDF / A.txt의 결과가 서로
+        (대소문자를 구분하지 않는 파일 시스템에서도) 덮어쓰지 않고, 매니페스트와도 겹치지 않음
+        """
+        digest = hashlib.sha256(file_name.encode('utf-8')).hexdigest()[:12]
+        return os.path.join(self.output_dir, f"{os.path.splitext(file_name)[0]}-{digest}.json")
+
+    def run(self, pdf_paths: List[str], force: bool = False) -> List[Dict]:
+        """
+        PDF 목록 일괄 분석
+
+        Args:
+            pdf_paths: 분석할 파일 경로 목록
+            force: True면 매니페스트와 관계없이 모두 다시 분석
+
+        Returns:
+            입력 순서대로의 파일별 결과
+            {"fileName", "path", "status": done/skipped/failed, "result", "error", "ids"}
+        """
+        os.makedirs(self.output_dir, exist_ok=True)
+        outcomes: Dict[str, Dict] = {}
+        pending = []
+        for path in pdf_paths:
+            outcome = None if force else self._load_checkpoint(path)
+            if outcome is not None:
+                outcomes[path] = outcome
+                print(f"⏭️ 건너뜀 (변경 없음): {os.path.basename(path)}")
+            else:
+                pending.append(path)
+
+        total = len(pending)
+        if total:
+            print(f"🚀 {total}개 파일 분석 (추출 {self.extract_workers}개, 분석 {self.analyze_workers}개 동시 처리)")
+        done_count = [0]
+        progress_lock = threading.Lock()
+
+        def finish(path: str, outcome: Dict):
+            outcomes[path] = outcome
+            with progress_lock:
+                done_count[0] += 1
+                mark = "✅" if outcome["status"] == STATUS_DONE else "❌"
+                detail = f"ID {outcome['ids']}개" if outcome["status"] == STATUS_DONE else outcome["error"]
+                print(f"{mark} [{done_count[0]}/{total}] {outcome['fileName']}: {detail}", flush=True)
+
+        with ThreadPoolExecutor(max_workers=self.extract_workers, thread_name_prefix='batch-extract') as extractors, \
+                ThreadPoolExecutor(max_workers=self.analyze_workers, thread_name_prefix='batch-analyze') as analyzers:
+            # 1단계: 추출이 끝난 파일부터 바로 분석 대기열에 넣음
+            extract_futures = {extractors.submit(self._extract, path, analyzers): path for path in pending}
+            analysis_futures: Dict[Future, str] = {}
+            for future in as_completed(extract_futures):
+                path = extract_futures[future]
+                queued = future.result()
+                if isinstance(queued, Future):
+                    analysis_futures[queued] = path
+                else:
+                    finish(path, queued)
+            # 2단계: 분석 결과 수집
+            for future in as_completed(analysis_futures):
+                finish(analysis_futures[future], future.result())
+
+        return [outcomes[path] for path in pdf_paths]
+
+    # ============================================================
+    # 단계별 처리
+    # ============================================================
+
+    def _extract(self, path: str, analyzers: ThreadPoolExecutor):
+        """텍스트 추출 후 분석 작업 제출 (추출 실패 시 실패 결과 반환)"""
+        file_name = os.path.basename(path)
+        try:
+            sha256 = file_sha256(path)
+            text = self.extract(path) or ''
+        except Exception as e:
+            return self._record_failure(path, None, f"텍스트 추출 오류: {e}")
+        if len(text.strip()) < MIN_TEXT_CHARS:
+            return self._record_failure(path, sha256, f"텍스트 추출 실패 (길이: {len(text)})")
+        print(f"📖 추출 완료: {file_name} ({len(text)}자)", flush=True)
+        return analyzers.submit(self._analyze, path, sha256, text)
+
+    def _analyze(self, path: str, sha256: str, text: str) -> Dict:
+        """분석 후 결과 JSON과 매니페스트에 기록"""
+        self.rate_limiter.acquire()
+        started = time.monotonic()
+        try:
+            result = self.analyze(path, text)
+        except Exception as e:
+            return self._record_failure(path, sha256, f"분석 오류: {e}")
+        if not isinstance(result, dict) or "error" in result:
+            error = result.get("error") if isinstance(result, dict) else "분석 결과 형식 오류"
+            return self._record_failure(path, sha256, f"분석 실패: {error}")
+
+        file_name = os.path.basename(path)
+        result_file = self.result_path(file_name)
+        try:
+            # 먼저 직렬화 → 직렬화할 수 없는 결과로 빈 파일이 남지 않음
+            payload = json.dumps(result, ensure_ascii=False, indent=2)
+            with open(result_file, 'w', encoding='utf-8') as f:
+                f.write(payload)
+        except (OSError, TypeError, ValueError) as e:
+            return self._record_failure(path, sha256, f"결과 저장 오류: {e}")
+
+        ids = count_ids(result)
+        self.manifest.update(file_name, {
+            "sha256": sha256,
+            "version": self.version,
+            "status": STATUS_DONE,
+            "resultFile": os.path.basename(result_file),
+            "ids": ids,
+            "textLength": len(text),
+            "seconds": round(time.monotonic() - started, 2),
+            "updatedAt": datetime.now().isoformat()
+        })
+        return self._outcome(path, STATUS_DONE, result=result, ids=ids)
+
+    def _load_checkpoint(self, path: str) -> Optional[Dict]:
+        """이미 분석했고 변경이 없는 파일이면 저장된 결과 반환"""
+        entry = self.manifest.get(os.path.basename(path))
+        if not entry or entry.get("status") != STATUS_DONE or entry.get("version") != self.version:
+            return None
+        result_file = os.path.join(self.output_dir, entry.get("resultFile", ''))
+        try:
+            if file_sha256(path) != entry.get("sha256"):
+                return None
+            with open(result_file, 'r', encoding='utf-8') as f:
+                result = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return None
+        return self._outcome(path, STATUS_SKIPPED, result=result, ids=entry.get("ids", 0))
+
+    def _record_failure(self, path: str, sha256: Optional[str], error: str) -> Dict:
+        self.manifest.update(os.path.basename(path), {
+            "sha256": sha256,
+            "version": self.version,
+            "status": STATUS_FAILED,
+            "error": error,
+            "updatedAt": datetime.now().isoformat()
+        })
+        return self._outcome(path, STATUS_FAILED, error=error)
+
+    @staticmethod
+    def _outcome(path: str, status: str, result: Optional[Dict] = None, error: Optional[str] = None,
+                 ids: int = 0) -> Dict:
+        return {
+            "fileName": os.path.basename(path),
+            "path": path,
+            "status": status,
+            "result": result,
+            "error": error,
+            "ids": ids
+        }
+
+
+def summarize(outcomes: List[Dict]) -> Dict[str, int]:
+    """상태별 파일 수"""
+    summary = {STATUS_DONE: 0, STATUS_SKIPPED: 0, STATUS_FAILED: 0}
+    for outcome in outcomes:
+        summary[outcome["status"]] = summary.get(outcome["status"], 0) + 1
+    return summary
+
+
+def chatbot_runner(chatbot, output_dir: str = DEFAULT_OUTPUT_DIR, **kwargs) -> BatchRunner:
+    """
+    UnifiedYachtChatbot의 추출/분석을 사용하는 배치 실행기
+
+    분석 버전 = 텍스트 추출기 버전 + 분석 프롬프트 버전 (둘 중 하나가 바뀌면 다시 분석)
+    """
+    from chatbot_unified import DOCUMENT_ANALYSIS_PROMPT_VERSION, TEXT_EXTRACTOR_VERSION
+
+    return BatchRunner(
+        extract=chatbot._extract_text_from_file,
+        analyze=chatbot._analyze_document_directly,
+        output_dir=output_dir,
+        version=f"{TEXT_EXTRACTOR_VERSION}:{DOCUMENT_ANALYSIS_PROMPT_VERSION}",
+        **kwargs
+    )
+
+
+def main():
+    """명령줄: python batch_runner.py [pdf_dir] [--force]"""
+    args = [arg for arg in sys.argv[1:] if not arg.startswith('--')]
+    force = '--force' in sys.argv[1:]
+    pdf_dir = args[0] if args else DEFAULT_PDF_DIR
+    if not os.path.isdir(pdf_dir):
+        print(f"❌ PDF 디렉토리를 찾을 수 없습니다: {pdf_dir}")
+        sys.exit(1)
+
+    from chatbot_unified import UnifiedYachtChatbot
+
+    pdf_paths = sorted(os.path.join(pdf_dir, name) for name in os.listdir(pdf_dir)
+                       if name.lower().endswith('.pdf'))
+    started = time.monotonic()
+    outcomes = chatbot_runner(UnifiedYachtChatbot(mode="cli")).run(pdf_paths, force=force)
+    summary = summarize(outcomes)
+    print(f"\n📊 완료 {summary[STATUS_DONE]}개 / 건너뜀 {summary[STATUS_SKIPPED]}개 / "
+          f"실패 {summary[STATUS_FAILED]}개 ({time.monotonic() - started:.1f}초)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,622 @@
+"""
+HooAah Yacht - SQLite 요트 카탈로그
+data/*.json 요트/부품/매뉴얼 데이터를 SQLite(WAL)에 넣어 요트 단위로 조회
+
+기존 방식:
+    요트 한 척의 부품을 보려고 해도 JSON 파일 전체를 파싱
+
+새 방식:
+- import_json(): data/*.json → SQLite (원본 파일이 바뀐 경우에만 다시 가져옴, sync())
+- 조회 API: 요트 ID/이름 인덱스로 필요한 행만 읽음
+  (get_yacht, find_yacht, get_parts, get_parts_by_name, get_dimensions, get_maintenance_items,
+   get_manual_resources, list_yachts, list_parts_entries)
+- open_catalog(): 명령줄 스크립트용 (data/catalog.db를 열고 바뀐 JSON을 가져옴)
+- export_json(): SQLite → Schema 5.0 JSON (Flutter 앱이 읽는 형식 그대로, 키 순서 포함)
+
+테이블:
+    source_file      원본 JSON 파일의 최상위 항목 (schemaVersion, lastUpdated 등)
+    yacht            yacht_specifications.json 요트 (id, 이름, 정규화된 이름, 원본 JSON)
+    dimension        요트 치수 (yachtSpecs.standard.dimensions, detailedDimensions)
+    parts_entry      부품 파일의 요트 항목 (부품 목록 제외)
+    part             부품 (yacht_parts_app_data.json / yacht_parts_database.json)
+    maintenance_item 정비 주기가 있는 부품 (카탈로그가 사용하는 부품 파일 기준)
+    manual_resource  yacht_manual_resources.json 매뉴얼 자료
+
+사용법:
+    db = CatalogDatabase('data/catalog.db')
+    db.sync('data')                       # JSON이 바뀌었으면 다시 가져옴
+    db.find_yacht('J/70')                 # 이름 인덱스 조회
+    db.get_parts('j70')                   # 해당 요트 부품 행만 조회
+    db = open_catalog('data')             # 위 두 단계를 한 번에 (스크립트용)
+    db.export_all('export/')              # Schema 5.0 JSON 파일로 내보내기
+
+명령줄:
+    python catalog_db.py import [data_dir]
+    python catalog_db.py export <out_dir>
+"""
+
+import os
+import re
+import sys
+import json
+import sqlite3
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+from yacht_name_matcher import normalize_yacht_name
+from yacht_store import (
+    DEFAULT_DATA_DIR,
+    PARTS_APP_DATA_VIEW,
+    PARTS_DATABASE_VIEW,
+    SPECIFICATIONS_VIEW,
+    write_json_atomic,
+)
+
+
+DEFAULT_DB_FILE = 'catalog.db'
+
+MANUAL_RESOURCES_FILE = 'yacht_manual_resources.json'
+
+# 가져오는 원본 파일 (부품 파일은 yacht_catalog.load_parts_data와 같은 우선순위)
+PARTS_FILES = (PARTS_APP_DATA_VIEW, PARTS_DATABASE_VIEW)
+SOURCE_FILES = (SPECIFICATIONS_VIEW,) + PARTS_FILES + (MANUAL_RESOURCES_FILE,)
+
+# yacht_manual_resources.json의 목록 항목
+RESOURCE_SECTIONS = ('resources', 'yachts')
+
+# 치수 섹션: (섹션 이름, 요트 JSON에서의 경로)
+DIMENSION_SECTIONS = (
+    ('standard', ('yachtSpecs', 'standard', 'dimensions')),
+    ('detailed', ('detailedDimensions',)),
+)
+
+
+def source_signature(data_dir: str = DEFAULT_DATA_DIR) -> str:
+    """원본 JSON 파일들의 (이름, 수정시각, 크기) 서명 (파일 내용은 읽지 않음)"""
+    signature = []
+    for name in SOURCE_FILES:
+        try:
+            stat = os.stat(os.path.join(data_dir, name))
+        except OSError:
+            continue
+        signature.append([name, stat.st_mtime_ns, stat.st_size])
+    return json.dumps(signature)
+
+
+def parse_interval_months(value: Any) -> Optional[int]:
+    """정비 주기 값 → 개월 수 (예: 12, "12", "12개월" → 12)"""
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, int):
+        return value
+    if isinstance(value, float):
+        return int(value)
+    if isinstance(value, str):
+        match = re.search(r'(\d+)', value)
+        if match:
+            return int(match.group(1))
+    return None
+
+
+def _dig(data: Any, path: Tuple[str, ...]) -> Any:
+    for key in path:
+        if not isinstance(data, dict):
+            return None
+        data = data.get(key)
+    return data
+
+
+def yacht_dimensions(yacht: Dict, section: str = 'standard') -> Dict[str, str]:
+    """요트 JSON의 치수 섹션 → {이름: 값} (dimension 테이블 / get_dimensions와 같은 형식)"""
+    path = dict(DIMENSION_SECTIONS).get(section)
+    dimensions = _dig(yacht, path) if path else None
+    if not isinstance(dimensions, dict):
+        return {}
+    return {name: str(value) for name, value in dimensions.items()
+            if not name.startswith('_') and value is not None and not isinstance(value, (dict, list))}
+
+
+def _name_key(name: str) -> str:
+    return normalize_yacht_name(name or '')
+
+
+def _dumps(value: Any) -> str:
+    return json.dumps(value, ensure_ascii=False)
+
+
+class CatalogDatabase:
+    """SQLite 요트 카탈로그 (가져오기 / 조회 / 내보내기)"""
+
+    def __init__(self, db_path: Optional[str] = None):
+        """
+        Args:
+            db_path: SQLite 파일 경로 (기본: data/catalog.db)
+        """
+        self.db_path = db_path or os.path.join(DEFAULT_DATA_DIR, DEFAULT_DB_FILE)
+        self._local = threading.local()
+        self._import_lock = threading.Lock()
+
+        db_dir = os.path.dirname(self.db_path)
+        if db_dir:
+            os.makedirs(db_dir, exist_ok=True)
+        self._init_db()
+
+    # ============================================================
+    # 가져오기
+    # ============================================================
+
+    def sync(self, data_dir: str = DEFAULT_DATA_DIR) -> bool:
+        """원본 JSON 파일이 마지막으로 가져온 뒤 바뀌었으면 다시 가져옴 (가져왔으면 True)"""
+        signature = source_signature(data_dir)
+        if self.get_meta('source_signature') == signature:
+            return False
+        with self._import_lock:
+            if self.get_meta('source_signature') == signature:
+                return False
+            self.import_json(data_dir, signature)
+            return True
+
+    def import_json(self, data_dir: str = DEFAULT_DATA_DIR, signature: Optional[str] = None) -> Dict[str, int]:
+        """
+        data/*.json 전체를 한 트랜잭션으로 다시 가져옴
+
+        JSON이 깨져 있으면 (다른 프로세스가 쓰는 중 등) json.JSONDecodeError를
+        그대로 전달하며, 기존 데이터는 바뀌지 않습니다.
+
+        Returns:
+            테이블별 가져온 행 수
+        """
+        if signature is None:
+            signature = source_signature(data_dir)
+
+        documents = {}
+        for name in SOURCE_FILES:
+            path = os.path.join(data_dir, name)
+            if os.path.exists(path):
+                with open(path, 'r', encoding='utf-8') as f:
+                    documents[name] = json.load(f)
+
+        counts = {"yacht": 0, "dimension": 0, "part": 0, "maintenance_item": 0, "manual_resource": 0}
+        conn = self._conn()
+        with conn:
+            for table in ('source_file', 'yacht', 'dimension', 'parts_entry', 'part',
+                          'maintenance_item', 'manual_resource'):
+                conn.execute(f"DELETE FROM {table}")
+
+            specs = documents.get(SPECIFICATIONS_VIEW)
+            if specs is not None:
+                self._insert_source(conn, SPECIFICATIONS_VIEW, specs, ('yachts',))
+                counts["yacht"], counts["dimension"] = self._import_yachts(conn, specs.get('yachts', []))
+
+            maintenance_source = next((name for name in PARTS_FILES if name in documents), None)
+            for name in PARTS_FILES:
+                if name not in documents:
+                    continue
+                self._insert_source(conn, name, documents[name], ('yachts',))
+                parts, items = self._import_parts(conn, name, documents[name].get('yachts', []),
+                                                  with_maintenance=(name == maintenance_source))
+                counts["part"] += parts
+                counts["maintenance_item"] += items
+
+            resources = documents.get(MANUAL_RESOURCES_FILE)
+            if resources is not None:
+                self._insert_source(conn, MANUAL_RESOURCES_FILE, resources, RESOURCE_SECTIONS)
+                counts["manual_resource"] = self._import_resources(conn, resources)
+
+            conn.execute(
+                "INSERT OR REPLACE INTO catalog_meta (key, value) VALUES ('source_signature', ?)",
+                (signature,)
+            )
+        return counts
+
+    @staticmethod
+    def _insert_source(conn: sqlite3.Connection, name: str, document: Dict, sections: Tuple[str, ...]):
+        # 목록 항목은 자리만 남겨 두어 내보낼 때 키 순서를 그대로 복원
+        meta = {key: (None if key in sections else value) for key, value in document.items()}
+        conn.execute("INSERT INTO source_file (name, meta) VALUES (?, ?)", (name, _dumps(meta)))
+
+    @staticmethod
+    def _import_yachts(conn: sqlite3.Connection, yachts: List[Dict]) -> Tuple[int, int]:
+        dimension_count = 0
+        for position, yacht in enumerate(yachts):
+            conn.execute(
+                "INSERT INTO yacht (position, id, name, name_key, manufacturer, type, manual_pdf, document) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (position, yacht.get('id'), yacht.get('name', ''), _name_key(yacht.get('name', '')),
+                 yacht.get('manufacturer'), yacht.get('type'), yacht.get('manualPDF'), _dumps(yacht))
+            )
+            yacht_id = yacht.get('id')
+            if not yacht_id:
+                continue
+            for section, _ in DIMENSION_SECTIONS:
+                for name, value in yacht_dimensions(yacht, section).items():
+                    conn.execute(
+                        "INSERT OR IGNORE INTO dimension (yacht_id, section, name, value) VALUES (?, ?, ?, ?)",
+                        (yacht_id, section, name, value)
+                    )
+                    dimension_count += 1
+        return len(yachts), dimension_count
+
+    @staticmethod
+    def _import_parts(conn: sqlite3.Connection, source: str, entries: List[Dict],
+                      with_maintenance: bool) -> Tuple[int, int]:
+        part_count = 0
+        item_count = 0
+        for entry_position, entry in enumerate(entries):
+            parts = entry.get('parts')
+            yacht_id = entry.get('id')
+            # 카테고리별 dict 형식은 항목 JSON에 그대로 보관
+            header = dict(entry, parts=None) if isinstance(parts, list) else entry
+            conn.execute(
+                "INSERT INTO parts_entry (source, position, yacht_id, name, name_key, document) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (source, entry_position, yacht_id, entry.get('name', ''), _name_key(entry.get('name', '')),
+                 _dumps(header))
+            )
+            if not isinstance(parts, list):
+                continue
+
+            for position, part in enumerate(parts):
+                if not isinstance(part, dict):
+                    conn.execute(
+                        "INSERT INTO part (source, entry_position, position, yacht_id, document) "
+                        "VALUES (?, ?, ?, ?, ?)",
+                        (source, entry_position, position, yacht_id, _dumps(part))
+                    )
+                    part_count += 1
+                    continue
+
+                interval = part.get('interval')
+                if interval is None:
+                    interval = part.get('maintenanceInterval')
+                conn.execute(
+                    "INSERT INTO part (source, entry_position, position, yacht_id, part_id, name, category, "
+                    "manufacturer, model, interval_months, document) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (source, entry_position, position, yacht_id, part.get('id'), part.get('name'),
+                     part.get('category'), part.get('manufacturer') or None, part.get('model') or None,
+                     parse_interval_months(interval), _dumps(part))
+                )
+                part_count += 1
+
+                details = part.get('maintenanceDetails')
+                if with_maintenance and yacht_id and (interval or isinstance(details, dict)):
+                    details = details if isinstance(details, dict) else {}
+                    conn.execute(
+                        "INSERT INTO maintenance_item (yacht_id, position, part_id, part_name, category, "
+                        "interval_months, interval_text, method, notes) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                        (yacht_id, position, part.get('id'), part.get('name'), part.get('category'),
+                         parse_interval_months(interval), str(interval) if interval else None,
+                         details.get('maintenanceMethod'), details.get('notes'))
+                    )
+                    item_count += 1
+        return part_count, item_count
+
+    @staticmethod
+    def _import_resources(conn: sqlite3.Connection, document: Dict) -> int:
+        count = 0
+        for section in RESOURCE_SECTIONS:
+            for position, resource in enumerate(document.get(section) or []):
+                name = resource.get('yachtModel') or resource.get('name') or ''
+                conn.execute(
+                    "INSERT INTO manual_resource (section, position, yacht_id, name_key, manual_pdf, "
+                    "document_type, document) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (section, position, resource.get('id'), _name_key(name), resource.get('manualPDF'),
+                     resource.get('documentType'), _dumps(resource))
+                )
+                count += 1
+        return count
+
+    # ============================================================
+    # 내보내기 (Schema 5.0 JSON)
+    # ============================================================
+
+    def export_json(self, name: str) -> Optional[Dict]:
+        """원본 JSON 파일 형식 그대로 재구성 (가져온 적 없는 파일이면 None)"""
+        conn = self._conn()
+        row = conn.execute("SELECT meta FROM source_file WHERE name = ?", (name,)).fetchone()
+        if row is None:
+            return None
+        document = json.loads(row[0])
+
+        if name == SPECIFICATIONS_VIEW:
+            document['yachts'] = self._documents("SELECT document FROM yacht ORDER BY position")
+        elif name in PARTS_FILES:
+            document['yachts'] = self._export_parts_entries(name)
+        elif name == MANUAL_RESOURCES_FILE:
+            for section in RESOURCE_SECTIONS:
+                if section in document:
+                    document[section] = self._documents(
+                        "SELECT document FROM manual_resource WHERE section = ? ORDER BY position", (section,)
+                    )
+        return document
+
+    def _export_parts_entries(self, source: str, where: str = "", params: Tuple = ()) -> List[Dict]:
+        conn = self._conn()
+        entries = []
+        for position, document in conn.execute(
+            f"SELECT position, document FROM parts_entry WHERE source = ? {where} ORDER BY position",
+            (source, *params)
+        ).fetchall():
+            entry = json.loads(document)
+            if entry.get('parts') is None and 'parts' in entry:
+                entry['parts'] = self._documents(
+                    "SELECT document FROM part WHERE source = ? AND entry_position = ? ORDER BY position",
+                    (source, position)
+                )
+            entries.append(entry)
+        return entries
+
+    def export_all(self, out_dir: str) -> List[str]:
+        """가져온 모든 파일을 out_dir에 JSON으로 저장, 저장한 파일 경로 목록 반환"""
+        os.makedirs(out_dir, exist_ok=True)
+        written = []
+        for name in SOURCE_FILES:
+            document = self.export_json(name)
+            if document is None:
+                continue
+            path = os.path.join(out_dir, name)
+            write_json_atomic(path, document)
+            written.append(path)
+        return written
+
+    # ============================================================
+    # 조회
+    # ============================================================
+
+    def load_yacht_data(self) -> Dict:
+        """yacht_specifications.json 내용 (yacht_catalog.load_yacht_data와 같은 형식)"""
+        return self.export_json(SPECIFICATIONS_VIEW) or {"yachts": []}
+
+    def load_parts_data(self) -> Dict:
+        """부품 데이터 (yacht_parts_app_data.json 우선, yacht_catalog.load_parts_data와 같은 형식)"""
+        for name in PARTS_FILES:
+            document = self.export_json(name)
+            if document is not None:
+                return document
+        return {"yachts": []}
+
+    def list_yachts(self) -> List[Dict]:
+        """요트 요약 목록 (id, name, manufacturer, type, manualPDF) — 원본 JSON은 읽지 않음"""
+        rows = self._conn().execute(
+            "SELECT id, name, manufacturer, type, manual_pdf FROM yacht ORDER BY position"
+        ).fetchall()
+        return [{"id": row[0], "name": row[1], "manufacturer": row[2], "type": row[3], "manualPDF": row[4]}
+                for row in rows]
+
+    def get_yacht(self, yacht_id: str) -> Optional[Dict]:
+        """요트 ID로 스펙 조회"""
+        return self._document("SELECT document FROM yacht WHERE id = ? ORDER BY position LIMIT 1", (yacht_id,))
+
+    def find_yacht(self, name: str) -> Optional[Dict]:
+        """요트 이름으로 스펙 조회 (대소문자, 하이픈/공백/슬래시 무시)"""
+        return self._document("SELECT document FROM yacht WHERE name_key = ? ORDER BY position LIMIT 1",
+                              (_name_key(name),))
+
+    def get_yacht_id(self, name: str) -> Optional[str]:
+        """요트 이름으로 요트 ID 조회"""
+        row = self._conn().execute(
+            "SELECT id FROM yacht WHERE name_key = ? AND id IS NOT NULL ORDER BY position LIMIT 1",
+            (_name_key(name),)
+        ).fetchone()
+        return row[0] if row else None
+
+    def get_parts(self, yacht_id: str, source: Optional[str] = None) -> Any:
+        """
+        요트 ID로 부품 목록 조회
+
+        Args:
+            yacht_id: 요트 ID
+            source: 부품 파일 (기본: yacht_parts_app_data.json, 없으면 yacht_parts_database.json)
+
+        Returns:
+            부품 목록 (yacht_parts_database.json의 카테고리별 dict 형식은 그대로 반환)
+        """
+        source = source or self._parts_source()
+        if source is None:
+            return []
+        row = self._conn().execute(
+            "SELECT position FROM parts_entry WHERE source = ? AND yacht_id = ? ORDER BY position LIMIT 1",
+            (source, yacht_id)
+        ).fetchone()
+        if row is None:
+            return []
+        entry = self._export_parts_entries(source, "AND position = ?", (row[0],))[0]
+        return entry.get('parts') or []
+
+    def get_parts_by_name(self, name: str, source: Optional[str] = None) -> Any:
+        """요트 이름으로 부품 목록 조회 (부품 파일의 요트 이름 기준, 형식은 get_parts와 같음)"""
+        source = source or self._parts_source()
+        if source is None:
+            return []
+        row = self._conn().execute(
+            "SELECT position FROM parts_entry WHERE source = ? AND name_key = ? ORDER BY position LIMIT 1",
+            (source, _name_key(name))
+        ).fetchone()
+        if row is None:
+            return []
+        entry = self._export_parts_entries(source, "AND position = ?", (row[0],))[0]
+        return entry.get('parts') or []
+
+    def list_parts_entries(self, source: str) -> List[Dict]:
+        """부품 파일의 요트 항목 (목록 형식의 부품은 읽지 않음, parts는 None)"""
+        return self._documents("SELECT document FROM parts_entry WHERE source = ? ORDER BY position", (source,))
+
+    def get_dimensions(self, yacht_id: str, section: str = 'standard') -> Dict[str, str]:
+        """요트 치수 (section: standard = yachtSpecs.standard.dimensions, detailed = detailedDimensions)"""
+        rows = self._conn().execute(
+            "SELECT name, value FROM dimension WHERE yacht_id = ? AND section = ? ORDER BY rowid",
+            (yacht_id, section)
+        ).fetchall()
+        return dict(rows)
+
+    def get_maintenance_items(self, yacht_id: str) -> List[Dict]:
+        """정비 주기가 있는 부품 목록 (interval은 개월 수, 숫자가 없으면 None)"""
+        rows = self._conn().execute(
+            "SELECT part_id, part_name, category, interval_months, interval_text, method, notes "
+            "FROM maintenance_item WHERE yacht_id = ? ORDER BY position",
+            (yacht_id,)
+        ).fetchall()
+        return [{"partId": row[0], "name": row[1], "category": row[2], "interval": row[3],
+                 "intervalText": row[4], "maintenanceMethod": row[5], "notes": row[6]}
+                for row in rows]
+
+    def get_manual_resources(self, yacht_id: Optional[str] = None, name: Optional[str] = None) -> List[Dict]:
+        """요트 ID 또는 이름으로 매뉴얼 자료 조회"""
+        yacht = self.get_yacht(yacht_id) if yacht_id else None
+        name_key = _name_key(name or (yacht or {}).get('name', ''))
+        return self._documents(
+            "SELECT document FROM manual_resource WHERE (yacht_id = ? OR (name_key = ? AND name_key != '')) "
+            "ORDER BY section, position",
+            (yacht_id, name_key)
+        )
+
+    def get_meta(self, key: str) -> Optional[str]:
+        row = self._conn().execute("SELECT value FROM catalog_meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def _parts_source(self) -> Optional[str]:
+        names = {row[0] for row in self._conn().execute("SELECT name FROM source_file").fetchall()}
+        return next((name for name in PARTS_FILES if name in names), None)
+
+    def _document(self, sql: str, params: Tuple = ()) -> Optional[Dict]:
+        row = self._conn().execute(sql, params).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def _documents(self, sql: str, params: Tuple = ()) -> List[Any]:
+        return [json.loads(row[0]) for row in self._conn().execute(sql, params).fetchall()]
+
+    # ============================================================
+    # SQLite
+    # ============================================================
+
+    def _conn(self) -> sqlite3.Connection:
+        """스레드별 연결 (조회마다 새로 열지 않음)"""
+        conn = getattr(self._local, 'conn', None)
+        # fork로 물려받은 연결은 부모 프로세스와 공유되므로 쓰지 않음 (gunicorn 작업자)
+        if conn is None or self._local.pid != os.getpid():
+            conn = sqlite3.connect(self.db_path, timeout=30)
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    def _init_db(self):
+        conn = self._conn()
+        # WAL: 가져오는 중에도 다른 프로세스/스레드는 이전 데이터를 계속 읽을 수 있음
+        conn.execute("PRAGMA journal_mode=WAL")
+        with conn:
+            columns = [row[1] for row in conn.execute("PRAGMA table_info(parts_entry)").fetchall()]
+            if columns and 'name_key' not in columns:
+                # 이전 형식 (이름 인덱스 없음): JSON에서 다시 만들 수 있으므로 지우고 다시 가져옴
+                conn.execute("DROP TABLE parts_entry")
+                conn.execute("DELETE FROM catalog_meta WHERE key = 'source_signature'")
+            conn.executescript("""
+                CREATE TABLE IF NOT EXISTS catalog_meta (
+                    key TEXT PRIMARY KEY,
+                    value TEXT
+                );
+                CREATE TABLE IF NOT EXISTS source_file (
+                    name TEXT PRIMARY KEY,
+                    meta TEXT NOT NULL
+                );
+                CREATE TABLE IF NOT EXISTS yacht (
+                    position INTEGER PRIMARY KEY,
+                    id TEXT,
+                    name TEXT NOT NULL,
+                    name_key TEXT NOT NULL,
+                    manufacturer TEXT,
+                    type TEXT,
+                    manual_pdf TEXT,
+                    document TEXT NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS idx_yacht_id ON yacht (id);
+                CREATE INDEX IF NOT EXISTS idx_yacht_name_key ON yacht (name_key);
+                CREATE TABLE IF NOT EXISTS dimension (
+                    yacht_id TEXT NOT NULL,
+                    section TEXT NOT NULL,
+                    name TEXT NOT NULL,
+                    value TEXT,
+                    PRIMARY KEY (yacht_id, section, name)
+                );
+                CREATE TABLE IF NOT EXISTS parts_entry (
+                    source TEXT NOT NULL,
+                    position INTEGER NOT NULL,
+                    yacht_id TEXT,
+                    name TEXT,
+                    name_key TEXT,
+                    document TEXT NOT NULL,
+                    PRIMARY KEY (source, position)
+                );
+                CREATE INDEX IF NOT EXISTS idx_parts_entry_yacht ON parts_entry (source, yacht_id);
+                CREATE INDEX IF NOT EXISTS idx_parts_entry_name ON parts_entry (source, name_key);
+                CREATE TABLE IF NOT EXISTS part (
+                    source TEXT NOT NULL,
+                    entry_position INTEGER NOT NULL,
+                    position INTEGER NOT NULL,
+                    yacht_id TEXT,
+                    part_id TEXT,
+                    name TEXT,
+                    category TEXT,
+                    manufacturer TEXT,
+                    model TEXT,
+                    interval_months INTEGER,
+                    document TEXT NOT NULL,
+                    PRIMARY KEY (source, entry_position, position)
+                );
+                CREATE INDEX IF NOT EXISTS idx_part_yacht ON part (yacht_id, category);
+                CREATE TABLE IF NOT EXISTS maintenance_item (
+                    yacht_id TEXT NOT NULL,
+                    position INTEGER NOT NULL,
+                    part_id TEXT,
+                    part_name TEXT,
+                    category TEXT,
+                    interval_months INTEGER,
+                    interval_text TEXT,
+                    method TEXT,
+                    notes TEXT
+                );
+                CREATE INDEX IF NOT EXISTS idx_maintenance_yacht ON maintenance_item (yacht_id, position);
+                CREATE TABLE IF NOT EXISTS manual_resource (
+                    section TEXT NOT NULL,
+                    position INTEGER NOT NULL,
+                    yacht_id TEXT,
+                    name_key TEXT,
+                    manual_pdf TEXT,
+                    document_type TEXT,
+                    document TEXT NOT NULL,
+                    PRIMARY KEY (section, position)
+                );
+                CREATE INDEX IF NOT EXISTS idx_manual_resource_yacht ON manual_resource (yacht_id);
+                CREATE INDEX IF NOT EXISTS idx_manual_resource_name ON manual_resource (name_key);
+            """)
+
+
+def open_catalog(data_dir: str = DEFAULT_DATA_DIR) -> CatalogDatabase:
+    """data_dir/catalog.db를 열고, 원본 JSON이 바뀌었으면 가져온 뒤 반환 (명령줄 스크립트용)"""
+    db = CatalogDatabase(os.path.join(data_dir, DEFAULT_DB_FILE))
+    db.sync(data_dir)
+    return db
+
+
+def main(argv: List[str]) -> int:
+    if len(argv) < 2 or argv[1] not in ('import', 'export'):
+        print("사용법: python catalog_db.py import [data_dir] | export <out_dir>")
+        return 1
+
+    if argv[1] == 'import':
+        data_dir = argv[2] if len(argv) > 2 else DEFAULT_DATA_DIR
+        db = CatalogDatabase(os.path.join(data_dir, DEFAULT_DB_FILE))
+        counts = db.import_json(data_dir)
+        print("✅ 카탈로그 가져오기 완료: " + ", ".join(f"{table} {count}개" for table, count in counts.items()))
+        return 0
+
+    if len(argv) < 3:
+        print("❌ 내보낼 디렉토리를 지정하세요: python catalog_db.py export <out_dir>")
+        return 1
+    db = open_catalog(DEFAULT_DATA_DIR)
+    for path in db.export_all(argv[2]):
+        print(f"✅ {path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
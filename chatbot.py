@@ -2,12 +2,17 @@
 """
 요트 정보 챗봇 - 향상된 버전
 yacht_specifications.json을 사용하여 상세한 요트 정보 제공
+(SQLite 카탈로그를 거쳐 읽으므로 JSON이 바뀐 경우에만 다시 가져옴)
 """
 import json
 import argparse
 import re
+import sqlite3
 from pathlib import Path
 
+from catalog_db import open_catalog
+from yacht_name_matcher import AhoCorasick
+
 
 def find_json_path():
     """JSON 파일 경로를 찾습니다. (우선순위: yacht_specifications.json > YachtList01.json)"""
@@ -44,6 +49,17 @@ def find_json_path():
     return None, None
 
 
+def load_yacht_data(json_path: Path, data_version: str) -> dict:
+    """요트 데이터 로드 (yacht_specifications.json은 SQLite 카탈로그에서, 기존 데이터는 JSON에서)"""
+    if data_version == 'new':
+        try:
+            return open_catalog(str(json_path.parent)).load_yacht_data()
+        except sqlite3.Error as e:
+            print(f"⚠️ SQLite 카탈로그 사용 불가, JSON 파일에서 로드: {e}")
+    with open(json_path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
 json_path, data_version = find_json_path()
 if json_path is None:
     raise FileNotFoundError(
@@ -53,8 +69,7 @@ if json_path is None:
         "- YachtList01.json"
     )
 
-with open(json_path, 'r', encoding='utf-8') as f:
-    yacht_data = json.load(f)
+yacht_data = load_yacht_data(json_path, data_version)
 
 print(f"✅ 데이터 로드 완료: {json_path.name} ({'상세 버전' if data_version == 'new' else '기본 버전'})")
 
@@ -71,21 +86,44 @@ def normalize_text(s: str) -> str:
     return s_clean
 
 
+# 이름 인덱스 캐시 (최근 요트 목록 하나만 유지): (이름 목록, 오토마톤)
+# 이름 목록 자체를 버전으로 사용 → 이름 수정/순서 변경 시 다시 구축, 이전 목록은 참조하지 않음
+_name_index_cache = None
+
+
+def _yacht_names(yachts_list: list) -> tuple:
+    # 새 버전과 구 버전 모두 지원
+    return tuple(yacht.get('name') or yacht.get('model_name', '') for yacht in yachts_list)
+
+
+def _get_name_index(yachts_list: list) -> AhoCorasick:
+    """요트 이름 단어 인덱스 (이름 목록이 바뀔 때만 다시 구축)"""
+    global _name_index_cache
+    names = _yacht_names(yachts_list)
+    cached = _name_index_cache
+    if cached is not None and cached[0] == names:
+        return cached[1]
+    
+    patterns = []
+    for index, model_name in enumerate(names):
+        model_norm = normalize_text(model_name)
+        # 이름 전체가 포함되면 각 단어도 포함되므로 단어만 패턴으로 등록
+        for part in model_norm.split():
+            patterns.append((part, index))
+    
+    automaton = AhoCorasick(patterns)
+    _name_index_cache = (names, automaton)
+    return automaton
+
+
 def get_yacht_by_name(question: str, yachts_list: list) -> dict:
     """질문에서 요트 이름을 찾아 매칭되는 요트 정보 반환"""
     question_norm = normalize_text(question)
     
-    for yacht in yachts_list:
-        # 새 버전과 구 버전 모두 지원
-        model_name = yacht.get('name') or yacht.get('model_name', '')
-        model_norm = normalize_text(model_name)
-        
-        if not model_norm:
-            continue
-        
-        # 완전 매칭 또는 부분 단어 매칭
-        if model_norm in question_norm or any(part in question_norm for part in model_norm.split()):
-            return yacht
+    # 완전 매칭 또는 부분 단어 매칭 (질문을 한 번만 훑어서 확인)
+    matched = _get_name_index(yachts_list).search(question_norm)
+    if matched:
+        return yachts_list[min(matched)]
     
     return None
 
@@ -11,17 +11,36 @@ import os
 from datetime import datetime
 import uuid
 from werkzeug.utils import secure_filename
+from session_store import SessionStore
+from yacht_catalog import LIST_CURSOR_TYPES, decode_cursor, encode_cursor, get_shared_catalog_store
+from gemini_client import gemini_stats
 
 app = Flask(__name__)
 CORS(app)  # Flutter 앱에서 접근 가능하도록 CORS 설정
 
-# 세션별 챗봇 인스턴스 저장
-chatbot_sessions = {}
-chatbot_with_pdf_sessions = {}
-
 # Gemini API 키 (환경변수에서 가져오기)
 GEMINI_API_KEY = os.getenv('GEMINI_API_KEY')
 
+# 세션 저장소 설정 (환경변수로 조정 가능)
+SESSION_MAX = int(os.getenv('CHAT_SESSION_MAX', 200))
+SESSION_TTL = float(os.getenv('CHAT_SESSION_TTL', 1800))
+HISTORY_MAX = int(os.getenv('CHAT_HISTORY_MAX', 100))
+
+# 세션별 챗봇 인스턴스 저장 (LRU + 유휴 만료, 제거된 세션 기록은 SQLite로 내려쓰기)
+chatbot_sessions = SessionStore(
+    lambda: YachtAIChatbot(api_key=GEMINI_API_KEY),
+    max_sessions=SESSION_MAX, idle_ttl=SESSION_TTL, max_history=HISTORY_MAX
+)
+chatbot_with_pdf_sessions = SessionStore(
+    lambda: YachtAIChatbotWithPDF(api_key=GEMINI_API_KEY),
+    max_sessions=SESSION_MAX, idle_ttl=SESSION_TTL, max_history=HISTORY_MAX,
+    spill_path=os.path.join('data', 'chat_sessions_pdf.db')
+)
+
+# 요트 목록 페이지 크기 (/api/yachts?limit=)
+YACHT_PAGE_SIZE = int(os.getenv('YACHT_PAGE_SIZE', 50))
+YACHT_PAGE_MAX = 200
+
 # 업로드된 파일 저장 디렉토리
 UPLOAD_FOLDER = 'uploads'
 ALLOWED_EXTENSIONS = {'pdf'}
@@ -35,15 +54,11 @@ def allowed_file(filename):
 
 def get_or_create_chatbot(session_id: str) -> YachtAIChatbot:
     """세션 ID로 챗봇 인스턴스 가져오기 또는 생성"""
-    if session_id not in chatbot_sessions:
-        chatbot_sessions[session_id] = YachtAIChatbot(api_key=GEMINI_API_KEY)
-    return chatbot_sessions[session_id]
+    return chatbot_sessions.get(session_id)
 
 def get_or_create_chatbot_with_pdf(session_id: str) -> YachtAIChatbotWithPDF:
     """세션 ID로 PDF 업로드 기능이 있는 챗봇 인스턴스 가져오기 또는 생성"""
-    if session_id not in chatbot_with_pdf_sessions:
-        chatbot_with_pdf_sessions[session_id] = YachtAIChatbotWithPDF(api_key=GEMINI_API_KEY)
-    return chatbot_with_pdf_sessions[session_id]
+    return chatbot_with_pdf_sessions.get(session_id)
 
 
 @app.route('/api/chat', methods=['POST'])
@@ -127,14 +142,8 @@ def get_history():
                 "error": "session_id가 필요합니다."
             }), 400
         
-        if session_id not in chatbot_sessions:
-            return jsonify({
-                "success": True,
-                "history": []
-            })
-        
-        chatbot = chatbot_sessions[session_id]
-        history = chatbot.get_history()
+        # 메모리에서 제거된 세션도 내려쓴 기록에서 조회
+        history = chatbot_sessions.get_history(session_id)
         
         return jsonify({
             "success": True,
@@ -174,8 +183,7 @@ def clear_history():
                 "error": "session_id가 필요합니다."
             }), 400
         
-        if session_id in chatbot_sessions:
-            chatbot_sessions[session_id].clear_history()
+        chatbot_sessions.clear(session_id)
         
         return jsonify({
             "success": True,
@@ -194,6 +202,11 @@ def get_yachts():
     """
     요트 목록 조회 API
     
+    Query (선택, 하나라도 있으면 이름순 페이지로 반환):
+    - limit: 페이지 크기 (기본 50, 최대 200)
+    - cursor: 이전 응답의 nextCursor
+    - q: 이름 접두어 (대소문자/공백/하이픈 무시)
+    
     Response:
     {
         "success": true,
@@ -205,13 +218,33 @@ def get_yachts():
                 "manufacturer": "FarEast Yachts"
             },
             ...
-        ]
+        ],
+        "total": 20,                          # q가 있으면 접두어에 맞는 요트 수
+        "nextCursor": "WyJmYXJlYXN0Mjgi..."   # 다음 페이지가 없으면 null
     }
     """
     try:
-        # 임시 챗봇 인스턴스로 데이터 가져오기
-        temp_chatbot = YachtAIChatbot(api_key=GEMINI_API_KEY)
-        yachts = temp_chatbot.yacht_data.get('yachts', [])
+        # 공유 카탈로그에서 데이터 가져오기 (요청마다 JSON을 다시 읽지 않음)
+        catalog = get_shared_catalog_store().get()
+        
+        limit = request.args.get('limit', type=int)
+        cursor = request.args.get('cursor')
+        query = request.args.get('q', '').strip()
+        next_cursor = None
+        
+        if limit is None and not cursor and not query:
+            # 기존 클라이언트 호환: 전체 목록
+            yachts = catalog.summaries
+            total = len(yachts)
+        else:
+            limit = min(max(limit or YACHT_PAGE_SIZE, 1), YACHT_PAGE_MAX)
+            try:
+                after = decode_cursor(cursor, types=LIST_CURSOR_TYPES) if cursor else None
+            except ValueError as e:
+                return jsonify({"success": False, "error": str(e)}), 400
+            yachts, last_key = catalog.list_page(limit, after=after, prefix=query)
+            total = catalog.count_prefix(query)
+            next_cursor = encode_cursor(list(last_key)) if last_key else None
         
         # 간단한 정보만 추출
         yacht_list = [
@@ -227,7 +260,8 @@ def get_yachts():
         return jsonify({
             "success": True,
             "yachts": yacht_list,
-            "total": len(yacht_list)
+            "total": total,
+            "nextCursor": next_cursor
         })
     
     except Exception as e:
@@ -255,10 +289,7 @@ def get_yacht_detail(yacht_id):
     }
     """
     try:
-        temp_chatbot = YachtAIChatbot(api_key=GEMINI_API_KEY)
-        yachts = temp_chatbot.yacht_data.get('yachts', [])
-        
-        yacht = next((y for y in yachts if y.get('id') == yacht_id), None)
+        yacht = get_shared_catalog_store().get().get_yacht(yacht_id)
         
         if not yacht:
             return jsonify({
@@ -284,7 +315,8 @@ def health_check():
     return jsonify({
         "status": "healthy",
         "timestamp": datetime.now().isoformat(),
-        "active_sessions": len(chatbot_sessions)
+        "active_sessions": len(chatbot_sessions),
+        "gemini": gemini_stats()
     })
 
 
@@ -8,6 +8,7 @@ import json
 import google.generativeai as genai
 from datetime import datetime
 from typing import List, Dict, Optional
+from gemini_client import GeminiClient
 
 class YachtAIChatbot:
     def __init__(self, api_key: str = None):
@@ -39,6 +40,9 @@ class YachtAIChatbot:
             self.model = genai.GenerativeModel('gemini-pro')
             print("✅ gemini-pro 모델 사용 (fallback)")
         
+        # 요청 한도 / 재시도 / 시간 제한 / 요청 병합 (같은 API 키의 모든 인스턴스가 공유)
+        self.model = GeminiClient(self.model, api_key=api_key)
+        
         # 대화 히스토리
         self.chat_history: List[Dict[str, str]] = []
         
@@ -14,9 +14,12 @@ HooAah Yacht AI Chatbot - 통합 버전
     # 대화형 모드
     python chatbot_unified.py
     
-    # API 서버 모드
+    # API 서버 모드 (개발 서버)
     python chatbot_unified.py --mode api
     
+    # API 서버 모드 (운영, gunicorn 다중 작업자)
+    gunicorn -c gunicorn.conf.py wsgi:app
+    
     # API 키 지정
     python chatbot_unified.py --api-key YOUR_API_KEY
 """
@@ -33,11 +36,46 @@ if sys.platform == 'win32':
         pass
 import json
 import sys
+import uuid
+import hashlib
 import argparse
 from datetime import datetime
-from typing import List, Dict, Optional
+from typing import Callable, Iterator, List, Dict, Optional, Tuple
 from pathlib import Path
 
+from catalog_db import CatalogDatabase
+from yacht_catalog import CatalogStore, YachtCatalog, get_shared_catalog_store
+from intent_router import IntentRouter, Route, get_intent_router
+from manual_analysis import (
+    DEFAULT_MAX_CHUNKS as MAX_ANALYSIS_CHUNKS,
+    analyze_chunks,
+    merge_analysis_results,
+    split_manual_text,
+)
+from search_index import get_shared_search_index
+from answer_cache import get_shared_answer_cache
+from llm_cache import get_shared_llm_cache
+from gemini_client import GeminiClient, gemini_stats
+from session_store import SessionStore
+from job_queue import JobQueue, JobQueueFull
+from yacht_store import build_registration_record, get_shared_registration_store
+from document_cache import get_shared_text_cache, get_shared_analysis_cache
+from pdf_extraction import (
+    extract_pdf_pages, extract_pdf_text_with_ocr, find_empty_pages, join_pages, ocr_available
+)
+
+# 텍스트 추출 로직 버전 (추출 방식이 바뀌면 올려서 이전 텍스트 캐시를 무효화)
+TEXT_EXTRACTOR_VERSION = "3"
+
+# 개별 치수 질문: 답변 종류 → (치수 키, 표시 이름)
+SPECIFIC_DIMENSIONS = {
+    'beam': ('beam', '폭 (Beam)'),
+    'loa': ('loa', '전장 (LOA)'),
+    'draft': ('draft', '흘수 (Draft)'),
+    'displacement': ('displacement', '배수량 (Displacement)'),
+    'mast_height': ('mastHeight', '마스트 높이 (Mast Height)'),
+}
+
 # Environment variables (.env 파일 로드)
 try:
     from dotenv import load_dotenv
@@ -63,7 +101,7 @@ except ImportError:
 
 # Flask API 관련
 try:
-    from flask import Flask, request, jsonify
+    from flask import Flask, Response, request, jsonify
     from flask_cors import CORS
     from werkzeug.utils import secure_filename
     HAS_FLASK = True
@@ -80,7 +118,7 @@ except ImportError:
     import sys
     try:
         subprocess.check_call([sys.executable, "-m", "pip", "install", "flask", "flask-cors", "--quiet"])
-        from flask import Flask, request, jsonify
+        from flask import Flask, Response, request, jsonify
         from flask_cors import CORS
         from werkzeug.utils import secure_filename
         HAS_FLASK = True
@@ -146,1395 +184,231 @@ except ImportError:
     HAS_PPTX = False
 
 
-class UnifiedYachtChatbot:
-    """
-    통합 요트 챗봇 클래스
-    모든 챗봇 기능을 통합
-    """
-    
-    def __init__(self, api_key: str = None, mode: str = "interactive"):
-        """
-        통합 챗봇 초기화
-        
-        Args:
-            api_key: Gemini API 키 (기본값: 제공된 API 키)
-            mode: 실행 모드 ("interactive", "api", "cli")
-        """
-        self.mode = mode
-        # API 키 우선순위: 인자 > 환경변수 (.env 파일) > 없으면 오류
-        self.api_key = api_key or os.getenv('GEMINI_API_KEY')
-        if not self.api_key:
-            print("⚠️ 경고: GEMINI_API_KEY가 설정되지 않았습니다.")
-            print("💡 .env 파일에 GEMINI_API_KEY를 설정하거나 --api-key 옵션을 사용하세요.")
-            print("📝 .env.example 파일을 참고하여 .env 파일을 생성하세요.")
-        
-        # Gemini AI 초기화
-        if HAS_GEMINI and self.api_key:
-            genai.configure(api_key=self.api_key)
-            try:
-                self.model = genai.GenerativeModel('gemini-2.5-flash')
-                print("✅ Gemini 2.5 Flash 모델 사용")
-            except Exception as e:
-                print(f"⚠️ Gemini 2.5 Flash 사용 실패, gemini-pro로 전환: {e}")
-                self.model = genai.GenerativeModel('gemini-pro')
-                print("✅ gemini-pro 모델 사용 (fallback)")
-            self.has_gemini = True
-        else:
-            self.has_gemini = False
-            print("⚠️ Gemini AI를 사용할 수 없습니다. 기본 모드로 실행됩니다.")
-        
-        # 대화 히스토리
-        self.chat_history: List[Dict[str, str]] = []
-        
-        # 요트 데이터 로드
-        self.yacht_data = self._load_yacht_data()
-        self.parts_data = self._load_parts_data()
-        
-        # 시스템 프롬프트
-        if self.has_gemini:
-            self.system_prompt = self._create_system_prompt()
-        
-        # 등록 데이터
-        self.current_yacht_registration = None
-        
-        print("✅ HooAah Yacht 통합 챗봇이 준비되었습니다!")
-        if mode == "interactive":
-            print("💬 자연스럽게 요트에 대해 질문해보세요.")
-            print("📄 PDF 파일 경로를 입력하면 자동으로 분석합니다.\n")
-    
-    def _load_yacht_data(self) -> Dict:
-        """요트 스펙 데이터 로드"""
-        try:
-            with open('data/yacht_specifications.json', 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except FileNotFoundError:
-            print("⚠️ yacht_specifications.json 파일을 찾을 수 없습니다.")
-            return {"yachts": []}
-    
-    def _load_parts_data(self) -> Dict:
-        """부품 데이터 로드 (interval 정보가 있는 yacht_parts_app_data.json 우선)"""
-        try:
-            # yacht_parts_app_data.json을 우선 로드 (interval 정보 포함)
-            with open('data/yacht_parts_app_data.json', 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except FileNotFoundError:
-            # fallback: yacht_parts_database.json
-            try:
-                with open('data/yacht_parts_database.json', 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            except FileNotFoundError:
-                print("⚠️ 부품 데이터 파일을 찾을 수 없습니다.")
-                return {"yachts": []}
-    
-    def _create_system_prompt(self) -> str:
-        """시스템 프롬프트 생성"""
-        yacht_list = [yacht.get('name', '') for yacht in self.yacht_data.get('yachts', [])]
-        
-        prompt = f"""당신은 HooAah Yacht의 전문 AI 어시스턴트입니다.
+# 문서 분석 프롬프트 (Schema Version 5.0)
+# 템플릿을 수정하면 해시가 바뀌어 이전 분석 결과 캐시는 자동으로 무효화됩니다.
+ANALYSIS_SCHEMA_VERSION = "5.0"
+DOCUMENT_ANALYSIS_PROMPT_TEMPLATE = """다음은 요트 매뉴얼 또는 부품 정보 문서에서 추출한 텍스트입니다:
 
-**역할:**
-- 요트 소유자와 관리자를 돕는 친절하고 전문적인 어시스턴트
-- 요트 스펙, 부품, 정비, 관리에 대한 모든 질문에 답변
-- 자연스럽고 대화적인 톤으로 소통
-- 사용자의 의도를 파악하여 적절한 응답 제공
+{extracted_text}
 
-**지원하는 요트 20종:**
-{', '.join(yacht_list)}
+---
 
-**데이터베이스 구조 (ERD 기반):**
-- User: 사용자 정보
-- Yacht: 요트 정보 (name)
-- Yacht_User: 사용자-요트 연결 (다대다 관계)
-- Part: 부품 정보 (name, manufacturer, model, interval)
-- Repair: 정비 내역 (repairDate만 저장, content 필드 없음)
-- Calendar: 캘린더 이벤트 (content 필드 있음, part_id와 연결)
-- Alert: 알림 (part_id와 일대일 관계)
+## 📋 작업 지시사항 (Schema Version 5.0)
 
-**의도 파악 및 응답 가이드라인:**
+매뉴얼에서 발견한 **모든 정보**를 최대한 상세하게 추출하세요.
 
-1. **요트 정보 조회 의도:**
-   - 키워드: "정보", "스펙", "사양", "크기", "치수", "길이", "폭", "높이", 요트 이름 등
-   - 응답: 해당 요트의 상세 정보 제공 (치수, 엔진, 돛 면적 등)
+---
 
-2. **요트 등록/PDF 업로드 의도:**
-   - 키워드: "등록", "업로드", "pdf", "문서", "매뉴얼", "새 요트", "요트 등록", "추가", "입력" 등
-   - 응답: PDF 파일 업로드 안내 메시지 반환
-   - 예시 문장:
-     * "새 요트 등록하고 싶어요"
-     * "pdf 매뉴얼 업로드해줘"
-     * "요트 정보 추가할게"
-     * "문서 등록하고 싶어"
-     * "매뉴얼 파일 올릴 수 있어?"
+### ✅ 섹션 1: 문서 기본 정보
+```json
+"documentInfo": {{
+  "title": "문서 제목",
+  "yachtModel": "요트 모델명",
+  "manufacturer": "제조사",
+  "documentType": "Owner's Manual / Parts List / Technical Specifications / Class Rules"
+}}
+```
 
-3. **도움말 요청 의도:**
-   - 키워드: "도움말", "도움", "help", "사용법", "어떻게", "방법", "사용", "사용법", "가이드" 등
-   - 응답: 도움말 메시지 반환
+---
 
-4. **요트 목록 조회 의도:**
-   - 키워드: "목록", "리스트", "전체", "모든 요트", "어떤 요트", "요트 종류" 등
-   - 응답: 요트 목록 반환
+### ✅ 섹션 2: 요트 기본 스펙
+**standard (표준 필드):**
+- dimensions: LOA, LWL, Beam, Draft, Displacement, mastHeight
+- engine: type, power, model
+- sailArea: mainsail, jib, spinnaker, total
 
-5. **요트 비교 의도:**
-   - 키워드: "비교", "차이", "어떤 게", "vs", "대" 등
-   - 응답: 여러 요트를 비교하여 차이점 설명
+**additional (발견한 모든 추가 정보):**
+- 위 standard에 없는 모든 스펙을 키-값으로 저장
+- 키 이름: camelCase (예: keelWeight, fuelCapacity)
+- 신뢰도: _confidence_{{키이름}}: "high" / "medium" / "low"
 
-6. **요트 추천 의도:**
-   - 키워드: "추천", "어떤 게 좋아", "선택", "고르" 등
-   - 응답: 사용 목적에 맞는 요트 추천
+---
 
-7. **정비/관리 질문:**
-   - 키워드: "정비", "관리", "주기", "점검", "교체" 등
-   - 응답: 정비 주기, 정비 이력, 관리 방법 안내
+### ✅ 섹션 3: 상세 치수 (Detailed Dimensions)
+**모든 치수 정보를 추출하세요:**
+- LWL, BOA, freeboard (bow/midship/stern)
+- headroom (saloon/cabins/galley)
+- ballastWeight, ballastRatio
+- keel dimensions, rudder dimensions
+- boom length, pole length
+- 신뢰도: _confidence_{{키이름}}
 
-**답변 형식:**
-- 짧고 명확하게 (모바일 화면에 적합)
-- 필요시 이모지 사용 (⛵, 🔧, 📏, ⚓ 등)
-- 숫자는 단위와 함께 명시
-- 추가 질문 유도
+---
 
-**중요:**
-- 사용자의 의도를 정확히 파악하여 적절한 응답 제공
-- 자연어로 된 모든 요청을 이해하고 처리
-- 특정 명령어가 아닌 관련 키워드만 있어도 의도 파악
-- 모르는 내용은 솔직히 모른다고 답변
+### ✅ 섹션 4: 외관 (Exterior)
 
-**데이터 활용:**
-아래 JSON 데이터를 참고하여 정확한 정보 제공:
+**🔑 중요: 모든 항목에 고유 ID 부여!**
 
-요트 스펙 데이터:
-{json.dumps(self.yacht_data, ensure_ascii=False, indent=2)[:5000]}...
+**ID 생성 규칙:**
+- Hull: `ext-hull-01`
+- Keel: `ext-hull-keel-01`
+- Rudder: `ext-hull-rudder-01`
+- Deck: `ext-deck-01`
+- Cockpit: `ext-deck-cockpit-01`
+- Windows: `ext-window-{{location}}-{{number}}`
+- Hatches: `ext-hatch-{{location}}-{{number}}`
 
-부품 데이터 (샘플):
-{json.dumps(self.parts_data, ensure_ascii=False, indent=2)[:3000]}...
-"""
-        return prompt
-    
-    def _get_file_extension(self, file_path: str) -> str:
-        """파일 확장자 추출"""
-        return os.path.splitext(file_path)[1].lower()
-    
-    def _is_supported_file(self, file_path: str) -> bool:
-        """지원되는 파일 형식인지 확인"""
-        ext = self._get_file_extension(file_path)
-        supported_extensions = ['.pdf', '.docx', '.doc', '.hwp', '.txt', '.xlsx', '.xls', '.pptx', '.ppt']
-        return ext in supported_extensions
-    
-    def _extract_file_path_from_message(self, message: str) -> Optional[str]:
-        """
-        사용자 메시지에서 파일 경로 추출 (PDF, Word, HWP 등)
-        모바일 앱에서 전달된 파일 경로도 지원 (iOS, Android)
-        """
-        import re
-        
-        # 지원되는 파일 확장자
-        supported_exts = r'(?:pdf|docx?|hwp|txt|xlsx?)'
-        
-        # 1. 따옴표로 감싸진 경로 찾기 (공백 포함 경로 지원)
-        quoted_patterns = [
-            rf'["\']([^"\']+\.{supported_exts})["\']',
-            rf'["\']([^"\']+\.{supported_exts})',
-            rf'([^"\']+\.{supported_exts})["\']',
-        ]
-        
-        for pattern in quoted_patterns:
-            match = re.search(pattern, message, re.IGNORECASE)
-            if match:
-                path = match.group(1).strip()
-                if os.path.exists(path):
-                    return os.path.abspath(path)
-        
-        # 2. Windows 절대 경로 패턴
-        windows_abs_pattern = rf'([A-Za-z]:[\\/](?:[^"\']+[\\/])*[^"\']+\.{supported_exts})'
-        match = re.search(windows_abs_pattern, message, re.IGNORECASE)
-        if match:
-            path = match.group(1).strip()
-            if os.path.exists(path):
-                return os.path.abspath(path)
-        
-        # 3. Unix/Linux/Mac 절대 경로 패턴
-        unix_abs_pattern = rf'(/[^"\']+\.{supported_exts})'
-        match = re.search(unix_abs_pattern, message, re.IGNORECASE)
-        if match:
-            path = match.group(1).strip()
-            if os.path.exists(path):
-                return os.path.abspath(path)
-        
-        # 4. 모바일 앱 경로 패턴
-        mobile_patterns = [
-            rf'(/storage/[^"\']+\.{supported_exts})',  # Android
-            rf'(/var/mobile/[^"\']+\.{supported_exts})',  # iOS
-            rf'(/data/[^"\']+\.{supported_exts})',  # Android data
-            rf'(file://[^"\']+\.{supported_exts})',  # file:// URI
-        ]
-        
-        for pattern in mobile_patterns:
-            match = re.search(pattern, message, re.IGNORECASE)
-            if match:
-                path = match.group(1).strip()
-                if path.startswith('file://'):
-                    path = path.replace('file://', '')
-                if os.path.exists(path):
-                    return os.path.abspath(path)
-        
-        # 5. 메시지 전체가 파일 경로인지 확인
-        message_clean = message.strip().strip('"').strip("'")
-        
-        if os.path.isabs(message_clean) and self._is_supported_file(message_clean):
-            if os.path.exists(message_clean):
-                return os.path.abspath(message_clean)
-        
-        if self._is_supported_file(message_clean):
-            if os.path.exists(message_clean):
-                return os.path.abspath(message_clean)
-            abs_path = os.path.abspath(message_clean)
-            if os.path.exists(abs_path):
-                return abs_path
-        
-        return None
-    
-    def _extract_pdf_path_from_message(self, message: str) -> Optional[str]:
-        """메시지에서 PDF 파일 경로 추출 (하위 호환성)"""
-        return self._extract_file_path_from_message(message)
-    
-    def _is_pdf_upload_request(self, message: str) -> bool:
-        """파일 업로드 요청인지 확인 (PDF, Word, HWP 등)"""
-        file_keywords = ['pdf', 'docx', 'doc', 'hwp', 'word', '문서', '매뉴얼', '업로드', '등록', '파일']
-        return any(keyword in message.lower() for keyword in file_keywords) or \
-               self._extract_file_path_from_message(message) is not None
-    
-    def _is_registration_request(self, message: str) -> bool:
-        """요트 등록 요청인지 확인"""
-        message_lower = message.lower()
-        registration_keywords = [
-            '요트 등록', '등록하고 싶어', '등록하고 싶어요', '등록하고 싶습니다',
-            '새 요트', '요트 추가', '추가하고 싶어', '추가하고 싶어요',
-            '부품 추가', '부품 등록', '부품 넣어', '부품 넣어줘'
-        ]
-        return any(keyword in message_lower for keyword in registration_keywords)
-    
-    def _handle_registration_request(self, user_message: str) -> str:
-        """요트 등록/부품 추가 요청 처리"""
-        message_lower = user_message.lower()
-        
-        # 부품 추가 요청인지 확인
-        parts_keywords = ['부품 추가', '부품 등록', '부품 넣어', '부품 넣어줘']
-        if any(keyword in message_lower for keyword in parts_keywords):
-            # 기존 요트에 부품 추가
-            yacht_name = self._extract_yacht_name_from_message(user_message)
-            if yacht_name:
-                return f"""📦 **{yacht_name} 부품 추가**
+**hull:**
+```json
+{{
+  "id": "ext-hull-01",
+  "name": "Hull",
+  "category": "Structure",
+  "manufacturer": "...",
+  "specifications": {{
+    "type": "Monohull",
+    "material": "GRP / Fiberglass / Carbon",
+    "color": "...",
+    "thickness": "...",
+    "gelcoatType": "...",
+    "coreType": "Balsa / Foam / Solid",
+    "_confidence_material": "high",
+    "_additional": {{}}
+  }},
+  "subComponents": [
+    {{
+      "id": "ext-hull-keel-01",
+      "parentId": "ext-hull-01",
+      "name": "Keel",
+      "category": "Hull Structure",
+      "specifications": {{
+        "type": "Fin / Bulb / Canting",
+        "material": "Lead / Iron / Composite",
+        "weight": "...",
+        "draft": "...",
+        "attachmentMethod": "..."
+      }},
+      "maintenanceDetails": {{
+        "interval": 12,
+        "inspectionItems": ["Keel bolts", "Corrosion", "Leakage"],
+        "commonIssues": "...",
+        "repairCost": "..."
+      }}
+    }},
+    {{
+      "id": "ext-hull-rudder-01",
+      "parentId": "ext-hull-01",
+      "name": "Rudder",
+      "specifications": {{
+        "type": "Spade / Skeg-mounted",
+        "material": "...",
+        "dimensions": "..."
+      }}
+    }}
+  ]
+}}
+```
 
-부품을 추가하려면 다음 방법 중 하나를 선택하세요:
+**deck, windows, hatches:** 동일한 구조로 추출
 
-1. **PDF 매뉴얼 업로드** (권장)
-   - PDF 파일 경로를 입력하세요
-   - 예: `data/yachtpdf/manual.pdf`
+---
 
-2. **수동 입력** (준비 중)
-   - 곧 지원 예정입니다
+### ✅ 섹션 5: 앵커 시스템 (Ground Tackle)
 
-PDF 파일 경로를 입력해주세요! 📎"""
-            else:
-                return """📦 **부품 추가**
+**ID 생성 규칙:**
+- Anchors: `anchor-{{type}}-{{number}}`
+- Chain: `anchor-chain-01`
+- Windlass: `anchor-windlass-01`
+- Windlass parts: `anchor-windlass-{{part}}-{{number}}`
 
-어떤 요트에 부품을 추가하시겠어요?
+```json
+{{
+  "anchors": [
+    {{
+      "id": "anchor-primary-01",
+      "name": "Primary Anchor",
+      "type": "Delta / CQR / Fortress / Rocna",
+      "manufacturer": "...",
+      "model": "...",
+      "specifications": {{
+        "weight": "... kg",
+        "material": "...",
+        "holdingPower": "... kg",
+        "_confidence_weight": "high"
+      }}
+    }}
+  ],
+  "chain": {{
+    "id": "anchor-chain-01",
+    "name": "Anchor Chain",
+    "specifications": {{
+      "material": "Galvanized steel / Stainless",
+      "diameter": "... mm",
+      "length": "... m",
+      "grade": "..."
+    }}
+  }},
+  "windlass": {{
+    "id": "anchor-windlass-01",
+    "name": "Windlass",
+    "manufacturer": "...",
+    "specifications": {{
+      "type": "Electric / Manual / Hydraulic",
+      "power": "...",
+      "maxPull": "..."
+    }},
+    "subComponents": [...]
+  }}
+}}
+```
 
-1. 요트 이름을 알려주세요
-   예: "Farr 40 부품 추가"
+---
 
-2. PDF 매뉴얼 파일 경로를 입력하세요
-   예: `data/yachtpdf/manual.pdf`
+### ✅ 섹션 6: 돛 목록 (Sail Inventory)
 
-요트 이름 또는 PDF 파일 경로를 입력해주세요! 📎"""
-        
-        # 일반 요트 등록 요청
-        return self._suggest_pdf_upload()
-    
-    def _is_yacht_info_request(self, message: str) -> bool:
-        """요트 정보 요청인지 확인"""
-        info_keywords = ['정보', '스펙', '사양', '크기', '치수', '길이', '폭', '높이', '추천']
-        yacht_names = [y.get('name', '').lower() for y in self.yacht_data.get('yachts', [])]
-        
-        message_lower = message.lower()
-        return any(keyword in message_lower for keyword in info_keywords) or \
-               any(name in message_lower for name in yacht_names)
-    
-    def chat(self, user_message: str, pdf_file_path: str = None) -> str:
-        """
-        사용자 메시지에 대한 응답 생성
-        
-        Args:
-            user_message: 사용자 입력 메시지
-            pdf_file_path: PDF 파일 경로 (모바일 앱에서 직접 전달되는 경우)
-            
-        Returns:
-            AI 응답 메시지
-        """
-        try:
-            # 1. 직접 전달된 파일 경로 확인 (모바일 앱에서 파일 업로드)
-            if pdf_file_path and os.path.exists(pdf_file_path):
-                return self._handle_file_upload(pdf_file_path)
-            
-            # 2. 메시지에서 PDF 파일 경로 추출
-            pdf_path = self._extract_pdf_path_from_message(user_message)
-            if pdf_path and os.path.exists(pdf_path):
-                # 즉시 피드백
-                print(f"\n📥 파일을 인식했습니다: {os.path.basename(pdf_path)}")
-                print("⏳ 분석을 시작합니다. 잠시만 기다려주세요...\n")
-                sys.stdout.flush()
-                return self._handle_file_upload(pdf_path)
-            
-            # 3. 명령어 처리 (빠른 응답)
-            message_lower = user_message.lower().strip()
-            if message_lower in ['/list', '/목록']:
-                return self._list_yachts()
-            
-            if message_lower in ['/info', '/정보']:
-                return self._get_data_info()
-            
-            if message_lower in ['/help', '/도움말']:
-                return self._get_help()
-            
-            # 4. 대화 히스토리에 추가
-            self.chat_history.append({
-                "role": "user",
-                "content": user_message,
-                "timestamp": datetime.now().isoformat()
-            })
-            
-            # 5. 간단한 질문 먼저 처리 (크기, 부품 개수 등)
-            simple_response = self._handle_simple_questions(user_message)
-            if simple_response:
-                response = simple_response
-            # 5-1. 요트 등록/부품 추가 요청 처리
-            elif self._is_registration_request(user_message):
-                response = self._handle_registration_request(user_message)
-            # 6. Gemini AI로 의도 파악 및 응답 생성
-            elif self.has_gemini:
-                # AI 응답 생성 시작 표시 (즉시)
-                print("🤖 AI가 생각 중입니다...", end="", flush=True)
-                # 분석 요청인 경우 추가 메시지
-                if any(keyword in user_message.lower() for keyword in ['분석', '분석해줘', '분석해주세요', '상세 분석']):
-                    print(" (상세 분석 중) ⏳", flush=True)
-                else:
-                    print(" ⏳", flush=True)
-                # AI가 의도를 파악하여 적절한 응답 생성
-                response = self._generate_intelligent_response(user_message)
-                # 완료 표시 (줄바꿈)
-                print("\r" + " " * 80 + "\r", end="", flush=True)  # 이전 메시지 지우기
-            else:
-                # 기본 모드: 키워드 기반 응답
-                response = self._generate_keyword_based_response(user_message)
-            
-            # 7. 대화 히스토리에 추가
-            self.chat_history.append({
-                "role": "assistant",
-                "content": response,
-                "timestamp": datetime.now().isoformat()
-            })
-            
-            return response
-            
-        except Exception as e:
-            error_msg = f"죄송합니다. 응답 생성 중 오류가 발생했습니다: {str(e)}"
-            print(f"❌ Error: {e}")
-            return error_msg
-    
-    def _generate_intelligent_response(self, user_message: str) -> str:
-        """Gemini AI를 사용한 지능형 응답 생성 (의도 파악)"""
-        try:
-            # 의도 파악을 위한 프롬프트
-            intent_prompt = f"""사용자 메시지: "{user_message}"
+**ID 생성 규칙:**
+- Mainsail: `sail-main-01`
+- Genoa: `sail-genoa-{{size}}-01`
+- Spinnaker: `sail-spinnaker-01`
 
-위 메시지를 분석하여 사용자의 의도를 파악하고 적절한 응답을 생성해주세요.
+```json
+[
+  {{
+    "id": "sail-main-01",
+    "name": "Mainsail",
+    "category": "Sails",
+    "manufacturer": "North Sails / Quantum / UK Sailmakers",
+    "model": "...",
+    "specifications": {{
+      "area": "... m²",
+      "luffLength": "... m",
+      "footLength": "... m",
+      "material": "Dacron / Mylar / 3Di / Carbon",
+      "weight": "... kg",
+      "year": "...",
+      "reefingPoints": 2,
+      "numberOfBattens": 4,
+      "condition": "Excellent / Good / Fair / Poor",
+      "_confidence_area": "high"
+    }},
+    "subComponents": [
+      {{
+        "id": "sail-main-slides-01",
+        "parentId": "sail-main-01",
+        "name": "Sail Slides",
+        "specifications": {{
+          "type": "...",
+          "quantity": 12
+        }}
+      }}
+    ],
+    "maintenanceDetails": {{
+      "interval": 6,
+      "inspectionItems": ["Stitching", "UV cover", "Battens"],
+      "repairCost": "..."
+    }}
+  }}
+]
+```
 
-**의도 분류:**
-1. **요트 정보 조회**: 요트 이름, 스펙, 치수 등에 대한 질문
-2. **요트 등록/PDF 업로드**: 새 요트를 등록하거나 PDF 매뉴얼을 업로드하려는 의도
-3. **요트 분석 요청**: 기존 요트 데이터를 분석하거나 상세 분석을 요청하는 의도 (키워드: "분석", "분석해줘", "분석해주세요", "상세 분석", "데이터 분석" 등)
-4. **도움말 요청**: 사용법, 가이드, 도움말을 요청하는 의도
-5. **요트 목록 조회**: 전체 요트 목록을 보려는 의도
-6. **요트 비교/추천**: 여러 요트를 비교하거나 추천을 요청하는 의도
-7. **정비/관리 질문**: 정비 주기, 관리 방법 등에 대한 질문
-8. **일반 대화**: 기타 요트 관련 질문
+---
 
-**응답 규칙:**
-- 요트 등록/PDF 업로드 의도가 감지되면: PDF 파일 업로드 안내 메시지를 반환
-- 요트 분석 요청 의도가 감지되면: 해당 요트의 상세 분석 정보를 제공 (스펙, 부품, 정비 주기, 특징 등 종합 분석)
-- 도움말 요청 의도가 감지되면: 도움말 내용을 반환
-- 요트 목록 조회 의도가 감지되면: 요트 목록을 반환
-- 요트 정보 조회 의도가 감지되면: 해당 요트의 상세 정보를 제공
-- 그 외: 자연스럽게 답변
+### ✅ 섹션 7: 갑판 장비 (Deck Equipment)
 
-**지원하는 요트 20종:**
-{', '.join([yacht.get('name', '') for yacht in self.yacht_data.get('yachts', [])])}
-
-위 규칙에 따라 사용자에게 적절한 응답을 생성해주세요."""
-            
-            # 의도 파악 및 응답 생성
-            response = self.model.generate_content(intent_prompt)
-            ai_response = response.text.strip()
-            
-            # 특수 응답 처리 (PDF 업로드, 분석, 도움말 등)
-            ai_response_lower = ai_response.lower()
-            user_message_lower = user_message.lower()
-            
-            # PDF 업로드 의도가 명확한 경우
-            if any(keyword in ai_response_lower for keyword in ['pdf', '업로드', '등록', '파일 경로']):
-                # PDF 업로드 안내 메시지로 대체
-                return self._suggest_pdf_upload()
-            
-            # 요트 분석 의도가 명확한 경우
-            if any(keyword in user_message_lower for keyword in ['분석', '분석해줘', '분석해주세요', '상세 분석', '데이터 분석', '요트 분석']):
-                # 요트 이름이 포함되어 있으면 해당 요트 분석, 없으면 전체 분석 안내
-                yacht_name = self._extract_yacht_name_from_message(user_message)
-                if yacht_name:
-                    return self._analyze_yacht_data(yacht_name)
-                else:
-                    return "어떤 요트를 분석하시겠어요? 요트 이름을 알려주시면 상세 분석을 제공해드리겠습니다.\n예: 'Farr 40 분석해줘'"
-            
-            # 도움말 의도가 명확한 경우
-            if any(keyword in ai_response_lower for keyword in ['도움말', '사용법', '가이드']):
-                # 도움말 메시지로 대체
-                return self._get_help()
-            
-            # 요트 목록 의도가 명확한 경우
-            if any(keyword in ai_response_lower for keyword in ['목록', '리스트', '전체 요트']):
-                # 요트 목록으로 대체
-                return self._list_yachts()
-            
-            # 일반 응답 반환
-            return ai_response
-            
-        except Exception as e:
-            # 오류 발생 시 키워드 기반 응답으로 fallback
-            return self._generate_keyword_based_response(user_message)
-    
-    def _generate_keyword_based_response(self, user_message: str) -> str:
-        """키워드 기반 응답 생성 (Gemini AI 없을 때)"""
-        message_lower = user_message.lower()
-        
-        # 1. 도움말 관련 키워드
-        help_keywords = ['도움말', '도움', 'help', '사용법', '어떻게', '방법', '사용', '가이드', '안내']
-        if any(keyword in message_lower for keyword in help_keywords):
-            return self._get_help()
-        
-        # 2. PDF 업로드/등록 관련 키워드
-        pdf_keywords = ['pdf', '문서', '매뉴얼', '업로드', '등록', '파일', '새 요트', '요트 등록', '추가', '입력', '올리', '넣']
-        if any(keyword in message_lower for keyword in pdf_keywords):
-            return self._suggest_pdf_upload_without_ai()
-        
-        # 2-1. 요트 분석 관련 키워드
-        analysis_keywords = ['분석', '분석해줘', '분석해주세요', '상세 분석', '데이터 분석', '요트 분석']
-        if any(keyword in message_lower for keyword in analysis_keywords):
-            yacht_name = self._extract_yacht_name_from_message(user_message)
-            if yacht_name:
-                return self._analyze_yacht_data(yacht_name)
-            else:
-                return "어떤 요트를 분석하시겠어요? 요트 이름을 알려주시면 상세 분석을 제공해드리겠습니다.\n예: 'Farr 40 분석해줘'"
-        
-        # 3. 요트 목록 관련 키워드
-        list_keywords = ['목록', '리스트', '전체', '모든 요트', '어떤 요트', '요트 종류', '요트 목록']
-        if any(keyword in message_lower for keyword in list_keywords):
-            return self._list_yachts()
-        
-        # 4. 요트 정보 조회 (기존 로직)
-        return self._generate_basic_response(user_message)
-    
-    def _generate_ai_response(self, user_message: str) -> str:
-        """Gemini AI를 사용한 응답 생성"""
-        try:
-            context = self._build_context()
-            response = self.model.generate_content(context)
-            return response.text
-        except Exception as e:
-            return f"AI 응답 생성 중 오류가 발생했습니다: {str(e)}"
-    
-    def _generate_basic_response(self, user_message: str) -> str:
-        """기본 모드 응답 생성 (Gemini AI 없이)"""
-        # 기존 chatbot.py의 로직 사용
-        message_lower = user_message.lower()
-        
-        # 요트 이름 찾기
-        for yacht in self.yacht_data.get('yachts', []):
-            yacht_name = yacht.get('name', '').lower()
-            if yacht_name in message_lower:
-                return self._format_yacht_info(yacht)
-        
-        return "죄송합니다. 요트 정보를 찾을 수 없습니다. '/list' 명령어로 요트 목록을 확인하세요."
-    
-    def _handle_simple_questions(self, user_message: str) -> Optional[str]:
-        """간단한 질문 처리 (크기, 부품 개수 등)"""
-        message_lower = user_message.lower()
-        
-        # 요트 이름 추출
-        yacht_name = self._extract_yacht_name_from_message(user_message)
-        if not yacht_name:
-            return None
-        
-        # 요트 찾기
-        yacht = None
-        for y in self.yacht_data.get('yachts', []):
-            if y.get('name', '').lower() == yacht_name.lower():
-                yacht = y
-                break
-        
-        if not yacht:
-            return None
-        
-        # 1. 특정 치수 요소 질문 (개별 처리)
-        # 폭 (Beam)
-        beam_keywords = ['폭', 'beam', '너비', '가로']
-        if any(keyword in message_lower for keyword in beam_keywords):
-            return self._format_specific_dimension(yacht, 'beam', '폭 (Beam)')
-        
-        # 길이/전장 (LOA)
-        loa_keywords = ['전장', 'loa', '길이', '전체 길이', '총 길이']
-        if any(keyword in message_lower for keyword in loa_keywords):
-            return self._format_specific_dimension(yacht, 'loa', '전장 (LOA)')
-        
-        # 흘수 (Draft)
-        draft_keywords = ['흘수', 'draft', '드래프트']
-        if any(keyword in message_lower for keyword in draft_keywords):
-            return self._format_specific_dimension(yacht, 'draft', '흘수 (Draft)')
-        
-        # 배수량 (Displacement)
-        displacement_keywords = ['배수량', 'displacement', '무게', '중량']
-        if any(keyword in message_lower for keyword in displacement_keywords):
-            return self._format_specific_dimension(yacht, 'displacement', '배수량 (Displacement)')
-        
-        # 마스트 높이
-        mast_keywords = ['마스트', 'mast', '마스트 높이', 'mast height', '높이']
-        if any(keyword in message_lower for keyword in mast_keywords):
-            return self._format_specific_dimension(yacht, 'mastHeight', '마스트 높이 (Mast Height)')
-        
-        # 세일링/돛 면적
-        sail_keywords = ['세일링', 'sailing', '돛', 'sail', '돛 면적', 'sail area', '세일 면적', '넓이', '면적']
-        if any(keyword in message_lower for keyword in sail_keywords):
-            return self._format_yacht_sail_area(yacht)
-        
-        # 크기/치수 질문 (전체)
-        size_keywords = ['크기', '치수', '수치', 'dimension']
-        if any(keyword in message_lower for keyword in size_keywords):
-            return self._format_yacht_dimensions(yacht)
-        
-        # 2. 부품 개수 질문
-        parts_count_keywords = ['부품', '부품 개수', '부품 수', 'parts', '몇 개', '개수']
-        if any(keyword in message_lower for keyword in parts_count_keywords):
-            parts = self._get_yacht_parts(yacht_name)
-            parts_count = len(parts) if isinstance(parts, list) else 0
-            if parts_count > 0:
-                return f"📦 **{yacht_name} 부품 정보**\n\n총 **{parts_count}개**의 부품이 등록되어 있습니다.\n\n더 자세한 정보를 원하시면 '{yacht_name} 분석해줘'라고 물어보세요."
-            else:
-                return f"📦 **{yacht_name} 부품 정보**\n\n현재 등록된 부품이 없습니다.\n\n부품 정보를 추가하려면 PDF 매뉴얼을 업로드해주세요."
-        
-        # 3. 엔진 질문
-        engine_keywords = ['엔진', 'engine', '모터', 'motor', '동력', '파워']
-        if any(keyword in message_lower for keyword in engine_keywords):
-            return self._format_yacht_engine_info(yacht)
-        
-        # 4. 정비/유지보수 질문 ✨ 새로 추가
-        maintenance_keywords = ['정비', '유지보수', '관리', '점검', '교체', '주기', 'maintenance', 'repair', 'service', '고장', '수리', '언제']
-        if any(keyword in message_lower for keyword in maintenance_keywords):
-            return self._format_yacht_maintenance_info(yacht, yacht_name)
-        
-        # 5. 부품 질문 (특정 부품)
-        parts_keywords = ['부품', 'parts', '컴포넌트', 'component']
-        if any(keyword in message_lower for keyword in parts_keywords):
-            parts = self._get_yacht_parts(yacht_name)
-            if isinstance(parts, list) and len(parts) > 0:
-                # 부품 목록 반환
-                return self._format_yacht_parts_list(yacht_name, parts)
-            else:
-                return f"📦 **{yacht_name} 부품 정보**\n\n현재 등록된 부품이 없습니다.\n\n부품 정보를 추가하려면 PDF 매뉴얼을 업로드해주세요."
-        
-        # 6. 제조사 질문
-        manufacturer_keywords = ['제조사', 'manufacturer', '만든', '누가']
-        if any(keyword in message_lower for keyword in manufacturer_keywords):
-            manufacturer = yacht.get('manufacturer', 'N/A')
-            return f"🏭 **{yacht_name} 제조사**\n\n제조사: **{manufacturer}**"
-        
-        # 7. 타입 질문
-        type_keywords = ['타입', '유형', '종류', 'type', '어떤']
-        if any(keyword in message_lower for keyword in type_keywords):
-            yacht_type = yacht.get('type', 'N/A')
-            return f"🏷️ **{yacht_name} 유형**\n\n유형: **{yacht_type}**"
-        
-        # 8. 기본 정보 (간단한 질문)
-        info_keywords = ['정보', '스펙', '사양', '알려줘', '뭐야', '어때']
-        if any(keyword in message_lower for keyword in info_keywords) and len(user_message.split()) <= 5:
-            # 매우 간단한 질문만 처리 (예: "TP52 정보", "Farr 40 알려줘")
-            return self._format_basic_yacht_info(yacht)
-        
-        return None
-    
-    def _format_basic_yacht_info(self, yacht: Dict) -> str:
-        """요트 기본 정보 간단 포맷팅"""
-        model_name = yacht.get('name', 'Unknown')
-        manufacturer = yacht.get('manufacturer', 'N/A')
-        yacht_type = yacht.get('type', 'N/A')
-        
-        response = f"📋 **{model_name} 기본 정보**\n\n"
-        response += f"제조사: {manufacturer}\n"
-        response += f"유형: {yacht_type}\n\n"
-        
-        # 치수 정보가 있으면 간단히 표시
-        dim = yacht.get('dimensions', {})
-        if dim:
-            if dim.get('loa'):
-                loa = dim['loa']
-                if isinstance(loa, dict):
-                    response += f"전장 (LOA): {loa.get('display', loa.get('value', 'N/A'))}\n"
-                else:
-                    response += f"전장 (LOA): {loa}\n"
-            if dim.get('beam'):
-                beam = dim['beam']
-                if isinstance(beam, dict):
-                    response += f"폭 (Beam): {beam.get('display', beam.get('value', 'N/A'))}\n"
-                else:
-                    response += f"폭 (Beam): {beam}\n"
-        
-        response += f"\n💡 더 자세한 정보를 원하시면 '{model_name} 분석해줘'라고 물어보세요."
-        
-        return response
-    
-    def _format_yacht_engine_info(self, yacht: Dict) -> str:
-        """요트 엔진 정보 포맷팅"""
-        model_name = yacht.get('name', 'Unknown')
-        
-        # Schema 5.0: yachtSpecs.standard.engine 경로로 검색
-        yacht_specs = yacht.get('yachtSpecs', {})
-        standard_specs = yacht_specs.get('standard', {})
-        engine = standard_specs.get('engine', {})
-        
-        # 추가 정보도 확인 (additional에 엔진 정보가 있을 수 있음)
-        additional_specs = yacht_specs.get('additional', {})
-        
-        # 엔진 정보 수집
-        engine_type = engine.get('type') or additional_specs.get('engineType') or None
-        engine_power = engine.get('power') or additional_specs.get('enginePower') or additional_specs.get('nominalMaximumPropulsionPower') or None
-        engine_model = engine.get('model') or additional_specs.get('engineModel') or None
-        
-        # 정보가 하나도 없으면
-        if not engine_type and not engine_power and not engine_model:
-            return f"🔧 **{model_name} 엔진 정보**\n\n등록된 엔진 정보가 없습니다.\n\n엔진 정보를 추가하려면 PDF 매뉴얼을 업로드해주세요."
-        
-        response = f"🔧 **{model_name} 엔진 정보**\n\n"
-        
-        if engine_type:
-            response += f"**타입**: {engine_type}\n"
-        if engine_power:
-            response += f"**출력**: {engine_power}\n"
-        if engine_model:
-            response += f"**모델**: {engine_model}\n"
-        
-        # 추가 엔진 관련 정보가 있으면 표시
-        if additional_specs.get('maximumRecommendedEngineSizeWeight'):
-            response += f"**권장 엔진 중량**: {additional_specs['maximumRecommendedEngineSizeWeight']}\n"
-        
-        response += f"\n💡 더 자세한 정보를 원하시면 '{model_name} 분석해줘'라고 물어보세요."
-        
-        return response
-    
-    def _format_yacht_maintenance_info(self, yacht: Dict, yacht_name: str) -> str:
-        """요트 정비/유지보수 정보 포맷팅 ✨ 새로 추가"""
-        model_name = yacht.get('name', 'Unknown')
-        
-        # 부품 정보에서 정비 주기 추출
-        parts = self._get_yacht_parts(yacht_name)
-        
-        if not parts or len(parts) == 0:
-            return f"🔧 **{model_name} 정비 정보**\n\n등록된 부품 및 정비 정보가 없습니다.\n\n정비 정보를 추가하려면 PDF 매뉴얼을 업로드해주세요."
-        
-        response = f"🔧 **{model_name} 정비 및 유지보수 정보**\n\n"
-        
-        # 부품별 정비 주기 정리
-        maintenance_schedule = {}
-        for part in parts:
-            if isinstance(part, dict):
-                interval = part.get('interval') or part.get('maintenanceInterval')
-                if interval:
-                    category = part.get('category', '기타')
-                    part_name = part.get('name', 'Unknown')
-                    
-                    if category not in maintenance_schedule:
-                        maintenance_schedule[category] = []
-                    
-                    # interval 숫자 추출
-                    interval_value = interval
-                    if isinstance(interval, str):
-                        import re
-                        match = re.search(r'(\d+)', interval)
-                        if match:
-                            interval_value = int(match.group(1))
-                    
-                    maintenance_schedule[category].append({
-                        'name': part_name,
-                        'interval': interval_value,
-                        'interval_display': f"{interval}개월" if isinstance(interval, int) else str(interval)
-                    })
-        
-        if not maintenance_schedule:
-            response += "정비 주기 정보가 없습니다.\n\n"
-            response += f"총 **{len(parts)}개**의 부품이 등록되어 있지만, 정비 주기가 명시되지 않았습니다.\n\n"
-        else:
-            response += f"**부품별 정비 주기** (총 {len(parts)}개 부품)\n\n"
-            
-            # 카테고리별로 정리
-            for category, items in sorted(maintenance_schedule.items()):
-                response += f"**📦 {category}**\n"
-                
-                # 정비 주기별로 정렬
-                sorted_items = sorted(items, key=lambda x: x['interval'] if isinstance(x['interval'], int) else 999)
-                
-                for item in sorted_items[:5]:  # 각 카테고리당 최대 5개
-                    response += f"  • {item['name']}: {item['interval_display']}마다 점검\n"
-                
-                if len(items) > 5:
-                    response += f"  ... 외 {len(items) - 5}개 부품\n"
-                
-                response += "\n"
-        
-        # 추가 정보 (maintenance 섹션이 있으면 표시)
-        maintenance_info = yacht.get('maintenance', [])
-        if maintenance_info and len(maintenance_info) > 0:
-            response += "**🔍 추가 정비 정보**\n\n"
-            for maint in maintenance_info[:5]:  # 최대 5개
-                if isinstance(maint, dict):
-                    task = maint.get('task') or maint.get('name', 'Unknown')
-                    interval = maint.get('interval', '')
-                    method = maint.get('method', '')
-                    
-                    response += f"**{task}**\n"
-                    if interval:
-                        response += f"  주기: {interval}\n"
-                    if method:
-                        response += f"  방법: {method[:100]}\n"  # 100자로 제한
-                    response += "\n"
-        
-        response += "\n💡 정비 관련 궁금한 점은 언제든 물어보세요!"
-        response += f"\n📊 전체 부품 목록: '{model_name} 부품'"
-        response += f"\n📖 상세 분석: '{model_name} 분석해줘'"
-        
-        return response
-    
-    def _format_yacht_parts_list(self, yacht_name: str, parts: List[Dict]) -> str:
-        """요트 부품 목록 포맷팅"""
-        if not parts or len(parts) == 0:
-            return f"📦 **{yacht_name} 부품 정보**\n\n등록된 부품이 없습니다."
-        
-        response = f"📦 **{yacht_name} 부품 목록**\n\n"
-        response += f"총 **{len(parts)}개**의 부품이 등록되어 있습니다.\n\n"
-        
-        # 카테고리별로 그룹화
-        categories = {}
-        for part in parts[:20]:  # 최대 20개만 표시
-            if isinstance(part, dict):
-                category = part.get('category', '기타')
-                if category not in categories:
-                    categories[category] = []
-                categories[category].append(part.get('name', 'Unknown'))
-        
-        for category, part_names in categories.items():
-            response += f"**{category}**: {', '.join(part_names[:5])}"
-            if len(part_names) > 5:
-                response += f" 외 {len(part_names) - 5}개"
-            response += "\n"
-        
-        if len(parts) > 20:
-            response += f"\n... 외 {len(parts) - 20}개 부품 더 있음\n"
-        
-        response += f"\n💡 전체 부품 목록을 보려면 '{yacht_name} 분석해줘'라고 물어보세요."
-        
-        return response
-    
-    def _format_specific_dimension(self, yacht: Dict, dimension_key: str, dimension_name: str) -> str:
-        """특정 치수 요소만 포맷팅"""
-        model_name = yacht.get('name', 'Unknown')
-        
-        # Schema 5.0: yachtSpecs.standard.dimensions 경로로 검색
-        yacht_specs = yacht.get('yachtSpecs', {})
-        standard_specs = yacht_specs.get('standard', {})
-        dim = standard_specs.get('dimensions', {})
-        
-        # 추가 정보도 확인 (detailedDimensions에 더 상세한 정보가 있을 수 있음)
-        detailed_dim = yacht.get('detailedDimensions', {})
-        
-        dimension_data = dim.get(dimension_key) or detailed_dim.get(dimension_key)
-        if not dimension_data:
-            return f"📏 **{model_name} {dimension_name}**\n\n등록된 {dimension_name} 정보가 없습니다.\n\n정보를 추가하려면 PDF 매뉴얼을 업로드해주세요."
-        
-        response = f"📏 **{model_name} {dimension_name}**\n\n"
-        
-        if isinstance(dimension_data, dict):
-            value = dimension_data.get('value', '')
-            unit = dimension_data.get('unit', '')
-            display = dimension_data.get('display', f"{value}{unit}")
-            response += f"**{dimension_name}**: {display}\n"
-        else:
-            response += f"**{dimension_name}**: {dimension_data}\n"
-        
-        response += f"\n💡 더 자세한 치수 정보를 원하시면 '{model_name} 크기' 또는 '{model_name} 치수'라고 물어보세요."
-        
-        return response
-    
-    def _format_yacht_sail_area(self, yacht: Dict) -> str:
-        """요트 돛 면적 정보 포맷팅"""
-        model_name = yacht.get('name', 'Unknown')
-        
-        # Schema 5.0: yachtSpecs.standard.sailArea 경로로 검색
-        yacht_specs = yacht.get('yachtSpecs', {})
-        standard_specs = yacht_specs.get('standard', {})
-        sail_area = standard_specs.get('sailArea', {})
-        
-        # sailInventory도 확인 (더 상세한 정보)
-        sail_inventory = yacht.get('sailInventory', {})
-        
-        if not sail_area and not sail_inventory:
-            return f"⛵ **{model_name} 돛 면적**\n\n등록된 돛 면적 정보가 없습니다.\n\n정보를 추가하려면 PDF 매뉴얼을 업로드해주세요."
-        
-        response = f"⛵ **{model_name} 돛 면적 (Sail Area)**\n\n"
-        
-        # mainsail (메인 세일)
-        main = sail_area.get('mainsail') or sail_area.get('main')
-        if main:
-            if isinstance(main, dict):
-                response += f"**메인 세일 (Mainsail)**: {main.get('value', '')}{main.get('unit', '')}\n"
-            else:
-                response += f"**메인 세일 (Mainsail)**: {main}\n"
-        
-        # genoa (제노아)
-        genoa = sail_area.get('genoa')
-        if genoa:
-            if isinstance(genoa, dict):
-                response += f"**제노아 (Genoa)**: {genoa.get('value', '')}{genoa.get('unit', '')}\n"
-            else:
-                response += f"**제노아 (Genoa)**: {genoa}\n"
-        
-        # jib (지브)
-        jib = sail_area.get('jib')
-        if jib:
-            if isinstance(jib, dict):
-                response += f"**지브 (Jib)**: {jib.get('value', '')}{jib.get('unit', '')}\n"
-            else:
-                response += f"**지브 (Jib)**: {jib}\n"
-        
-        # spinnaker (스피나커)
-        spinnaker = sail_area.get('spinnaker')
-        if spinnaker:
-            if isinstance(spinnaker, dict):
-                response += f"**스피나커 (Spinnaker)**: {spinnaker.get('value', '')}{spinnaker.get('unit', '')}\n"
-            else:
-                response += f"**스피나커 (Spinnaker)**: {spinnaker}\n"
-        
-        # total (총 면적)
-        total = sail_area.get('total')
-        if total:
-            if isinstance(total, dict):
-                display = total.get('display', f"{total.get('value', '')}{total.get('unit', '')}")
-                response += f"**총 면적 (Total)**: {display}\n"
-            else:
-                response += f"**총 면적 (Total)**: {total}\n"
-        
-        response += f"\n💡 더 자세한 정보를 원하시면 '{model_name} 분석해줘'라고 물어보세요."
-        
-        return response
-    
-    def _format_yacht_dimensions(self, yacht: Dict) -> str:
-        """요트 치수 정보 포맷팅"""
-        model_name = yacht.get('name', 'Unknown')
-        
-        # Schema 5.0: yachtSpecs.standard.dimensions 경로로 검색
-        yacht_specs = yacht.get('yachtSpecs', {})
-        standard_specs = yacht_specs.get('standard', {})
-        dim = standard_specs.get('dimensions', {})
-        
-        # detailedDimensions도 확인
-        detailed_dim = yacht.get('detailedDimensions', {})
-        
-        response = f"📏 **{model_name} 크기 정보**\n\n"
-        response += "**기본 치수**\n"
-        
-        # LOA (전장)
-        loa = dim.get('LOA') or detailed_dim.get('LOA')
-        if loa:
-            if isinstance(loa, dict):
-                response += f"- LOA (전장): {loa.get('display', loa.get('value', ''))}\n"
-            else:
-                response += f"- LOA (전장): {loa}\n"
-        
-        # LWL (수선장)
-        lwl = dim.get('LWL') or dim.get('Lh') or detailed_dim.get('hullLength')
-        if lwl:
-            if isinstance(lwl, dict):
-                response += f"- LWL (수선장): {lwl.get('display', lwl.get('value', ''))}\n"
-            else:
-                response += f"- LWL (수선장): {lwl}\n"
-        
-        # Beam (폭)
-        beam = dim.get('Beam') or detailed_dim.get('beam')
-        if beam:
-            if isinstance(beam, dict):
-                response += f"- Beam (폭): {beam.get('display', beam.get('value', ''))}\n"
-            else:
-                response += f"- Beam (폭): {beam}\n"
-        
-        # Draft (흘수)
-        draft = dim.get('Draft') or detailed_dim.get('draughtDeepKeel')
-        if draft:
-            if isinstance(draft, dict):
-                response += f"- Draft (흘수): {draft.get('display', draft.get('value', ''))}\n"
-            else:
-                response += f"- Draft (흘수): {draft}\n"
-        
-        # Displacement (배수량)
-        disp = dim.get('Displacement') or detailed_dim.get('displacement')
-        if disp:
-            if isinstance(disp, dict):
-                response += f"- Displacement (배수량): {disp.get('display', disp.get('value', ''))}\n"
-            else:
-                response += f"- Displacement (배수량): {disp}\n"
-        
-        # Mast Height (마스트 높이)
-        mast = dim.get('mastHeight') or detailed_dim.get('airDraftClassicalMast')
-        if mast:
-            if isinstance(mast, dict):
-                response += f"- Mast Height (마스트 높이): {mast.get('display', mast.get('value', ''))}\n"
-            else:
-                response += f"- Mast Height (마스트 높이): {mast}\n"
-        
-        return response
-    
-    def _format_full_yacht_info(self, yacht: Dict) -> str:
-        """요트 전체 정보 포맷팅"""
-        model_name = yacht.get('name', 'Unknown')
-        response = f"🛥️ **{model_name}** - 상세 정보\n\n"
-        
-        if yacht.get('manufacturer'):
-            response += f"제조사: {yacht['manufacturer']}\n"
-        if yacht.get('type'):
-            response += f"타입: {yacht['type']}\n"
-        if yacht.get('designer'):
-            response += f"디자이너: {yacht['designer']}\n"
-        if yacht.get('year'):
-            response += f"제작년도: {yacht['year']}\n"
-        
-        response += "\n"
-        
-        # 치수 정보
-        dim = yacht.get('dimensions', {})
-        if dim:
-            response += "📏 **치수**\n"
-            if dim.get('loa'):
-                loa = dim['loa']
-                if isinstance(loa, dict):
-                    response += f"- LOA: {loa.get('display', loa.get('value', ''))}\n"
-                else:
-                    response += f"- LOA: {loa}\n"
-            if dim.get('beam'):
-                beam = dim['beam']
-                if isinstance(beam, dict):
-                    response += f"- Beam (폭): {beam.get('display', beam.get('value', ''))}\n"
-                else:
-                    response += f"- Beam (폭): {beam}\n"
-            if dim.get('draft'):
-                draft = dim['draft']
-                if isinstance(draft, dict):
-                    response += f"- Draft (흘수): {draft.get('display', draft.get('value', ''))}\n"
-                else:
-                    response += f"- Draft (흘수): {draft}\n"
-            if dim.get('displacement'):
-                disp = dim['displacement']
-                if isinstance(disp, dict):
-                    response += f"- Displacement (배수량): {disp.get('display', disp.get('value', ''))}\n"
-                else:
-                    response += f"- Displacement (배수량): {disp}\n"
-            if dim.get('mastHeight'):
-                mast = dim['mastHeight']
-                if isinstance(mast, dict):
-                    response += f"- Mast Height: {mast.get('display', mast.get('value', ''))}\n"
-                else:
-                    response += f"- Mast Height: {mast}\n"
-            response += "\n"
-        
-        # 돛 면적
-        sail_area = yacht.get('sailArea', {})
-        if sail_area:
-            response += "⛵ **돛 면적**\n"
-            if sail_area.get('main'):
-                main = sail_area['main']
-                if isinstance(main, dict):
-                    response += f"- Main: {main.get('value', '')} {main.get('unit', '')}\n"
-                else:
-                    response += f"- Main: {main} m²\n"
-            if sail_area.get('jib'):
-                jib = sail_area['jib']
-                if isinstance(jib, dict):
-                    response += f"- Jib: {jib.get('value', '')} {jib.get('unit', '')}\n"
-                else:
-                    response += f"- Jib: {jib} m²\n"
-            if sail_area.get('spinnaker'):
-                spin = sail_area['spinnaker']
-                if isinstance(spin, dict):
-                    response += f"- Spinnaker: {spin.get('value', '')} {spin.get('unit', '')}\n"
-                else:
-                    response += f"- Spinnaker: {spin} m²\n"
-            if sail_area.get('total'):
-                total = sail_area['total']
-                if isinstance(total, dict):
-                    response += f"- Total: {total.get('display', total.get('value', ''))}\n"
-                else:
-                    response += f"- Total: {total} m²\n"
-            response += "\n"
-        
-        # 엔진 정보
-        engine = yacht.get('engine', {})
-        if engine:
-            response += "🔧 **엔진**\n"
-            if engine.get('type'):
-                response += f"- Type: {engine['type']}\n"
-            if engine.get('power'):
-                response += f"- Power: {engine['power']}\n"
-            if engine.get('model'):
-                response += f"- Model: {engine['model']}\n"
-        
-        return response
-    
-    def _build_context(self) -> str:
-        """대화 컨텍스트 구성"""
-        context = self.system_prompt + "\n\n**대화 기록:**\n"
-        recent_history = self.chat_history[-10:]
-        
-        for msg in recent_history:
-            role = "사용자" if msg["role"] == "user" else "어시스턴트"
-            context += f"\n{role}: {msg['content']}\n"
-        
-        return context
-    
-    def _handle_file_upload(self, file_path: str) -> str:
-        """파일 업로드 및 분석 처리 (PDF, Word, HWP, Excel, PPTX 등)"""
-        try:
-            file_name = os.path.basename(file_path)
-            file_ext = self._get_file_extension(file_path)
-            
-            # 지원되는 파일 형식 확인
-            if not self._is_supported_file(file_path):
-                return f"❌ 지원되지 않는 파일 형식입니다.\n\n지원 형식: PDF, Word (.docx, .doc), HWP, 텍스트 (.txt), Excel (.xlsx, .xls), PowerPoint (.pptx, .ppt)"
-            
-            print(f"📄 파일 분석 시작: {file_name} ({file_ext})", flush=True)
-            
-            # 파일 분석 시작 메시지
-            analyzing_msg = f"📄 {file_name} 문서를 분석 중입니다...\n잠시만 기다려주세요! ⏳"
-            
-            self.chat_history.append({
-                "role": "user",
-                "content": f"[파일 업로드: {file_name}]",
-                "timestamp": datetime.now().isoformat()
-            })
-            
-            self.chat_history.append({
-                "role": "assistant",
-                "content": analyzing_msg,
-                "timestamp": datetime.now().isoformat()
-            })
-            
-            # 파일 형식에 따라 텍스트 추출
-            print("📖 텍스트 추출 중...", flush=True)
-            extracted_text = self._extract_text_from_file(file_path)
-            
-            if not extracted_text or len(extracted_text.strip()) < 100:
-                return f"❌ {file_name}에서 텍스트를 추출할 수 없습니다.\n\n파일이 손상되었거나 암호화되어 있을 수 있습니다."
-            
-            # 분석 실행
-            print(f"✅ 텍스트 추출 완료 ({len(extracted_text)} 문자)", flush=True)
-            print("🤖 AI 분석 시작...", flush=True)
-            analysis_result = self._analyze_document_directly(file_path, extracted_text)
-            
-            # 분석 결과 확인
-            if "error" in analysis_result:
-                error_msg = f"❌ 문서 분석 중 오류가 발생했습니다:\n{analysis_result.get('error', '알 수 없는 오류')}"
-                self.chat_history.append({
-                    "role": "assistant",
-                    "content": error_msg,
-                    "timestamp": datetime.now().isoformat()
-                })
-                return error_msg
-            
-            # 분석 결과를 요트 등록 형식으로 변환
-            registration_data = self._convert_analysis_to_registration(analysis_result)
-            
-            # 등록 완료 메시지 생성
-            completion_msg = self._generate_registration_completion_message(analysis_result, registration_data)
-            
-            # 등록 데이터 저장 (메모리 + JSON 파일)
-            self.current_yacht_registration = registration_data
-            
-            # JSON 파일로 저장
-            self._save_registration_to_json(registration_data, analysis_result)
-            
-            # 대화 히스토리에 추가
-            self.chat_history.append({
-                "role": "assistant",
-                "content": completion_msg,
-                "timestamp": datetime.now().isoformat()
-            })
-            
-            print(f"✅ {file_name} 분석 및 등록 준비 완료!")
-            
-            return completion_msg
-            
-        except Exception as e:
-            error_msg = f"❌ 파일 처리 중 오류가 발생했습니다: {str(e)}"
-            print(f"❌ Error: {e}")
-            import traceback
-            traceback.print_exc()
-            
-            self.chat_history.append({
-                "role": "assistant",
-                "content": error_msg,
-                "timestamp": datetime.now().isoformat()
-            })
-            
-            return error_msg
-    
-    def _analyze_document_directly(self, file_path: str, extracted_text: str) -> Dict:
-        """문서 직접 분석 (yacht_document_analyzer 없이)"""
-        # 텍스트가 너무 길면 앞부분만 사용
-        if len(extracted_text) > 30000:
-            extracted_text = extracted_text[:30000] + "\n\n[... 텍스트가 너무 길어 일부만 분석합니다 ...]"
-        
-        if not self.has_gemini:
-            return {
-                "error": "문서 분석 기능은 Gemini API가 필요합니다.",
-                "fileInfo": {
-                    "fileName": os.path.basename(file_path),
-                    "filePath": file_path
-                }
-            }
-        
-        # 분석 프롬프트 (완전한 버전 5.0)
-        prompt = f"""다음은 요트 매뉴얼 또는 부품 정보 문서에서 추출한 텍스트입니다:
-
-{extracted_text}
-
----
-
-## 📋 작업 지시사항 (Schema Version 5.0)
-
-매뉴얼에서 발견한 **모든 정보**를 최대한 상세하게 추출하세요.
-
----
-
-### ✅ 섹션 1: 문서 기본 정보
-```json
-"documentInfo": {{
-  "title": "문서 제목",
-  "yachtModel": "요트 모델명",
-  "manufacturer": "제조사",
-  "documentType": "Owner's Manual / Parts List / Technical Specifications / Class Rules"
-}}
-```
-
----
-
-### ✅ 섹션 2: 요트 기본 스펙
-**standard (표준 필드):**
-- dimensions: LOA, LWL, Beam, Draft, Displacement, mastHeight
-- engine: type, power, model
-- sailArea: mainsail, jib, spinnaker, total
-
-**additional (발견한 모든 추가 정보):**
-- 위 standard에 없는 모든 스펙을 키-값으로 저장
-- 키 이름: camelCase (예: keelWeight, fuelCapacity)
-- 신뢰도: _confidence_{{키이름}}: "high" / "medium" / "low"
-
----
-
-### ✅ 섹션 3: 상세 치수 (Detailed Dimensions)
-**모든 치수 정보를 추출하세요:**
-- LWL, BOA, freeboard (bow/midship/stern)
-- headroom (saloon/cabins/galley)
-- ballastWeight, ballastRatio
-- keel dimensions, rudder dimensions
-- boom length, pole length
-- 신뢰도: _confidence_{{키이름}}
-
----
-
-### ✅ 섹션 4: 외관 (Exterior)
-
-**🔑 중요: 모든 항목에 고유 ID 부여!**
-
-**ID 생성 규칙:**
-- Hull: `ext-hull-01`
-- Keel: `ext-hull-keel-01`
-- Rudder: `ext-hull-rudder-01`
-- Deck: `ext-deck-01`
-- Cockpit: `ext-deck-cockpit-01`
-- Windows: `ext-window-{{location}}-{{number}}`
-- Hatches: `ext-hatch-{{location}}-{{number}}`
-
-**hull:**
-```json
-{{
-  "id": "ext-hull-01",
-  "name": "Hull",
-  "category": "Structure",
-  "manufacturer": "...",
-  "specifications": {{
-    "type": "Monohull",
-    "material": "GRP / Fiberglass / Carbon",
-    "color": "...",
-    "thickness": "...",
-    "gelcoatType": "...",
-    "coreType": "Balsa / Foam / Solid",
-    "_confidence_material": "high",
-    "_additional": {{}}
-  }},
-  "subComponents": [
-    {{
-      "id": "ext-hull-keel-01",
-      "parentId": "ext-hull-01",
-      "name": "Keel",
-      "category": "Hull Structure",
-      "specifications": {{
-        "type": "Fin / Bulb / Canting",
-        "material": "Lead / Iron / Composite",
-        "weight": "...",
-        "draft": "...",
-        "attachmentMethod": "..."
-      }},
-      "maintenanceDetails": {{
-        "interval": 12,
-        "inspectionItems": ["Keel bolts", "Corrosion", "Leakage"],
-        "commonIssues": "...",
-        "repairCost": "..."
-      }}
-    }},
-    {{
-      "id": "ext-hull-rudder-01",
-      "parentId": "ext-hull-01",
-      "name": "Rudder",
-      "specifications": {{
-        "type": "Spade / Skeg-mounted",
-        "material": "...",
-        "dimensions": "..."
-      }}
-    }}
-  ]
-}}
-```
-
-**deck, windows, hatches:** 동일한 구조로 추출
-
----
-
-### ✅ 섹션 5: 앵커 시스템 (Ground Tackle)
-
-**ID 생성 규칙:**
-- Anchors: `anchor-{{type}}-{{number}}`
-- Chain: `anchor-chain-01`
-- Windlass: `anchor-windlass-01`
-- Windlass parts: `anchor-windlass-{{part}}-{{number}}`
-
-```json
-{{
-  "anchors": [
-    {{
-      "id": "anchor-primary-01",
-      "name": "Primary Anchor",
-      "type": "Delta / CQR / Fortress / Rocna",
-      "manufacturer": "...",
-      "model": "...",
-      "specifications": {{
-        "weight": "... kg",
-        "material": "...",
-        "holdingPower": "... kg",
-        "_confidence_weight": "high"
-      }}
-    }}
-  ],
-  "chain": {{
-    "id": "anchor-chain-01",
-    "name": "Anchor Chain",
-    "specifications": {{
-      "material": "Galvanized steel / Stainless",
-      "diameter": "... mm",
-      "length": "... m",
-      "grade": "..."
-    }}
-  }},
-  "windlass": {{
-    "id": "anchor-windlass-01",
-    "name": "Windlass",
-    "manufacturer": "...",
-    "specifications": {{
-      "type": "Electric / Manual / Hydraulic",
-      "power": "...",
-      "maxPull": "..."
-    }},
-    "subComponents": [...]
-  }}
-}}
-```
-
----
-
-### ✅ 섹션 6: 돛 목록 (Sail Inventory)
-
-**ID 생성 규칙:**
-- Mainsail: `sail-main-01`
-- Genoa: `sail-genoa-{{size}}-01`
-- Spinnaker: `sail-spinnaker-01`
-
-```json
-[
-  {{
-    "id": "sail-main-01",
-    "name": "Mainsail",
-    "category": "Sails",
-    "manufacturer": "North Sails / Quantum / UK Sailmakers",
-    "model": "...",
-    "specifications": {{
-      "area": "... m²",
-      "luffLength": "... m",
-      "footLength": "... m",
-      "material": "Dacron / Mylar / 3Di / Carbon",
-      "weight": "... kg",
-      "year": "...",
-      "reefingPoints": 2,
-      "numberOfBattens": 4,
-      "condition": "Excellent / Good / Fair / Poor",
-      "_confidence_area": "high"
-    }},
-    "subComponents": [
-      {{
-        "id": "sail-main-slides-01",
-        "parentId": "sail-main-01",
-        "name": "Sail Slides",
-        "specifications": {{
-          "type": "...",
-          "quantity": 12
-        }}
-      }}
-    ],
-    "maintenanceDetails": {{
-      "interval": 6,
-      "inspectionItems": ["Stitching", "UV cover", "Battens"],
-      "repairCost": "..."
-    }}
-  }}
-]
-```
-
----
-
-### ✅ 섹션 7: 갑판 장비 (Deck Equipment)
-
-**ID 생성 규칙:**
-- Winches: `deck-winch-{{location}}-{{number}}`
-- Cleats: `deck-cleat-{{location}}-{{number}}`
-- Blocks: `deck-block-{{type}}-{{number}}`
+**ID 생성 규칙:**
+- Winches: `deck-winch-{{location}}-{{number}}`
+- Cleats: `deck-cleat-{{location}}-{{number}}`
+- Blocks: `deck-block-{{type}}-{{number}}`
 
 ```json
 {{
@@ -1869,108 +743,1487 @@ PDF 파일 경로를 입력해주세요! 📎"""
 }}
 ```
 
----
+---
+
+### ✅ 섹션 13: 부품 (Parts) - 통합 리스트
+
+**ID: `part-{{category}}-{{name}}-{{number}}`**
+
+모든 부품을 하나의 배열에 통합하세요.
+
+```json
+[
+  {{
+    "id": "part-rigging-mast-01",
+    "name": "Mast",
+    "manufacturer": "Selden / Z-Spars / Hall Spars",
+    "model": "...",
+    "interval": 12,
+    "category": "Rigging",
+    "specifications": {{
+      "material": "Aluminum / Carbon",
+      "length": "... m",
+      "weight": "... kg",
+      "partNumber": "...",
+      "_confidence_length": "high"
+    }},
+    "subParts": [...],
+    "maintenanceDetails": {{
+      "interval": 12,
+      "inspectionItems": ["Corrosion", "Bolts", "Wiring"],
+      "repairCost": "..."
+    }}
+  }}
+]
+```
+
+---
+
+### ✅ 섹션 14: 유지보수 (Maintenance)
+
+```json
+[
+  {{
+    "item": "...",
+    "interval": "... 개월",
+    "method": "..."
+  }}
+]
+```
+
+---
+
+### ✅ 섹션 15: 분석 결과 (Analysis Result)
+
+```json
+{{
+  "canExtractText": true/false,
+  "canAnalyze": true/false,
+  "reason": "요트 매뉴얼이 아닌 경우 이유 설명"
+}}
+```
+
+---
+
+## 🎯 최종 응답 형식
+
+```json
+{{
+  "schemaVersion": "5.0",
+  "analyzedAt": "2025-11-20T10:30:00Z",
+  "documentInfo": {{...}},
+  "yachtSpecs": {{
+    "standard": {{...}},
+    "additional": {{...}}
+  }},
+  "detailedDimensions": {{...}},
+  "exterior": {{...}},
+  "groundTackle": {{...}},
+  "sailInventory": [...],
+  "deckEquipment": {{...}},
+  "accommodations": {{...}},
+  "tanks": {{...}},
+  "electricalSystem": {{...}},
+  "electronics": {{...}},
+  "plumbingSystem": {{...}},
+  "parts": [...],
+  "maintenance": [...],
+  "analysisResult": {{...}}
+}}
+```
+
+---
+
+## ⚠️ 중요 규칙
+
+1. **ID 필수**: 모든 항목에 고유 ID 부여
+2. **부모-자식 관계**: subComponents/subParts에 parentId 추가
+3. **신뢰도**: 중요 필드에 _confidence 추가
+4. **확장성**: _additional 필드 활용
+5. **중복 방지**: standard에 있는 정보는 additional에 추가 금지
+6. **추측 금지**: 불확실하면 null
+7. **JSON만**: 다른 설명 불필요
+
+**JSON 형식으로만 응답해주세요.**"""
+DOCUMENT_ANALYSIS_PROMPT_VERSION = hashlib.sha256(
+    (ANALYSIS_SCHEMA_VERSION + DOCUMENT_ANALYSIS_PROMPT_TEMPLATE).encode('utf-8')
+).hexdigest()[:12]
+
+
+class UnifiedYachtChatbot:
+    """
+    통합 요트 챗봇 클래스
+    모든 챗봇 기능을 통합
+    """
+    
+    def __init__(self, api_key: str = None, mode: str = "interactive", catalog_store: Optional[CatalogStore] = None):
+        """
+        통합 챗봇 초기화
+        
+        Args:
+            api_key: Gemini API 키 (기본값: 제공된 API 키)
+            mode: 실행 모드 ("interactive", "api", "cli")
+            catalog_store: 요트 카탈로그 저장소 (기본값: 프로세스 공유 저장소)
+        """
+        self.mode = mode
+        # API 키 우선순위: 인자 > 환경변수 (.env 파일) > 없으면 오류
+        self.api_key = api_key or os.getenv('GEMINI_API_KEY')
+        if not self.api_key:
+            print("⚠️ 경고: GEMINI_API_KEY가 설정되지 않았습니다.")
+            print("💡 .env 파일에 GEMINI_API_KEY를 설정하거나 --api-key 옵션을 사용하세요.")
+            print("📝 .env.example 파일을 참고하여 .env 파일을 생성하세요.")
+        
+        # Gemini AI 초기화
+        if HAS_GEMINI and self.api_key:
+            genai.configure(api_key=self.api_key)
+            try:
+                self.model = genai.GenerativeModel('gemini-2.5-flash')
+                print("✅ Gemini 2.5 Flash 모델 사용")
+            except Exception as e:
+                print(f"⚠️ Gemini 2.5 Flash 사용 실패, gemini-pro로 전환: {e}")
+                self.model = genai.GenerativeModel('gemini-pro')
+                print("✅ gemini-pro 모델 사용 (fallback)")
+            # 요청 한도 / 재시도 / 시간 제한 / 요청 병합 (같은 API 키의 모든 세션이 공유)
+            self.model = GeminiClient(self.model, api_key=self.api_key)
+            self.has_gemini = True
+        else:
+            self.has_gemini = False
+            print("⚠️ Gemini AI를 사용할 수 없습니다. 기본 모드로 실행됩니다.")
+        
+        # 대화 히스토리
+        self.chat_history: List[Dict[str, str]] = []
+        
+        # 요트 데이터 (프로세스 전체에서 공유하는 카탈로그를 참조)
+        self.catalog_store = catalog_store or get_shared_catalog_store()
+        self.catalog_store.get()
+        
+        # 키워드 의도 분류기 (프로세스 공유, 한 번만 컴파일)
+        self.intent_router = get_intent_router()
+        
+        # 등록 데이터
+        self.current_yacht_registration = None
+        
+        # 정형 답변 생성 함수 (_answer_builders에서 한 번만 생성)
+        self._answer_builder_map: Optional[Dict[str, Callable[[Dict], str]]] = None
+        
+        print("✅ HooAah Yacht 통합 챗봇이 준비되었습니다!")
+        if mode == "interactive":
+            print("💬 자연스럽게 요트에 대해 질문해보세요.")
+            print("📄 PDF 파일 경로를 입력하면 자동으로 분석합니다.\n")
+    
+    @property
+    def catalog(self) -> YachtCatalog:
+        """현재 요트 카탈로그 스냅샷 (읽기 전용)"""
+        return self.catalog_store.get()
+    
+    @property
+    def catalog_db(self) -> Optional[CatalogDatabase]:
+        """SQLite 카탈로그 (요트 단위 조회용, JSON 백엔드면 None)"""
+        return self.catalog_store.database
+    
+    @property
+    def yacht_data(self) -> Dict:
+        """요트 스펙 데이터 (공유 카탈로그)"""
+        return self.catalog.yacht_data
+    
+    @property
+    def parts_data(self) -> Dict:
+        """부품 데이터 (공유 카탈로그)"""
+        return self.catalog.parts_data
+    
+    @property
+    def system_prompt(self) -> str:
+        """시스템 프롬프트 (카탈로그 스냅샷당 한 번만 생성)"""
+        return self.catalog.memo('system_prompt', self._create_system_prompt)
+    
+    def _create_system_prompt(self) -> str:
+        """시스템 프롬프트 생성"""
+        yacht_list = self.catalog.yacht_names()
+        
+        prompt = f"""당신은 HooAah Yacht의 전문 AI 어시스턴트입니다.
+
+**역할:**
+- 요트 소유자와 관리자를 돕는 친절하고 전문적인 어시스턴트
+- 요트 스펙, 부품, 정비, 관리에 대한 모든 질문에 답변
+- 자연스럽고 대화적인 톤으로 소통
+- 사용자의 의도를 파악하여 적절한 응답 제공
+
+**지원하는 요트 20종:**
+{', '.join(yacht_list)}
+
+**데이터베이스 구조 (ERD 기반):**
+- User: 사용자 정보
+- Yacht: 요트 정보 (name)
+- Yacht_User: 사용자-요트 연결 (다대다 관계)
+- Part: 부품 정보 (name, manufacturer, model, interval)
+- Repair: 정비 내역 (repairDate만 저장, content 필드 없음)
+- Calendar: 캘린더 이벤트 (content 필드 있음, part_id와 연결)
+- Alert: 알림 (part_id와 일대일 관계)
+
+**의도 파악 및 응답 가이드라인:**
+
+1. **요트 정보 조회 의도:**
+   - 키워드: "정보", "스펙", "사양", "크기", "치수", "길이", "폭", "높이", 요트 이름 등
+   - 응답: 해당 요트의 상세 정보 제공 (치수, 엔진, 돛 면적 등)
+
+2. **요트 등록/PDF 업로드 의도:**
+   - 키워드: "등록", "업로드", "pdf", "문서", "매뉴얼", "새 요트", "요트 등록", "추가", "입력" 등
+   - 응답: PDF 파일 업로드 안내 메시지 반환
+   - 예시 문장:
+     * "새 요트 등록하고 싶어요"
+     * "pdf 매뉴얼 업로드해줘"
+     * "요트 정보 추가할게"
+     * "문서 등록하고 싶어"
+     * "매뉴얼 파일 올릴 수 있어?"
+
+3. **도움말 요청 의도:**
+   - 키워드: "도움말", "도움", "help", "사용법", "어떻게", "방법", "사용", "사용법", "가이드" 등
+   - 응답: 도움말 메시지 반환
 
-### ✅ 섹션 13: 부품 (Parts) - 통합 리스트
+4. **요트 목록 조회 의도:**
+   - 키워드: "목록", "리스트", "전체", "모든 요트", "어떤 요트", "요트 종류" 등
+   - 응답: 요트 목록 반환
 
-**ID: `part-{{category}}-{{name}}-{{number}}`**
+5. **요트 비교 의도:**
+   - 키워드: "비교", "차이", "어떤 게", "vs", "대" 등
+   - 응답: 여러 요트를 비교하여 차이점 설명
 
-모든 부품을 하나의 배열에 통합하세요.
+6. **요트 추천 의도:**
+   - 키워드: "추천", "어떤 게 좋아", "선택", "고르" 등
+   - 응답: 사용 목적에 맞는 요트 추천
 
-```json
-[
-  {{
-    "id": "part-rigging-mast-01",
-    "name": "Mast",
-    "manufacturer": "Selden / Z-Spars / Hall Spars",
-    "model": "...",
-    "interval": 12,
-    "category": "Rigging",
-    "specifications": {{
-      "material": "Aluminum / Carbon",
-      "length": "... m",
-      "weight": "... kg",
-      "partNumber": "...",
-      "_confidence_length": "high"
-    }},
-    "subParts": [...],
-    "maintenanceDetails": {{
-      "interval": 12,
-      "inspectionItems": ["Corrosion", "Bolts", "Wiring"],
-      "repairCost": "..."
-    }}
-  }}
-]
-```
+7. **정비/관리 질문:**
+   - 키워드: "정비", "관리", "주기", "점검", "교체" 등
+   - 응답: 정비 주기, 정비 이력, 관리 방법 안내
 
----
+**답변 형식:**
+- 짧고 명확하게 (모바일 화면에 적합)
+- 필요시 이모지 사용 (⛵, 🔧, 📏, ⚓ 등)
+- 숫자는 단위와 함께 명시
+- 추가 질문 유도
 
-### ✅ 섹션 14: 유지보수 (Maintenance)
+**중요:**
+- 사용자의 의도를 정확히 파악하여 적절한 응답 제공
+- 자연어로 된 모든 요청을 이해하고 처리
+- 특정 명령어가 아닌 관련 키워드만 있어도 의도 파악
+- 모르는 내용은 솔직히 모른다고 답변
 
-```json
-[
-  {{
-    "item": "...",
-    "interval": "... 개월",
-    "method": "..."
-  }}
-]
-```
+**데이터 활용:**
+질문마다 검색 인덱스에서 찾은 관련 자료 (요트 스펙, 부품, 매뉴얼 본문)가 함께 제공됩니다.
+관련 자료를 참고하여 정확한 정보를 제공하고, 자료에 없는 내용은 추측하지 마세요.
+"""
+        return prompt
+    
+    def _retrieve_context(self, user_message: str) -> str:
+        """
+        질문과 관련된 자료 검색 (스펙/부품/매뉴얼 조각 상위 k개)
+        
+        메시지에 요트 이름이 있으면 해당 요트 자료를 우선합니다.
+        검색 인덱스를 쓸 수 없으면 빈 문자열을 반환합니다.
+        """
+        search_index = get_shared_search_index()
+        if search_index is None:
+            return ""
+        catalog = self.catalog
+        try:
+            search_index.index_catalog(catalog)
+            yacht_name = catalog.name_matcher.match(user_message)
+            yacht_id = catalog.get_yacht_id(yacht_name) if yacht_name else None
+            return search_index.build_context(user_message, yacht_id=yacht_id)
+        except Exception as e:
+            print(f"⚠️ 관련 자료 검색 실패: {e}")
+            return ""
+    
+    def _get_file_extension(self, file_path: str) -> str:
+        """파일 확장자 추출"""
+        return os.path.splitext(file_path)[1].lower()
+    
+    def _is_supported_file(self, file_path: str) -> bool:
+        """지원되는 파일 형식인지 확인"""
+        ext = self._get_file_extension(file_path)
+        supported_extensions = ['.pdf', '.docx', '.doc', '.hwp', '.txt', '.xlsx', '.xls', '.pptx', '.ppt']
+        return ext in supported_extensions
+    
+    def _extract_file_path_from_message(self, message: str) -> Optional[str]:
+        """
+        사용자 메시지에서 파일 경로 추출 (PDF, Word, HWP 등)
+        모바일 앱에서 전달된 파일 경로도 지원 (iOS, Android)
+        """
+        import re
+        
+        # 지원되는 파일 확장자
+        supported_exts = r'(?:pdf|docx?|hwp|txt|xlsx?)'
+        
+        # 1. 따옴표로 감싸진 경로 찾기 (공백 포함 경로 지원)
+        quoted_patterns = [
+            rf'["\']([^"\']+\.{supported_exts})["\']',
+            rf'["\']([^"\']+\.{supported_exts})',
+            rf'([^"\']+\.{supported_exts})["\']',
+        ]
+        
+        for pattern in quoted_patterns:
+            match = re.search(pattern, message, re.IGNORECASE)
+            if match:
+                path = match.group(1).strip()
+                if os.path.exists(path):
+                    return os.path.abspath(path)
+        
+        # 2. Windows 절대 경로 패턴
+        windows_abs_pattern = rf'([A-Za-z]:[\\/](?:[^"\']+[\\/])*[^"\']+\.{supported_exts})'
+        match = re.search(windows_abs_pattern, message, re.IGNORECASE)
+        if match:
+            path = match.group(1).strip()
+            if os.path.exists(path):
+                return os.path.abspath(path)
+        
+        # 3. Unix/Linux/Mac 절대 경로 패턴
+        unix_abs_pattern = rf'(/[^"\']+\.{supported_exts})'
+        match = re.search(unix_abs_pattern, message, re.IGNORECASE)
+        if match:
+            path = match.group(1).strip()
+            if os.path.exists(path):
+                return os.path.abspath(path)
+        
+        # 4. 모바일 앱 경로 패턴
+        mobile_patterns = [
+            rf'(/storage/[^"\']+\.{supported_exts})',  # Android
+            rf'(/var/mobile/[^"\']+\.{supported_exts})',  # iOS
+            rf'(/data/[^"\']+\.{supported_exts})',  # Android data
+            rf'(file://[^"\']+\.{supported_exts})',  # file:// URI
+        ]
+        
+        for pattern in mobile_patterns:
+            match = re.search(pattern, message, re.IGNORECASE)
+            if match:
+                path = match.group(1).strip()
+                if path.startswith('file://'):
+                    path = path.replace('file://', '')
+                if os.path.exists(path):
+                    return os.path.abspath(path)
+        
+        # 5. 메시지 전체가 파일 경로인지 확인
+        message_clean = message.strip().strip('"').strip("'")
+        
+        if os.path.isabs(message_clean) and self._is_supported_file(message_clean):
+            if os.path.exists(message_clean):
+                return os.path.abspath(message_clean)
+        
+        if self._is_supported_file(message_clean):
+            if os.path.exists(message_clean):
+                return os.path.abspath(message_clean)
+            abs_path = os.path.abspath(message_clean)
+            if os.path.exists(abs_path):
+                return abs_path
+        
+        return None
+    
+    def _extract_pdf_path_from_message(self, message: str) -> Optional[str]:
+        """메시지에서 PDF 파일 경로 추출 (하위 호환성)"""
+        return self._extract_file_path_from_message(message)
+    
+    def _is_pdf_upload_request(self, message: str) -> bool:
+        """파일 업로드 요청인지 확인 (PDF, Word, HWP 등)"""
+        file_keywords = ['pdf', 'docx', 'doc', 'hwp', 'word', '문서', '매뉴얼', '업로드', '등록', '파일']
+        return any(keyword in message.lower() for keyword in file_keywords) or \
+               self._extract_file_path_from_message(message) is not None
+    
+    def _is_registration_request(self, message: str) -> bool:
+        """요트 등록 요청인지 확인"""
+        return self.intent_router.route(message).registration is not None
+    
+    def _handle_registration_request(self, user_message: str, route: Optional[Route] = None) -> str:
+        """요트 등록/부품 추가 요청 처리"""
+        route = route or self.intent_router.route(user_message)
+        
+        # 부품 추가 요청인지 확인
+        if route.registration == 'parts_registration':
+            # 기존 요트에 부품 추가
+            yacht_name = self._extract_yacht_name_from_message(user_message)
+            if yacht_name:
+                return f"""📦 **{yacht_name} 부품 추가**
 
----
+부품을 추가하려면 다음 방법 중 하나를 선택하세요:
 
-### ✅ 섹션 15: 분석 결과 (Analysis Result)
+1. **PDF 매뉴얼 업로드** (권장)
+   - PDF 파일 경로를 입력하세요
+   - 예: `data/yachtpdf/manual.pdf`
 
-```json
-{{
-  "canExtractText": true/false,
-  "canAnalyze": true/false,
-  "reason": "요트 매뉴얼이 아닌 경우 이유 설명"
-}}
-```
+2. **수동 입력** (준비 중)
+   - 곧 지원 예정입니다
 
----
+PDF 파일 경로를 입력해주세요! 📎"""
+            else:
+                return """📦 **부품 추가**
 
-## 🎯 최종 응답 형식
+어떤 요트에 부품을 추가하시겠어요?
 
-```json
-{{
-  "schemaVersion": "5.0",
-  "analyzedAt": "2025-11-20T10:30:00Z",
-  "documentInfo": {{...}},
-  "yachtSpecs": {{
-    "standard": {{...}},
-    "additional": {{...}}
-  }},
-  "detailedDimensions": {{...}},
-  "exterior": {{...}},
-  "groundTackle": {{...}},
-  "sailInventory": [...],
-  "deckEquipment": {{...}},
-  "accommodations": {{...}},
-  "tanks": {{...}},
-  "electricalSystem": {{...}},
-  "electronics": {{...}},
-  "plumbingSystem": {{...}},
-  "parts": [...],
-  "maintenance": [...],
-  "analysisResult": {{...}}
-}}
-```
+1. 요트 이름을 알려주세요
+   예: "Farr 40 부품 추가"
+
+2. PDF 매뉴얼 파일 경로를 입력하세요
+   예: `data/yachtpdf/manual.pdf`
+
+요트 이름 또는 PDF 파일 경로를 입력해주세요! 📎"""
+        
+        # 일반 요트 등록 요청
+        return self._suggest_pdf_upload()
+    
+    def _is_yacht_info_request(self, message: str) -> bool:
+        """요트 정보 요청인지 확인"""
+        info_keywords = ['정보', '스펙', '사양', '크기', '치수', '길이', '폭', '높이', '추천']
+        
+        message_lower = message.lower()
+        return any(keyword in message_lower for keyword in info_keywords) or \
+               self.catalog.name_matcher.match(message) is not None
+    
+    def chat(self, user_message: str, pdf_file_path: str = None) -> str:
+        """
+        사용자 메시지에 대한 응답 생성
+        
+        Args:
+            user_message: 사용자 입력 메시지
+            pdf_file_path: PDF 파일 경로 (모바일 앱에서 직접 전달되는 경우)
+            
+        Returns:
+            AI 응답 메시지
+        """
+        try:
+            response, record_history = self._respond_without_ai(user_message, pdf_file_path)
+            
+            # 6. Gemini AI로 의도 파악 및 응답 생성
+            if response is None:
+                # AI 응답 생성 시작 표시 (즉시)
+                print("🤖 AI가 생각 중입니다...", end="", flush=True)
+                # 분석 요청인 경우 추가 메시지
+                if any(keyword in user_message.lower() for keyword in ['분석', '분석해줘', '분석해주세요', '상세 분석']):
+                    print(" (상세 분석 중) ⏳", flush=True)
+                else:
+                    print(" ⏳", flush=True)
+                # AI가 의도를 파악하여 적절한 응답 생성
+                response = self._generate_intelligent_response(user_message)
+                # 완료 표시 (줄바꿈)
+                print("\r" + " " * 80 + "\r", end="", flush=True)  # 이전 메시지 지우기
+            
+            # 7. 대화 히스토리에 추가
+            if record_history:
+                self._record_assistant_message(response)
+            
+            return response
+            
+        except Exception as e:
+            error_msg = f"죄송합니다. 응답 생성 중 오류가 발생했습니다: {str(e)}"
+            print(f"❌ Error: {e}")
+            return error_msg
+    
+    def chat_stream(self, user_message: str, pdf_file_path: str = None) -> Iterator[Dict[str, str]]:
+        """
+        사용자 메시지에 대한 응답을 이벤트로 나누어 생성 (스트리밍)
+        
+        이벤트:
+        - {"event": "delta", "text": ...}: AI 응답 조각 (받는 즉시 전달)
+        - {"event": "replace", "text": ...}: 후처리로 응답 전체가 바뀐 경우 (이전 조각 대체)
+        - {"event": "done", "text": ...}: 최종 응답 전체
+        - {"event": "error", "text": ...}: 오류 메시지
+        
+        AI를 거치지 않는 빠른 응답 (명령어, 간단한 질문 등)은 done 이벤트 하나로 전달됩니다.
+        """
+        try:
+            response, record_history = self._respond_without_ai(user_message, pdf_file_path)
+            
+            if response is None:
+                parts = []
+                replaced = None
+                for event in self._stream_intelligent_response(user_message):
+                    if event["event"] == "delta":
+                        parts.append(event["text"])
+                    else:
+                        replaced = event["text"]
+                    yield event
+                response = replaced if replaced is not None else "".join(parts).strip()
+            
+            if record_history:
+                self._record_assistant_message(response)
+            
+            yield {"event": "done", "text": response}
+            
+        except Exception as e:
+            print(f"❌ Error: {e}")
+            yield {"event": "error", "text": f"죄송합니다. 응답 생성 중 오류가 발생했습니다: {str(e)}"}
+    
+    def _respond_without_ai(self, user_message: str, pdf_file_path: str = None) -> Tuple[Optional[str], bool]:
+        """
+        AI 호출 없이 처리할 수 있는 메시지 처리
+        
+        Returns:
+            (응답, 대화 기록 여부) - 응답이 None이면 Gemini AI 응답이 필요
+        """
+        # 1. 직접 전달된 파일 경로 확인 (모바일 앱에서 파일 업로드)
+        if pdf_file_path and os.path.exists(pdf_file_path):
+            return self._handle_file_upload(pdf_file_path), False
+        
+        # 2. 메시지에서 PDF 파일 경로 추출
+        pdf_path = self._extract_pdf_path_from_message(user_message)
+        if pdf_path and os.path.exists(pdf_path):
+            # 즉시 피드백
+            print(f"\n📥 파일을 인식했습니다: {os.path.basename(pdf_path)}")
+            print("⏳ 분석을 시작합니다. 잠시만 기다려주세요...\n")
+            sys.stdout.flush()
+            return self._handle_file_upload(pdf_path), False
+        
+        # 3. 명령어 처리 (빠른 응답)
+        message_lower = user_message.lower().strip()
+        if message_lower in ['/list', '/목록']:
+            return self._list_yachts(), False
+        
+        if message_lower in ['/info', '/정보']:
+            return self._get_data_info(), False
+        
+        if message_lower in ['/help', '/도움말']:
+            return self._get_help(), False
+        
+        # 4. 대화 히스토리에 추가
+        self.chat_history.append({
+            "role": "user",
+            "content": user_message,
+            "timestamp": datetime.now().isoformat()
+        })
+        
+        # 키워드 표 전체를 한 번에 매칭 (이후 단계는 이 결과만 사용)
+        route = self.intent_router.route(user_message)
+        
+        # 5. 간단한 질문 먼저 처리 (크기, 부품 개수 등)
+        simple_response = self._handle_simple_questions(user_message, route)
+        if simple_response:
+            return simple_response, True
+        # 5-1. 요트 등록/부품 추가 요청 처리
+        if route.registration is not None:
+            return self._handle_registration_request(user_message, route), True
+        # 5-2. 의도가 분명한 일반 요청 (도움말, 목록, PDF 업로드, 분석)은 AI 분류 없이 응답
+        if self.has_gemini and route.intent is not None:
+            return self._respond_to_intent(user_message, route.intent), True
+        # 6. Gemini AI 응답 필요 (의도가 모호한 경우)
+        if self.has_gemini:
+            return None, True
+        # 기본 모드: 키워드 기반 응답
+        return self._generate_keyword_based_response(user_message, route), True
+    
+    def _respond_to_intent(self, user_message: str, intent: str) -> str:
+        """확정된 일반 의도에 대한 응답 (_postprocess_intelligent_response와 같은 응답)"""
+        if intent == 'help':
+            return self._get_help()
+        if intent == 'list':
+            return self._list_yachts()
+        if intent == 'upload':
+            return self._suggest_pdf_upload() if self.has_gemini else self._suggest_pdf_upload_without_ai()
+        # analysis
+        yacht_name = self._extract_yacht_name_from_message(user_message)
+        if yacht_name:
+            return self._analyze_yacht_data(yacht_name)
+        return "어떤 요트를 분석하시겠어요? 요트 이름을 알려주시면 상세 분석을 제공해드리겠습니다.\n예: 'Farr 40 분석해줘'"
+    
+    def _record_assistant_message(self, response: str):
+        self.chat_history.append({
+            "role": "assistant",
+            "content": response,
+            "timestamp": datetime.now().isoformat()
+        })
+    
+    def _build_intent_prompt(self, user_message: str) -> str:
+        """의도 파악을 위한 프롬프트 (질문과 관련된 자료만 포함)"""
+        related = self._retrieve_context(user_message)
+        related_section = f"""
+**관련 자료 (검색 결과):**
+{related}
+""" if related else ""
+        return f"""사용자 메시지: "{user_message}"
+{related_section}
+위 메시지를 분석하여 사용자의 의도를 파악하고 적절한 응답을 생성해주세요.
 
----
+**의도 분류:**
+1. **요트 정보 조회**: 요트 이름, 스펙, 치수 등에 대한 질문
+2. **요트 등록/PDF 업로드**: 새 요트를 등록하거나 PDF 매뉴얼을 업로드하려는 의도
+3. **요트 분석 요청**: 기존 요트 데이터를 분석하거나 상세 분석을 요청하는 의도 (키워드: "분석", "분석해줘", "분석해주세요", "상세 분석", "데이터 분석" 등)
+4. **도움말 요청**: 사용법, 가이드, 도움말을 요청하는 의도
+5. **요트 목록 조회**: 전체 요트 목록을 보려는 의도
+6. **요트 비교/추천**: 여러 요트를 비교하거나 추천을 요청하는 의도
+7. **정비/관리 질문**: 정비 주기, 관리 방법 등에 대한 질문
+8. **일반 대화**: 기타 요트 관련 질문
 
-## ⚠️ 중요 규칙
+**응답 규칙:**
+- 요트 등록/PDF 업로드 의도가 감지되면: PDF 파일 업로드 안내 메시지를 반환
+- 요트 분석 요청 의도가 감지되면: 해당 요트의 상세 분석 정보를 제공 (스펙, 부품, 정비 주기, 특징 등 종합 분석)
+- 도움말 요청 의도가 감지되면: 도움말 내용을 반환
+- 요트 목록 조회 의도가 감지되면: 요트 목록을 반환
+- 요트 정보 조회 의도가 감지되면: 해당 요트의 상세 정보를 제공
+- 그 외: 자연스럽게 답변
 
-1. **ID 필수**: 모든 항목에 고유 ID 부여
-2. **부모-자식 관계**: subComponents/subParts에 parentId 추가
-3. **신뢰도**: 중요 필드에 _confidence 추가
-4. **확장성**: _additional 필드 활용
-5. **중복 방지**: standard에 있는 정보는 additional에 추가 금지
-6. **추측 금지**: 불확실하면 null
-7. **JSON만**: 다른 설명 불필요
+**지원하는 요트 20종:**
+{', '.join(self.catalog.yacht_names())}
 
-**JSON 형식으로만 응답해주세요.**"""
+위 규칙에 따라 사용자에게 적절한 응답을 생성해주세요. 요트 정보는 관련 자료를 근거로 답변하세요."""
+    
+    def _generate_intelligent_response(self, user_message: str) -> str:
+        """Gemini AI를 사용한 지능형 응답 생성 (의도 파악)"""
+        try:
+            # 의도 파악 및 응답 생성 (같은 질문은 캐시된 응답 사용)
+            yacht_id, version = self._response_cache_scope(user_message)
+            ai_response = self._cached_model_response(
+                'intent', user_message, yacht_id, version,
+                lambda: self.model.generate_content(self._build_intent_prompt(user_message)).text.strip()
+            )
+            return self._postprocess_intelligent_response(user_message, ai_response)
+            
+        except Exception as e:
+            # 오류 발생 시 키워드 기반 응답으로 fallback
+            return self._generate_keyword_based_response(user_message)
+    
+    def _stream_intelligent_response(self, user_message: str) -> Iterator[Dict[str, str]]:
+        """
+        _generate_intelligent_response의 스트리밍 버전
+        
+        Gemini 응답 조각을 delta 이벤트로 바로 전달하고, 다 받은 뒤 후처리로
+        응답이 바뀌면 (PDF 업로드 안내, 도움말 등) replace 이벤트를 보냅니다.
+        """
+        parts = []
+        try:
+            # 캐시된 응답이 있으면 조각 하나로 바로 전달
+            yacht_id, version = self._response_cache_scope(user_message)
+            llm_cache = get_shared_llm_cache()
+            cached = llm_cache.get('intent', user_message, yacht_id, version) if llm_cache is not None else None
+            chunks = [cached] if cached is not None else self._stream_model_text(self._build_intent_prompt(user_message))
+            for text in chunks:
+                # 첫 조각의 앞쪽 공백 제거 (비스트리밍 응답의 strip()과 동일하게)
+                if not parts:
+                    text = text.lstrip()
+                    if not text:
+                        continue
+                parts.append(text)
+                yield {"event": "delta", "text": text}
+            
+            ai_response = "".join(parts).strip()
+            if cached is None and llm_cache is not None:
+                llm_cache.put('intent', user_message, yacht_id, version, ai_response)
+            final_response = self._postprocess_intelligent_response(user_message, ai_response)
+        except Exception as e:
+            # 오류 발생 시 키워드 기반 응답으로 fallback
+            ai_response = None
+            final_response = self._generate_keyword_based_response(user_message)
+        
+        if final_response != ai_response:
+            yield {"event": "replace", "text": final_response}
+    
+    def _response_cache_scope(self, user_message: str) -> Tuple[Optional[str], str]:
+        """LLM 응답 캐시 범위: (질문에서 찾은 요트 ID, 카탈로그 버전)"""
+        catalog = self.catalog
+        yacht_name = self._extract_yacht_name_from_message(user_message)
+        yacht_id = catalog.get_yacht_id(yacht_name) if yacht_name else None
+        return yacht_id, catalog.version
+    
+    def _cached_model_response(self, kind: str, question: str, yacht_id: Optional[str], version: str,
+                               generate: Callable[[], str]) -> str:
+        """LLM 응답 캐시 조회 후 없으면 generate()로 모델 호출 (캐시를 쓸 수 없으면 바로 호출)"""
+        llm_cache = get_shared_llm_cache()
+        if llm_cache is None:
+            return generate()
+        return llm_cache.get_or_generate(kind, question, yacht_id, version, generate)
+    
+    def _stream_model_text(self, prompt: str) -> Iterator[str]:
+        """모델 응답 텍스트를 조각 단위로 반환 (스트리밍을 지원하지 않는 모델은 한 번에)"""
+        try:
+            stream = self.model.generate_content(prompt, stream=True)
+        except TypeError:
+            # stream 인자를 받지 않는 로컬 대체 모델
+            yield self.model.generate_content(prompt).text
+            return
+        for chunk in stream:
+            try:
+                text = chunk.text
+            except ValueError:
+                # 안전 필터 등으로 텍스트가 없는 조각
+                continue
+            if text:
+                yield text
+    
+    def _postprocess_intelligent_response(self, user_message: str, ai_response: str) -> str:
+        """AI 응답 후처리 (PDF 업로드, 분석, 도움말 등 특수 응답으로 대체)"""
+        ai_response_lower = ai_response.lower()
+        user_message_lower = user_message.lower()
+        
+        # PDF 업로드 의도가 명확한 경우
+        if any(keyword in ai_response_lower for keyword in ['pdf', '업로드', '등록', '파일 경로']):
+            # PDF 업로드 안내 메시지로 대체
+            return self._suggest_pdf_upload()
+        
+        # 요트 분석 의도가 명확한 경우
+        if any(keyword in user_message_lower for keyword in ['분석', '분석해줘', '분석해주세요', '상세 분석', '데이터 분석', '요트 분석']):
+            # 요트 이름이 포함되어 있으면 해당 요트 분석, 없으면 전체 분석 안내
+            yacht_name = self._extract_yacht_name_from_message(user_message)
+            if yacht_name:
+                return self._analyze_yacht_data(yacht_name)
+            else:
+                return "어떤 요트를 분석하시겠어요? 요트 이름을 알려주시면 상세 분석을 제공해드리겠습니다.\n예: 'Farr 40 분석해줘'"
+        
+        # 도움말 의도가 명확한 경우
+        if any(keyword in ai_response_lower for keyword in ['도움말', '사용법', '가이드']):
+            # 도움말 메시지로 대체
+            return self._get_help()
+        
+        # 요트 목록 의도가 명확한 경우
+        if any(keyword in ai_response_lower for keyword in ['목록', '리스트', '전체 요트']):
+            # 요트 목록으로 대체
+            return self._list_yachts()
+        
+        # 일반 응답 반환
+        return ai_response
+    
+    def _generate_keyword_based_response(self, user_message: str, route: Optional[Route] = None) -> str:
+        """
+        키워드 기반 응답 생성 (Gemini AI 없을 때)
+        
+        점수와 관계없이 키워드가 맞은 의도 중 우선순위가 가장 높은 것으로 응답합니다.
+        (도움말 → PDF 업로드/등록 → 분석 → 요트 목록 → 요트 정보)
+        """
+        route = route or self.intent_router.route(user_message)
+        intent = IntentRouter.first_general_intent(route)
+        if intent == 'upload':
+            return self._suggest_pdf_upload_without_ai()
+        if intent is not None:
+            return self._respond_to_intent(user_message, intent)
+        
+        # 요트 정보 조회 (기존 로직)
+        return self._generate_basic_response(user_message)
+    
+    def _generate_ai_response(self, user_message: str) -> str:
+        """Gemini AI를 사용한 응답 생성"""
+        try:
+            context = self._build_context()
+            related = self._retrieve_context(user_message)
+            if related:
+                context += f"\n\n**관련 자료 (검색 결과):**\n{related}\n"
+            response = self.model.generate_content(context)
+            return response.text
+        except Exception as e:
+            return f"AI 응답 생성 중 오류가 발생했습니다: {str(e)}"
+    
+    def _generate_basic_response(self, user_message: str) -> str:
+        """기본 모드 응답 생성 (Gemini AI 없이)"""
+        # 요트 이름 찾기 (이름 인덱스로 한 번에 매칭)
+        yacht_name = self.catalog.name_matcher.match(user_message)
+        if yacht_name:
+            yacht = self.catalog.find_yacht(yacht_name)
+            if yacht:
+                return self._formatted_answer(yacht, 'full_info')
+        
+        return "죄송합니다. 요트 정보를 찾을 수 없습니다. '/list' 명령어로 요트 목록을 확인하세요."
+    
+    def _handle_simple_questions(self, user_message: str, route: Optional[Route] = None) -> Optional[str]:
+        """간단한 질문 처리 (크기, 부품 개수 등)"""
+        # 요트 이름 추출
+        yacht_name = self._extract_yacht_name_from_message(user_message)
+        if not yacht_name:
+            return None
+        
+        # 요트 찾기
+        yacht = self.catalog.find_yacht(yacht_name)
+        if not yacht:
+            return None
+        
+        # 키워드 우선순위: 개별 치수 → 돛 면적 → 전체 치수 → 부품 개수 → 엔진 → 정비 → 부품 → 제조사 → 유형 → 기본 정보
+        route = route or self.intent_router.route(user_message)
+        question = route.yacht_question
+        
+        # 1. 특정 치수 요소 질문 (개별 처리)
+        if question in SPECIFIC_DIMENSIONS:
+            return self._formatted_answer(yacht, question)
+        
+        # 세일링/돛 면적
+        if question == 'sail_area':
+            return self._formatted_answer(yacht, 'sail_area')
+        
+        # 크기/치수 질문 (전체)
+        if question == 'dimensions':
+            return self._formatted_answer(yacht, 'dimensions')
+        
+        # 2. 부품 개수 질문
+        if question == 'parts_count':
+            parts = self._get_yacht_parts(yacht_name)
+            parts_count = len(parts) if isinstance(parts, list) else 0
+            if parts_count > 0:
+                return f"📦 **{yacht_name} 부품 정보**\n\n총 **{parts_count}개**의 부품이 등록되어 있습니다.\n\n더 자세한 정보를 원하시면 '{yacht_name} 분석해줘'라고 물어보세요."
+            else:
+                return f"📦 **{yacht_name} 부품 정보**\n\n현재 등록된 부품이 없습니다.\n\n부품 정보를 추가하려면 PDF 매뉴얼을 업로드해주세요."
+        
+        # 3. 엔진 질문
+        if question == 'engine':
+            return self._formatted_answer(yacht, 'engine')
+        
+        # 4. 정비/유지보수 질문
+        if question == 'maintenance':
+            return self._formatted_answer(yacht, 'maintenance')
+        
+        # 5. 부품 질문 (특정 부품)
+        if question == 'parts_list':
+            parts = self._get_yacht_parts(yacht_name)
+            if isinstance(parts, list) and len(parts) > 0:
+                # 부품 목록 반환
+                return self._format_yacht_parts_list(yacht_name, parts)
+            else:
+                return f"📦 **{yacht_name} 부품 정보**\n\n현재 등록된 부품이 없습니다.\n\n부품 정보를 추가하려면 PDF 매뉴얼을 업로드해주세요."
+        
+        # 6. 제조사 질문
+        if question == 'manufacturer':
+            manufacturer = yacht.get('manufacturer', 'N/A')
+            return f"🏭 **{yacht_name} 제조사**\n\n제조사: **{manufacturer}**"
+        
+        # 7. 타입 질문
+        if question == 'yacht_type':
+            yacht_type = yacht.get('type', 'N/A')
+            return f"🏷️ **{yacht_name} 유형**\n\n유형: **{yacht_type}**"
+        
+        # 8. 기본 정보 (간단한 질문)
+        if question == 'basic_info' and len(user_message.split()) <= 5:
+            # 매우 간단한 질문만 처리 (예: "TP52 정보", "Farr 40 알려줘")
+            return self._formatted_answer(yacht, 'basic_info')
+        
+        return None
+    
+    def _answer_builders(self) -> Dict[str, Callable[[Dict], str]]:
+        """답변 종류 → 카탈로그 데이터만으로 답변을 만드는 함수 (결과가 캐시됨, 한 번만 생성)"""
+        if self._answer_builder_map is None:
+            self._answer_builder_map = self._create_answer_builders()
+        return self._answer_builder_map
+    
+    def _create_answer_builders(self) -> Dict[str, Callable[[Dict], str]]:
+        """답변 종류별 생성 함수 목록 생성"""
+        builders: Dict[str, Callable[[Dict], str]] = {
+            kind: (lambda yacht, key=key, name=name: self._format_specific_dimension(yacht, key, name))
+            for kind, (key, name) in SPECIFIC_DIMENSIONS.items()
+        }
+        builders.update({
+            'dimensions': self._format_yacht_dimensions,
+            'sail_area': self._format_yacht_sail_area,
+            'engine': self._format_yacht_engine_info,
+            'maintenance': lambda yacht: self._format_yacht_maintenance_info(yacht, yacht.get('name', '')),
+            'basic_info': self._format_basic_yacht_info,
+            'full_info': self._format_full_yacht_info,
+        })
+        return builders
+    
+    def _formatted_answer(self, yacht: Dict, kind: str) -> str:
+        """
+        정형 답변 (치수, 돛 면적, 엔진, 정비 등)
+        
+        (요트 ID, 답변 종류, 요트 데이터 버전)으로 프로세스 공유 캐시에서 재사용합니다.
+        ID가 없거나 카탈로그의 요트와 다른 객체면 캐시하지 않고 바로 만듭니다.
+        """
+        build = self._answer_builders()[kind]
+        catalog = self.catalog
+        yacht_id = yacht.get('id')
+        if not yacht_id or catalog.get_yacht(yacht_id) is not yacht:
+            return build(yacht)
+        return get_shared_answer_cache().get_or_build(
+            yacht_id, kind, catalog.yacht_version(yacht_id), lambda: build(yacht)
+        )
+    
+    def warm_answer_cache(self) -> int:
+        """전체 요트의 정형 답변을 미리 생성 (서버 시작 시)"""
+        catalog = self.catalog
+        builders = self._answer_builders()
+        kinds = {kind: (lambda yacht_id, build=build: build(catalog.get_yacht(yacht_id)))
+                 for kind, build in builders.items()}
+        # 요약 목록의 ID로 조회 (SQLite 카탈로그에서도 전체 문서를 만들지 않음)
+        yacht_ids = dict.fromkeys(yacht.get('id') for yacht in catalog.summaries if yacht.get('id'))
+        items = [(yacht_id, catalog.yacht_version(yacht_id)) for yacht_id in yacht_ids
+                 if catalog.get_yacht(yacht_id) is not None]
+        return get_shared_answer_cache().warm(items, kinds)
+    
+    def _format_basic_yacht_info(self, yacht: Dict) -> str:
+        """요트 기본 정보 간단 포맷팅"""
+        model_name = yacht.get('name', 'Unknown')
+        manufacturer = yacht.get('manufacturer', 'N/A')
+        yacht_type = yacht.get('type', 'N/A')
+        
+        response = f"📋 **{model_name} 기본 정보**\n\n"
+        response += f"제조사: {manufacturer}\n"
+        response += f"유형: {yacht_type}\n\n"
+        
+        # 치수 정보가 있으면 간단히 표시
+        dim = yacht.get('dimensions', {})
+        if dim:
+            if dim.get('loa'):
+                loa = dim['loa']
+                if isinstance(loa, dict):
+                    response += f"전장 (LOA): {loa.get('display', loa.get('value', 'N/A'))}\n"
+                else:
+                    response += f"전장 (LOA): {loa}\n"
+            if dim.get('beam'):
+                beam = dim['beam']
+                if isinstance(beam, dict):
+                    response += f"폭 (Beam): {beam.get('display', beam.get('value', 'N/A'))}\n"
+                else:
+                    response += f"폭 (Beam): {beam}\n"
+        
+        response += f"\n💡 더 자세한 정보를 원하시면 '{model_name} 분석해줘'라고 물어보세요."
+        
+        return response
+    
+    def _format_yacht_engine_info(self, yacht: Dict) -> str:
+        """요트 엔진 정보 포맷팅"""
+        model_name = yacht.get('name', 'Unknown')
+        
+        # Schema 5.0: yachtSpecs.standard.engine 경로로 검색
+        yacht_specs = yacht.get('yachtSpecs', {})
+        standard_specs = yacht_specs.get('standard', {})
+        engine = standard_specs.get('engine', {})
+        
+        # 추가 정보도 확인 (additional에 엔진 정보가 있을 수 있음)
+        additional_specs = yacht_specs.get('additional', {})
+        
+        # 엔진 정보 수집
+        engine_type = engine.get('type') or additional_specs.get('engineType') or None
+        engine_power = engine.get('power') or additional_specs.get('enginePower') or additional_specs.get('nominalMaximumPropulsionPower') or None
+        engine_model = engine.get('model') or additional_specs.get('engineModel') or None
+        
+        # 정보가 하나도 없으면
+        if not engine_type and not engine_power and not engine_model:
+            return f"🔧 **{model_name} 엔진 정보**\n\n등록된 엔진 정보가 없습니다.\n\n엔진 정보를 추가하려면 PDF 매뉴얼을 업로드해주세요."
+        
+        response = f"🔧 **{model_name} 엔진 정보**\n\n"
+        
+        if engine_type:
+            response += f"**타입**: {engine_type}\n"
+        if engine_power:
+            response += f"**출력**: {engine_power}\n"
+        if engine_model:
+            response += f"**모델**: {engine_model}\n"
+        
+        # 추가 엔진 관련 정보가 있으면 표시
+        if additional_specs.get('maximumRecommendedEngineSizeWeight'):
+            response += f"**권장 엔진 중량**: {additional_specs['maximumRecommendedEngineSizeWeight']}\n"
+        
+        response += f"\n💡 더 자세한 정보를 원하시면 '{model_name} 분석해줘'라고 물어보세요."
+        
+        return response
+    
+    def _format_yacht_maintenance_info(self, yacht: Dict, yacht_name: str) -> str:
+        """요트 정비/유지보수 정보 포맷팅 ✨ 새로 추가"""
+        model_name = yacht.get('name', 'Unknown')
+        
+        # 부품 정보에서 정비 주기 추출
+        parts = self._get_yacht_parts(yacht_name)
+        
+        if not parts or len(parts) == 0:
+            return f"🔧 **{model_name} 정비 정보**\n\n등록된 부품 및 정비 정보가 없습니다.\n\n정비 정보를 추가하려면 PDF 매뉴얼을 업로드해주세요."
+        
+        response = f"🔧 **{model_name} 정비 및 유지보수 정보**\n\n"
+        
+        # 부품별 정비 주기 정리
+        maintenance_schedule = {}
+        for part in self._get_maintenance_parts(yacht, parts):
+            if isinstance(part, dict):
+                interval = part.get('interval') or part.get('maintenanceInterval')
+                if interval:
+                    category = part.get('category', '기타')
+                    part_name = part.get('name', 'Unknown')
+                    
+                    if category not in maintenance_schedule:
+                        maintenance_schedule[category] = []
+                    
+                    # interval 숫자 추출
+                    interval_value = interval
+                    if isinstance(interval, str):
+                        import re
+                        match = re.search(r'(\d+)', interval)
+                        if match:
+                            interval_value = int(match.group(1))
+                    
+                    maintenance_schedule[category].append({
+                        'name': part_name,
+                        'interval': interval_value,
+                        'interval_display': f"{interval}개월" if isinstance(interval, int) else str(interval)
+                    })
+        
+        if not maintenance_schedule:
+            response += "정비 주기 정보가 없습니다.\n\n"
+            response += f"총 **{len(parts)}개**의 부품이 등록되어 있지만, 정비 주기가 명시되지 않았습니다.\n\n"
+        else:
+            response += f"**부품별 정비 주기** (총 {len(parts)}개 부품)\n\n"
+            
+            # 카테고리별로 정리
+            for category, items in sorted(maintenance_schedule.items()):
+                response += f"**📦 {category}**\n"
+                
+                # 정비 주기별로 정렬
+                sorted_items = sorted(items, key=lambda x: x['interval'] if isinstance(x['interval'], int) else 999)
+                
+                for item in sorted_items[:5]:  # 각 카테고리당 최대 5개
+                    response += f"  • {item['name']}: {item['interval_display']}마다 점검\n"
+                
+                if len(items) > 5:
+                    response += f"  ... 외 {len(items) - 5}개 부품\n"
+                
+                response += "\n"
+        
+        # 추가 정보 (maintenance 섹션이 있으면 표시)
+        maintenance_info = yacht.get('maintenance', [])
+        if maintenance_info and len(maintenance_info) > 0:
+            response += "**🔍 추가 정비 정보**\n\n"
+            for maint in maintenance_info[:5]:  # 최대 5개
+                if isinstance(maint, dict):
+                    task = maint.get('task') or maint.get('name', 'Unknown')
+                    interval = maint.get('interval', '')
+                    method = maint.get('method', '')
+                    
+                    response += f"**{task}**\n"
+                    if interval:
+                        response += f"  주기: {interval}\n"
+                    if method:
+                        response += f"  방법: {method[:100]}\n"  # 100자로 제한
+                    response += "\n"
+        
+        response += "\n💡 정비 관련 궁금한 점은 언제든 물어보세요!"
+        response += f"\n📊 전체 부품 목록: '{model_name} 부품'"
+        response += f"\n📖 상세 분석: '{model_name} 분석해줘'"
+        
+        return response
+    
+    def _format_yacht_parts_list(self, yacht_name: str, parts: List[Dict]) -> str:
+        """요트 부품 목록 포맷팅"""
+        if not parts or len(parts) == 0:
+            return f"📦 **{yacht_name} 부품 정보**\n\n등록된 부품이 없습니다."
+        
+        response = f"📦 **{yacht_name} 부품 목록**\n\n"
+        response += f"총 **{len(parts)}개**의 부품이 등록되어 있습니다.\n\n"
+        
+        # 카테고리별로 그룹화
+        categories = {}
+        for part in parts[:20]:  # 최대 20개만 표시
+            if isinstance(part, dict):
+                category = part.get('category', '기타')
+                if category not in categories:
+                    categories[category] = []
+                categories[category].append(part.get('name', 'Unknown'))
+        
+        for category, part_names in categories.items():
+            response += f"**{category}**: {', '.join(part_names[:5])}"
+            if len(part_names) > 5:
+                response += f" 외 {len(part_names) - 5}개"
+            response += "\n"
+        
+        if len(parts) > 20:
+            response += f"\n... 외 {len(parts) - 20}개 부품 더 있음\n"
+        
+        response += f"\n💡 전체 부품 목록을 보려면 '{yacht_name} 분석해줘'라고 물어보세요."
+        
+        return response
+    
+    def _format_specific_dimension(self, yacht: Dict, dimension_key: str, dimension_name: str) -> str:
+        """특정 치수 요소만 포맷팅"""
+        model_name = yacht.get('name', 'Unknown')
+        
+        # Schema 5.0: yachtSpecs.standard.dimensions 경로로 검색
+        yacht_specs = yacht.get('yachtSpecs', {})
+        standard_specs = yacht_specs.get('standard', {})
+        dim = standard_specs.get('dimensions', {})
+        
+        # 추가 정보도 확인 (detailedDimensions에 더 상세한 정보가 있을 수 있음)
+        detailed_dim = yacht.get('detailedDimensions', {})
+        
+        dimension_data = dim.get(dimension_key) or detailed_dim.get(dimension_key)
+        if not dimension_data:
+            return f"📏 **{model_name} {dimension_name}**\n\n등록된 {dimension_name} 정보가 없습니다.\n\n정보를 추가하려면 PDF 매뉴얼을 업로드해주세요."
+        
+        response = f"📏 **{model_name} {dimension_name}**\n\n"
+        
+        if isinstance(dimension_data, dict):
+            value = dimension_data.get('value', '')
+            unit = dimension_data.get('unit', '')
+            display = dimension_data.get('display', f"{value}{unit}")
+            response += f"**{dimension_name}**: {display}\n"
+        else:
+            response += f"**{dimension_name}**: {dimension_data}\n"
+        
+        response += f"\n💡 더 자세한 치수 정보를 원하시면 '{model_name} 크기' 또는 '{model_name} 치수'라고 물어보세요."
+        
+        return response
+    
+    def _format_yacht_sail_area(self, yacht: Dict) -> str:
+        """요트 돛 면적 정보 포맷팅"""
+        model_name = yacht.get('name', 'Unknown')
+        
+        # Schema 5.0: yachtSpecs.standard.sailArea 경로로 검색
+        yacht_specs = yacht.get('yachtSpecs', {})
+        standard_specs = yacht_specs.get('standard', {})
+        sail_area = standard_specs.get('sailArea', {})
+        
+        # sailInventory도 확인 (더 상세한 정보)
+        sail_inventory = yacht.get('sailInventory', {})
+        
+        if not sail_area and not sail_inventory:
+            return f"⛵ **{model_name} 돛 면적**\n\n등록된 돛 면적 정보가 없습니다.\n\n정보를 추가하려면 PDF 매뉴얼을 업로드해주세요."
+        
+        response = f"⛵ **{model_name} 돛 면적 (Sail Area)**\n\n"
+        
+        # mainsail (메인 세일)
+        main = sail_area.get('mainsail') or sail_area.get('main')
+        if main:
+            if isinstance(main, dict):
+                response += f"**메인 세일 (Mainsail)**: {main.get('value', '')}{main.get('unit', '')}\n"
+            else:
+                response += f"**메인 세일 (Mainsail)**: {main}\n"
+        
+        # genoa (제노아)
+        genoa = sail_area.get('genoa')
+        if genoa:
+            if isinstance(genoa, dict):
+                response += f"**제노아 (Genoa)**: {genoa.get('value', '')}{genoa.get('unit', '')}\n"
+            else:
+                response += f"**제노아 (Genoa)**: {genoa}\n"
+        
+        # jib (지브)
+        jib = sail_area.get('jib')
+        if jib:
+            if isinstance(jib, dict):
+                response += f"**지브 (Jib)**: {jib.get('value', '')}{jib.get('unit', '')}\n"
+            else:
+                response += f"**지브 (Jib)**: {jib}\n"
+        
+        # spinnaker (스피나커)
+        spinnaker = sail_area.get('spinnaker')
+        if spinnaker:
+            if isinstance(spinnaker, dict):
+                response += f"**스피나커 (Spinnaker)**: {spinnaker.get('value', '')}{spinnaker.get('unit', '')}\n"
+            else:
+                response += f"**스피나커 (Spinnaker)**: {spinnaker}\n"
+        
+        # total (총 면적)
+        total = sail_area.get('total')
+        if total:
+            if isinstance(total, dict):
+                display = total.get('display', f"{total.get('value', '')}{total.get('unit', '')}")
+                response += f"**총 면적 (Total)**: {display}\n"
+            else:
+                response += f"**총 면적 (Total)**: {total}\n"
+        
+        response += f"\n💡 더 자세한 정보를 원하시면 '{model_name} 분석해줘'라고 물어보세요."
+        
+        return response
+    
+    def _format_yacht_dimensions(self, yacht: Dict) -> str:
+        """요트 치수 정보 포맷팅"""
+        model_name = yacht.get('name', 'Unknown')
+        
+        # Schema 5.0: yachtSpecs.standard.dimensions 경로로 검색
+        yacht_specs = yacht.get('yachtSpecs', {})
+        standard_specs = yacht_specs.get('standard', {})
+        dim = standard_specs.get('dimensions', {})
+        
+        # detailedDimensions도 확인
+        detailed_dim = yacht.get('detailedDimensions', {})
+        
+        response = f"📏 **{model_name} 크기 정보**\n\n"
+        response += "**기본 치수**\n"
+        
+        # LOA (전장)
+        loa = dim.get('LOA') or detailed_dim.get('LOA')
+        if loa:
+            if isinstance(loa, dict):
+                response += f"- LOA (전장): {loa.get('display', loa.get('value', ''))}\n"
+            else:
+                response += f"- LOA (전장): {loa}\n"
+        
+        # LWL (수선장)
+        lwl = dim.get('LWL') or dim.get('Lh') or detailed_dim.get('hullLength')
+        if lwl:
+            if isinstance(lwl, dict):
+                response += f"- LWL (수선장): {lwl.get('display', lwl.get('value', ''))}\n"
+            else:
+                response += f"- LWL (수선장): {lwl}\n"
+        
+        # Beam (폭)
+        beam = dim.get('Beam') or detailed_dim.get('beam')
+        if beam:
+            if isinstance(beam, dict):
+                response += f"- Beam (폭): {beam.get('display', beam.get('value', ''))}\n"
+            else:
+                response += f"- Beam (폭): {beam}\n"
+        
+        # Draft (흘수)
+        draft = dim.get('Draft') or detailed_dim.get('draughtDeepKeel')
+        if draft:
+            if isinstance(draft, dict):
+                response += f"- Draft (흘수): {draft.get('display', draft.get('value', ''))}\n"
+            else:
+                response += f"- Draft (흘수): {draft}\n"
+        
+        # Displacement (배수량)
+        disp = dim.get('Displacement') or detailed_dim.get('displacement')
+        if disp:
+            if isinstance(disp, dict):
+                response += f"- Displacement (배수량): {disp.get('display', disp.get('value', ''))}\n"
+            else:
+                response += f"- Displacement (배수량): {disp}\n"
+        
+        # Mast Height (마스트 높이)
+        mast = dim.get('mastHeight') or detailed_dim.get('airDraftClassicalMast')
+        if mast:
+            if isinstance(mast, dict):
+                response += f"- Mast Height (마스트 높이): {mast.get('display', mast.get('value', ''))}\n"
+            else:
+                response += f"- Mast Height (마스트 높이): {mast}\n"
+        
+        return response
+    
+    def _format_full_yacht_info(self, yacht: Dict) -> str:
+        """요트 전체 정보 포맷팅"""
+        model_name = yacht.get('name', 'Unknown')
+        response = f"🛥️ **{model_name}** - 상세 정보\n\n"
+        
+        if yacht.get('manufacturer'):
+            response += f"제조사: {yacht['manufacturer']}\n"
+        if yacht.get('type'):
+            response += f"타입: {yacht['type']}\n"
+        if yacht.get('designer'):
+            response += f"디자이너: {yacht['designer']}\n"
+        if yacht.get('year'):
+            response += f"제작년도: {yacht['year']}\n"
+        
+        response += "\n"
+        
+        # 치수 정보
+        dim = yacht.get('dimensions', {})
+        if dim:
+            response += "📏 **치수**\n"
+            if dim.get('loa'):
+                loa = dim['loa']
+                if isinstance(loa, dict):
+                    response += f"- LOA: {loa.get('display', loa.get('value', ''))}\n"
+                else:
+                    response += f"- LOA: {loa}\n"
+            if dim.get('beam'):
+                beam = dim['beam']
+                if isinstance(beam, dict):
+                    response += f"- Beam (폭): {beam.get('display', beam.get('value', ''))}\n"
+                else:
+                    response += f"- Beam (폭): {beam}\n"
+            if dim.get('draft'):
+                draft = dim['draft']
+                if isinstance(draft, dict):
+                    response += f"- Draft (흘수): {draft.get('display', draft.get('value', ''))}\n"
+                else:
+                    response += f"- Draft (흘수): {draft}\n"
+            if dim.get('displacement'):
+                disp = dim['displacement']
+                if isinstance(disp, dict):
+                    response += f"- Displacement (배수량): {disp.get('display', disp.get('value', ''))}\n"
+                else:
+                    response += f"- Displacement (배수량): {disp}\n"
+            if dim.get('mastHeight'):
+                mast = dim['mastHeight']
+                if isinstance(mast, dict):
+                    response += f"- Mast Height: {mast.get('display', mast.get('value', ''))}\n"
+                else:
+                    response += f"- Mast Height: {mast}\n"
+            response += "\n"
+        
+        # 돛 면적
+        sail_area = yacht.get('sailArea', {})
+        if sail_area:
+            response += "⛵ **돛 면적**\n"
+            if sail_area.get('main'):
+                main = sail_area['main']
+                if isinstance(main, dict):
+                    response += f"- Main: {main.get('value', '')} {main.get('unit', '')}\n"
+                else:
+                    response += f"- Main: {main} m²\n"
+            if sail_area.get('jib'):
+                jib = sail_area['jib']
+                if isinstance(jib, dict):
+                    response += f"- Jib: {jib.get('value', '')} {jib.get('unit', '')}\n"
+                else:
+                    response += f"- Jib: {jib} m²\n"
+            if sail_area.get('spinnaker'):
+                spin = sail_area['spinnaker']
+                if isinstance(spin, dict):
+                    response += f"- Spinnaker: {spin.get('value', '')} {spin.get('unit', '')}\n"
+                else:
+                    response += f"- Spinnaker: {spin} m²\n"
+            if sail_area.get('total'):
+                total = sail_area['total']
+                if isinstance(total, dict):
+                    response += f"- Total: {total.get('display', total.get('value', ''))}\n"
+                else:
+                    response += f"- Total: {total} m²\n"
+            response += "\n"
+        
+        # 엔진 정보
+        engine = yacht.get('engine', {})
+        if engine:
+            response += "🔧 **엔진**\n"
+            if engine.get('type'):
+                response += f"- Type: {engine['type']}\n"
+            if engine.get('power'):
+                response += f"- Power: {engine['power']}\n"
+            if engine.get('model'):
+                response += f"- Model: {engine['model']}\n"
+        
+        return response
+    
+    def _build_context(self) -> str:
+        """대화 컨텍스트 구성"""
+        context = self.system_prompt + "\n\n**대화 기록:**\n"
+        recent_history = self.chat_history[-10:]
+        
+        for msg in recent_history:
+            role = "사용자" if msg["role"] == "user" else "어시스턴트"
+            context += f"\n{role}: {msg['content']}\n"
+        
+        return context
+    
+    def _handle_file_upload(self, file_path: str) -> str:
+        """파일 업로드 및 분석 처리 (PDF, Word, HWP, Excel, PPTX 등)"""
+        try:
+            file_name = os.path.basename(file_path)
+            file_ext = self._get_file_extension(file_path)
+            
+            # 지원되는 파일 형식 확인
+            if not self._is_supported_file(file_path):
+                return f"❌ 지원되지 않는 파일 형식입니다.\n\n지원 형식: PDF, Word (.docx, .doc), HWP, 텍스트 (.txt), Excel (.xlsx, .xls), PowerPoint (.pptx, .ppt)"
+            
+            print(f"📄 파일 분석 시작: {file_name} ({file_ext})", flush=True)
+            
+            # 파일 분석 시작 메시지
+            analyzing_msg = f"📄 {file_name} 문서를 분석 중입니다...\n잠시만 기다려주세요! ⏳"
+            
+            self.chat_history.append({
+                "role": "user",
+                "content": f"[파일 업로드: {file_name}]",
+                "timestamp": datetime.now().isoformat()
+            })
+            
+            self.chat_history.append({
+                "role": "assistant",
+                "content": analyzing_msg,
+                "timestamp": datetime.now().isoformat()
+            })
+            
+            # 파일 형식에 따라 텍스트 추출
+            print("📖 텍스트 추출 중...", flush=True)
+            extracted_text = self._extract_text_from_file(file_path)
+            
+            if not extracted_text or len(extracted_text.strip()) < 100:
+                return f"❌ {file_name}에서 텍스트를 추출할 수 없습니다.\n\n파일이 손상되었거나 암호화되어 있을 수 있습니다."
+            
+            # 분석 실행
+            print(f"✅ 텍스트 추출 완료 ({len(extracted_text)} 문자)", flush=True)
+            print("🤖 AI 분석 시작...", flush=True)
+            analysis_result = self._analyze_document_directly(file_path, extracted_text)
+            
+            # 분석 결과 확인
+            if "error" in analysis_result:
+                error_msg = f"❌ 문서 분석 중 오류가 발생했습니다:\n{analysis_result.get('error', '알 수 없는 오류')}"
+                self.chat_history.append({
+                    "role": "assistant",
+                    "content": error_msg,
+                    "timestamp": datetime.now().isoformat()
+                })
+                return error_msg
+            
+            # 분석 결과를 요트 등록 형식으로 변환
+            registration_data = self._convert_analysis_to_registration(analysis_result)
+            
+            # 등록 완료 메시지 생성
+            completion_msg = self._generate_registration_completion_message(analysis_result, registration_data)
+            
+            # 등록 데이터 저장 (메모리 + JSON 파일)
+            self.current_yacht_registration = registration_data
+            
+            # JSON 파일로 저장
+            self._save_registration_to_json(registration_data, analysis_result, extracted_text)
+            
+            # 대화 히스토리에 추가
+            self.chat_history.append({
+                "role": "assistant",
+                "content": completion_msg,
+                "timestamp": datetime.now().isoformat()
+            })
+            
+            print(f"✅ {file_name} 분석 및 등록 준비 완료!")
+            
+            return completion_msg
+            
+        except Exception as e:
+            error_msg = f"❌ 파일 처리 중 오류가 발생했습니다: {str(e)}"
+            print(f"❌ Error: {e}")
+            import traceback
+            traceback.print_exc()
+            
+            self.chat_history.append({
+                "role": "assistant",
+                "content": error_msg,
+                "timestamp": datetime.now().isoformat()
+            })
+            
+            return error_msg
+    
+    def _analyze_document_directly(self, file_path: str, extracted_text: str) -> Dict:
+        """
+        문서 직접 분석 (yacht_document_analyzer 없이)
+        
+        긴 문서는 섹션 경계에서 조각으로 나눠 동시에 분석한 뒤 결과를 병합합니다.
+        (이전에는 앞 30,000자만 분석하여 뒤쪽 부품/정비 섹션이 누락됨)
+        """
+        chunks = split_manual_text(extracted_text)
+        if len(chunks) <= 1:
+            result = self._analyze_document_chunk(extracted_text)
+            result["fileInfo"] = self._document_file_info(file_path)
+            if "error" not in result:
+                print("✅ 분석 완료!")
+            return result
+        
+        if len(chunks) > MAX_ANALYSIS_CHUNKS:
+            print(f"⚠️ 문서가 너무 길어 앞 {MAX_ANALYSIS_CHUNKS}개 조각만 분석합니다 (전체 {len(chunks)}개)")
+            chunks = chunks[:MAX_ANALYSIS_CHUNKS]
+        
+        print(f"🧩 문서를 {len(chunks)}개 조각으로 나눠 분석합니다 ({len(extracted_text)} 문자)")
+        results = analyze_chunks(chunks, self._analyze_document_chunk)
+        failed = [result for result in results if "error" in result]
+        
+        if len(failed) == len(results):
+            result = dict(failed[0])
+            result["fileInfo"] = self._document_file_info(file_path)
+            return result
+        
+        result = merge_analysis_results(results)
+        result["analysisChunks"] = {
+            "total": len(results),
+            "analyzed": len(results) - len(failed),
+            "failed": len(failed)
+        }
+        result["fileInfo"] = self._document_file_info(file_path)
+        
+        if failed:
+            print(f"⚠️ {len(failed)}개 조각 분석 실패: {failed[0].get('error')}")
+        print("✅ 분석 완료!")
+        return result
+    
+    def _analyze_document_chunk(self, extracted_text: str) -> Dict:
+        """문서 텍스트(또는 조각) 하나를 Schema 5.0 형식으로 분석 (분석 결과 캐시 사용)"""
+        # 같은 텍스트 + 같은 프롬프트 템플릿의 분석 결과가 있으면 재사용
+        analysis_cache = get_shared_analysis_cache(DOCUMENT_ANALYSIS_PROMPT_VERSION)
+        cached = analysis_cache.get(extracted_text)
+        if cached is not None:
+            print("⚡ 캐시된 분석 결과 사용")
+            return cached
+        
+        if analysis_cache.replay_only:
+            return {"error": "캐시된 분석 결과가 없습니다 (replay 모드에서는 AI를 호출하지 않습니다)."}
+        
+        if not self.has_gemini:
+            return {"error": "문서 분석 기능은 Gemini API가 필요합니다."}
+        
+        # 분석 프롬프트 (완전한 버전 5.0)
+        prompt = DOCUMENT_ANALYSIS_PROMPT_TEMPLATE.format(extracted_text=extracted_text)
         
         # Gemini API 호출
         print("🤖 AI 분석 중...")
@@ -1993,115 +2246,54 @@ PDF 파일 경로를 입력해주세요! 📎"""
         try:
             result = json.loads(result_text)
         except json.JSONDecodeError:
-            result = {
+            return {
                 "rawResponse": result_text,
                 "error": "JSON 파싱 실패",
                 "extractedTextLength": len(extracted_text)
             }
         
-        # 파일 정보 추가
-        result["fileInfo"] = {
+        if not isinstance(result, dict):
+            return {"error": "분석 결과 형식 오류", "rawResponse": result_text}
+        
+        # 파싱에 성공한 결과만 캐시 (실패한 응답은 다음에 다시 분석)
+        analysis_cache.put(extracted_text, result)
+        return result
+    
+    def _document_file_info(self, file_path: str) -> Dict:
+        """분석 결과에 붙이는 파일 정보"""
+        return {
             "fileName": os.path.basename(file_path),
             "filePath": file_path,
             "fileSize": os.path.getsize(file_path)
         }
-        
-        print("✅ 분석 완료!")
-        return result
     
     def _extract_text_from_pdf(self, pdf_path: str) -> str:
-        """PDF에서 텍스트 추출 (일반 방법 실패 시 OCR 시도)"""
-        text = ""
-        
-        # 방법 1: PyPDF2로 텍스트 추출 시도
-        if HAS_PYPDF2:
-            try:
-                with open(pdf_path, 'rb') as file:
-                    pdf_reader = PyPDF2.PdfReader(file)
-                    for page in pdf_reader.pages:
-                        page_text = page.extract_text()
-                        if page_text:
-                            text += page_text + "\n"
-                # 텍스트가 충분히 추출되었으면 반환
-                if len(text.strip()) > 100:
-                    return text
-            except Exception as e:
-                print(f"⚠️ PyPDF2로 텍스트 추출 실패: {e}")
-        
-        # 방법 2: pdfplumber로 텍스트 추출 시도
-        if HAS_PDFPLUMBER:
-            try:
-                import pdfplumber
-                with pdfplumber.open(pdf_path) as pdf:
-                    for page in pdf.pages:
-                        page_text = page.extract_text()
-                        if page_text:
-                            text += page_text + "\n"
-                # 텍스트가 충분히 추출되었으면 반환
-                if len(text.strip()) > 100:
-                    return text
-            except Exception as e:
-                print(f"⚠️ pdfplumber로 텍스트 추출 실패: {e}")
-        
-        # 방법 3: EasyOCR 사용 (스캔된 이미지 PDF인 경우)
-        if len(text.strip()) < 100:
-            try:
-                print("📷 텍스트 추출 실패. OCR을 시도합니다...")
-                text = self._extract_text_with_easyocr(pdf_path)
-                if len(text.strip()) > 100:
-                    print("✅ OCR로 텍스트 추출 성공!")
-                    return text
-            except Exception as e:
-                print(f"⚠️ OCR 실패: {e}")
-                print("💡 OCR 패키지를 설치하려면:")
-                print("   python install_ocr_local.py")
+        """PDF에서 텍스트 추출 (텍스트 레이어가 없는 페이지만 OCR)"""
+        # 방법 1, 2: PyPDF2 + pdfplumber 페이지 단위 병렬 추출
+        pages = extract_pdf_pages(pdf_path)
+        text = join_pages(pages)
+        
+        # 방법 3: EasyOCR 사용 (스캔된 이미지 페이지)
+        empty_pages = find_empty_pages(pages)
+        if pages and not empty_pages:
+            return text
+        # 텍스트가 충분하면 OCR 패키지가 없을 때 조용히 넘어감
+        if len(text.strip()) > 100 and not ocr_available():
+            return text
         
+        print(f"📷 텍스트가 없는 페이지 {len(empty_pages) if pages else '전체'}에 OCR을 시도합니다...")
+        ocr_text = self._extract_text_with_easyocr(pdf_path, pages)
+        if len(ocr_text.strip()) > len(text.strip()):
+            print("✅ OCR로 텍스트 추출 성공!")
+            return ocr_text
         return text
     
-    def _extract_text_with_easyocr(self, pdf_path: str) -> str:
-        """EasyOCR을 사용한 텍스트 추출 (스캔된 이미지 PDF용)"""
+    def _extract_text_with_easyocr(self, pdf_path: str, pages: Optional[List[str]] = None) -> str:
+        """EasyOCR을 사용한 텍스트 추출 (텍스트 레이어가 비어 있는 페이지만)"""
         try:
-            import fitz  # PyMuPDF
-            import easyocr
-            import numpy as np
-            from PIL import Image
-            import io
-            
-            # EasyOCR 초기화 (영어 + 한국어)
-            print("   🤖 EasyOCR 초기화 중...")
-            reader = easyocr.Reader(['en', 'ko'], gpu=False)
-            
-            # PDF 열기
-            doc = fitz.open(pdf_path)
-            total_pages = len(doc)
-            print(f"   📄 총 {total_pages}페이지를 OCR 처리 중...")
-            
-            text = ""
-            
-            for page_num in range(total_pages):
-                # PDF 페이지를 이미지로 변환
-                page = doc[page_num]
-                pix = page.get_pixmap(dpi=300)
-                img_data = pix.tobytes("png")
-                img = Image.open(io.BytesIO(img_data))
-                
-                # numpy 배열로 변환
-                img_array = np.array(img)
-                
-                # OCR 실행
-                results = reader.readtext(img_array)
-                
-                # 결과 텍스트 추출
-                page_text = "\n".join([text_result[1] for text_result in results])
-                text += f"\n--- Page {page_num + 1} ---\n{page_text}\n"
-                
-                if (page_num + 1) % 5 == 0:
-                    print(f"   진행 중: {page_num + 1}/{total_pages} 페이지")
-            
-            doc.close()
+            text = extract_pdf_text_with_ocr(pdf_path, pages)
             print(f"   ✅ OCR 완료: {len(text)} 문자 추출")
             return text
-            
         except ImportError as e:
             print(f"❌ 필요한 패키지가 설치되지 않았습니다: {e}")
             print("💡 실행: python install_ocr_local.py")
@@ -2113,7 +2305,17 @@ PDF 파일 경로를 입력해주세요! 📎"""
             return ""
     
     def _extract_text_from_file(self, file_path: str) -> str:
-        """파일에서 텍스트 추출 (PDF, Word, HWP, Excel, PPTX 등)"""
+        """파일에서 텍스트 추출 (PDF, Word, HWP, Excel, PPTX 등, 파일 해시 기반 캐시 사용)"""
+        try:
+            cache = get_shared_text_cache()
+        except OSError as e:
+            # 캐시 디렉토리를 만들 수 없음 (읽기 전용 디스크 등)
+            print(f"⚠️ 텍스트 캐시 사용 불가, 직접 추출: {e}")
+            return self._extract_text_uncached(file_path)
+        return cache.get_or_extract(file_path, TEXT_EXTRACTOR_VERSION, self._extract_text_uncached)
+    
+    def _extract_text_uncached(self, file_path: str) -> str:
+        """파일 확장자별 텍스트 추출 (캐시 미사용)"""
         file_ext = self._get_file_extension(file_path)
         
         if file_ext == '.pdf':
@@ -2277,7 +2479,7 @@ PDF 파일 경로를 입력해주세요! 📎"""
     
     def _list_yachts(self) -> str:
         """요트 목록 반환"""
-        yachts = self.yacht_data.get('yachts', [])
+        yachts = self.catalog.summaries
         if not yachts:
             return "요트 데이터를 찾을 수 없습니다."
         
@@ -2365,53 +2567,21 @@ Gemini API 키를 설정하려면:
 
 PDF 파일 경로를 입력해주세요! 📎"""
         
-        return message
-    
-    def _extract_yacht_name_from_message(self, message: str) -> Optional[str]:
-        """메시지에서 요트 이름 추출 (하이픈, 공백, 슬래시 등 무시)"""
-        import re
-        # 하이픈, 공백, 언더스코어, 슬래시 등을 제거하여 정규화
-        message_normalized = re.sub(r'[-_\s/]+', '', message.lower())
-        
-        for yacht in self.yacht_data.get('yachts', []):
-            yacht_name = yacht.get('name', '')
-            if not yacht_name:
-                continue
-            
-            # 요트 이름도 정규화 (슬래시도 제거)
-            yacht_name_normalized = re.sub(r'[-_\s/]+', '', yacht_name.lower())
-            
-            # 정규화된 이름이 메시지에 포함되어 있는지 확인
-            if yacht_name_normalized in message_normalized:
-                return yacht_name
-            
-            # 부분 매칭도 시도 (예: "farr40" -> "Farr 40", "j70" -> "J/70")
-            if yacht_name_normalized and message_normalized.find(yacht_name_normalized) != -1:
-                return yacht_name
-            
-            # 숫자만 있는 경우도 시도 (예: "j70" -> "J/70")
-            # 요트 이름에서 숫자 추출
-            yacht_numbers = re.findall(r'\d+', yacht_name_normalized)
-            message_numbers = re.findall(r'\d+', message_normalized)
-            if yacht_numbers and message_numbers:
-                # 숫자가 일치하고, 요트 이름의 문자 부분이 메시지에 포함되어 있으면 매칭
-                if yacht_numbers[0] == message_numbers[0]:
-                    yacht_letters = re.sub(r'\d+', '', yacht_name_normalized)
-                    message_letters = re.sub(r'\d+', '', message_normalized)
-                    if yacht_letters and yacht_letters in message_letters:
-                        return yacht_name
-        
-        return None
+        return message
+    
+    def _extract_yacht_name_from_message(self, message: str) -> Optional[str]:
+        """
+        메시지에서 요트 이름 추출 (하이픈, 공백, 슬래시 등 무시)
+        
+        카탈로그 로드 시 구축한 이름 인덱스로 메시지를 한 번만 훑어서 매칭
+        (예: "farr40" -> "Farr 40", "j70" -> "J/70")
+        """
+        return self.catalog.name_matcher.match(message)
     
     def _analyze_yacht_data(self, yacht_name: str) -> str:
         """요트 데이터 종합 분석"""
         # 요트 정보 찾기
-        yacht = None
-        for y in self.yacht_data.get('yachts', []):
-            if y.get('name', '').lower() == yacht_name.lower():
-                yacht = y
-                break
-        
+        yacht = self.catalog.find_yacht(yacht_name)
         if not yacht:
             return f"'{yacht_name}' 요트 정보를 찾을 수 없습니다."
         
@@ -2439,25 +2609,45 @@ PDF 파일 경로를 입력해주세요! 📎"""
 
 친근하고 전문적인 톤으로 답변해주세요."""
                 
-                response = self.model.generate_content(analysis_prompt)
-                result = f"📊 **{yacht_name} 종합 분석**\n\n{response.text}"
+                # 분석 결과는 질문 표현과 관계없이 요트 데이터에만 의존 (요트 데이터 버전으로 캐시)
+                catalog = self.catalog
+                yacht_id = yacht.get('id')
+                version = catalog.yacht_version(yacht_id) if yacht_id else catalog.version
+                analysis_text = self._cached_model_response(
+                    'analysis', yacht_name, yacht_id, version,
+                    lambda: self.model.generate_content(analysis_prompt).text
+                )
+                result = f"📊 **{yacht_name} 종합 분석**\n\n{analysis_text}"
                 sys.stdout.flush()  # 버퍼 강제 출력
                 return result
             except Exception as e:
                 # AI 분석 실패 시 기본 정보 제공
-                return self._format_full_yacht_info(yacht)
+                return self._formatted_answer(yacht, 'full_info')
         else:
             # Gemini AI 없을 때 기본 정보 제공
-            return self._format_full_yacht_info(yacht)
+            return self._formatted_answer(yacht, 'full_info')
     
     def _get_yacht_parts(self, yacht_name: str) -> List[Dict]:
         """요트의 부품 목록 가져오기"""
-        parts_list = []
-        for yacht_data in self.parts_data.get('yachts', []):
-            if yacht_data.get('name', '').lower() == yacht_name.lower():
-                parts_list = yacht_data.get('parts', [])
-                break
-        return parts_list
+        return self.catalog.get_parts_by_name(yacht_name)
+    
+    def _get_maintenance_parts(self, yacht: Dict, parts: List[Dict]) -> List[Dict]:
+        """
+        정비 주기 정리에 사용할 부품 목록
+        
+        SQLite 카탈로그가 있으면 정비 주기가 있는 해당 요트 행만 조회합니다.
+        """
+        yacht_id = yacht.get('id')
+        if self.catalog_db is None or not yacht_id:
+            return parts
+        items = []
+        for item in self.catalog_db.get_maintenance_items(yacht_id):
+            text = item['intervalText']
+            if not text:
+                continue
+            interval = item['interval'] if text == str(item['interval']) else text
+            items.append({'name': item['name'], 'category': item['category'] or '기타', 'interval': interval})
+        return items
     
     def clear_history(self):
         """대화 히스토리 초기화"""
@@ -2625,72 +2815,43 @@ PDF 파일 경로를 입력해주세요! 📎"""
         
         return message
     
-    def _save_registration_to_json(self, registration_data: Dict, analysis_result: Dict):
-        """등록 데이터를 JSON 파일로 저장"""
-        try:
-            self._add_to_yacht_specifications(registration_data, analysis_result)
-            self._save_to_registered_yachts(registration_data, analysis_result)
-            self._save_parts_to_json_files(registration_data, analysis_result)
-            print("💾 JSON 파일에 저장 완료!")
-        except Exception as e:
-            print(f"⚠️ JSON 파일 저장 중 오류: {e}")
-    
-    def _add_to_yacht_specifications(self, registration_data: Dict, analysis_result: Dict):
-        """yacht_specifications.json에 요트 추가 (ID 포함)"""
+    def _save_registration_to_json(self, registration_data: Dict, analysis_result: Dict,
+                                   extracted_text: Optional[str] = None):
+        """
+        등록 데이터 저장
+        
+        등록 로그(SQLite)에 한 번 기록한 뒤, data/*.json 파일 6개는 잠시 후 한꺼번에 갱신합니다.
+        (연속 등록은 파일마다 한 번의 로드/저장으로 묶임)
+        extracted_text가 있으면 매뉴얼 본문을 검색 인덱스에 추가합니다.
+        """
         try:
-            spec_file = 'data/yacht_specifications.json'
-            if os.path.exists(spec_file):
-                with open(spec_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-            else:
-                data = {
-                    "version": "1.0",
-                    "description": "요트 상세 스펙 데이터베이스",
-                    "lastUpdated": datetime.now().strftime("%Y-%m-%d"),
-                    "yachts": []
-                }
-            
             basic_info = registration_data.get("basicInfo", {})
-            specs = registration_data.get("specifications", {})
-            
-            # 🆕 registration_data에서 ID 가져오기 (없으면 생성)
             yacht_id = registration_data.get("id") or basic_info.get("id")
             if not yacht_id:
                 yacht_id = self._generate_yacht_id(basic_info.get("name", ""))
             
-            existing_ids = [y.get("id") for y in data.get("yachts", [])]
-            if yacht_id in existing_ids:
-                # 기존 요트 업데이트
-                for yacht in data["yachts"]:
-                    if yacht.get("id") == yacht_id:
-                        yacht.update({
-                            "id": yacht_id,  # 🆕 ID 명시
-                            "name": basic_info.get("name", ""),
-                            "manufacturer": basic_info.get("manufacturer", ""),
-                            "type": basic_info.get("type", ""),
-                            "manual": basic_info.get("manual", ""),
-                            **self._convert_specs_to_yacht_format(specs)
-                        })
-                        break
-            else:
-                # 새 요트 추가
-                new_yacht = {
-                    "id": yacht_id,  # 🆕 ID 우선 배치
-                    "name": basic_info.get("name", ""),
-                    "manufacturer": basic_info.get("manufacturer", ""),
-                    "type": basic_info.get("type", ""),
-                    "manual": basic_info.get("manual", ""),
-                    **self._convert_specs_to_yacht_format(specs)
-                }
-                data["yachts"].append(new_yacht)
-            
-            data["lastUpdated"] = datetime.now().strftime("%Y-%m-%d")
-            with open(spec_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
-            
-            print(f"✅ {spec_file}에 저장됨 (ID: {yacht_id})")
+            record = build_registration_record(
+                yacht_id, registration_data, analysis_result,
+                self._convert_specs_to_yacht_format(registration_data.get("specifications", {}))
+            )
+            store = get_shared_registration_store()
+            store.record(record)
+            print(f"💾 등록 저장 완료 (ID: {yacht_id})")
+            
+            # 이 요트의 캐시된 정형 답변 / LLM 응답 삭제 (다른 요트의 답변은 유지)
+            get_shared_answer_cache().invalidate(yacht_id)
+            llm_cache = get_shared_llm_cache()
+            if llm_cache is not None:
+                llm_cache.invalidate(yacht_id)
+            
+            # 새로 등록된 요트가 모든 세션에 보이도록 JSON 갱신 후 카탈로그 다시 로드
+            store.schedule_materialize(on_done=self.catalog_store.reload)
+            
+            search_index = get_shared_search_index()
+            if extracted_text and search_index is not None:
+                search_index.index_manual(yacht_id, basic_info.get("name", yacht_id), extracted_text)
         except Exception as e:
-            print(f"⚠️ yacht_specifications.json 저장 실패: {e}")
+            print(f"⚠️ 등록 저장 중 오류: {e}")
     
     def _convert_specs_to_yacht_format(self, specs: Dict) -> Dict:
         """등록 데이터 스펙을 yacht_specifications.json 형식으로 변환"""
@@ -2774,353 +2935,6 @@ PDF 파일 경로를 입력해주세요! 📎"""
         
         return result
     
-    def _save_to_registered_yachts(self, registration_data: Dict, analysis_result: Dict):
-        """등록된 요트를 registered_yachts.json에 저장 (ID 포함)"""
-        try:
-            reg_file = 'data/registered_yachts.json'
-            if os.path.exists(reg_file):
-                with open(reg_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-            else:
-                data = {
-                    "schemaVersion": "5.0",
-                    "description": "사용자가 등록한 요트 목록 (chatbot_unified.py로 등록)",
-                    "lastUpdated": datetime.now().strftime("%Y-%m-%d"),
-                    "totalYachts": 0,
-                    "yachts": []
-                }
-            
-            # 🆕 요트 ID 가져오기 (registration_data에 이미 포함됨)
-            yacht_id = registration_data.get("id") or registration_data.get("basicInfo", {}).get("id")
-            
-            registration_entry = {
-                "id": yacht_id,  # 🆕 최상위 ID
-                "registrationDate": datetime.now().isoformat(),
-                "source": "PDF Upload",
-                "pdfFile": analysis_result.get("fileInfo", {}).get("fileName", ""),
-                "registrationData": registration_data,
-                "analysisResult": {
-                    "documentInfo": analysis_result.get("documentInfo", {}),
-                    "partsCount": len(analysis_result.get("parts", [])),
-                    "analysisStatus": "success" if "error" not in analysis_result else "error"
-                }
-            }
-            
-            data["yachts"].append(registration_entry)
-            data["totalYachts"] = len(data["yachts"])
-            data["lastUpdated"] = datetime.now().strftime("%Y-%m-%d")
-            
-            with open(reg_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
-            
-            print(f"✅ {reg_file}에 저장됨 (ID: {yacht_id})")
-        except Exception as e:
-            print(f"⚠️ registered_yachts.json 저장 실패: {e}")
-    
-    def _save_parts_to_json_files(self, registration_data: Dict, analysis_result: Dict):
-        """부품 정보를 각 JSON 파일에 저장 (요트 ID 사용)"""
-        try:
-            basic_info = registration_data.get("basicInfo", {})
-            yacht_name = basic_info.get("name", "")
-            
-            # 🆕 registration_data에서 ID 가져오기
-            yacht_id = registration_data.get("id") or basic_info.get("id")
-            if not yacht_id:
-                yacht_id = self._generate_yacht_id(yacht_name)
-            
-            manufacturer = basic_info.get("manufacturer", "")
-            manual_pdf = basic_info.get("manual", "")
-            parts = analysis_result.get("parts", [])
-            
-            if not parts:
-                print("⚠️ 추출된 부품이 없어 부품 JSON 파일 저장을 건너뜁니다.")
-                return
-            
-            self._add_to_yacht_parts_database(yacht_id, yacht_name, manufacturer, manual_pdf, parts)
-            self._add_to_extracted_parts_detailed(yacht_id, yacht_name, manufacturer, manual_pdf, parts)
-            self._add_to_extracted_parts(yacht_id, yacht_name, manufacturer, manual_pdf, parts)
-            self._add_to_parts_app_data(yacht_id, yacht_name, manufacturer, manual_pdf, parts)
-            
-            print(f"✅ 부품 정보가 {len(parts)}개 JSON 파일에 저장됨 (Yacht ID: {yacht_id})")
-        except Exception as e:
-            print(f"⚠️ 부품 JSON 파일 저장 중 오류: {e}")
-            import traceback
-            traceback.print_exc()
-    
-    def _add_to_yacht_parts_database(self, yacht_id: str, yacht_name: str, manufacturer: str, manual_pdf: str, parts: List[Dict]):
-        """yacht_parts_database.json에 부품 추가 (요트 ID 사용)"""
-        try:
-            db_file = 'data/yacht_parts_database.json'
-            if os.path.exists(db_file):
-                with open(db_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-            else:
-                data = {"yachts": []}
-            
-            yacht_entry = None
-            for yacht in data.get("yachts", []):
-                if yacht.get("id") == yacht_id:
-                    yacht_entry = yacht
-                    break
-            
-            if not yacht_entry:
-                yacht_entry = {
-                    "id": yacht_id,  # 🆕 올바른 ID 사용
-                    "name": yacht_name,
-                    "manufacturer": manufacturer,
-                    "type": "",
-                    "length": None,
-                    "officialWebsite": None,
-                    "manualPDF": manual_pdf,
-                    "dimensions": {},
-                    "parts": {
-                        "rigging": {"physicalParts": [], "maintenanceItems": []},
-                        "sails": {"physicalParts": [], "maintenanceItems": []},
-                        "engine": {"physicalParts": [], "maintenanceItems": []},
-                        "hull": {"physicalParts": [], "maintenanceItems": []},
-                        "electrical": {"physicalParts": [], "maintenanceItems": []},
-                        "plumbing": {"physicalParts": [], "maintenanceItems": []}
-                    }
-                }
-                data["yachts"].append(yacht_entry)
-            
-            parts_dict = yacht_entry.get("parts", {})
-            
-            for part in parts:
-                category = part.get("category", "rigging").lower()
-                name = part.get("name", "")
-                if not name:
-                    continue
-                
-                if category in ["rigging", "rig"]:
-                    cat_key = "rigging"
-                elif category in ["sails", "sail"]:
-                    cat_key = "sails"
-                elif category in ["engine", "motor"]:
-                    cat_key = "engine"
-                elif category in ["hull", "deck"]:
-                    cat_key = "hull"
-                elif category in ["electrical", "electric", "electronics"]:
-                    cat_key = "electrical"
-                elif category in ["plumbing", "water"]:
-                    cat_key = "plumbing"
-                else:
-                    cat_key = "rigging"
-                
-                if cat_key not in parts_dict:
-                    parts_dict[cat_key] = {"physicalParts": [], "maintenanceItems": []}
-                
-                physical_part = {
-                    "id": f"{yacht_id}-{cat_key}-{len(parts_dict[cat_key]['physicalParts']) + 1:02d}",
-                    "category": category.capitalize(),
-                    "name": name,
-                    "partNumber": part.get("model", ""),
-                    "manufacturer": part.get("manufacturer", ""),
-                    "maintenanceInterval": f"{part.get('interval', 12)}개월" if part.get("interval") else "Annual inspection"
-                }
-                
-                parts_dict[cat_key]["physicalParts"].append(physical_part)
-            
-            with open(db_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
-            
-            print(f"✅ yacht_parts_database.json에 저장됨 (Yacht ID: {yacht_id})")
-        except Exception as e:
-            print(f"⚠️ yacht_parts_database.json 저장 실패: {e}")
-    
-    def _add_to_extracted_parts_detailed(self, yacht_id: str, yacht_name: str, manufacturer: str, manual_pdf: str, parts: List[Dict]):
-        """extracted_yacht_parts_detailed.json에 부품 추가"""
-        try:
-            file_path = 'data/extracted_yacht_parts_detailed.json'
-            if os.path.exists(file_path):
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-            else:
-                data = {"yachts": []}
-            
-            yacht_entry = None
-            for yacht in data.get("yachts", []):
-                if yacht.get("id") == yacht_id:
-                    yacht_entry = yacht
-                    break
-            
-            if not yacht_entry:
-                yacht_entry = {
-                    "id": yacht_id,
-                    "name": yacht_name,
-                    "manufacturer": manufacturer,
-                    "manualPDF": manual_pdf,
-                    "parts": {
-                        "rigging": [], "sails": [], "engine": [],
-                        "hull": [], "electrical": [], "plumbing": []
-                    }
-                }
-                data["yachts"].append(yacht_entry)
-            
-            parts_dict = yacht_entry.get("parts", {})
-            
-            for part in parts:
-                category = part.get("category", "rigging").lower()
-                name = part.get("name", "")
-                if not name:
-                    continue
-                
-                if category in ["rigging", "rig"]:
-                    cat_key = "rigging"
-                elif category in ["sails", "sail"]:
-                    cat_key = "sails"
-                elif category in ["engine", "motor"]:
-                    cat_key = "engine"
-                elif category in ["hull", "deck"]:
-                    cat_key = "hull"
-                elif category in ["electrical", "electric", "electronics"]:
-                    cat_key = "electrical"
-                elif category in ["plumbing", "water"]:
-                    cat_key = "plumbing"
-                else:
-                    cat_key = "rigging"
-                
-                if cat_key not in parts_dict:
-                    parts_dict[cat_key] = []
-                
-                part_entry = {
-                    "name": name,
-                    "description": f"{manufacturer} {yacht_name} - {name}",
-                    "specifications": [
-                        part.get("model", ""),
-                        part.get("manufacturer", ""),
-                        f"Interval: {part.get('interval', 'N/A')} months" if part.get("interval") else ""
-                    ]
-                }
-                
-                parts_dict[cat_key].append(part_entry)
-            
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
-            
-            print(f"✅ extracted_yacht_parts_detailed.json에 저장됨")
-        except Exception as e:
-            print(f"⚠️ extracted_yacht_parts_detailed.json 저장 실패: {e}")
-    
-    def _add_to_extracted_parts(self, yacht_id: str, yacht_name: str, manufacturer: str, manual_pdf: str, parts: List[Dict]):
-        """extracted_yacht_parts.json에 부품 추가 (간단한 형식)"""
-        try:
-            file_path = 'data/extracted_yacht_parts.json'
-            if os.path.exists(file_path):
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-            else:
-                data = {"yachts": []}
-            
-            # data가 리스트인 경우 딕셔너리로 변환
-            if isinstance(data, list):
-                data = {"yachts": data}
-            
-            # data가 딕셔너리가 아니거나 "yachts" 키가 없는 경우
-            if not isinstance(data, dict):
-                data = {"yachts": []}
-            elif "yachts" not in data:
-                data["yachts"] = []
-            
-            yacht_entry = None
-            for yacht in data.get("yachts", []):
-                if yacht.get("id") == yacht_id:
-                    yacht_entry = yacht
-                    break
-            
-            if not yacht_entry:
-                yacht_entry = {
-                    "id": yacht_id,
-                    "name": yacht_name,
-                    "manufacturer": manufacturer,
-                    "parts": []
-                }
-                if not isinstance(data.get("yachts"), list):
-                    data["yachts"] = []
-                data["yachts"].append(yacht_entry)
-            
-            # 기존 부품 목록 가져오기 (중복 방지)
-            if not isinstance(yacht_entry, dict):
-                yacht_entry = {"parts": []}
-            existing_parts = yacht_entry.get("parts", [])
-            existing_part_names = {p.get("name", "") for p in existing_parts if isinstance(p, dict)}
-            
-            for part in parts:
-                # parts가 dict인지 확인
-                if not isinstance(part, dict):
-                    continue
-                    
-                name = part.get("name", "")
-                if not name or name in existing_part_names:
-                    continue
-                
-                part_entry = {
-                    "name": name,
-                    "manufacturer": part.get("manufacturer", ""),
-                    "model": part.get("model", ""),
-                    "category": part.get("category", "rigging"),
-                    "interval": part.get("interval")
-                }
-                
-                yacht_entry["parts"].append(part_entry)
-                existing_part_names.add(name)
-            
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
-            
-            print(f"✅ extracted_yacht_parts.json에 저장됨")
-        except Exception as e:
-            print(f"⚠️ extracted_yacht_parts.json 저장 실패: {e}")
-            import traceback
-            traceback.print_exc()
-    
-    def _add_to_parts_app_data(self, yacht_id: str, yacht_name: str, manufacturer: str, manual_pdf: str, parts: List[Dict]):
-        """yacht_parts_app_data.json에 부품 추가"""
-        try:
-            file_path = 'data/yacht_parts_app_data.json'
-            if os.path.exists(file_path):
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-            else:
-                data = {"yachts": []}
-            
-            yacht_entry = None
-            for yacht in data.get("yachts", []):
-                if yacht.get("id") == yacht_id:
-                    yacht_entry = yacht
-                    break
-            
-            if not yacht_entry:
-                yacht_entry = {
-                    "id": yacht_id,
-                    "name": yacht_name,
-                    "manufacturer": manufacturer,
-                    "parts": []
-                }
-                data["yachts"].append(yacht_entry)
-            
-            for part in parts:
-                name = part.get("name", "")
-                if not name:
-                    continue
-                
-                part_entry = {
-                    "name": name,
-                    "manufacturer": part.get("manufacturer", ""),
-                    "model": part.get("model", ""),
-                    "category": part.get("category", "rigging"),
-                    "maintenanceInterval": part.get("interval", 12)
-                }
-                
-                yacht_entry["parts"].append(part_entry)
-            
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
-            
-            print(f"✅ yacht_parts_app_data.json에 저장됨")
-        except Exception as e:
-            print(f"⚠️ yacht_parts_app_data.json 저장 실패: {e}")
-    
     def get_registration_data(self) -> Optional[Dict]:
         """현재 등록 중인 요트 데이터 반환"""
         return self.current_yacht_registration
@@ -3166,23 +2980,290 @@ def run_interactive_mode(api_key: str = None):
             print(f"\n❌ 오류 발생: {e}")
 
 
-def run_api_server(api_key: str = None, port: int = 5000):
-    """API 서버 모드 실행"""
+def create_app(api_key: str = None):
+    """
+    API 서버 Flask 앱 생성 (앱 팩토리)
+    
+    개발 서버 (run_api_server)와 운영 서버 (gunicorn, wsgi.py)가 같은 앱을 사용합니다.
+    gunicorn preload_app으로 마스터에서 한 번 호출하면 카탈로그와 정형 답변 캐시를
+    미리 채운 상태로 작업자 프로세스가 fork됩니다.
+    
+    작업자 프로세스 간 공유:
+    - 카탈로그: 파일 변경 확인으로 다른 작업자의 등록 내용을 다시 읽음
+    - 정형 답변 캐시: 작업자별 메모리, 요트별 데이터 버전으로 무효화
+    - LLM 응답 캐시, 세션 기록, 작업 큐: 같은 SQLite 파일 공유
+    """
     if not HAS_FLASK:
-        print("❌ Flask가 설치되지 않았습니다. pip install flask flask-cors")
-        return
+        raise RuntimeError("Flask가 설치되지 않았습니다. pip install flask flask-cors")
+    
+    api_key = api_key or os.getenv('GEMINI_API_KEY')
+    
+    # 요트 카탈로그는 프로세스당 한 번만 로드하고 모든 세션이 공유
+    catalog_store = get_shared_catalog_store()
+    catalog_store.get()
+    
+    chatbot = UnifiedYachtChatbot(api_key=api_key, mode="api", catalog_store=catalog_store)
     
-    chatbot = UnifiedYachtChatbot(api_key=api_key, mode="api")
+    # 자주 묻는 정형 답변 (치수, 엔진, 정비 등)을 전체 요트에 대해 미리 생성
+    warmed = chatbot.warm_answer_cache()
+    print(f"⚡ 정형 답변 캐시 준비 완료 ({warmed}개)")
     
     app = Flask(__name__)
     CORS(app)
     
-    chatbot_sessions = {}
+    # 세션 저장소 (LRU + 유휴 만료, 제거된 세션 기록은 SQLite로 내려쓰기)
+    # 공유 모드: 대화마다 기록을 저장해 어느 작업자 프로세스로 요청이 가도 대화를 이어감
+    chatbot_sessions = SessionStore(
+        lambda: UnifiedYachtChatbot(api_key=api_key, mode="api", catalog_store=catalog_store),
+        max_sessions=int(os.getenv('CHAT_SESSION_MAX', 200)),
+        idle_ttl=float(os.getenv('CHAT_SESSION_TTL', 1800)),
+        max_history=int(os.getenv('CHAT_HISTORY_MAX', 100)),
+        shared=os.getenv('CHAT_SESSION_SHARED', '1') == '1'
+    )
     
     def get_or_create_chatbot(session_id: str):
-        if session_id not in chatbot_sessions:
-            chatbot_sessions[session_id] = UnifiedYachtChatbot(api_key=api_key, mode="api")
-        return chatbot_sessions[session_id]
+        return chatbot_sessions.get(session_id)
+    
+    # 문서 처리 작업 큐 (추출 → 분석 → 저장을 요청 밖에서 실행, 상태는 SQLite에 저장)
+    job_queue = JobQueue(
+        workers=int(os.getenv('JOB_WORKERS', 2)),
+        max_pending=int(os.getenv('JOB_MAX_PENDING', 100))
+    )
+    
+    def wants_async() -> bool:
+        """?async=1 또는 form의 async=1이면 작업 ID를 즉시 반환"""
+        value = request.args.get('async') or request.form.get('async') or ''
+        return value.lower() in ('1', 'true', 'yes')
+    
+    def submit_job(kind: str, payload: Dict):
+        """작업 제출 후 202 응답 (대기열이 가득 차면 업로드 파일을 지우고 503)"""
+        try:
+            job_id = job_queue.submit(kind, payload)
+        except JobQueueFull as e:
+            discard_upload(payload.get("file_path"))
+            return jsonify({"success": False, "error": str(e)}), 503
+        return jsonify({
+            "success": True,
+            "jobId": job_id,
+            "status": "queued",
+            "statusUrl": f"/api/jobs/{job_id}",
+            "eventsUrl": f"/api/jobs/{job_id}/events"
+        }), 202
+    
+    upload_folder = 'uploads'
+    
+    def save_upload(file) -> Tuple[str, str]:
+        """
+        업로드 파일을 uploads/<uuid>/<파일명>에 저장하고 (경로, 파일명) 반환
+        
+        같은 이름의 파일이 동시에 올라와도 (비동기 작업) 서로 덮어쓰지 않고,
+        분석 결과에는 원래 파일명이 그대로 남습니다.
+        """
+        if secure_filename:
+            filename = secure_filename(file.filename)
+        else:
+            # secure_filename이 없으면 기본 파일명 사용
+            filename = file.filename.replace(' ', '_')
+        upload_dir = os.path.join(upload_folder, uuid.uuid4().hex)
+        os.makedirs(upload_dir, exist_ok=True)
+        file_path = os.path.join(upload_dir, filename)
+        file.save(file_path)
+        return file_path, filename
+    
+    def discard_upload(file_path: Optional[str]):
+        """처리가 끝난 업로드 파일 삭제 (save_upload가 만든 디렉터리도 비었으면 삭제)"""
+        if not file_path:
+            return
+        try:
+            os.remove(file_path)
+        except OSError:
+            pass
+        upload_dir = os.path.dirname(file_path)
+        if os.path.dirname(upload_dir) == upload_folder:
+            try:
+                os.rmdir(upload_dir)
+            except OSError:
+                pass
+    
+    def _report(job, stage: str, message: str = None):
+        if job is not None:
+            job.progress(stage, message)
+    
+    def process_chat_upload(session_id: str, file_path: str, filename: str, user_message: str, job=None):
+        """업로드된 PDF를 챗봇 대화로 처리"""
+        _report(job, 'analyzing', filename)
+        chatbot = get_or_create_chatbot(session_id)
+        ai_response = chatbot.chat(user_message, pdf_file_path=file_path)
+        chatbot_sessions.save(session_id)
+        return {
+            "success": True,
+            "response": ai_response,
+            "session_id": session_id,
+            "file_name": filename,
+            "timestamp": datetime.now().isoformat()
+        }, 200
+    
+    def process_registration(session_id: str, file_path: str, filename: str, job=None):
+        """요트 PDF 등록: 텍스트 추출 → AI 분석 → JSON 저장"""
+        # 챗봇 인스턴스 가져오기
+        chatbot = get_or_create_chatbot(session_id)
+        
+        # 텍스트 추출
+        print(f"📄 파일 분석 시작: {filename}", flush=True)
+        _report(job, 'extracting', filename)
+        extracted_text = chatbot._extract_text_from_file(file_path)
+        
+        if not extracted_text or len(extracted_text.strip()) < 100:
+            return {
+                "success": False,
+                "error": f"{filename}에서 텍스트를 추출할 수 없습니다."
+            }, 400
+        
+        # AI 분석 (JSON 형식으로)
+        print(f"🤖 AI 분석 중...", flush=True)
+        _report(job, 'analyzing')
+        analysis_result = chatbot._analyze_document_directly(file_path, extracted_text)
+        
+        # 분석 실패 확인
+        if "error" in analysis_result:
+            return {
+                "success": False,
+                "error": analysis_result.get("error", "분석 실패")
+            }, 500
+        
+        # 등록 데이터 변환
+        registration_data = chatbot._convert_analysis_to_registration(analysis_result)
+        
+        # JSON 파일 저장
+        _report(job, 'saving')
+        chatbot._save_registration_to_json(registration_data, analysis_result, extracted_text)
+        
+        # JSON 형식으로 응답 (자연어 없음)
+        return {
+            "success": True,
+            "fileName": filename,
+            "timestamp": datetime.now().isoformat(),
+            "yacht": {
+                "basicInfo": registration_data.get("basicInfo", {}),
+                "specifications": registration_data.get("specifications", {}),
+                "parts": registration_data.get("parts", [])
+            },
+            "analysisResult": {
+                "documentInfo": analysis_result.get("documentInfo", {}),
+                "yachtSpecs": analysis_result.get("yachtSpecs", {}),
+                "detailedDimensions": analysis_result.get("detailedDimensions", {}),
+                "exterior": analysis_result.get("exterior", {}),
+                "groundTackle": analysis_result.get("groundTackle", {}),
+                "sailInventory": analysis_result.get("sailInventory", []),
+                "deckEquipment": analysis_result.get("deckEquipment", {}),
+                "accommodations": analysis_result.get("accommodations", {}),
+                "tanks": analysis_result.get("tanks", {}),
+                "electricalSystem": analysis_result.get("electricalSystem", {}),
+                "electronics": analysis_result.get("electronics", {}),
+                "plumbingSystem": analysis_result.get("plumbingSystem", {}),
+                "parts": analysis_result.get("parts", []),
+                "maintenance": analysis_result.get("maintenance", [])
+            }
+        }, 200
+    
+    def process_pdf_analysis(tmp_path: str, original_filename: str, job=None):
+        """PDF 부품 분석 (Backend DTO 형식), 끝나면 임시 파일 삭제"""
+        try:
+            # 챗봇 인스턴스로 분석
+            chatbot = get_or_create_chatbot('backend-api')
+            
+            # PDF 텍스트 추출
+            _report(job, 'extracting', original_filename)
+            extracted_text = chatbot._extract_text_from_file(tmp_path)
+            
+            if not extracted_text or len(extracted_text.strip()) < 100:
+                return {
+                    "success": False,
+                    "error": "Unable to extract text from PDF"
+                }, 400
+            
+            # AI 분석
+            _report(job, 'analyzing')
+            analysis_result = chatbot._analyze_document_directly(tmp_path, extracted_text)
+            
+            if not analysis_result or "error" in analysis_result:
+                return {
+                    "success": False,
+                    "error": analysis_result.get("error", "Analysis failed")
+                }, 500
+            
+            # Backend DTO 형식으로 변환
+            parts_list = analysis_result.get('parts', [])
+            parts_dto = []
+            
+            for part in parts_list:
+                parts_dto.append({
+                    "id": part.get('id', ''),
+                    "name": part.get('name', ''),
+                    "manufacturer": part.get('manufacturer', ''),
+                    "model": part.get('model', ''),
+                    "interval": part.get('maintenanceDetails', {}).get('interval'),
+                    "maintenanceDetails": {
+                        "recommendedInterval": part.get('maintenanceDetails', {}).get('recommendedInterval', ''),
+                        "maintenanceMethod": part.get('maintenanceDetails', {}).get('maintenanceMethod', ''),
+                        "notes": part.get('maintenanceDetails', {}).get('notes', '')
+                    }
+                })
+            
+            yacht_name = analysis_result.get('documentInfo', {}).get('yachtName', 'Unknown')
+            yacht_id = chatbot._generate_yacht_id(yacht_name)
+            
+            return {
+                "success": True,
+                "yachtId": yacht_id,
+                "yachtName": yacht_name,
+                "parts": parts_dto,
+                "totalParts": len(parts_dto),
+                "documentInfo": {
+                    "fileName": original_filename,
+                    "manufacturer": analysis_result.get('documentInfo', {}).get('manufacturer', ''),
+                    "model": analysis_result.get('documentInfo', {}).get('model', ''),
+                    "year": analysis_result.get('documentInfo', {}).get('year')
+                }
+            }, 200
+            
+        finally:
+            # 임시 파일 삭제
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+    
+    def _missing_file_result(payload: Dict):
+        return {"success": False, "error": f"업로드 파일이 없습니다: {payload.get('filename')}"}
+    
+    def run_chat_upload_job(job, payload: Dict) -> Dict:
+        if not os.path.exists(payload["file_path"]):
+            return _missing_file_result(payload)
+        try:
+            return process_chat_upload(payload["session_id"], payload["file_path"],
+                                       payload["filename"], payload["message"], job)[0]
+        finally:
+            discard_upload(payload["file_path"])
+    
+    def run_registration_job(job, payload: Dict) -> Dict:
+        if not os.path.exists(payload["file_path"]):
+            return _missing_file_result(payload)
+        try:
+            return process_registration(payload["session_id"], payload["file_path"], payload["filename"], job)[0]
+        finally:
+            discard_upload(payload["file_path"])
+    
+    def run_pdf_analysis_job(job, payload: Dict) -> Dict:
+        if not os.path.exists(payload["file_path"]):
+            return _missing_file_result(payload)
+        return process_pdf_analysis(payload["file_path"], payload["filename"], job)[0]
+    
+    job_queue.register('chat_upload', run_chat_upload_job)
+    job_queue.register('register', run_registration_job)
+    job_queue.register('analyze_pdf', run_pdf_analysis_job)
+    # 끝나지 않은 작업 복구는 여기서 한 번만 (preload 시 fork 전 마스터에서 실행)
+    # 작업자 스레드는 프로세스마다 시작 (run_api_server, gunicorn post_worker_init, 첫 submit)
+    job_queue.recover()
+    app.extensions['job_queue'] = job_queue
     
     @app.route('/api/chat', methods=['POST'])
     def chat():
@@ -3197,6 +3278,7 @@ def run_api_server(api_key: str = None, port: int = 5000):
             
             chatbot = get_or_create_chatbot(session_id)
             ai_response = chatbot.chat(user_message, pdf_file_path=pdf_file_path)
+            chatbot_sessions.save(session_id)
             
             return jsonify({
                 "success": True,
@@ -3207,6 +3289,40 @@ def run_api_server(api_key: str = None, port: int = 5000):
         except Exception as e:
             return jsonify({"success": False, "error": str(e)}), 500
     
+    @app.route('/api/chat/stream', methods=['GET', 'POST'])
+    def chat_stream():
+        """
+        스트리밍 채팅 API (Server-Sent Events)
+        
+        Request:
+        - POST JSON {"message", "session_id"} 또는 GET ?message=...&session_id=...
+        
+        Response (text/event-stream):
+        - event: delta   - AI 응답 조각 (data: {"text"})
+        - event: replace - 후처리로 응답 전체가 바뀜, 이전 조각 대체 (data: {"text"})
+        - event: done    - 최종 응답 (data: {"text", "session_id", "timestamp"})
+        - event: error   - 오류 (data: {"text"})
+        """
+        data = request.get_json(silent=True) if request.method == 'POST' else request.args
+        if not data or not data.get('message'):
+            return jsonify({"success": False, "error": "메시지가 필요합니다."}), 400
+        
+        user_message = data['message']
+        session_id = data.get('session_id', 'default')
+        pdf_file_path = data.get('pdf_file_path')
+        chatbot = get_or_create_chatbot(session_id)
+        
+        def generate():
+            for event in chatbot.chat_stream(user_message, pdf_file_path=pdf_file_path):
+                payload = {"text": event["text"]}
+                if event["event"] == "done":
+                    payload.update({"session_id": session_id, "timestamp": datetime.now().isoformat()})
+                yield f"event: {event['event']}\ndata: {json.dumps(payload, ensure_ascii=False)}\n\n"
+            chatbot_sessions.save(session_id)
+        
+        return Response(generate(), mimetype='text/event-stream',
+                        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
+    
     @app.route('/api/chat/upload', methods=['POST'])
     def upload_pdf():
         """
@@ -3217,6 +3333,7 @@ def run_api_server(api_key: str = None, port: int = 5000):
         - file: PDF 파일
         - message: 사용자 메시지 (선택사항)
         - session_id: 세션 ID (선택사항)
+        - async: 1이면 작업 ID를 즉시 반환 (선택사항)
         """
         try:
             if 'file' not in request.files:
@@ -3229,33 +3346,27 @@ def run_api_server(api_key: str = None, port: int = 5000):
             if not file.filename.lower().endswith('.pdf'):
                 return jsonify({"success": False, "error": "PDF 파일만 업로드 가능합니다."}), 400
             
-            # 파일 저장
-            upload_folder = 'uploads'
-            os.makedirs(upload_folder, exist_ok=True)
-            
-            if secure_filename:
-                filename = secure_filename(file.filename)
-            else:
-                # secure_filename이 없으면 기본 파일명 사용
-                filename = file.filename.replace(' ', '_')
-            file_path = os.path.join(upload_folder, filename)
-            file.save(file_path)
+            # 파일 저장 (업로드마다 고유 디렉터리)
+            file_path, filename = save_upload(file)
             
             # 세션 정보
             session_id = request.form.get('session_id', 'default')
             user_message = request.form.get('message', f'PDF 파일 업로드: {filename}')
             
-            # 챗봇으로 처리
-            chatbot = get_or_create_chatbot(session_id)
-            ai_response = chatbot.chat(user_message, pdf_file_path=file_path)
+            if wants_async():
+                return submit_job('chat_upload', {
+                    "session_id": session_id,
+                    "file_path": file_path,
+                    "filename": filename,
+                    "message": user_message
+                })
             
-            return jsonify({
-                "success": True,
-                "response": ai_response,
-                "session_id": session_id,
-                "file_name": filename,
-                "timestamp": datetime.now().isoformat()
-            })
+            # 챗봇으로 처리
+            try:
+                body, status = process_chat_upload(session_id, file_path, filename, user_message)
+            finally:
+                discard_upload(file_path)
+            return jsonify(body), status
         except Exception as e:
             return jsonify({"success": False, "error": str(e)}), 500
     
@@ -3270,6 +3381,7 @@ def run_api_server(api_key: str = None, port: int = 5000):
         
         Response:
         - JSON 형식의 추출된 요트 데이터 (자연어 없음)
+        - async=1이면 202 + jobId (결과는 /api/jobs/<jobId>에서 조회)
         """
         try:
             if 'file' not in request.files:
@@ -3282,77 +3394,24 @@ def run_api_server(api_key: str = None, port: int = 5000):
             if not file.filename.lower().endswith('.pdf'):
                 return jsonify({"success": False, "error": "PDF 파일만 업로드 가능합니다."}), 400
             
-            # 파일 저장
-            upload_folder = 'uploads'
-            os.makedirs(upload_folder, exist_ok=True)
-            
-            if secure_filename:
-                filename = secure_filename(file.filename)
-            else:
-                filename = file.filename.replace(' ', '_')
-            file_path = os.path.join(upload_folder, filename)
-            file.save(file_path)
+            # 파일 저장 (업로드마다 고유 디렉터리)
+            file_path, filename = save_upload(file)
             
             # 세션 정보
             session_id = request.form.get('session_id', 'default')
             
-            # 챗봇 인스턴스 가져오기
-            chatbot = get_or_create_chatbot(session_id)
-            
-            # 텍스트 추출
-            print(f"📄 파일 분석 시작: {filename}", flush=True)
-            extracted_text = chatbot._extract_text_from_file(file_path)
-            
-            if not extracted_text or len(extracted_text.strip()) < 100:
-                return jsonify({
-                    "success": False,
-                    "error": f"{filename}에서 텍스트를 추출할 수 없습니다."
-                }), 400
-            
-            # AI 분석 (JSON 형식으로)
-            print(f"🤖 AI 분석 중...", flush=True)
-            analysis_result = chatbot._analyze_document_directly(file_path, extracted_text)
-            
-            # 분석 실패 확인
-            if "error" in analysis_result:
-                return jsonify({
-                    "success": False,
-                    "error": analysis_result.get("error", "분석 실패")
-                }), 500
-            
-            # 등록 데이터 변환
-            registration_data = chatbot._convert_analysis_to_registration(analysis_result)
-            
-            # JSON 파일 저장
-            chatbot._save_registration_to_json(registration_data, analysis_result)
+            if wants_async():
+                return submit_job('register', {
+                    "session_id": session_id,
+                    "file_path": file_path,
+                    "filename": filename
+                })
             
-            # JSON 형식으로 응답 (자연어 없음)
-            return jsonify({
-                "success": True,
-                "fileName": filename,
-                "timestamp": datetime.now().isoformat(),
-                "yacht": {
-                    "basicInfo": registration_data.get("basicInfo", {}),
-                    "specifications": registration_data.get("specifications", {}),
-                    "parts": registration_data.get("parts", [])
-                },
-                "analysisResult": {
-                    "documentInfo": analysis_result.get("documentInfo", {}),
-                    "yachtSpecs": analysis_result.get("yachtSpecs", {}),
-                    "detailedDimensions": analysis_result.get("detailedDimensions", {}),
-                    "exterior": analysis_result.get("exterior", {}),
-                    "groundTackle": analysis_result.get("groundTackle", {}),
-                    "sailInventory": analysis_result.get("sailInventory", []),
-                    "deckEquipment": analysis_result.get("deckEquipment", {}),
-                    "accommodations": analysis_result.get("accommodations", {}),
-                    "tanks": analysis_result.get("tanks", {}),
-                    "electricalSystem": analysis_result.get("electricalSystem", {}),
-                    "electronics": analysis_result.get("electronics", {}),
-                    "plumbingSystem": analysis_result.get("plumbingSystem", {}),
-                    "parts": analysis_result.get("parts", []),
-                    "maintenance": analysis_result.get("maintenance", [])
-                }
-            }), 200
+            try:
+                body, status = process_registration(session_id, file_path, filename)
+            finally:
+                discard_upload(file_path)
+            return jsonify(body), status
             
         except Exception as e:
             print(f"❌ Error: {e}")
@@ -3364,8 +3423,7 @@ def run_api_server(api_key: str = None, port: int = 5000):
     def get_history():
         try:
             session_id = request.args.get('session_id', 'default')
-            chatbot = get_or_create_chatbot(session_id)
-            history = chatbot.get_history()
+            history = chatbot_sessions.get_history(session_id)
             return jsonify({"success": True, "history": history})
         except Exception as e:
             return jsonify({"success": False, "error": str(e)}), 500
@@ -3382,15 +3440,11 @@ def run_api_server(api_key: str = None, port: int = 5000):
                     "error": "yacht_name parameter is required"
                 }), 400
             
-            # 챗봇 인스턴스 생성
-            chatbot = get_or_create_chatbot('backend-api')
+            # 공유 카탈로그 인덱스로 조회 (요트 수와 무관하게 O(1))
+            catalog = catalog_store.get()
             
             # 요트 데이터 조회
-            yacht_data = None
-            for yacht in chatbot.yacht_data.get('yachts', []):
-                if yacht.get('name', '').lower() == yacht_name.lower():
-                    yacht_data = yacht
-                    break
+            yacht_data = catalog.find_yacht(yacht_name)
             
             if not yacht_data:
                 return jsonify({
@@ -3400,12 +3454,7 @@ def run_api_server(api_key: str = None, port: int = 5000):
             
             # 부품 데이터 조회
             yacht_id = yacht_data.get('id', '')
-            parts_list = []
-            
-            for yacht_parts in chatbot.parts_data.get('yachts', []):
-                if yacht_parts.get('id') == yacht_id:
-                    parts_list = yacht_parts.get('parts', [])
-                    break
+            parts_list = catalog.get_parts(yacht_id)
             
             # Backend DTO 형식으로 변환
             parts_dto = []
@@ -3470,69 +3519,12 @@ def run_api_server(api_key: str = None, port: int = 5000):
                 file.save(tmp_file.name)
                 tmp_path = tmp_file.name
             
-            try:
-                # 챗봇 인스턴스로 분석
-                chatbot = get_or_create_chatbot('backend-api')
-                
-                # PDF 텍스트 추출
-                extracted_text = chatbot._extract_text_from_pdf(tmp_path)
-                
-                if not extracted_text or len(extracted_text.strip()) < 100:
-                    return jsonify({
-                        "success": False,
-                        "error": "Unable to extract text from PDF"
-                    }), 400
-                
-                # AI 분석
-                analysis_result = chatbot._analyze_document_directly(tmp_path, extracted_text)
-                
-                if not analysis_result or "error" in analysis_result:
-                    return jsonify({
-                        "success": False,
-                        "error": analysis_result.get("error", "Analysis failed")
-                    }), 500
-                
-                # Backend DTO 형식으로 변환
-                parts_list = analysis_result.get('parts', [])
-                parts_dto = []
-                
-                for part in parts_list:
-                    parts_dto.append({
-                        "id": part.get('id', ''),
-                        "name": part.get('name', ''),
-                        "manufacturer": part.get('manufacturer', ''),
-                        "model": part.get('model', ''),
-                        "interval": part.get('maintenanceDetails', {}).get('interval'),
-                        "maintenanceDetails": {
-                            "recommendedInterval": part.get('maintenanceDetails', {}).get('recommendedInterval', ''),
-                            "maintenanceMethod": part.get('maintenanceDetails', {}).get('maintenanceMethod', ''),
-                            "notes": part.get('maintenanceDetails', {}).get('notes', '')
-                        }
-                    })
-                
-                yacht_name = analysis_result.get('documentInfo', {}).get('yachtName', 'Unknown')
-                yacht_id = chatbot._generate_yacht_id(yacht_name)
-                
-                return jsonify({
-                    "success": True,
-                    "yachtId": yacht_id,
-                    "yachtName": yacht_name,
-                    "parts": parts_dto,
-                    "totalParts": len(parts_dto),
-                    "documentInfo": {
-                        "fileName": file.filename,
-                        "manufacturer": analysis_result.get('documentInfo', {}).get('manufacturer', ''),
-                        "model": analysis_result.get('documentInfo', {}).get('model', ''),
-                        "year": analysis_result.get('documentInfo', {}).get('year')
-                    }
-                }), 200
-                
-            finally:
-                # 임시 파일 삭제
-                import os
-                if os.path.exists(tmp_path):
-                    os.remove(tmp_path)
-                    
+            if wants_async():
+                return submit_job('analyze_pdf', {"file_path": tmp_path, "filename": file.filename})
+            
+            body, status = process_pdf_analysis(tmp_path, file.filename)
+            return jsonify(body), status
+            
         except Exception as e:
             print(f"❌ Error in analyze_pdf_file: {e}")
             import traceback
@@ -3542,17 +3534,46 @@ def run_api_server(api_key: str = None, port: int = 5000):
                 "error": str(e)
             }), 500
     
+    @app.route('/api/jobs/<job_id>', methods=['GET'])
+    def get_job(job_id):
+        """문서 처리 작업 상태 조회 (queued → running → succeeded/failed)"""
+        job = job_queue.get(job_id)
+        if job is None:
+            return jsonify({"success": False, "error": "작업을 찾을 수 없습니다."}), 404
+        return jsonify({"success": True, **job}), 200
+    
+    @app.route('/api/jobs/<job_id>/events', methods=['GET'])
+    def stream_job_events(job_id):
+        """문서 처리 작업 진행 이벤트 (Server-Sent Events, 작업이 끝나면 종료)"""
+        if job_queue.get(job_id) is None:
+            return jsonify({"success": False, "error": "작업을 찾을 수 없습니다."}), 404
+        
+        def generate():
+            for job in job_queue.events(job_id):
+                if job is None:
+                    yield ": keep-alive\n\n"
+                    continue
+                event = "done" if job["status"] in ("succeeded", "failed") else "progress"
+                yield f"event: {event}\ndata: {json.dumps(job, ensure_ascii=False)}\n\n"
+        
+        return Response(generate(), mimetype='text/event-stream',
+                        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
+    
     @app.route('/api/health', methods=['GET'])
     def health_check():
         """헬스체크 엔드포인트"""
         try:
             chatbot = get_or_create_chatbot('health-check')
-            yacht_count = len(chatbot.yacht_data.get('yachts', []))
+            yacht_count = len(chatbot.catalog.summaries)
+            llm_cache = get_shared_llm_cache()
             
             return jsonify({
                 "status": "healthy",
                 "timestamp": datetime.now().isoformat(),
                 "yachtCount": yacht_count,
+                "answerCache": get_shared_answer_cache().stats(),
+                "llmCache": llm_cache.stats() if llm_cache is not None else None,
+                "gemini": gemini_stats(),
                 "version": "5.0"
             }), 200
         except Exception as e:
@@ -3562,6 +3583,18 @@ def run_api_server(api_key: str = None, port: int = 5000):
                 "timestamp": datetime.now().isoformat()
             }), 500
     
+    return app
+
+
+def run_api_server(api_key: str = None, port: int = 5000):
+    """API 서버 모드 실행 (개발 서버, 운영 환경은 gunicorn -c gunicorn.conf.py wsgi:app)"""
+    if not HAS_FLASK:
+        print("❌ Flask가 설치되지 않았습니다. pip install flask flask-cors")
+        return
+    
+    app = create_app(api_key=api_key)
+    app.extensions['job_queue'].start()
+    
     print("=" * 60)
     print("🌐 HooAah Yacht AI Chatbot API Server")
     print("=" * 60)
@@ -3580,7 +3613,9 @@ def run_api_server(api_key: str = None, port: int = 5000):
     print("=" * 60)
     print()
     
-    app.run(host='0.0.0.0', port=port, debug=True)
+    # 디버그 모드/리로더는 FLASK_DEBUG=1일 때만 (리로더는 프로세스를 하나 더 띄워 초기화를 반복함)
+    debug = os.getenv('FLASK_DEBUG', '0') == '1'
+    app.run(host='0.0.0.0', port=port, debug=debug, use_reloader=debug, threaded=True)
 
 
 def main():
@@ -9,6 +9,7 @@ import google.generativeai as genai
 from datetime import datetime
 from typing import List, Dict, Optional
 from yacht_document_analyzer import YachtDocumentAnalyzer
+from gemini_client import GeminiClient
 import tempfile
 import shutil
 
@@ -39,6 +40,9 @@ class YachtAIChatbotWithPDF:
             self.model = genai.GenerativeModel('gemini-pro')
             print("✅ gemini-pro 모델 사용 (fallback)")
         
+        # 요청 한도 / 재시도 / 시간 제한 / 요청 병합 (같은 API 키의 모든 인스턴스가 공유)
+        self.model = GeminiClient(self.model, api_key=api_key)
+        
         # 문서 분석기 초기화
         self.document_analyzer = YachtDocumentAnalyzer(api_key=api_key)
         
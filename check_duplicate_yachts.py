@@ -1,14 +1,19 @@
 """
 요트 데이터 중복 확인 스크립트
 여러 JSON 파일에서 중복된 요트를 찾아 정리합니다.
+카탈로그 파일 (스펙/부품/매뉴얼 자료)은 SQLite 카탈로그에서 요트 항목만 읽습니다.
 """
 
 import json
 import os
 import sys
+import sqlite3
 from collections import defaultdict
 from pathlib import Path
 
+from catalog_db import MANUAL_RESOURCES_FILE, open_catalog
+from yacht_store import PARTS_APP_DATA_VIEW, PARTS_DATABASE_VIEW
+
 # Windows 콘솔 인코딩 설정
 if sys.platform == 'win32':
     try:
@@ -26,6 +31,14 @@ def load_json_file(file_path):
         print(f"⚠️ {file_path} 로드 실패: {e}")
         return None
 
+def open_catalog_or_none(data_dir):
+    """SQLite 카탈로그 (JSON이 바뀌었으면 가져옴), 쓸 수 없으면 None (JSON 파일을 직접 읽음)"""
+    try:
+        return open_catalog(str(data_dir))
+    except (json.JSONDecodeError, OSError, sqlite3.Error) as e:
+        print(f"⚠️ SQLite 카탈로그를 사용할 수 없어 JSON 파일을 읽습니다: {e}")
+        return None
+
 def extract_yacht_names_from_specifications(data):
     """yacht_specifications.json에서 요트 이름 추출"""
     yachts = []
@@ -35,8 +48,8 @@ def extract_yacht_names_from_specifications(data):
             if name:
                 yachts.append({
                     "name": name,
-                    "id": yacht.get("id", ""),
-                    "manufacturer": yacht.get("manufacturer", "")
+                    "id": yacht.get("id") or "",
+                    "manufacturer": yacht.get("manufacturer") or ""
                 })
     return yachts
 
@@ -141,11 +154,12 @@ def check_duplicates():
     
     # 각 파일에서 요트 이름 추출
     all_yachts = defaultdict(list)
+    catalog = open_catalog_or_none(data_dir)
     
     # 1. yacht_specifications.json
     specs_file = data_dir / "yacht_specifications.json"
     if specs_file.exists():
-        data = load_json_file(specs_file)
+        data = {"yachts": catalog.list_yachts()} if catalog else load_json_file(specs_file)
         if data:
             yachts = extract_yacht_names_from_specifications(data)
             for yacht in yachts:
@@ -178,7 +192,8 @@ def check_duplicates():
     # 3. yacht_parts_database.json
     parts_db_file = data_dir / "yacht_parts_database.json"
     if parts_db_file.exists():
-        data = load_json_file(parts_db_file)
+        data = ({"yachts": catalog.list_parts_entries(PARTS_DATABASE_VIEW)} if catalog
+                else load_json_file(parts_db_file))
         if data:
             yachts = extract_yacht_names_from_parts_database(data)
             for yacht in yachts:
@@ -209,7 +224,8 @@ def check_duplicates():
     # 5. yacht_parts_app_data.json
     app_data_file = data_dir / "yacht_parts_app_data.json"
     if app_data_file.exists():
-        data = load_json_file(app_data_file)
+        data = ({"yachts": catalog.list_parts_entries(PARTS_APP_DATA_VIEW)} if catalog
+                else load_json_file(app_data_file))
         if data:
             yachts = extract_yacht_names_from_parts_app_data(data)
             for yacht in yachts:
@@ -225,7 +241,7 @@ def check_duplicates():
     # 6. yacht_manual_resources.json
     manual_resources_file = data_dir / "yacht_manual_resources.json"
     if manual_resources_file.exists():
-        data = load_json_file(manual_resources_file)
+        data = catalog.export_json(MANUAL_RESOURCES_FILE) if catalog else load_json_file(manual_resources_file)
         if data:
             yachts = extract_yacht_names_from_manual_resources(data)
             for yacht in yachts:
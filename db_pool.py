@@ -0,0 +1,252 @@
+"""
+HooAah Yacht - DB 연결 풀
+여러 스레드 (API 요청)가 제한된 수의 DB 연결을 나눠 쓰는 스레드 안전 연결 풀
+
+특징:
+- 최대 연결 수 제한 (모두 사용 중이면 checkout_timeout초까지 대기 후 PoolExhausted)
+- 꺼낼 때 ping으로 상태 확인 → 서버가 끊은 연결 (MySQL wait_timeout)은 버리고 새로 연결
+- 오래 쉬었거나 (max_idle) 오래된 (recycle) 연결은 다시 연결
+- 컨텍스트 매니저 커서: 정상 종료 시 커밋 (commit=True), 예외 시 롤백
+- 반납할 때 항상 롤백 → 읽기만 한 연결도 트랜잭션 (REPEATABLE READ 스냅샷)을 끝내고 재사용
+- fork된 작업자 프로세스 (gunicorn)는 부모의 연결을 쓰지 않고 새로 연결
+
+사용법:
+    pool = ConnectionPool(lambda: pymysql.connect(**params), max_size=10)
+    with pool.cursor() as cursor:
+        cursor.execute("SELECT ...")
+    with pool.cursor(commit=True) as cursor:
+        cursor.execute("INSERT ...")
+
+환경 변수:
+    DB_POOL_SIZE: 최대 연결 수 (기본: 10)
+    DB_POOL_TIMEOUT: 연결을 기다리는 최대 시간 (초, 기본: 10)
+    DB_POOL_MAX_IDLE: 이 시간 이상 쉰 연결은 다시 연결 (초, 기본: 300)
+    DB_POOL_RECYCLE: 이 시간 이상 된 연결은 다시 연결 (초, 기본: 3600)
+"""
+
+import os
+import time
+import threading
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, Optional
+
+
+DEFAULT_POOL_SIZE = int(os.getenv('DB_POOL_SIZE', 10))
+DEFAULT_CHECKOUT_TIMEOUT = float(os.getenv('DB_POOL_TIMEOUT', 10))
+DEFAULT_MAX_IDLE = float(os.getenv('DB_POOL_MAX_IDLE', 300))
+DEFAULT_RECYCLE = float(os.getenv('DB_POOL_RECYCLE', 3600))
+
+
+class PoolExhausted(Exception):
+    """사용 가능한 연결이 없음 (대기 시간 초과)"""
+
+
+class PoolClosed(Exception):
+    """close()된 풀에서 연결을 꺼내려 함"""
+
+
+def default_ping(conn) -> None:
+    """연결 상태 확인 (pymysql: ping, 그 외: SELECT 1), 끊겼으면 예외"""
+    if hasattr(conn, 'ping'):
+        conn.ping(reconnect=False)
+    else:
+        cursor = conn.cursor()
+        try:
+            cursor.execute("SELECT 1")
+        finally:
+            cursor.close()
+
+
+class _PooledConnection:
+    """풀에 들어 있는 연결과 생성/마지막 사용 시각"""
+
+    __slots__ = ('conn', 'created_at', 'last_used')
+
+    def __init__(self, conn):
+        self.conn = conn
+        self.created_at = time.monotonic()
+        self.last_used = self.created_at
+
+
+class ConnectionPool:
+    """최대 크기 + 꺼낼 때 ping + 유휴/수명 재연결을 적용한 스레드 안전 연결 풀"""
+
+    def __init__(self, connect: Callable[[], Any], max_size: int = DEFAULT_POOL_SIZE,
+                 checkout_timeout: float = DEFAULT_CHECKOUT_TIMEOUT,
+                 max_idle: float = DEFAULT_MAX_IDLE, recycle: float = DEFAULT_RECYCLE,
+                 ping: Optional[Callable[[Any], None]] = default_ping):
+        """
+        Args:
+            connect: 새 DB-API 연결을 만드는 함수
+            max_size: 최대 연결 수 (사용 중 + 대기 중)
+            checkout_timeout: 연결을 기다리는 최대 시간 (초)
+            max_idle: 이 시간 이상 쉰 연결은 다시 연결 (초, 0이면 제한 없음)
+            recycle: 이 시간 이상 된 연결은 다시 연결 (초, 0이면 제한 없음)
+            ping: 꺼낼 때 연결 상태 확인 함수 (None이면 확인 안 함)
+        """
+        self._connect = connect
+        self.max_size = max(1, max_size)
+        self.checkout_timeout = checkout_timeout
+        self.max_idle = max_idle
+        self.recycle = recycle
+        self._ping = ping
+
+        # 최근 반납한 연결부터 재사용 (LIFO) → 오래 쉬는 연결은 자연스럽게 만료
+        self._idle: "deque[_PooledConnection]" = deque()
+        self._open = 0
+        self._cond = threading.Condition()
+        self._pid = os.getpid()
+        self._closed = False
+        self._stats = {"created": 0, "reused": 0, "recycled": 0, "broken": 0, "waits": 0}
+
+    # ============================================================
+    # 사용
+    # ============================================================
+
+    @contextmanager
+    def connection(self) -> Iterator[Any]:
+        """
+        연결 하나를 빌려 쓰고 반납
+
+        반납 전에 항상 롤백합니다 (커밋한 뒤라면 아무 일도 없음). 읽기만 한 연결의
+        트랜잭션이 열린 채 남으면 다음 사용자가 오래된 스냅샷을 보게 되기 때문입니다.
+        롤백이 실패한 연결은 폐기합니다.
+        """
+        pooled = self._checkout()
+        try:
+            yield pooled.conn
+        finally:
+            self._release(pooled, healthy=self._rollback(pooled.conn))
+
+    @contextmanager
+    def cursor(self, commit: bool = False) -> Iterator[Any]:
+        """커서를 빌려 씀 (commit=True면 정상 종료 시 커밋)"""
+        with self.connection() as conn:
+            cursor = conn.cursor()
+            try:
+                yield cursor
+            finally:
+                cursor.close()
+            if commit:
+                conn.commit()
+
+    def close(self):
+        """
+        쉬고 있는 연결을 모두 닫음
+
+        사용 중인 연결은 반납될 때 닫히고, 이후 연결을 꺼내면 PoolClosed가 발생합니다.
+        """
+        with self._cond:
+            self._closed = True
+            idle = list(self._idle)
+            self._idle.clear()
+            self._open -= len(idle)
+            self._cond.notify_all()
+        for pooled in idle:
+            self._close(pooled.conn)
+
+    def stats(self) -> Dict[str, int]:
+        """연결 수와 생성/재사용/재연결/폐기/대기 횟수"""
+        with self._cond:
+            return dict(self._stats, open=self._open, idle=len(self._idle), maxSize=self.max_size)
+
+    # ============================================================
+    # 꺼내기 / 반납
+    # ============================================================
+
+    def _checkout(self) -> _PooledConnection:
+        deadline = time.monotonic() + self.checkout_timeout
+        while True:
+            with self._cond:
+                if self._closed:
+                    raise PoolClosed("닫힌 DB 연결 풀입니다")
+                self._check_fork()
+                pooled = self._idle.pop() if self._idle else None
+                if pooled is None:
+                    if self._open < self.max_size:
+                        # 자리를 먼저 잡고 연결은 잠금 밖에서 생성
+                        self._open += 1
+                    else:
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0:
+                            raise PoolExhausted(f"DB 연결을 얻지 못했습니다 (최대 {self.max_size}개 사용 중)")
+                        self._stats["waits"] += 1
+                        self._cond.wait(remaining)
+                        continue
+
+            if pooled is None:
+                return self._create()
+            if self._usable(pooled):
+                with self._cond:
+                    self._stats["reused"] += 1
+                return pooled
+            # 만료되었거나 끊긴 연결: 닫고 같은 자리에 새로 연결
+            self._close(pooled.conn)
+            return self._create()
+
+    def _create(self) -> _PooledConnection:
+        """새 연결 (자리는 이미 잡혀 있음, 실패하면 자리 반환)"""
+        try:
+            pooled = _PooledConnection(self._connect())
+        except BaseException:
+            with self._cond:
+                self._open -= 1
+                self._cond.notify()
+            raise
+        with self._cond:
+            self._stats["created"] += 1
+        return pooled
+
+    def _usable(self, pooled: _PooledConnection) -> bool:
+        now = time.monotonic()
+        if (self.max_idle and now - pooled.last_used > self.max_idle) or \
+                (self.recycle and now - pooled.created_at > self.recycle):
+            with self._cond:
+                self._stats["recycled"] += 1
+            return False
+        if self._ping is None:
+            return True
+        try:
+            self._ping(pooled.conn)
+            return True
+        except Exception:
+            with self._cond:
+                self._stats["broken"] += 1
+            return False
+
+    def _release(self, pooled: _PooledConnection, healthy: bool):
+        with self._cond:
+            if os.getpid() != self._pid:
+                return
+            keep = healthy and not self._closed
+            if keep:
+                pooled.last_used = time.monotonic()
+                self._idle.append(pooled)
+            else:
+                self._open -= 1
+                if not healthy:
+                    self._stats["broken"] += 1
+            self._cond.notify()
+        if not keep:
+            self._close(pooled.conn)
+
+    def _rollback(self, conn) -> bool:
+        try:
+            conn.rollback()
+            return True
+        except Exception:
+            return False
+
+    def _close(self, conn):
+        try:
+            conn.close()
+        except Exception:
+            pass
+
+    def _check_fork(self):
+        """fork된 자식 프로세스: 부모의 연결 (같은 소켓)은 닫지 않고 버림"""
+        if os.getpid() != self._pid:
+            self._pid = os.getpid()
+            self._idle.clear()
+            self._open = 0
@@ -0,0 +1,302 @@
+"""
+HooAah Yacht - 문서 처리 결과 캐시
+파일 내용 해시(SHA-256) 기반으로 문서 처리 결과를 디스크에 저장하는 캐시
+
+- DocumentTextCache: 문서에서 추출한 텍스트 (PyPDF2 / pdfplumber / EasyOCR 결과)
+  키 = SHA-256(파일 바이트) + 추출기 버전
+  → 같은 매뉴얼을 다시 업로드하면 추출(특히 OCR)을 건너뜀
+- DocumentAnalysisCache: Gemini 문서 분석 결과 (JSON)
+  키 = SHA-256(분석에 사용한 텍스트) + 프롬프트 템플릿 해시
+  → 같은 문서를 다시 분석하면 LLM 호출 없이 즉시 반환
+
+캐시 크기가 한도를 넘으면 가장 오래 사용하지 않은 항목부터 삭제합니다.
+
+환경 변수:
+    DOCUMENT_CACHE_DIR: 캐시 디렉토리 (기본: .cache)
+    DOCUMENT_TEXT_CACHE_MAX_MB: 텍스트 캐시 최대 크기 (기본: 512)
+    DOCUMENT_ANALYSIS_CACHE_MAX_MB: 분석 결과 캐시 최대 크기 (기본: 256)
+    DOCUMENT_ANALYSIS_CACHE_MODE: 분석 결과 캐시 모드
+        readwrite (기본) - 캐시 조회 후 없으면 LLM 호출하여 저장
+        replay           - 캐시만 사용 (LLM 호출 안 함, 테스트/오프라인 배치용)
+        off              - 캐시 사용 안 함
+"""
+
+import os
+import json
+import hashlib
+import tempfile
+import threading
+from typing import Callable, Dict, Optional
+
+
+DEFAULT_CACHE_DIR = os.getenv('DOCUMENT_CACHE_DIR', '.cache')
+
+ANALYSIS_CACHE_MODES = ('readwrite', 'replay', 'off')
+
+# 이보다 짧은 추출 결과는 실패로 보고 캐시하지 않음 (OCR 패키지 설치 후 재시도 가능하도록)
+MIN_CACHEABLE_CHARS = 100
+
+
+def file_sha256(file_path: str, chunk_size: int = 1024 * 1024) -> str:
+    """파일 바이트의 SHA-256 해시"""
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def text_sha256(text: str) -> str:
+    """문자열(UTF-8)의 SHA-256 해시"""
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+class _DiskCache:
+    """키 → 파일 하나로 저장하는 크기 제한 디스크 캐시"""
+
+    suffix = '.bin'
+
+    def __init__(self, cache_dir: str, max_bytes: int):
+        """
+        Args:
+            cache_dir: 캐시 파일 디렉토리
+            max_bytes: 캐시 최대 크기 (바이트)
+        """
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key + self.suffix)
+
+    def _read(self, key: str) -> Optional[bytes]:
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as f:
+                data = f.read()
+        except FileNotFoundError:
+            return None
+        # 최근 사용 시각 갱신 (eviction 순서에 사용)
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return data
+
+    def _write(self, key: str, data: bytes):
+        # 임시 파일에 쓴 뒤 교체 (읽는 쪽이 쓰다 만 파일을 보지 않도록)
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, self._path(key))
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        self._evict()
+
+    def _evict(self):
+        """최대 크기를 넘으면 가장 오래 사용하지 않은 항목부터 삭제"""
+        with self._lock:
+            entries = []
+            total = 0
+            for name in os.listdir(self.cache_dir):
+                if not name.endswith(self.suffix):
+                    continue
+                path = os.path.join(self.cache_dir, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+                total += stat.st_size
+
+            if total <= self.max_bytes:
+                return
+
+            for _, size, path in sorted(entries):
+                try:
+                    os.remove(path)
+                except OSError:
+                    continue
+                total -= size
+                if total <= self.max_bytes:
+                    break
+
+    def delete(self, key: str):
+        """항목 삭제"""
+        try:
+            os.remove(self._path(key))
+        except FileNotFoundError:
+            pass
+
+
+class DocumentTextCache(_DiskCache):
+    """문서 텍스트 추출 결과 캐시"""
+
+    suffix = '.txt'
+
+    def __init__(self, cache_dir: Optional[str] = None, max_bytes: Optional[int] = None):
+        if cache_dir is None:
+            cache_dir = os.path.join(DEFAULT_CACHE_DIR, 'document_text')
+        if max_bytes is None:
+            max_bytes = int(os.getenv('DOCUMENT_TEXT_CACHE_MAX_MB', 512)) * 1024 * 1024
+        super().__init__(cache_dir, max_bytes)
+
+    @staticmethod
+    def make_key(file_path: str, extractor_version: str) -> str:
+        """캐시 키: 파일 내용 해시 + 추출기 버전"""
+        version_tag = hashlib.sha256(extractor_version.encode('utf-8')).hexdigest()[:8]
+        return f"{file_sha256(file_path)}-{version_tag}"
+
+    def get(self, key: str) -> Optional[str]:
+        """캐시된 텍스트 (없으면 None)"""
+        data = self._read(key)
+        return data.decode('utf-8') if data is not None else None
+
+    def put(self, key: str, text: str):
+        """텍스트 저장"""
+        self._write(key, text.encode('utf-8'))
+
+    def get_or_extract(self, file_path: str, extractor_version: str,
+                       extract: Callable[[str], str]) -> str:
+        """
+        캐시된 텍스트를 반환하고, 없으면 extract(file_path)로 추출 후 저장
+
+        Args:
+            file_path: 문서 파일 경로
+            extractor_version: 추출 로직 버전 (바뀌면 이전 캐시는 사용하지 않음)
+            extract: 텍스트 추출 함수
+        """
+        # 캐시 조회/저장 실패 (디스크 오류 등)만 직접 추출로 대체 → extract의 오류는 그대로 전달
+        try:
+            key = self.make_key(file_path, extractor_version)
+            cached = self.get(key)
+        except OSError as e:
+            print(f"⚠️ 텍스트 캐시 사용 불가, 직접 추출: {e}")
+            return extract(file_path)
+        if cached is not None:
+            print(f"⚡ 캐시된 텍스트 사용: {os.path.basename(file_path)} ({len(cached)} 문자)", flush=True)
+            return cached
+
+        text = extract(file_path)
+        if text and len(text.strip()) >= MIN_CACHEABLE_CHARS:
+            try:
+                self.put(key, text)
+            except OSError as e:
+                print(f"⚠️ 텍스트 캐시 저장 실패: {e}")
+        return text
+
+
+class DocumentAnalysisCache(_DiskCache):
+    """
+    문서 분석 결과 캐시
+
+    프롬프트 템플릿이 바뀌면 (스키마 변경 등) 해시가 달라져 이전 결과는 조회되지 않으며,
+    purge_stale()로 이전 템플릿의 결과를 명시적으로 삭제할 수 있습니다.
+    """
+
+    suffix = '.json'
+
+    def __init__(self, prompt_version: str, cache_dir: Optional[str] = None,
+                 max_bytes: Optional[int] = None, mode: Optional[str] = None):
+        """
+        Args:
+            prompt_version: 프롬프트 템플릿 해시 (스키마 버전 포함)
+            cache_dir: 캐시 파일 디렉토리
+            max_bytes: 캐시 최대 크기 (바이트)
+            mode: readwrite / replay / off
+        """
+        if cache_dir is None:
+            cache_dir = os.path.join(DEFAULT_CACHE_DIR, 'document_analysis')
+        if max_bytes is None:
+            max_bytes = int(os.getenv('DOCUMENT_ANALYSIS_CACHE_MAX_MB', 256)) * 1024 * 1024
+        if mode is None:
+            mode = os.getenv('DOCUMENT_ANALYSIS_CACHE_MODE', 'readwrite')
+        if mode not in ANALYSIS_CACHE_MODES:
+            raise ValueError(f"지원하지 않는 분석 캐시 모드: {mode} (사용 가능: {', '.join(ANALYSIS_CACHE_MODES)})")
+        super().__init__(cache_dir, max_bytes)
+        self.prompt_version = prompt_version
+        self.mode = mode
+
+    @property
+    def enabled(self) -> bool:
+        return self.mode != 'off'
+
+    @property
+    def replay_only(self) -> bool:
+        return self.mode == 'replay'
+
+    def make_key(self, text: str) -> str:
+        """캐시 키: 분석 텍스트 해시 + 프롬프트 템플릿 해시"""
+        return f"{text_sha256(text)}-{self.prompt_version}"
+
+    def get(self, text: str) -> Optional[Dict]:
+        """캐시된 분석 결과 (없으면 None)"""
+        if not self.enabled:
+            return None
+        data = self._read(self.make_key(text))
+        if data is None:
+            return None
+        try:
+            return json.loads(data.decode('utf-8'))
+        except ValueError:
+            return None
+
+    def put(self, text: str, result: Dict):
+        """분석 결과 저장 (replay/off 모드에서는 저장하지 않음)"""
+        if self.mode != 'readwrite':
+            return
+        try:
+            self._write(self.make_key(text), json.dumps(result, ensure_ascii=False).encode('utf-8'))
+        except OSError as e:
+            print(f"⚠️ 분석 캐시 저장 실패: {e}")
+
+    def purge_stale(self) -> int:
+        """현재 프롬프트 템플릿이 아닌 분석 결과 삭제 (삭제한 개수 반환)"""
+        removed = 0
+        current = f"-{self.prompt_version}{self.suffix}"
+        for name in os.listdir(self.cache_dir):
+            if name.endswith(self.suffix) and not name.endswith(current):
+                try:
+                    os.remove(os.path.join(self.cache_dir, name))
+                    removed += 1
+                except OSError:
+                    pass
+        return removed
+
+
+_shared_text_cache: Optional[DocumentTextCache] = None
+_shared_analysis_caches: Dict[str, DocumentAnalysisCache] = {}
+_shared_lock = threading.Lock()
+
+
+def get_shared_text_cache() -> DocumentTextCache:
+    """프로세스 공유 텍스트 캐시"""
+    global _shared_text_cache
+    if _shared_text_cache is None:
+        with _shared_lock:
+            if _shared_text_cache is None:
+                _shared_text_cache = DocumentTextCache()
+    return _shared_text_cache
+
+
+def get_shared_analysis_cache(prompt_version: str) -> DocumentAnalysisCache:
+    """
+    프로세스 공유 분석 결과 캐시
+
+    프롬프트 버전별로 처음 생성할 때 이전 템플릿의 결과를 삭제합니다.
+    """
+    cache = _shared_analysis_caches.get(prompt_version)
+    if cache is None:
+        with _shared_lock:
+            cache = _shared_analysis_caches.get(prompt_version)
+            if cache is None:
+                cache = DocumentAnalysisCache(prompt_version)
+                removed = cache.purge_stale() if cache.mode == 'readwrite' else 0
+                if removed:
+                    print(f"🧹 이전 스키마 분석 캐시 {removed}개 삭제")
+                _shared_analysis_caches[prompt_version] = cache
+    return cache
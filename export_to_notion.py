@@ -3,6 +3,7 @@
 JSON 데이터를 Notion 형식으로 변환
 - Notion에 붙여넣기 가능한 CSV 생성
 - Notion Database 형식 마크다운 생성
+- 카탈로그 파일은 SQLite 카탈로그 (catalog_db)에서 읽음 (JSON이 바뀐 경우에만 다시 가져옴)
 """
 
 import sys
@@ -11,6 +12,8 @@ import json
 import csv
 from datetime import datetime
 
+from catalog_db import open_catalog
+
 if sys.platform == 'win32':
     try:
         sys.stdout.reconfigure(encoding='utf-8')
@@ -21,6 +24,20 @@ if sys.platform == 'win32':
 OUTPUT_DIR = "notion_export"
 os.makedirs(OUTPUT_DIR, exist_ok=True)
 
+DATA_DIR = "data"
+_catalog = None
+
+
+def load_catalog_document(name):
+    """data/<name> 내용 (SQLite 카탈로그에서 재구성, 가져온 적 없는 파일이면 FileNotFoundError)"""
+    global _catalog
+    if _catalog is None:
+        _catalog = open_catalog(DATA_DIR)
+    document = _catalog.export_json(name)
+    if document is None:
+        raise FileNotFoundError(os.path.join(DATA_DIR, name))
+    return document
+
 print("=" * 80)
 print("📝 JSON → Notion 변환 스크립트")
 print("=" * 80)
@@ -31,8 +48,7 @@ def export_yacht_specifications():
     """yacht_specifications.json → Notion CSV"""
     print("1️⃣ yacht_specifications.json 변환 중...")
     
-    with open("data/yacht_specifications.json", 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    data = load_catalog_document("yacht_specifications.json")
     
     # CSV 생성
     csv_file = os.path.join(OUTPUT_DIR, "yacht_specifications.csv")
@@ -82,8 +98,7 @@ def export_yacht_parts_database():
     """yacht_parts_database.json → Notion CSV"""
     print("\n2️⃣ yacht_parts_database.json 변환 중...")
     
-    with open("data/yacht_parts_database.json", 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    data = load_catalog_document("yacht_parts_database.json")
     
     # CSV 생성
     csv_file = os.path.join(OUTPUT_DIR, "yacht_parts_database.csv")
@@ -129,8 +144,7 @@ def export_yacht_parts_app_data():
     """yacht_parts_app_data.json → Notion CSV"""
     print("\n3️⃣ yacht_parts_app_data.json 변환 중...")
     
-    with open("data/yacht_parts_app_data.json", 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    data = load_catalog_document("yacht_parts_app_data.json")
     
     # CSV 생성
     csv_file = os.path.join(OUTPUT_DIR, "yacht_parts_app_data.csv")
@@ -206,8 +220,7 @@ def export_yacht_manual_resources():
     """yacht_manual_resources.json → Notion CSV"""
     print("\n5️⃣ yacht_manual_resources.json 변환 중...")
     
-    with open("data/yacht_manual_resources.json", 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    data = load_catalog_document("yacht_manual_resources.json")
     
     # CSV 생성
     csv_file = os.path.join(OUTPUT_DIR, "yacht_manual_resources.csv")
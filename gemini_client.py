@@ -0,0 +1,345 @@
+"""
+HooAah Yacht - Gemini 호출 래퍼
+모든 generate_content 호출을 감싸 요청 한도, 재시도, 시간 제한을 한 곳에서 처리
+
+- API 키별 토큰 버킷: 분당 요청 수 제한 (같은 키를 쓰는 모든 챗봇/세션이 공유)
+- 재시도: 한도 초과(429), 일시적 서버 오류(500/503/504), 연결 오류는
+  지수 백오프 + 지터(full jitter)로 다시 시도
+- 호출별 시간 제한: SDK에 request_options={"timeout": ...}로 전달 (응답이 늦으면 GeminiTimeoutError)
+  시간 초과는 재시도하지 않음 (느린 요청을 다시 보내 유료 호출이 늘어나지 않도록)
+- 요청 병합: 같은 프롬프트가 이미 처리 중이면 새로 호출하지 않고 그 결과를 함께 사용
+- 지표: 호출/성공/실패/재시도/시간 초과/병합/대기 시간 (gemini_stats)
+
+GenerativeModel과 같은 generate_content 인터페이스라 호출하는 쪽은 바꿀 필요가 없습니다.
+(로컬 대체 모델도 그대로 감쌀 수 있어 테스트 가능)
+
+사용법:
+    model = GeminiClient(genai.GenerativeModel('gemini-2.5-flash'), api_key=api_key)
+    response = model.generate_content(prompt)
+
+환경 변수:
+    GEMINI_RATE_PER_MINUTE: API 키별 분당 최대 요청 수 (기본: 60, 0이면 제한 없음)
+    GEMINI_BURST: 한 번에 몰아서 보낼 수 있는 요청 수 (기본: 10)
+    GEMINI_MAX_RETRIES: 최대 재시도 횟수 (기본: 3)
+    GEMINI_BACKOFF_BASE: 첫 재시도 대기 시간 상한 (초, 기본: 1)
+    GEMINI_BACKOFF_MAX: 재시도 대기 시간 최대값 (초, 기본: 30)
+    GEMINI_TIMEOUT: 호출별 시간 제한 (초, 기본: 120, 0이면 제한 없음)
+    GEMINI_MAX_CONCURRENCY: request_options를 받지 않는 모델에 시간 제한을 적용하는 동시 호출 수 (기본: 16)
+"""
+
+import os
+import time
+import random
+import inspect
+import hashlib
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from typing import Any, Callable, Dict, Optional
+
+
+DEFAULT_RATE_PER_MINUTE = float(os.getenv('GEMINI_RATE_PER_MINUTE', 60))
+DEFAULT_BURST = int(os.getenv('GEMINI_BURST', 10))
+DEFAULT_MAX_RETRIES = int(os.getenv('GEMINI_MAX_RETRIES', 3))
+DEFAULT_BACKOFF_BASE = float(os.getenv('GEMINI_BACKOFF_BASE', 1))
+DEFAULT_BACKOFF_MAX = float(os.getenv('GEMINI_BACKOFF_MAX', 30))
+DEFAULT_TIMEOUT = float(os.getenv('GEMINI_TIMEOUT', 120))
+DEFAULT_MAX_CONCURRENCY = int(os.getenv('GEMINI_MAX_CONCURRENCY', 16))
+
+# 재시도할 예외 (google.api_core.exceptions 이름 기준, 패키지가 없어도 판별 가능)
+RETRYABLE_ERROR_NAMES = {
+    'ResourceExhausted', 'TooManyRequests',
+    'InternalServerError', 'ServiceUnavailable',
+}
+RETRYABLE_STATUS_CODES = {429, 500, 503}
+
+# 시간 초과 예외 (재시도하지 않고 GeminiTimeoutError로 변환)
+TIMEOUT_ERROR_NAMES = {'DeadlineExceeded', 'GatewayTimeout'}
+
+
+class GeminiError(Exception):
+    """Gemini 호출 실패 (재시도 후에도 실패)"""
+
+
+class GeminiTimeoutError(GeminiError, TimeoutError):
+    """Gemini 호출 시간 초과"""
+
+
+def is_timeout(error: BaseException) -> bool:
+    """시간 초과 오류인지 (GeminiTimeoutError, SDK DeadlineExceeded/504)"""
+    return isinstance(error, TimeoutError) or type(error).__name__ in TIMEOUT_ERROR_NAMES \
+        or getattr(error, 'code', None) == 504
+
+
+def is_retryable(error: BaseException) -> bool:
+    """다시 시도하면 성공할 수 있는 오류인지 (한도 초과, 일시적 서버/연결 오류, 시간 초과 제외)"""
+    if is_timeout(error):
+        return False
+    if isinstance(error, ConnectionError):
+        return True
+    if type(error).__name__ in RETRYABLE_ERROR_NAMES:
+        return True
+    # google.api_core 예외의 HTTP 상태 코드
+    return getattr(error, 'code', None) in RETRYABLE_STATUS_CODES
+
+
+class TokenBucket:
+    """토큰 버킷 요청 한도 (rate_per_minute로 채워지고 최대 burst개까지 쌓임)"""
+
+    def __init__(self, rate_per_minute: float, burst: int):
+        self.rate = rate_per_minute / 60.0 if rate_per_minute and rate_per_minute > 0 else 0.0
+        self.capacity = max(1, burst)
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """토큰 하나 사용 (없으면 채워질 때까지 대기), 대기한 시간(초) 반환"""
+        if not self.rate:
+            return 0.0
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            # 토큰을 미리 차감하고 (음수 가능), 부족한 만큼 대기 → 대기 순서대로 공정하게 분배
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+
+class _KeyState:
+    """API 키별 공유 상태 (토큰 버킷, 처리 중인 요청, 지표)"""
+
+    def __init__(self):
+        self.bucket = TokenBucket(DEFAULT_RATE_PER_MINUTE, DEFAULT_BURST)
+        self.inflight: Dict[str, Future] = {}
+        self.lock = threading.Lock()
+        self.metrics = {
+            "calls": 0, "succeeded": 0, "failed": 0, "retries": 0, "timeouts": 0,
+            "coalesced": 0, "throttledSeconds": 0.0, "latencySeconds": 0.0,
+        }
+
+    def count(self, name: str, amount: float = 1):
+        with self.lock:
+            self.metrics[name] += amount
+
+
+_key_states: Dict[str, _KeyState] = {}
+_key_states_lock = threading.Lock()
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def _key_label(api_key: Optional[str]) -> str:
+    # 지표에 키 원문이 남지 않도록 해시 앞부분만 사용
+    return hashlib.sha256(api_key.encode('utf-8')).hexdigest()[:8] if api_key else 'default'
+
+
+def _get_key_state(label: str) -> _KeyState:
+    state = _key_states.get(label)
+    if state is None:
+        with _key_states_lock:
+            state = _key_states.setdefault(label, _KeyState())
+    return state
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(max_workers=DEFAULT_MAX_CONCURRENCY,
+                                               thread_name_prefix='gemini-call')
+    return _executor
+
+
+def _reset_after_fork():
+    """fork된 작업자 프로세스 (gunicorn)에서 부모의 스레드 풀/처리 중 요청/잠금을 버림"""
+    global _executor, _key_states_lock, _executor_lock
+    _executor = None
+    _executor_lock = threading.Lock()
+    _key_states_lock = threading.Lock()
+    for state in _key_states.values():
+        state.lock = threading.Lock()
+        state.inflight.clear()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+class GeminiClient:
+    """요청 한도 + 재시도 + 시간 제한 + 요청 병합을 적용한 generate_content 래퍼"""
+
+    def __init__(self, model, api_key: Optional[str] = None, max_retries: Optional[int] = None,
+                 timeout: Optional[float] = None, backoff_base: Optional[float] = None,
+                 backoff_max: Optional[float] = None, sleep: Callable[[float], None] = time.sleep):
+        """
+        Args:
+            model: generate_content를 가진 모델 (GenerativeModel 또는 로컬 대체 모델)
+            api_key: 요청 한도를 공유할 API 키 (None이면 'default')
+            max_retries: 최대 재시도 횟수
+            timeout: 호출별 시간 제한 (초, 0이면 제한 없음)
+            backoff_base: 첫 재시도 대기 시간 상한 (초)
+            backoff_max: 재시도 대기 시간 최대값 (초)
+            sleep: 재시도 대기 함수 (테스트용)
+        """
+        self.model = model
+        self.key = _key_label(api_key)
+        self.max_retries = DEFAULT_MAX_RETRIES if max_retries is None else max_retries
+        self.timeout = DEFAULT_TIMEOUT if timeout is None else timeout
+        self.backoff_base = DEFAULT_BACKOFF_BASE if backoff_base is None else backoff_base
+        self.backoff_max = DEFAULT_BACKOFF_MAX if backoff_max is None else backoff_max
+        self._sleep = sleep
+        self._state = _get_key_state(self.key)
+        # SDK (GenerativeModel)는 request_options로 시간 제한을 받아 호출 자체를 끊음
+        self._native_timeout = _accepts_request_options(model)
+
+    def __getattr__(self, name: str) -> Any:
+        # generate_content 외의 속성 (model_name 등)은 원래 모델로 전달
+        if name == 'model':
+            raise AttributeError(name)
+        return getattr(self.model, name)
+
+    def generate_content(self, prompt, stream: bool = False, **kwargs):
+        """
+        모델 호출 (GenerativeModel.generate_content와 같은 인터페이스)
+
+        스트리밍 호출은 연결 시작까지만 재시도/시간 제한을 적용하고 병합하지 않습니다.
+        """
+        if stream:
+            return self._call_with_retry(self._request(prompt, dict(kwargs, stream=True)))
+        call = self._request(prompt, kwargs)
+        if not isinstance(prompt, str) or kwargs:
+            return self._call_with_retry(call)
+        return self._coalesced(prompt, call)
+
+    def _request(self, prompt, kwargs: Dict[str, Any]) -> Callable[[], Any]:
+        """모델 호출 함수 (SDK가 받으면 시간 제한을 request_options로 전달)"""
+        if self.timeout and self._native_timeout:
+            options = dict(kwargs.get('request_options') or {})
+            options.setdefault('timeout', self.timeout)
+            kwargs = dict(kwargs, request_options=options)
+        return lambda: self.model.generate_content(prompt, **kwargs)
+
+    # ============================================================
+    # 요청 병합
+    # ============================================================
+
+    def _coalesced(self, prompt: str, call: Callable[[], Any]):
+        model_name = getattr(self.model, 'model_name', type(self.model).__name__)
+        key = hashlib.sha256(f"{model_name}\x1f{prompt}".encode('utf-8')).hexdigest()
+        state = self._state
+        with state.lock:
+            leader = state.inflight.get(key)
+            if leader is None:
+                future: Future = Future()
+                state.inflight[key] = future
+            else:
+                state.metrics["coalesced"] += 1
+        if leader is not None:
+            return leader.result()
+
+        try:
+            result = self._call_with_retry(call)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with state.lock:
+                state.inflight.pop(key, None)
+
+    # ============================================================
+    # 한도 / 재시도 / 시간 제한
+    # ============================================================
+
+    def _call_with_retry(self, call: Callable[[], Any]):
+        state = self._state
+        attempt = 0
+        while True:
+            state.count("throttledSeconds", state.bucket.acquire())
+            state.count("calls")
+            started = time.monotonic()
+            try:
+                result = self._call_with_timeout(call)
+            except Exception as e:
+                if is_timeout(e):
+                    # 시간 초과는 재시도하지 않음 (끝나지 않은 호출 위에 유료 호출을 또 보내지 않도록)
+                    state.count("timeouts")
+                    state.count("failed")
+                    if isinstance(e, GeminiTimeoutError):
+                        raise
+                    raise GeminiTimeoutError(f"AI 응답 시간 초과 ({self.timeout:.0f}초)") from e
+                if attempt >= self.max_retries or not is_retryable(e):
+                    state.count("failed")
+                    if attempt and is_retryable(e):
+                        raise GeminiError(
+                            f"AI 서비스가 일시적으로 응답하지 않습니다 ({attempt}회 재시도 후 실패): {e}"
+                        ) from e
+                    raise
+                attempt += 1
+                state.count("retries")
+                self._sleep(self._backoff(attempt))
+                continue
+            state.count("latencySeconds", time.monotonic() - started)
+            state.count("succeeded")
+            return result
+
+    def _backoff(self, attempt: int) -> float:
+        """지수 백오프 + full jitter: 0 ~ min(최대값, 기본값 × 2^(시도-1))"""
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** (attempt - 1))))
+
+    def _call_with_timeout(self, call: Callable[[], Any]):
+        if not self.timeout or self._native_timeout:
+            return call()
+
+        # request_options를 받지 않는 모델: 스레드 풀에서 실행하고 시작한 시점부터 시간 제한
+        started = threading.Event()
+
+        def run():
+            started.set()
+            return call()
+
+        future = _get_executor().submit(run)
+        if not started.wait(self.timeout) and future.cancel():
+            # 동시 호출이 모두 사용 중이라 시작도 못 함 (대기열에서 취소되어 호출되지 않음)
+            raise GeminiTimeoutError(
+                f"AI 호출 대기 시간 초과 ({self.timeout:.0f}초, 동시 호출 {DEFAULT_MAX_CONCURRENCY}개 사용 중)"
+            )
+        try:
+            return future.result(timeout=self.timeout)
+        except FutureTimeoutError:
+            # 이미 시작된 호출은 중단할 수 없으므로 결과를 버림
+            raise GeminiTimeoutError(f"AI 응답 시간 초과 ({self.timeout:.0f}초)")
+
+    def stats(self) -> Dict[str, float]:
+        """이 API 키의 호출 지표"""
+        return gemini_stats().get(self.key, {})
+
+
+def _accepts_request_options(model) -> bool:
+    """generate_content가 request_options 인자를 받는지 (google.generativeai GenerativeModel)"""
+    try:
+        return 'request_options' in inspect.signature(model.generate_content).parameters
+    except (AttributeError, TypeError, ValueError):
+        return False
+
+
+def gemini_stats() -> Dict[str, Dict[str, float]]:
+    """API 키별 호출 지표 (키는 해시 앞부분)"""
+    with _key_states_lock:
+        states = dict(_key_states)
+    stats = {}
+    for label, state in states.items():
+        with state.lock:
+            metrics = dict(state.metrics)
+        metrics["throttledSeconds"] = round(metrics["throttledSeconds"], 3)
+        metrics["latencySeconds"] = round(metrics["latencySeconds"], 3)
+        metrics["inflight"] = len(state.inflight)
+        stats[label] = metrics
+    return stats
@@ -0,0 +1,40 @@
+"""
+HooAah Yacht - gunicorn 설정 (운영 API 서버)
+
+사용법:
+    gunicorn -c gunicorn.conf.py wsgi:app
+
+- preload_app: 마스터에서 앱을 한 번 만들고 (카탈로그 로드, 정형 답변 캐시 준비,
+  끝나지 않은 작업 복구) 작업자는 준비된 상태로 fork
+  → fork 전에는 Gemini 호출/스레드 시작을 하지 않음 (작업자에서 처음 사용할 때 생성)
+- gthread 작업자: Gemini 호출과 SSE 스트리밍은 대부분 응답 대기라 작업자당 여러 스레드로 처리
+- 작업자 간 공유: 카탈로그 JSON (파일 변경 확인), LLM 응답 캐시/세션 기록/작업 큐 SQLite
+
+환경 변수:
+    PORT: 포트 (기본: 5000)
+    WEB_CONCURRENCY: 작업자 프로세스 수 (기본: CPU 수, 최대 4)
+    GUNICORN_THREADS: 작업자당 스레드 수 (기본: 8)
+    GUNICORN_TIMEOUT: 응답 없는 작업자 재시작 시간 (초, 기본: 180)
+"""
+
+import os
+
+
+bind = f"0.0.0.0:{os.getenv('PORT', 5000)}"
+workers = int(os.getenv('WEB_CONCURRENCY', min(4, os.cpu_count() or 1)))
+worker_class = 'gthread'
+threads = int(os.getenv('GUNICORN_THREADS', 8))
+timeout = int(os.getenv('GUNICORN_TIMEOUT', 180))
+graceful_timeout = 30
+keepalive = 5
+preload_app = True
+
+accesslog = '-'
+errorlog = '-'
+
+
+def post_worker_init(worker):
+    """작업자마다 문서 처리 작업 스레드 시작 (스레드는 fork로 물려받지 않음)"""
+    job_queue = worker.wsgi.extensions.get('job_queue')
+    if job_queue is not None:
+        job_queue.start()
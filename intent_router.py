@@ -0,0 +1,151 @@
+"""
+HooAah Yacht - 의도 분류기 (키워드 기반 빠른 경로)
+챗봇 곳곳에 흩어져 있던 키워드 표를 한 곳에 모아 하나의 다중 패턴 매처로 컴파일하고,
+메시지를 한 번 훑어 의도별 점수를 계산
+
+- 요트 질문 (폭, 전장, 엔진, 정비 등): 메시지에 요트 이름이 있을 때 우선순위 순서로 결정
+- 등록 요청 (요트 등록, 부품 추가): 정확한 문구가 있으면 바로 결정
+- 일반 의도 (도움말, 목록, PDF 업로드, 분석): 점수로 결정
+  - 강한 키워드 2점, 약한 키워드 1점
+  - 최고 점수가 2점 이상이고 두 번째 의도의 2배 이상이면 확정 (AI 호출 없이 응답)
+  - 그 외 (키워드 없음, 여러 의도가 비슷함)는 모호한 것으로 보고 Gemini에 넘김
+
+사용법:
+    router = get_intent_router()
+    route = router.route("요트 목록 보여줘")
+    route.intent        # 'list' (확정된 일반 의도, 모호하면 None)
+    route.yacht_question  # 'beam', 'engine' 등 (요트 질문 키워드가 없으면 None)
+"""
+
+import threading
+from typing import Dict, List, Optional, Set, Tuple
+
+from yacht_name_matcher import AhoCorasick
+
+
+# 요트 질문 (우선순위 순서, 앞의 규칙이 먼저 적용됨)
+YACHT_QUESTION_RULES: List[Tuple[str, List[str]]] = [
+    ('beam', ['폭', 'beam', '너비', '가로']),
+    ('loa', ['전장', 'loa', '길이', '전체 길이', '총 길이']),
+    ('draft', ['흘수', 'draft', '드래프트']),
+    ('displacement', ['배수량', 'displacement', '무게', '중량']),
+    ('mast_height', ['마스트', 'mast', '마스트 높이', 'mast height', '높이']),
+    ('sail_area', ['세일링', 'sailing', '돛', 'sail', '돛 면적', 'sail area', '세일 면적', '넓이', '면적']),
+    ('dimensions', ['크기', '치수', '수치', 'dimension']),
+    ('parts_count', ['부품', '부품 개수', '부품 수', 'parts', '몇 개', '개수']),
+    ('engine', ['엔진', 'engine', '모터', 'motor', '동력', '파워']),
+    ('maintenance', ['정비', '유지보수', '관리', '점검', '교체', '주기', 'maintenance', 'repair', 'service',
+                     '고장', '수리', '언제']),
+    ('parts_list', ['부품', 'parts', '컴포넌트', 'component']),
+    ('manufacturer', ['제조사', 'manufacturer', '만든', '누가']),
+    ('yacht_type', ['타입', '유형', '종류', 'type', '어떤']),
+    ('basic_info', ['정보', '스펙', '사양', '알려줘', '뭐야', '어때']),
+]
+
+# 등록 요청 (정확한 문구, 부품 추가가 우선)
+REGISTRATION_RULES: List[Tuple[str, List[str]]] = [
+    ('parts_registration', ['부품 추가', '부품 등록', '부품 넣어', '부품 넣어줘']),
+    ('registration', ['요트 등록', '등록하고 싶어', '등록하고 싶어요', '등록하고 싶습니다',
+                      '새 요트', '요트 추가', '추가하고 싶어', '추가하고 싶어요']),
+]
+
+# 일반 의도: (의도, 강한 키워드, 약한 키워드) - 키워드 기반 응답의 우선순위 순서
+GENERAL_RULES: List[Tuple[str, List[str], List[str]]] = [
+    ('help', ['도움말', 'help', '사용법', '가이드'],
+             ['도움', '어떻게', '방법', '사용', '안내']),
+    ('upload', ['pdf', '업로드', '요트 등록', '새 요트'],
+               ['문서', '매뉴얼', '등록', '파일', '추가', '입력', '올리', '넣']),
+    ('analysis', ['분석'], []),
+    ('list', ['목록', '리스트', '모든 요트', '요트 종류', '요트 목록'],
+             ['전체', '어떤 요트']),
+]
+
+STRONG_WEIGHT = 2
+WEAK_WEIGHT = 1
+
+# 일반 의도 확정 조건
+MIN_CONFIDENT_SCORE = 2
+DOMINANCE_RATIO = 2
+
+
+class Route:
+    """메시지 분류 결과"""
+
+    __slots__ = ('scores', 'matched', 'yacht_question', 'registration', 'intent')
+
+    def __init__(self, scores: Dict[str, int], matched: Set[str], yacht_question: Optional[str],
+                 registration: Optional[str], intent: Optional[str]):
+        self.scores = scores                  # 일반 의도별 점수
+        self.matched = matched                # 키워드가 하나라도 맞은 규칙 이름
+        self.yacht_question = yacht_question  # 우선순위가 가장 높은 요트 질문
+        self.registration = registration      # 'parts_registration' / 'registration' / None
+        self.intent = intent                  # 확정된 일반 의도 (모호하면 None)
+
+    def has(self, name: str) -> bool:
+        """해당 규칙의 키워드가 메시지에 있는지"""
+        return name in self.matched
+
+    def __repr__(self):
+        return (f"Route(intent={self.intent!r}, yacht_question={self.yacht_question!r}, "
+                f"registration={self.registration!r}, scores={self.scores!r})")
+
+
+class IntentRouter:
+    """모든 키워드 표를 하나의 Aho–Corasick 오토마톤으로 컴파일한 의도 분류기"""
+
+    def __init__(self):
+        patterns = []
+        for name, keywords in YACHT_QUESTION_RULES + REGISTRATION_RULES:
+            for keyword in keywords:
+                patterns.append((keyword, (name, keyword, 0)))
+        for name, strong, weak in GENERAL_RULES:
+            for keyword in strong:
+                patterns.append((keyword, (name, keyword, STRONG_WEIGHT)))
+            for keyword in weak:
+                patterns.append((keyword, (name, keyword, WEAK_WEIGHT)))
+        self._automaton = AhoCorasick(patterns)
+
+    def route(self, message: str) -> Route:
+        """메시지를 한 번 훑어 의도 분류"""
+        hits = self._automaton.search(message.lower())
+
+        matched: Set[str] = set()
+        scores: Dict[str, int] = {}
+        for name, _, weight in hits:
+            matched.add(name)
+            if weight:
+                scores[name] = scores.get(name, 0) + weight
+
+        yacht_question = next((name for name, _ in YACHT_QUESTION_RULES if name in matched), None)
+        registration = next((name for name, _ in REGISTRATION_RULES if name in matched), None)
+        return Route(scores, matched, yacht_question, registration, self._decide(scores))
+
+    @staticmethod
+    def _decide(scores: Dict[str, int]) -> Optional[str]:
+        if not scores:
+            return None
+        ranked = sorted(scores.items(), key=lambda item: item[1], reverse=True)
+        best, best_score = ranked[0]
+        runner_up = ranked[1][1] if len(ranked) > 1 else 0
+        if best_score >= MIN_CONFIDENT_SCORE and best_score >= DOMINANCE_RATIO * runner_up:
+            return best
+        return None
+
+    @staticmethod
+    def first_general_intent(route: Route) -> Optional[str]:
+        """키워드가 하나라도 맞은 일반 의도 중 우선순위가 가장 높은 것 (AI 없이 응답할 때 사용)"""
+        return next((name for name, _, _ in GENERAL_RULES if name in route.matched), None)
+
+
+_shared_router: Optional[IntentRouter] = None
+_shared_router_lock = threading.Lock()
+
+
+def get_intent_router() -> IntentRouter:
+    """프로세스 공유 의도 분류기 (키워드 표는 한 번만 컴파일)"""
+    global _shared_router
+    if _shared_router is None:
+        with _shared_router_lock:
+            if _shared_router is None:
+                _shared_router = IntentRouter()
+    return _shared_router
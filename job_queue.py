@@ -0,0 +1,318 @@
+"""
+HooAah Yacht - 문서 분석 작업 큐
+오래 걸리는 문서 처리 (텍스트 추출 → OCR → AI 분석 → 저장)를 HTTP 요청 밖에서 실행
+
+특징:
+- submit()은 작업 ID를 즉시 반환하고, 제한된 수의 작업자 스레드가 순서대로 처리
+- 대기 작업 수 제한 (가득 차면 JobQueueFull)
+- 작업 상태/진행 단계/결과를 SQLite에 저장 → 서버 재시작 후에도 조회 가능,
+  처리 중이던 작업은 재시작 시 다시 실행
+- 진행 이벤트 구독 (events) → SSE로 전달
+- 여러 작업자 프로세스가 같은 SQLite 파일을 써도 작업은 한 번만 실행 (조건부 UPDATE로 선점)
+
+사용법:
+    jobs = JobQueue(workers=2)
+    jobs.register('register', handle_register)   # handler(job, payload) -> dict
+    job_id = jobs.submit('register', {"file_path": "uploads/<uuid>/manual.pdf"})
+    jobs.get(job_id)   # {"status": "running", "stage": "analyzing", ...}
+"""
+
+import os
+import json
+import time
+import uuid
+import queue
+import sqlite3
+import threading
+from typing import Any, Callable, Dict, Iterator, Optional
+
+
+DEFAULT_DB_PATH = os.path.join('data', 'jobs.db')
+
+# 작업 상태
+QUEUED = 'queued'
+RUNNING = 'running'
+SUCCEEDED = 'succeeded'
+FAILED = 'failed'
+FINISHED_STATUSES = (SUCCEEDED, FAILED)
+
+
+class JobQueueFull(Exception):
+    """대기 중인 작업이 너무 많음"""
+
+
+class JobContext:
+    """작업 처리 함수에 전달되는 진행 상황 보고 객체"""
+
+    def __init__(self, queue_: "JobQueue", job_id: str):
+        self._queue = queue_
+        self.job_id = job_id
+
+    def progress(self, stage: str, message: Optional[str] = None):
+        """진행 단계 보고 (예: 'extracting', 'analyzing', 'saving')"""
+        self._queue._update(self.job_id, stage=stage, message=message)
+
+
+class JobQueue:
+    """SQLite에 상태를 저장하는 작업 큐"""
+
+    def __init__(self, db_path: str = DEFAULT_DB_PATH, workers: int = 2,
+                 max_pending: int = 100, retention: float = 7 * 24 * 3600):
+        """
+        Args:
+            db_path: 작업 상태 SQLite 파일
+            workers: 동시에 처리할 작업 수
+            max_pending: 최대 대기 작업 수
+            retention: 끝난 작업 보관 기간 (초)
+        """
+        self.db_path = db_path
+        self.workers = workers
+        self.retention = retention
+
+        self._handlers: Dict[str, Callable[[JobContext, Dict], Dict]] = {}
+        self._pending: "queue.Queue[str]" = queue.Queue(maxsize=max_pending)
+        self._changed = threading.Condition()
+        self._threads = []
+        self._started = False
+        self._recovered = False
+        self._start_lock = threading.Lock()
+
+        self._init_db()
+
+    # ============================================================
+    # 등록 / 제출
+    # ============================================================
+
+    def register(self, kind: str, handler: Callable[[JobContext, Dict], Dict]):
+        """
+        작업 종류별 처리 함수 등록
+
+        처리 함수는 결과 dict를 반환합니다. 결과에 "success": False가 있으면
+        실패한 작업으로 기록하고, 예외가 발생해도 실패로 기록합니다.
+        """
+        self._handlers[kind] = handler
+
+    def recover(self):
+        """
+        재시작 전 끝나지 않은 작업을 다시 대기열에 넣음 (한 번만 실행)
+
+        여러 작업자 프로세스 (gunicorn)로 실행할 때는 fork 전에 마스터에서 한 번 호출합니다.
+        작업자마다 호출하면 다른 작업자가 처리 중인 작업을 다시 대기열에 넣게 됩니다.
+        """
+        with self._start_lock:
+            if self._recovered:
+                return
+            self._recovered = True
+            self._purge_finished()
+            for job_id in self._unfinished_job_ids():
+                self._update(job_id, status=QUEUED, stage='queued', message='서버 재시작 후 다시 처리')
+                try:
+                    self._pending.put_nowait(job_id)
+                except queue.Full:
+                    self._update(job_id, status=FAILED, error='대기열이 가득 차 다시 처리하지 못했습니다.')
+
+    def start(self):
+        """작업자 스레드 시작 (복구 전이면 끝나지 않은 작업부터 다시 대기열에 넣음)"""
+        self.recover()
+        with self._start_lock:
+            if self._started:
+                return
+            self._started = True
+            for index in range(self.workers):
+                thread = threading.Thread(target=self._worker, name=f"job-worker-{index}", daemon=True)
+                thread.start()
+                self._threads.append(thread)
+
+    def submit(self, kind: str, payload: Dict) -> str:
+        """작업 제출 (작업 ID 즉시 반환)"""
+        if kind not in self._handlers:
+            raise ValueError(f"등록되지 않은 작업 종류: {kind}")
+        self.start()
+
+        job_id = uuid.uuid4().hex
+        now = time.time()
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT INTO job (job_id, kind, status, stage, payload, created_at, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (job_id, kind, QUEUED, 'queued', json.dumps(payload, ensure_ascii=False), now, now)
+            )
+        try:
+            self._pending.put_nowait(job_id)
+        except queue.Full:
+            self._update(job_id, status=FAILED, error='대기 중인 작업이 너무 많습니다.')
+            raise JobQueueFull("대기 중인 작업이 너무 많습니다. 잠시 후 다시 시도하세요.")
+        return job_id
+
+    # ============================================================
+    # 조회
+    # ============================================================
+
+    def get(self, job_id: str) -> Optional[Dict]:
+        """작업 상태 (없으면 None)"""
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT job_id, kind, status, stage, message, result, error, created_at, updated_at "
+                "FROM job WHERE job_id = ?", (job_id,)
+            ).fetchone()
+        if row is None:
+            return None
+        return {
+            "jobId": row[0],
+            "kind": row[1],
+            "status": row[2],
+            "stage": row[3],
+            "message": row[4],
+            "result": json.loads(row[5]) if row[5] else None,
+            "error": row[6],
+            "createdAt": row[7],
+            "updatedAt": row[8],
+        }
+
+    def events(self, job_id: str, timeout: float = 600, heartbeat: float = 15,
+               poll: float = 1.0) -> Iterator[Optional[Dict]]:
+        """
+        작업 상태가 바뀔 때마다 상태를 반환하는 제너레이터 (끝나면 종료)
+
+        같은 프로세스의 변경은 바로 알림을 받고, 다른 작업자 프로세스가 처리하는
+        작업은 poll초마다 SQLite에서 다시 확인합니다.
+        heartbeat초 동안 변화가 없으면 None을 반환합니다 (연결 유지용).
+        """
+        deadline = time.monotonic() + timeout
+        last_seen = None
+        last_sent = time.monotonic()
+        while True:
+            job = self.get(job_id)
+            if job is None:
+                return
+            marker = (job["status"], job["stage"], job["message"], job["updatedAt"])
+            if marker != last_seen:
+                last_seen = marker
+                last_sent = time.monotonic()
+                yield job
+            if job["status"] in FINISHED_STATUSES or time.monotonic() >= deadline:
+                return
+            with self._changed:
+                self._changed.wait(timeout=min(poll, heartbeat))
+            if time.monotonic() - last_sent >= heartbeat:
+                last_sent = time.monotonic()
+                yield None
+
+    # ============================================================
+    # 작업자
+    # ============================================================
+
+    def _worker(self):
+        while True:
+            job_id = self._pending.get()
+            try:
+                self._run(job_id)
+            finally:
+                self._pending.task_done()
+
+    def _run(self, job_id: str):
+        with self._connect() as conn:
+            row = conn.execute("SELECT kind, payload FROM job WHERE job_id = ?", (job_id,)).fetchone()
+        if row is None:
+            return
+        kind, payload = row[0], json.loads(row[1])
+        handler = self._handlers.get(kind)
+        if handler is None:
+            self._update(job_id, status=FAILED, error=f"등록되지 않은 작업 종류: {kind}")
+            return
+
+        if not self._claim(job_id):
+            # 다른 작업자 프로세스가 이미 처리 중이거나 끝낸 작업
+            return
+        try:
+            result = handler(JobContext(self, job_id), payload)
+        except Exception as e:
+            print(f"❌ 작업 실패 ({kind}, {job_id}): {e}")
+            import traceback
+            traceback.print_exc()
+            self._update(job_id, status=FAILED, stage='failed', error=str(e))
+            return
+
+        if isinstance(result, dict) and result.get("success") is False:
+            self._update(job_id, status=FAILED, stage='failed', result=result,
+                         error=result.get("error", "작업 실패"))
+        else:
+            self._update(job_id, status=SUCCEEDED, stage='done', result=result)
+
+    # ============================================================
+    # SQLite
+    # ============================================================
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.db_path, timeout=10)
+
+    def _init_db(self):
+        db_dir = os.path.dirname(self.db_path)
+        if db_dir:
+            os.makedirs(db_dir, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS job (
+                    job_id TEXT PRIMARY KEY,
+                    kind TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    stage TEXT,
+                    message TEXT,
+                    payload TEXT NOT NULL,
+                    result TEXT,
+                    error TEXT,
+                    created_at REAL NOT NULL,
+                    updated_at REAL NOT NULL
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_job_status ON job (status, created_at)")
+
+    _UNSET = object()
+
+    def _update(self, job_id: str, status: Optional[str] = None, stage: Optional[str] = None,
+                message: Any = _UNSET, result: Any = _UNSET, error: Any = _UNSET):
+        fields = {"updated_at": time.time()}
+        if status is not None:
+            fields["status"] = status
+        if stage is not None:
+            fields["stage"] = stage
+        if message is not self._UNSET:
+            fields["message"] = message
+        if result is not self._UNSET:
+            fields["result"] = json.dumps(result, ensure_ascii=False) if result is not None else None
+        if error is not self._UNSET:
+            fields["error"] = error
+
+        assignments = ", ".join(f"{name} = ?" for name in fields)
+        try:
+            with self._connect() as conn:
+                conn.execute(f"UPDATE job SET {assignments} WHERE job_id = ?", (*fields.values(), job_id))
+        except sqlite3.Error as e:
+            print(f"⚠️ 작업 상태 저장 실패 ({job_id}): {e}")
+        with self._changed:
+            self._changed.notify_all()
+
+    def _claim(self, job_id: str) -> bool:
+        """대기 중인 작업을 실행 중으로 표시 (다른 프로세스가 먼저 가져갔으면 False)"""
+        with self._connect() as conn:
+            claimed = conn.execute(
+                "UPDATE job SET status = ?, stage = ?, updated_at = ? WHERE job_id = ? AND status = ?",
+                (RUNNING, 'started', time.time(), job_id, QUEUED)
+            ).rowcount == 1
+        with self._changed:
+            self._changed.notify_all()
+        return claimed
+
+    def _unfinished_job_ids(self):
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT job_id FROM job WHERE status IN (?, ?) ORDER BY created_at", (QUEUED, RUNNING)
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def _purge_finished(self):
+        with self._connect() as conn:
+            conn.execute(
+                "DELETE FROM job WHERE status IN (?, ?) AND updated_at < ?",
+                (SUCCEEDED, FAILED, time.time() - self.retention)
+            )
@@ -0,0 +1,236 @@
+"""
+HooAah Yacht - LLM 응답 캐시 (SQLite)
+여러 세션에서 반복되는 자유 질문 ("TP52 정비 주기 알려줘", "Farr 40 분석해줘")의
+Gemini 응답을 디스크에 저장해 같은 질문은 LLM 호출 없이 바로 응답
+
+- 키 = 응답 종류 + 정규화된 질문 + 요트 ID + 카탈로그 버전
+  (정규화: 소문자, 공백/문장부호 제거 → "Farr 40 분석해줘?" == "farr40 분석해줘")
+  → 카탈로그가 바뀌면 버전이 달라져 자연스럽게 무효화
+- 유효 기간 (TTL)이 지난 항목은 사용하지 않고 삭제
+- 항목 수가 한도를 넘으면 가장 오래 사용하지 않은 항목부터 삭제
+- 적중/실패/만료/삭제 횟수 집계 (stats)
+
+환경 변수:
+    LLM_CACHE_PATH: 캐시 SQLite 파일 (기본: data/llm_cache.db)
+    LLM_CACHE_TTL: 유효 기간 (초, 기본: 604800 = 7일)
+    LLM_CACHE_MAX: 최대 항목 수 (기본: 10000)
+"""
+
+import os
+import re
+import time
+import hashlib
+import sqlite3
+import threading
+from typing import Callable, Dict, Optional
+
+
+DEFAULT_DB_PATH = os.getenv('LLM_CACHE_PATH', os.path.join('data', 'llm_cache.db'))
+DEFAULT_TTL = float(os.getenv('LLM_CACHE_TTL', 7 * 24 * 3600))
+DEFAULT_MAX_ENTRIES = int(os.getenv('LLM_CACHE_MAX', 10000))
+
+# 정규화 시 제거하는 문자 (공백, 문장부호)
+_NOISE_RE = re.compile(r'[\s?!.,~·…"\'`()\[\]{}]+')
+
+
+def normalize_question(question: str) -> str:
+    """질문 정규화 (소문자, 공백/문장부호 제거)"""
+    return _NOISE_RE.sub('', question.lower())
+
+
+class LLMResponseCache:
+    """SQLite 기반 LLM 응답 캐시 (TTL + LRU 크기 제한)"""
+
+    def __init__(self, db_path: str = DEFAULT_DB_PATH, ttl: float = DEFAULT_TTL,
+                 max_entries: int = DEFAULT_MAX_ENTRIES):
+        """
+        Args:
+            db_path: 캐시 SQLite 파일 경로
+            ttl: 유효 기간 (초)
+            max_entries: 최대 항목 수
+        """
+        self.db_path = db_path
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._local = threading.local()
+        self._write_lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self._counters = {"hits": 0, "misses": 0, "expired": 0, "evicted": 0}
+
+        db_dir = os.path.dirname(self.db_path)
+        if db_dir:
+            os.makedirs(db_dir, exist_ok=True)
+        self._init_db()
+
+    @staticmethod
+    def make_key(kind: str, question: str, yacht_id: Optional[str], version: str) -> str:
+        """캐시 키 (SHA-256)"""
+        raw = '\x1f'.join([kind, normalize_question(question), yacht_id or '', version])
+        return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+    # ============================================================
+    # 조회 / 저장
+    # ============================================================
+
+    def get(self, kind: str, question: str, yacht_id: Optional[str], version: str) -> Optional[str]:
+        """
+        캐시된 응답 조회
+
+        Args:
+            kind: 응답 종류 ('intent', 'analysis' 등)
+            question: 사용자 질문 (정규화하여 비교)
+            yacht_id: 질문에서 찾은 요트 ID (없으면 None)
+            version: 응답이 근거로 한 카탈로그 버전
+
+        Returns:
+            응답 텍스트 (없거나 만료되었으면 None)
+        """
+        key = self.make_key(kind, question, yacht_id, version)
+        now = time.time()
+        try:
+            row = self._conn().execute(
+                "SELECT response, created_at FROM response WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self._count('misses')
+                return None
+            if now - row[1] > self.ttl:
+                with self._write_lock, self._conn() as conn:
+                    conn.execute("DELETE FROM response WHERE key = ?", (key,))
+                self._count('expired')
+                self._count('misses')
+                return None
+            with self._write_lock, self._conn() as conn:
+                conn.execute("UPDATE response SET last_used = ?, hits = hits + 1 WHERE key = ?", (now, key))
+        except sqlite3.Error as e:
+            print(f"⚠️ LLM 응답 캐시 조회 실패: {e}")
+            return None
+        self._count('hits')
+        return row[0]
+
+    def put(self, kind: str, question: str, yacht_id: Optional[str], version: str, response: str):
+        """응답 저장 (한도를 넘으면 오래 사용하지 않은 항목 삭제)"""
+        if not response:
+            return
+        key = self.make_key(kind, question, yacht_id, version)
+        now = time.time()
+        try:
+            with self._write_lock, self._conn() as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO response "
+                    "(key, kind, question, yacht_id, version, response, created_at, last_used, hits) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, 0)",
+                    (key, kind, normalize_question(question), yacht_id, version, response, now, now)
+                )
+                count = conn.execute("SELECT COUNT(*) FROM response").fetchone()[0]
+                if count > self.max_entries:
+                    evicted = conn.execute(
+                        "DELETE FROM response WHERE key IN "
+                        "(SELECT key FROM response ORDER BY last_used LIMIT ?)",
+                        (count - self.max_entries,)
+                    ).rowcount
+                    self._count('evicted', evicted)
+        except sqlite3.Error as e:
+            print(f"⚠️ LLM 응답 캐시 저장 실패: {e}")
+
+    def get_or_generate(self, kind: str, question: str, yacht_id: Optional[str], version: str,
+                        generate: Callable[[], str]) -> str:
+        """캐시된 응답 반환 (없으면 generate()로 만들어 저장)"""
+        cached = self.get(kind, question, yacht_id, version)
+        if cached is not None:
+            return cached
+        response = generate()
+        self.put(kind, question, yacht_id, version, response)
+        return response
+
+    # ============================================================
+    # 관리
+    # ============================================================
+
+    def purge_expired(self) -> int:
+        """만료된 항목 삭제"""
+        with self._write_lock, self._conn() as conn:
+            deleted = conn.execute(
+                "DELETE FROM response WHERE created_at < ?", (time.time() - self.ttl,)
+            ).rowcount
+        self._count('expired', deleted)
+        return deleted
+
+    def invalidate(self, yacht_id: Optional[str] = None) -> int:
+        """항목 삭제 (yacht_id가 None이면 전체)"""
+        with self._write_lock, self._conn() as conn:
+            if yacht_id is None:
+                return conn.execute("DELETE FROM response").rowcount
+            return conn.execute("DELETE FROM response WHERE yacht_id = ?", (yacht_id,)).rowcount
+
+    def stats(self) -> Dict[str, float]:
+        """항목 수, 적중/실패/만료/삭제 횟수, 적중률"""
+        with self._stats_lock:
+            stats: Dict[str, float] = dict(self._counters)
+        try:
+            stats["entries"] = self._conn().execute("SELECT COUNT(*) FROM response").fetchone()[0]
+        except sqlite3.Error:
+            stats["entries"] = -1
+        lookups = stats["hits"] + stats["misses"]
+        stats["hitRate"] = round(stats["hits"] / lookups, 3) if lookups else 0.0
+        return stats
+
+    def _count(self, name: str, amount: int = 1):
+        with self._stats_lock:
+            self._counters[name] += amount
+
+    # ============================================================
+    # SQLite
+    # ============================================================
+
+    def _conn(self) -> sqlite3.Connection:
+        """스레드별 연결"""
+        conn = getattr(self._local, 'conn', None)
+        # fork로 물려받은 연결은 부모 프로세스와 공유되므로 쓰지 않음 (gunicorn 작업자)
+        if conn is None or self._local.pid != os.getpid():
+            conn = sqlite3.connect(self.db_path, timeout=30)
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    def _init_db(self):
+        conn = self._conn()
+        conn.execute("PRAGMA journal_mode=WAL")
+        with conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS response (
+                    key TEXT PRIMARY KEY,
+                    kind TEXT NOT NULL,
+                    question TEXT NOT NULL,
+                    yacht_id TEXT,
+                    version TEXT NOT NULL,
+                    response TEXT NOT NULL,
+                    created_at REAL NOT NULL,
+                    last_used REAL NOT NULL,
+                    hits INTEGER NOT NULL DEFAULT 0
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_response_last_used ON response (last_used)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_response_yacht ON response (yacht_id)")
+
+
+_shared_cache: Optional[LLMResponseCache] = None
+_shared_cache_lock = threading.Lock()
+
+
+def get_shared_llm_cache(db_path: str = DEFAULT_DB_PATH) -> Optional[LLMResponseCache]:
+    """
+    프로세스 공유 LLM 응답 캐시
+
+    캐시 파일을 열 수 없으면 None을 반환합니다 (호출하는 쪽은 캐시 없이 동작).
+    """
+    global _shared_cache
+    if _shared_cache is None:
+        with _shared_cache_lock:
+            if _shared_cache is None:
+                try:
+                    _shared_cache = LLMResponseCache(db_path)
+                except sqlite3.Error as e:
+                    print(f"⚠️ LLM 응답 캐시를 사용할 수 없습니다: {e}")
+                    return None
+    return _shared_cache
@@ -0,0 +1,190 @@
+"""
+HooAah Yacht - 매뉴얼 분할 분석 (map-reduce)
+긴 매뉴얼을 앞 30,000자만 잘라 한 번에 분석하던 방식을 대신해,
+본문을 섹션 경계에서 나눠 동시에 분석하고 Schema 5.0 부분 결과를 하나로 합침
+
+- split_manual_text(): 제목/빈 줄 등 섹션 경계에서 max_chars 이하로 분할
+- analyze_chunks(): 제한된 수의 스레드로 조각 동시 분석 (순서 유지)
+- merge_analysis_results(): 부분 결과 병합
+  - id가 있는 항목 (ext-hull-01, deck-winch-* 등)은 id 기준으로 하나로 합침
+  - 값이 다르면 _confidence_* 가 높은 쪽을 채택 (같으면 앞 조각 우선)
+  - 빈 값 (None, "", [], {})은 다른 조각의 값으로 채움
+
+환경 변수:
+    ANALYSIS_CHUNK_CHARS: 조각 최대 길이 (기본: 30000)
+    ANALYSIS_WORKERS: 동시에 분석할 조각 수 (기본: 4)
+    ANALYSIS_MAX_CHUNKS: 분석할 최대 조각 수 (기본: 20)
+"""
+
+import os
+import re
+import json
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+
+
+DEFAULT_CHUNK_CHARS = int(os.getenv('ANALYSIS_CHUNK_CHARS', 30000))
+DEFAULT_WORKERS = int(os.getenv('ANALYSIS_WORKERS', 4))
+DEFAULT_MAX_CHUNKS = int(os.getenv('ANALYSIS_MAX_CHUNKS', 20))
+
+# 조각이 이 비율 이상 찼으면 섹션 경계에서 자름
+_SECTION_BREAK_RATIO = 0.6
+
+# 섹션 제목으로 보는 줄: "3.2 ENGINE", "Chapter 4", "SECTION 5 - RIGGING", 대문자 제목
+_HEADING_RE = re.compile(
+    r'^(?:\d+(?:\.\d+)*\.?\s+\S|(?:chapter|section|part)\s+\d+|[A-Z][A-Z0-9 &/\-]{3,60}$)',
+    re.IGNORECASE
+)
+
+# 병합 결과에 포함하지 않는 조각 분석 메타 항목
+_RESULT_META_KEYS = {'error', 'rawResponse', 'extractedTextLength', 'fileInfo'}
+
+_CONFIDENCE_RANK = {'low': 1, 'medium': 2, 'high': 3}
+
+
+def _is_heading(line: str) -> bool:
+    stripped = line.strip()
+    return bool(stripped) and len(stripped) <= 80 and bool(_HEADING_RE.match(stripped))
+
+
+def split_manual_text(text: str, max_chars: Optional[int] = None) -> List[str]:
+    """
+    매뉴얼 본문을 max_chars 이하 조각으로 분할 (기본: ANALYSIS_CHUNK_CHARS)
+
+    조각이 어느 정도 찼으면 빈 줄 또는 섹션 제목 앞에서 자르고,
+    경계가 없으면 줄 단위로, 한 줄이 너무 길면 글자 수로 자릅니다.
+    """
+    max_chars = max_chars or DEFAULT_CHUNK_CHARS
+    if len(text) <= max_chars:
+        return [text] if text.strip() else []
+
+    chunks: List[str] = []
+    current: List[str] = []
+    size = 0
+    for line in text.splitlines():
+        while len(line) > max_chars:
+            if current:
+                chunks.append('\n'.join(current))
+                current, size = [], 0
+            chunks.append(line[:max_chars])
+            line = line[max_chars:]
+
+        at_boundary = not line.strip() or _is_heading(line)
+        if current and (size + len(line) + 1 > max_chars or
+                        (at_boundary and size >= max_chars * _SECTION_BREAK_RATIO)):
+            chunks.append('\n'.join(current))
+            current, size = [], 0
+        if not current and not line.strip():
+            continue
+        current.append(line)
+        size += len(line) + 1
+
+    if current:
+        chunks.append('\n'.join(current))
+    return [chunk for chunk in chunks if chunk.strip()]
+
+
+def analyze_chunks(chunks: List[str], analyze: Callable[[str], Dict],
+                   workers: Optional[int] = None) -> List[Dict]:
+    """
+    조각 동시 분석
+
+    Args:
+        chunks: 본문 조각
+        analyze: 조각 하나를 분석하는 함수 (실패 시 예외 또는 "error" 항목이 있는 dict)
+        workers: 최대 동시 분석 수
+
+    Returns:
+        조각 순서대로의 분석 결과 (예외는 {"error": ...}로 변환)
+    """
+    def run(chunk: str) -> Dict:
+        try:
+            result = analyze(chunk)
+        except Exception as e:
+            return {"error": str(e)}
+        return result if isinstance(result, dict) else {"error": "분석 결과 형식 오류"}
+
+    workers = max(1, min(workers or DEFAULT_WORKERS, len(chunks)))
+    if workers == 1:
+        return [run(chunk) for chunk in chunks]
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='manual-analysis') as executor:
+        return list(executor.map(run, chunks))
+
+
+def _is_empty(value: Any) -> bool:
+    return value is None or value == '' or value == [] or value == {}
+
+
+def _confidence(data: Dict, key: str) -> int:
+    value = data.get(f'_confidence_{key}')
+    return _CONFIDENCE_RANK.get(str(value).lower(), 0) if value is not None else 0
+
+
+def _merge_lists(base: List, other: List) -> List:
+    merged = list(base)
+    by_id = {item['id']: index for index, item in enumerate(merged)
+             if isinstance(item, dict) and item.get('id')}
+    seen = {json.dumps(item, sort_keys=True, ensure_ascii=False) for item in merged
+            if not (isinstance(item, dict) and item.get('id'))}
+
+    for item in other:
+        if isinstance(item, dict) and item.get('id'):
+            index = by_id.get(item['id'])
+            if index is None:
+                by_id[item['id']] = len(merged)
+                merged.append(item)
+            else:
+                merged[index] = _merge_dicts(merged[index], item)
+            continue
+        key = json.dumps(item, sort_keys=True, ensure_ascii=False)
+        if key not in seen:
+            seen.add(key)
+            merged.append(item)
+    return merged
+
+
+def _merge_dicts(base: Dict, other: Dict) -> Dict:
+    merged = dict(base)
+    for key, value in other.items():
+        if key.startswith('_confidence_'):
+            continue
+        if key not in merged or _is_empty(merged[key]):
+            merged[key] = value
+            if f'_confidence_{key}' in other:
+                merged[f'_confidence_{key}'] = other[f'_confidence_{key}']
+            continue
+
+        current = merged[key]
+        if _is_empty(value) or value == current:
+            continue
+        if isinstance(current, dict) and isinstance(value, dict):
+            merged[key] = _merge_dicts(current, value)
+        elif isinstance(current, list) and isinstance(value, list):
+            merged[key] = _merge_lists(current, value)
+        elif _confidence(other, key) > _confidence(merged, key):
+            merged[key] = value
+            merged[f'_confidence_{key}'] = other[f'_confidence_{key}']
+
+    # 값이 같았던 항목도 더 높은 신뢰도를 유지
+    for key, value in other.items():
+        if key.startswith('_confidence_'):
+            field = key[len('_confidence_'):]
+            if merged.get(field) == other.get(field) and _confidence(other, field) > _confidence(merged, field):
+                merged[key] = value
+    return merged
+
+
+def merge_analysis_results(results: List[Dict]) -> Dict:
+    """
+    조각별 Schema 5.0 분석 결과 병합 (실패한 조각은 제외)
+
+    Returns:
+        병합된 결과 (성공한 조각이 없으면 빈 dict)
+    """
+    merged: Dict = {}
+    for result in results:
+        if not isinstance(result, dict) or 'error' in result:
+            continue
+        partial = {key: value for key, value in result.items() if key not in _RESULT_META_KEYS}
+        merged = _merge_dicts(merged, partial) if merged else partial
+    return merged
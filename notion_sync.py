@@ -0,0 +1,421 @@
+"""
+HooAah Yacht - Notion 데이터베이스 동기화 엔진
+JSON 레코드를 Notion 데이터베이스 페이지로 upsert하되 바뀐 페이지만 씀
+
+동작:
+1. 데이터베이스 전체를 페이지 단위 (has_more / next_cursor)로 읽어 키 → 페이지 맵 생성
+2. 레코드 속성과 기존 페이지 속성을 같은 형태로 정규화해 해시 비교 → 새 페이지/바뀐 페이지만 골라냄
+3. 생성/수정을 workers개 스레드로 동시에 보내되, 공유 요청 한도 (초당 rate개)를 지킴
+   429 (rate_limited)는 Retry-After만큼 모든 스레드가 쉬고 재시도, 5xx/연결 오류는 지수 백오프
+   단, 페이지 생성 (멱등이 아님)은 5xx/연결 오류 뒤 다시 보내지 않고 키로 다시 조회해
+   이미 만들어졌는지 확인 (응답만 잃어버린 생성이 중복 페이지가 되지 않게)
+
+→ 바뀐 것이 없으면 읽기 요청 (100개당 1회)만으로 끝남
+→ 연결은 requests.Session 하나를 재사용 (keep-alive 연결 풀)
+→ base_url만 바꾸면 로컬 HTTP 스텁으로 테스트 가능
+
+사용법:
+    client = NotionClient(api_key)
+    engine = NotionSyncEngine(client, database_id, key=('Yacht ID', 'Part ID'))
+    stats = engine.sync(records)            # {"created": 1, "updated": 2, "unchanged": 97, ...}
+
+환경 변수:
+    NOTION_API_URL: API 주소 (기본: https://api.notion.com/v1)
+    NOTION_RATE_PER_SECOND: 초당 최대 요청 수 (기본: 3, Notion 평균 한도)
+    NOTION_WORKERS: 동시 쓰기 스레드 수 (기본: 3)
+    NOTION_MAX_RETRIES: 요청당 최대 재시도 횟수 (기본: 5)
+"""
+
+import os
+import json
+import time
+import random
+import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+
+
+NOTION_API_URL = os.getenv('NOTION_API_URL', 'https://api.notion.com/v1')
+NOTION_VERSION = '2022-06-28'
+DEFAULT_RATE_PER_SECOND = float(os.getenv('NOTION_RATE_PER_SECOND', 3))
+DEFAULT_WORKERS = int(os.getenv('NOTION_WORKERS', 3))
+DEFAULT_MAX_RETRIES = int(os.getenv('NOTION_MAX_RETRIES', 5))
+
+# 한 번에 읽는 페이지 수 (Notion 최대값)
+QUERY_PAGE_SIZE = 100
+
+RETRYABLE_STATUS = (409, 429, 500, 502, 503, 504)
+
+
+class NotionError(Exception):
+    """Notion API 요청 실패 (재시도 후에도 실패했거나 재시도할 수 없는 오류)"""
+
+    def __init__(self, message: str, status: Optional[int] = None, uncertain: bool = False):
+        super().__init__(message)
+        self.status = status
+        # 서버가 요청을 처리했는지 알 수 없음 (5xx/연결 오류)
+        self.uncertain = uncertain
+
+
+# ============================================================
+# 요청 한도
+# ============================================================
+
+class RateLimiter:
+    """
+    스레드 공유 요청 간격 제한 (초당 rate개)
+
+    429를 받으면 pause()로 모든 스레드의 다음 요청을 Retry-After 뒤로 미룸
+    """
+
+    def __init__(self, rate_per_second: float, clock: Callable[[], float] = time.monotonic,
+                 sleep: Callable[[float], None] = time.sleep):
+        self.interval = 1.0 / rate_per_second if rate_per_second > 0 else 0.0
+        self._clock = clock
+        self._sleep = sleep
+        self._next = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """요청 차례가 올 때까지 대기, 기다린 시간 (초) 반환"""
+        with self._lock:
+            now = self._clock()
+            start = max(now, self._next)
+            self._next = start + self.interval
+        wait = start - now
+        if wait > 0:
+            self._sleep(wait)
+        return wait
+
+    def pause(self, seconds: float):
+        """지금부터 seconds초 동안 새 요청을 보내지 않음"""
+        with self._lock:
+            self._next = max(self._next, self._clock() + seconds)
+
+
+# ============================================================
+# API 클라이언트
+# ============================================================
+
+class NotionClient:
+    """Session 재사용 + 요청 한도 + 429/5xx 재시도를 적용한 Notion API 클라이언트"""
+
+    def __init__(self, api_key: str, base_url: str = NOTION_API_URL,
+                 rate_per_second: float = DEFAULT_RATE_PER_SECOND,
+                 max_retries: int = DEFAULT_MAX_RETRIES, pool_size: int = DEFAULT_WORKERS,
+                 timeout: float = 30.0, sleep: Callable[[float], None] = time.sleep):
+        """
+        Args:
+            api_key: Notion Integration 토큰
+            base_url: API 주소 (테스트에서는 로컬 스텁 주소)
+            rate_per_second: 초당 최대 요청 수 (0이면 제한 없음)
+            max_retries: 요청당 최대 재시도 횟수
+            pool_size: keep-alive 연결 수 (동시 쓰기 스레드 수 이상)
+            timeout: 요청 하나의 제한 시간 (초)
+            sleep: 대기 함수 (테스트에서 교체)
+        """
+        self.base_url = base_url.rstrip('/')
+        self.max_retries = max(0, max_retries)
+        self.timeout = timeout
+        self._sleep = sleep
+        self.limiter = RateLimiter(rate_per_second, sleep=sleep)
+
+        self.session = requests.Session()
+        self.session.headers.update({
+            'Authorization': f'Bearer {api_key}',
+            'Content-Type': 'application/json',
+            'Notion-Version': NOTION_VERSION,
+        })
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max(1, pool_size))
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+        self._stats_lock = threading.Lock()
+        self._stats = {"requests": 0, "retries": 0, "rateLimited": 0}
+
+    def request(self, method: str, path: str, body: Optional[Dict] = None, idempotent: bool = True) -> Dict:
+        """
+        API 요청 (429/5xx/연결 오류는 재시도)
+
+        Args:
+            idempotent: False면 처리되었을 수도 있는 실패 (5xx/연결 오류)는 재시도하지 않고
+                        uncertain=True인 NotionError로 알림 (429/409는 처리 전 거절이므로 재시도)
+
+        Raises:
+            NotionError: 재시도 후에도 실패하거나 4xx 오류
+        """
+        url = f"{self.base_url}/{path.lstrip('/')}"
+        attempt = 0
+        while True:
+            self.limiter.acquire()
+            self._count("requests")
+            try:
+                response = self.session.request(method, url, json=body, timeout=self.timeout)
+            except requests.RequestException as e:
+                if attempt >= self.max_retries or not idempotent:
+                    raise NotionError(f"{method} {path} 연결 실패: {e}", uncertain=True) from e
+                self._backoff(attempt)
+                attempt += 1
+                continue
+
+            if response.status_code == 200:
+                return response.json()
+            uncertain = response.status_code >= 500
+            if response.status_code not in RETRYABLE_STATUS or attempt >= self.max_retries or \
+                    (uncertain and not idempotent):
+                raise NotionError(f"{method} {path} 실패: {response.status_code} {response.text[:200]}",
+                                  status=response.status_code, uncertain=uncertain)
+
+            if response.status_code == 429:
+                self._count("rateLimited")
+                retry_after = _retry_after(response.headers.get('Retry-After'))
+                # 모든 스레드가 함께 쉼 (한 스레드만 쉬면 나머지가 계속 429를 받음)
+                self.limiter.pause(retry_after if retry_after is not None else self._delay(attempt))
+            else:
+                self._backoff(attempt)
+            attempt += 1
+
+    def query_all(self, database_id: str, filter: Optional[Dict] = None) -> List[Dict]:
+        """데이터베이스의 모든 페이지 (has_more / next_cursor를 따라 끝까지 읽음)"""
+        pages: List[Dict] = []
+        body: Dict[str, Any] = {'page_size': QUERY_PAGE_SIZE}
+        if filter:
+            body['filter'] = filter
+        while True:
+            result = self.request('POST', f'databases/{database_id}/query', body)
+            pages.extend(result.get('results', []))
+            if not result.get('has_more') or not result.get('next_cursor'):
+                return pages
+            body['start_cursor'] = result['next_cursor']
+
+    def create_page(self, database_id: str, properties: Dict) -> Dict:
+        """페이지 생성 (멱등이 아니므로 5xx/연결 오류는 재시도하지 않음)"""
+        return self.request('POST', 'pages', {'parent': {'database_id': database_id},
+                                              'properties': properties}, idempotent=False)
+
+    def update_page(self, page_id: str, properties: Dict) -> Dict:
+        return self.request('PATCH', f'pages/{page_id}', {'properties': properties})
+
+    def archive_page(self, page_id: str) -> Dict:
+        return self.request('PATCH', f'pages/{page_id}', {'archived': True})
+
+    def stats(self) -> Dict[str, int]:
+        """요청/재시도/429 횟수"""
+        with self._stats_lock:
+            return dict(self._stats)
+
+    def close(self):
+        self.session.close()
+
+    def _count(self, key: str):
+        with self._stats_lock:
+            self._stats[key] += 1
+
+    def _delay(self, attempt: int) -> float:
+        # 지수 백오프 + 지터 (0.5, 1, 2, 4 ... 최대 30초)
+        return min(30.0, 0.5 * (2 ** attempt)) * (0.5 + random.random() / 2)
+
+    def _backoff(self, attempt: int):
+        self._count("retries")
+        self._sleep(self._delay(attempt))
+
+
+def _retry_after(value: Optional[str]) -> Optional[float]:
+    try:
+        return max(0.0, float(value)) if value is not None else None
+    except ValueError:
+        return None
+
+
+# ============================================================
+# 속성 정규화 / 해시
+# ============================================================
+
+def property_value(prop: Optional[Dict]) -> Any:
+    """
+    Notion 속성을 비교용 값으로 변환
+
+    보낼 속성 ({'rich_text': [{'text': {'content': 'x'}}]})과
+    받은 속성 ({'type': 'rich_text', 'rich_text': [{'plain_text': 'x', ...}]})이 같은 값이 됨
+    """
+    if not prop:
+        return None
+    for kind in ('title', 'rich_text'):
+        if kind in prop:
+            return ''.join(item.get('plain_text') or (item.get('text') or {}).get('content', '')
+                           for item in prop[kind] or [])
+    if 'number' in prop:
+        number = prop['number']
+        return int(number) if isinstance(number, float) and number.is_integer() else number
+    for kind in ('select', 'status'):
+        if kind in prop:
+            return (prop[kind] or {}).get('name')
+    if 'multi_select' in prop:
+        return sorted(option.get('name') for option in prop['multi_select'] or [])
+    if 'date' in prop:
+        return (prop['date'] or {}).get('start')
+    for kind in ('url', 'checkbox', 'email', 'phone_number'):
+        if kind in prop:
+            return prop[kind]
+    return json.dumps(prop, sort_keys=True, ensure_ascii=False)
+
+
+def properties_hash(properties: Dict, names: Optional[Iterable[str]] = None) -> str:
+    """속성 해시 (names가 있으면 그 속성만 비교 → Notion에서 추가한 열은 무시)"""
+    names = sorted(properties if names is None else names)
+    payload = json.dumps([[name, property_value(properties.get(name))] for name in names],
+                         ensure_ascii=False, separators=(',', ':'))
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+
+
+# ============================================================
+# 동기화 엔진
+# ============================================================
+
+class NotionSyncEngine:
+    """전체 읽기 + 해시 비교 + 병렬 upsert로 Notion 데이터베이스를 JSON과 맞춤"""
+
+    def __init__(self, client: NotionClient, database_id: str, key: Tuple[str, ...],
+                 workers: int = DEFAULT_WORKERS):
+        """
+        Args:
+            client: NotionClient
+            database_id: 대상 데이터베이스 ID
+            key: 레코드를 식별하는 속성 이름 (예: ('ID',), ('Yacht ID', 'Part ID'))
+            workers: 동시 쓰기 스레드 수
+        """
+        self.client = client
+        self.database_id = database_id
+        self.key = tuple(key)
+        self.workers = max(1, workers)
+
+    def record_key(self, properties: Dict) -> Tuple:
+        return tuple(property_value(properties.get(name)) or '' for name in self.key)
+
+    def key_filter(self, properties: Dict) -> Dict:
+        """레코드 키 속성이 모두 같은 페이지를 찾는 데이터베이스 query 필터"""
+        conditions = []
+        for name in self.key:
+            prop = properties.get(name) or {}
+            kind = next((kind for kind in ('title', 'rich_text', 'number', 'select') if kind in prop), 'rich_text')
+            conditions.append({'property': name, kind: {'equals': property_value(prop)}})
+        return conditions[0] if len(conditions) == 1 else {'and': conditions}
+
+    def create(self, properties: Dict) -> Dict:
+        """
+        페이지 생성 (중복 없이)
+
+        생성 요청이 5xx/연결 오류로 끝나면 Notion에 이미 만들어졌을 수 있으므로
+        다시 보내기 전에 키로 조회해, 있으면 그 페이지를 결과로 씀
+        """
+        attempt = 0
+        while True:
+            try:
+                return self.client.create_page(self.database_id, properties)
+            except NotionError as e:
+                if not e.uncertain or attempt >= self.client.max_retries:
+                    raise
+            key = self.record_key(properties)
+            for page in self.client.query_all(self.database_id, filter=self.key_filter(properties)):
+                if not page.get('archived') and self.record_key(page.get('properties') or {}) == key:
+                    return page
+            self.client._backoff(attempt)
+            attempt += 1
+
+    def load_pages(self) -> Tuple[Dict[Tuple, Dict], List[Dict]]:
+        """기존 페이지 (키 → 페이지)와 중복 페이지 목록 (같은 키의 두 번째 이후)"""
+        pages: Dict[Tuple, Dict] = {}
+        duplicates: List[Dict] = []
+        for page in self.client.query_all(self.database_id):
+            if page.get('archived'):
+                continue
+            key = self.record_key(page.get('properties') or {})
+            if not any(key):
+                continue
+            if key in pages:
+                duplicates.append(page)
+            else:
+                pages[key] = page
+        return pages, duplicates
+
+    def plan(self, records: Iterable[Dict]) -> Dict[str, Any]:
+        """
+        바뀐 레코드 계산 (Notion에는 쓰지 않음)
+
+        Returns:
+            {"create": [properties], "update": [(page_id, properties)], "unchanged": n,
+             "invalid": n, "archive": [page_id]}
+        """
+        pages, duplicates = self.load_pages()
+        create: List[Dict] = []
+        update: List[Tuple[str, Dict]] = []
+        seen = set()
+        unchanged = invalid = 0
+
+        for properties in records:
+            key = self.record_key(properties)
+            if not all(key) or key in seen:
+                # 키 없음 또는 같은 키 중복 (앞의 레코드 우선)
+                invalid += 1
+                continue
+            seen.add(key)
+            page = pages.get(key)
+            if page is None:
+                create.append(properties)
+            elif properties_hash(properties) == properties_hash(page.get('properties') or {}, properties):
+                unchanged += 1
+            else:
+                update.append((page['id'], properties))
+
+        archive = [page['id'] for key, page in pages.items() if key not in seen]
+        archive += [page['id'] for page in duplicates]
+        return {"create": create, "update": update, "unchanged": unchanged,
+                "invalid": invalid, "archive": archive}
+
+    def sync(self, records: Iterable[Dict], prune: bool = False, dry_run: bool = False) -> Dict[str, int]:
+        """
+        바뀐 레코드만 Notion에 반영
+
+        Args:
+            records: Notion 속성 dict 목록
+            prune: JSON에 없는 페이지와 중복 페이지를 아카이브
+            dry_run: 계산만 하고 쓰지 않음
+
+        Returns:
+            {"total", "created", "updated", "unchanged", "invalid", "archived", "failed"}
+        """
+        plan = self.plan(records)
+        tasks: List[Tuple[str, Callable[[], Dict]]] = []
+        tasks += [("created", lambda p=properties: self.create(p))
+                  for properties in plan["create"]]
+        tasks += [("updated", lambda i=page_id, p=properties: self.client.update_page(i, p))
+                  for page_id, properties in plan["update"]]
+        if prune:
+            tasks += [("archived", lambda i=page_id: self.client.archive_page(i))
+                      for page_id in plan["archive"]]
+
+        stats = {
+            "total": len(plan["create"]) + len(plan["update"]) + plan["unchanged"] + plan["invalid"],
+            "created": 0, "updated": 0, "unchanged": plan["unchanged"],
+            "invalid": plan["invalid"], "archived": 0, "failed": 0,
+        }
+        if dry_run:
+            for kind, _ in tasks:
+                stats[kind] += 1
+            return stats
+
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='notion-sync') as executor:
+            futures = [(kind, executor.submit(task)) for kind, task in tasks]
+            for kind, future in futures:
+                try:
+                    future.result()
+                    stats[kind] += 1
+                except NotionError as e:
+                    # 한 페이지 실패로 전체를 멈추지 않음 (다음 실행에서 다시 시도됨)
+                    stats["failed"] += 1
+                    print(f"❌ {e}")
+        return stats
@@ -0,0 +1,362 @@
+"""
+HooAah Yacht - 부품/정비 항목 DB 일괄 적재
+yacht_parts_app_data.json + yacht_parts_database.json → part, maintenance_item 테이블
+
+- part: 요트별 부품 (yacht_id, part_id 유일), 카테고리/정비 주기 인덱스
+- maintenance_item: 정비 주기가 있는 부품과 maintenanceItems 항목
+  (yacht_id + 주기, 카테고리, 주기 인덱스 → "N개월 이내 정비" 조회)
+
+두 JSON 파일을 요트 ID와 부품 ID (없으면 이름)로 합칩니다.
+- 주기 (interval, maintenanceInterval): yacht_parts_app_data.json 우선
+- 사양 (specifications, subParts, maintenanceDetails): yacht_parts_database.json
+
+적재는 요트 단위 교체: 대상 요트의 기존 행을 지우고 executemany로 batch_size개씩
+INSERT, 전체를 한 트랜잭션으로 커밋 (pymysql은 한 batch를 여러 행 INSERT 한 번으로 전송)
+→ DB-API 연결이면 무엇이든 사용 (pymysql, 테스트용 sqlite3)
+
+사용법:
+    python parts_loader.py                  # data/ JSON → MySQL (DB_* 환경 변수)
+
+    loader = PartsLoader(connection)
+    loader.ensure_tables()
+    stats = loader.load(app_data, parts_database)   # {"yachts": 20, "parts": 640, "maintenanceItems": 380}
+"""
+
+import os
+import re
+import json
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from yacht_sync import DEFAULT_BATCH_SIZE, SyncDialect, dialect_for
+
+
+PART_TABLE = 'part'
+MAINTENANCE_TABLE = 'maintenance_item'
+
+PART_COLUMNS = (
+    'yacht_id', 'part_id', 'name', 'category', 'manufacturer', 'model',
+    'interval_months', 'specifications',
+)
+MAINTENANCE_COLUMNS = (
+    'yacht_id', 'part_id', 'name', 'category', 'interval_months', 'details',
+)
+
+_MYSQL_DDL = (
+    f"""
+    CREATE TABLE IF NOT EXISTS {PART_TABLE} (
+        id BIGINT NOT NULL AUTO_INCREMENT,
+        yacht_id VARCHAR(100) NOT NULL,
+        part_id VARCHAR(150) NOT NULL,
+        name VARCHAR(255) NOT NULL,
+        category VARCHAR(100),
+        manufacturer VARCHAR(255),
+        model VARCHAR(255),
+        interval_months INT,
+        specifications JSON,
+        PRIMARY KEY (id),
+        UNIQUE KEY uk_part_yacht_part (yacht_id, part_id),
+        INDEX idx_part_yacht_category (yacht_id, category),
+        INDEX idx_part_interval (interval_months)
+    ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_general_ci
+    """,
+    f"""
+    CREATE TABLE IF NOT EXISTS {MAINTENANCE_TABLE} (
+        id BIGINT NOT NULL AUTO_INCREMENT,
+        yacht_id VARCHAR(100) NOT NULL,
+        part_id VARCHAR(150),
+        name VARCHAR(255) NOT NULL,
+        category VARCHAR(100),
+        interval_months INT,
+        details JSON,
+        PRIMARY KEY (id),
+        INDEX idx_maintenance_yacht_interval (yacht_id, interval_months),
+        INDEX idx_maintenance_yacht_category (yacht_id, category),
+        INDEX idx_maintenance_interval (interval_months)
+    ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_general_ci
+    """,
+)
+
+_SQLITE_DDL = (
+    f"""
+    CREATE TABLE IF NOT EXISTS {PART_TABLE} (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        yacht_id VARCHAR(100) NOT NULL,
+        part_id VARCHAR(150) NOT NULL,
+        name VARCHAR(255) NOT NULL,
+        category VARCHAR(100),
+        manufacturer VARCHAR(255),
+        model VARCHAR(255),
+        interval_months INT,
+        specifications TEXT,
+        UNIQUE (yacht_id, part_id)
+    )
+    """,
+    f"CREATE INDEX IF NOT EXISTS idx_part_yacht_category ON {PART_TABLE} (yacht_id, category)",
+    f"CREATE INDEX IF NOT EXISTS idx_part_interval ON {PART_TABLE} (interval_months)",
+    f"""
+    CREATE TABLE IF NOT EXISTS {MAINTENANCE_TABLE} (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        yacht_id VARCHAR(100) NOT NULL,
+        part_id VARCHAR(150),
+        name VARCHAR(255) NOT NULL,
+        category VARCHAR(100),
+        interval_months INT,
+        details TEXT
+    )
+    """,
+    f"CREATE INDEX IF NOT EXISTS idx_maintenance_yacht_interval ON {MAINTENANCE_TABLE} (yacht_id, interval_months)",
+    f"CREATE INDEX IF NOT EXISTS idx_maintenance_yacht_category ON {MAINTENANCE_TABLE} (yacht_id, category)",
+    f"CREATE INDEX IF NOT EXISTS idx_maintenance_interval ON {MAINTENANCE_TABLE} (interval_months)",
+)
+
+
+# ============================================================
+# JSON → 행 변환
+# ============================================================
+
+def _interval_months(value: Any) -> Optional[int]:
+    """정비 주기 (개월) 정수 변환 (12, "12", "12 months" → 12)"""
+    if isinstance(value, bool) or value is None:
+        return None
+    if isinstance(value, (int, float)):
+        return int(value) if value > 0 else None
+    match = re.search(r'\d+', str(value))
+    return int(match.group()) if match and int(match.group()) > 0 else None
+
+
+def _json_or_none(value: Any) -> Optional[str]:
+    return json.dumps(value, ensure_ascii=False, separators=(',', ':')) if value else None
+
+
+def _text(value: Any, limit: int = 255) -> Optional[str]:
+    if value is None or value == '':
+        return None
+    return str(value)[:limit]
+
+
+def _part_key(part: Dict) -> str:
+    """두 파일의 같은 부품을 찾는 키 (부품 ID, 없으면 소문자 이름)"""
+    return part.get('id') or f"name:{(part.get('name') or '').strip().lower()}"
+
+
+def flatten_parts(parts: Any) -> Tuple[List[Dict], List[Dict]]:
+    """
+    부품 목록 정리 → (부품, 별도 정비 항목)
+
+    카테고리별 dict 형식 ({"rigging": {"physicalParts": [...], "maintenanceItems": [...]}})도 처리
+    """
+    if isinstance(parts, list):
+        return [part for part in parts if isinstance(part, dict) and part.get('name')], []
+    physical, maintenance = [], []
+    if isinstance(parts, dict):
+        for category, group in parts.items():
+            if not isinstance(group, dict):
+                continue
+            for part in group.get('physicalParts') or []:
+                if isinstance(part, dict) and part.get('name'):
+                    physical.append(dict(part, category=part.get('category') or category))
+            for item in group.get('maintenanceItems') or []:
+                if isinstance(item, dict) and item.get('name'):
+                    maintenance.append(dict(item, category=item.get('category') or category))
+    return physical, maintenance
+
+
+def _merge_part(detail: Optional[Dict], app: Optional[Dict]) -> Dict:
+    """같은 부품의 두 기록 합치기 (주기는 앱 데이터, 사양은 부품 DB 우선)"""
+    detail, app = detail or {}, app or {}
+    merged = dict(detail)
+    for key in ('name', 'category', 'manufacturer', 'model'):
+        merged[key] = detail.get(key) or app.get(key)
+    merged['interval'] = (app.get('interval') if app.get('interval') is not None else app.get('maintenanceInterval'))
+    if merged['interval'] is None:
+        merged['interval'] = detail.get('interval') if detail.get('interval') is not None \
+            else detail.get('maintenanceInterval')
+    merged['id'] = detail.get('id') or app.get('id')
+    return merged
+
+
+def _unique_part_id(part: Dict, used: set) -> str:
+    """부품 ID (없으면 이름으로 생성), 같은 요트 안에서 겹치면 번호 추가"""
+    base = part.get('id') or 'part-' + (re.sub(r'[^a-z0-9]+', '-', part['name'].lower()).strip('-') or 'unnamed')
+    base = base[:140]
+    part_id, suffix = base, 2
+    while part_id in used:
+        part_id = f"{base}-{suffix}"
+        suffix += 1
+    used.add(part_id)
+    return part_id
+
+
+def build_rows(app_data: Dict, parts_database: Dict) -> Dict[str, Dict[str, List[Tuple]]]:
+    """
+    두 JSON을 요트별 part / maintenance_item 행으로 변환
+
+    Returns:
+        {yacht_id: {"parts": [PART_COLUMNS 순서 tuple], "maintenance": [MAINTENANCE_COLUMNS 순서 tuple]}}
+    """
+    yachts: Dict[str, Dict[str, Any]] = {}
+    for source, data in (('detail', parts_database), ('app', app_data)):
+        for entry in (data or {}).get('yachts', []):
+            yacht_id = entry.get('id')
+            if not yacht_id:
+                continue
+            slot = yachts.setdefault(yacht_id, {"detail": [], "app": [], "maintenance": []})
+            parts, maintenance = flatten_parts(entry.get('parts'))
+            slot[source].extend(parts)
+            slot["maintenance"].extend(maintenance)
+
+    rows: Dict[str, Dict[str, List[Tuple]]] = {}
+    for yacht_id, slot in yachts.items():
+        # 부품 DB 순서를 유지하고 앱 데이터에만 있는 부품은 뒤에 추가
+        detail_by_key: Dict[str, Dict] = {}
+        app_by_key: Dict[str, Dict] = {}
+        order: Dict[str, None] = {}
+        for source, index in (("detail", detail_by_key), ("app", app_by_key)):
+            for part in slot[source]:
+                key = _part_key(part)
+                if key not in index:
+                    index[key] = part
+                    order.setdefault(key)
+
+        used_ids: set = set()
+        part_rows, maintenance_rows = [], []
+        for key in order:
+            part = _merge_part(detail_by_key.get(key), app_by_key.get(key))
+            part_id = _unique_part_id(part, used_ids)
+            interval = _interval_months(part.get('interval'))
+            specifications = part.get('specifications') or {}
+            if part.get('subParts'):
+                specifications = dict(specifications, subParts=part['subParts'])
+            part_rows.append((
+                yacht_id, part_id, _text(part['name']), _text(part.get('category'), 100),
+                _text(part.get('manufacturer')), _text(part.get('model')),
+                interval, _json_or_none(specifications),
+            ))
+            if interval is not None:
+                maintenance_rows.append((
+                    yacht_id, part_id, _text(part['name']), _text(part.get('category'), 100),
+                    interval, _json_or_none(part.get('maintenanceDetails')),
+                ))
+
+        for item in slot["maintenance"]:
+            maintenance_rows.append((
+                yacht_id, _text(item.get('partId') or item.get('id'), 150), _text(item['name']),
+                _text(item.get('category'), 100),
+                _interval_months(item.get('interval') if item.get('interval') is not None
+                                 else item.get('maintenanceInterval')),
+                _json_or_none(item.get('maintenanceDetails') or item.get('details')),
+            ))
+
+        rows[yacht_id] = {"parts": part_rows, "maintenance": maintenance_rows}
+    return rows
+
+
+# ============================================================
+# 적재
+# ============================================================
+
+class PartsLoader:
+    """요트 단위 교체 + executemany batch로 부품/정비 항목을 적재"""
+
+    def __init__(self, connection, dialect: Optional[SyncDialect] = None,
+                 batch_size: int = DEFAULT_BATCH_SIZE):
+        """
+        Args:
+            connection: DB-API 연결 (pymysql 또는 sqlite3)
+            dialect: SQL 방언 (None이면 연결 종류로 선택)
+            batch_size: INSERT 한 번에 보낼 행 수
+        """
+        self.connection = connection
+        self.dialect = dialect or dialect_for(connection)
+        self.batch_size = max(1, batch_size)
+
+    def ensure_tables(self):
+        """part, maintenance_item 테이블이 없으면 생성"""
+        cursor = self.connection.cursor()
+        try:
+            for statement in (_MYSQL_DDL if self.dialect.name == 'mysql' else _SQLITE_DDL):
+                cursor.execute(statement)
+        finally:
+            cursor.close()
+        self.connection.commit()
+
+    def load(self, app_data: Dict, parts_database: Dict,
+             yacht_ids: Optional[Iterable[str]] = None) -> Dict[str, int]:
+        """
+        JSON 내용을 적재 (대상 요트의 기존 행 교체, 한 트랜잭션)
+
+        Args:
+            app_data: yacht_parts_app_data.json 내용
+            parts_database: yacht_parts_database.json 내용
+            yacht_ids: 적재할 요트 ID (None이면 전체)
+
+        Returns:
+            {"yachts", "parts", "maintenanceItems"}
+        """
+        rows = build_rows(app_data, parts_database)
+        if yacht_ids is not None:
+            wanted = set(yacht_ids)
+            rows = {yacht_id: value for yacht_id, value in rows.items() if yacht_id in wanted}
+
+        placeholder = self.dialect.placeholder
+        part_sql = (f"INSERT INTO {PART_TABLE} ({', '.join(PART_COLUMNS)}) "
+                    f"VALUES ({', '.join([placeholder] * len(PART_COLUMNS))})")
+        maintenance_sql = (f"INSERT INTO {MAINTENANCE_TABLE} ({', '.join(MAINTENANCE_COLUMNS)}) "
+                           f"VALUES ({', '.join([placeholder] * len(MAINTENANCE_COLUMNS))})")
+        part_rows = [row for value in rows.values() for row in value["parts"]]
+        maintenance_rows = [row for value in rows.values() for row in value["maintenance"]]
+        targets = [(yacht_id,) for yacht_id in rows]
+
+        cursor = self.connection.cursor()
+        try:
+            for table in (MAINTENANCE_TABLE, PART_TABLE):
+                cursor.executemany(f"DELETE FROM {table} WHERE yacht_id = {placeholder}", targets)
+            for sql, values in ((part_sql, part_rows), (maintenance_sql, maintenance_rows)):
+                for start in range(0, len(values), self.batch_size):
+                    cursor.executemany(sql, values[start:start + self.batch_size])
+            self.connection.commit()
+        except Exception:
+            self.connection.rollback()
+            raise
+        finally:
+            cursor.close()
+
+        return {"yachts": len(rows), "parts": len(part_rows), "maintenanceItems": len(maintenance_rows)}
+
+
+def load_json_files(data_dir: str = 'data') -> Tuple[Dict, Dict]:
+    """(yacht_parts_app_data.json, yacht_parts_database.json) 내용 (없으면 빈 목록)"""
+    loaded = []
+    for file_name in ('yacht_parts_app_data.json', 'yacht_parts_database.json'):
+        path = os.path.join(data_dir, file_name)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                loaded.append(json.load(f))
+        except FileNotFoundError:
+            print(f"⚠️ 파일을 찾을 수 없습니다: {path}")
+            loaded.append({"yachts": []})
+    return loaded[0], loaded[1]
+
+
+def main():
+    """data/ 부품 JSON → MySQL part/maintenance_item 테이블"""
+    from sync_json_to_mysql import connect_mysql
+
+    app_data, parts_database = load_json_files()
+    connection = connect_mysql()
+    if not connection:
+        return
+    try:
+        loader = PartsLoader(connection)
+        loader.ensure_tables()
+        stats = loader.load(app_data, parts_database)
+        print(f"✅ 적재 완료: 요트 {stats['yachts']}척, 부품 {stats['parts']}개, "
+              f"정비 항목 {stats['maintenanceItems']}개")
+    except Exception as e:
+        print(f"❌ 적재 실패: {e}")
+    finally:
+        connection.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,378 @@
+"""
+HooAah Yacht - PDF 텍스트 추출 엔진
+챗봇, 문서 분석기, 부품 추출 스크립트가 함께 사용하는 페이지 단위 PDF 텍스트 추출
+
+특징:
+- 페이지 범위를 나누어 여러 프로세스에서 병렬 추출 (ProcessPoolExecutor)
+- 페이지마다 PyPDF2 결과가 충분한지 판단하고, 부족한 페이지만 pdfplumber로 다시 추출
+- 페이지 결과는 리스트로 모아 한 번에 join (문자열 += 반복 없음)
+- 페이지 수가 적은 문서는 프로세스 생성 비용 없이 현재 프로세스에서 추출
+- 텍스트 레이어가 비어 있는 페이지만 OCR (EasyOCR)
+  → OCR 작업자 프로세스가 EasyOCR 리더를 한 번만 로드해 계속 재사용
+  → 페이지 렌더링(PyMuPDF)과 인식을 파이프라인으로 겹쳐 처리
+
+사용법:
+    from pdf_extraction import extract_pdf_text, extract_pdf_pages
+
+    text = extract_pdf_text("manual.pdf")
+    pages = extract_pdf_pages("manual.pdf")   # 페이지별 텍스트 목록
+    text = extract_pdf_text_with_ocr("scanned.pdf")  # 빈 페이지는 OCR
+
+환경 변수:
+    PDF_EXTRACT_WORKERS: 추출 프로세스 수 (기본: CPU 수, 1이면 병렬 처리 안 함)
+    OCR_WORKERS: OCR 작업자 프로세스 수 (기본: 1, 작업자마다 EasyOCR 모델을 메모리에 올림)
+    OCR_DPI: OCR용 페이지 렌더링 해상도 (기본: 300)
+    OCR_MAX_PAGES: 문서당 OCR 최대 페이지 수 (기본: 50)
+"""
+
+import os
+import threading
+import importlib.util
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, List, Optional, Tuple
+
+try:
+    import PyPDF2
+    HAS_PYPDF2 = True
+except ImportError:
+    HAS_PYPDF2 = False
+
+try:
+    import pdfplumber
+    HAS_PDFPLUMBER = True
+except ImportError:
+    HAS_PDFPLUMBER = False
+
+
+# 이 글자 수 미만인 페이지는 PyPDF2 결과가 부족하다고 보고 pdfplumber로 다시 추출
+MIN_PAGE_CHARS = 20
+
+# 이 페이지 수 미만이면 병렬 처리하지 않음
+PARALLEL_MIN_PAGES = 16
+
+# 작업 하나가 맡는 최소 페이지 수
+MIN_PAGES_PER_SHARD = 8
+
+# 텍스트 레이어가 이 글자 수 미만인 페이지는 스캔 이미지로 보고 OCR
+OCR_EMPTY_PAGE_CHARS = 10
+
+OCR_LANGUAGES = ['en', 'ko']
+
+
+def count_pdf_pages(pdf_path: str) -> int:
+    """PDF 페이지 수 (읽을 수 없으면 0)"""
+    if HAS_PYPDF2:
+        try:
+            with open(pdf_path, 'rb') as file:
+                return len(PyPDF2.PdfReader(file).pages)
+        except Exception as e:
+            print(f"⚠️ PyPDF2로 페이지 수 확인 실패: {e}")
+    if HAS_PDFPLUMBER:
+        try:
+            with pdfplumber.open(pdf_path) as pdf:
+                return len(pdf.pages)
+        except Exception as e:
+            print(f"⚠️ pdfplumber로 페이지 수 확인 실패: {e}")
+    return 0
+
+
+def _page_text_is_sufficient(text: str) -> bool:
+    return len(text.strip()) >= MIN_PAGE_CHARS
+
+
+def extract_page_range(pdf_path: str, start: int, end: int) -> List[str]:
+    """
+    [start, end) 페이지 텍스트 추출 (프로세스 풀 작업 단위)
+
+    페이지마다 PyPDF2로 먼저 추출하고, 결과가 부족한 페이지만 pdfplumber로 다시 추출해
+    더 긴 쪽을 사용합니다.
+    """
+    pages = [''] * (end - start)
+
+    if HAS_PYPDF2:
+        try:
+            with open(pdf_path, 'rb') as file:
+                reader = PyPDF2.PdfReader(file)
+                for offset, page_num in enumerate(range(start, min(end, len(reader.pages)))):
+                    try:
+                        pages[offset] = reader.pages[page_num].extract_text() or ''
+                    except Exception as e:
+                        print(f"⚠️ PyPDF2 {page_num + 1}페이지 추출 실패: {e}")
+        except Exception as e:
+            print(f"⚠️ PyPDF2로 텍스트 추출 실패: {e}")
+
+    retry = [offset for offset, text in enumerate(pages) if not _page_text_is_sufficient(text)]
+    if retry and HAS_PDFPLUMBER:
+        try:
+            with pdfplumber.open(pdf_path) as pdf:
+                for offset in retry:
+                    page_num = start + offset
+                    if page_num >= len(pdf.pages):
+                        break
+                    try:
+                        page_text = pdf.pages[page_num].extract_text() or ''
+                    except Exception as e:
+                        print(f"⚠️ pdfplumber {page_num + 1}페이지 추출 실패: {e}")
+                        continue
+                    if len(page_text.strip()) > len(pages[offset].strip()):
+                        pages[offset] = page_text
+        except Exception as e:
+            print(f"⚠️ pdfplumber로 텍스트 추출 실패: {e}")
+
+    return pages
+
+
+def _shard_ranges(page_count: int, workers: int) -> List[Tuple[int, int]]:
+    """페이지 범위를 작업 단위로 분할 (작업자당 2개 정도, 최소 MIN_PAGES_PER_SHARD 페이지)"""
+    shard_size = max(MIN_PAGES_PER_SHARD, -(-page_count // (workers * 2)))
+    return [(start, min(start + shard_size, page_count))
+            for start in range(0, page_count, shard_size)]
+
+
+def _default_workers() -> int:
+    return int(os.getenv('PDF_EXTRACT_WORKERS', os.cpu_count() or 1))
+
+
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_lock = threading.Lock()
+
+
+def get_extraction_pool() -> ProcessPoolExecutor:
+    """프로세스 공유 추출 풀 (처음 사용할 때 생성)"""
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = ProcessPoolExecutor(max_workers=_default_workers())
+    return _pool
+
+
+def _reset_extraction_pool():
+    """작업자 프로세스가 죽은 풀 폐기 (다음 사용 시 새로 생성)"""
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(wait=False)
+            _pool = None
+
+
+def extract_pdf_pages(pdf_path: str, workers: Optional[int] = None) -> List[str]:
+    """
+    PDF 페이지별 텍스트 추출
+
+    Args:
+        pdf_path: PDF 파일 경로
+        workers: 추출 프로세스 수 (기본: PDF_EXTRACT_WORKERS 또는 CPU 수)
+
+    Returns:
+        페이지 순서대로의 텍스트 목록 (텍스트가 없는 페이지는 빈 문자열)
+    """
+    if not (HAS_PYPDF2 or HAS_PDFPLUMBER):
+        return []
+
+    page_count = count_pdf_pages(pdf_path)
+    if page_count == 0:
+        return []
+
+    if workers is None:
+        workers = _default_workers()
+    if workers <= 1 or page_count < PARALLEL_MIN_PAGES:
+        return extract_page_range(pdf_path, 0, page_count)
+
+    ranges = _shard_ranges(page_count, workers)
+    try:
+        pool = get_extraction_pool()
+        futures = [pool.submit(extract_page_range, pdf_path, start, end) for start, end in ranges]
+        pages: List[str] = []
+        for future in futures:
+            pages.extend(future.result())
+        return pages
+    except (BrokenProcessPool, OSError) as e:
+        print(f"⚠️ 병렬 추출 실패, 단일 프로세스로 추출: {e}")
+        _reset_extraction_pool()
+        return extract_page_range(pdf_path, 0, page_count)
+
+
+def join_pages(pages: List[str]) -> str:
+    """텍스트가 있는 페이지만 줄바꿈으로 연결"""
+    return ''.join([page + "\n" for page in pages if page])
+
+
+def extract_pdf_text(pdf_path: str, workers: Optional[int] = None) -> str:
+    """PDF 전체 텍스트 추출"""
+    return join_pages(extract_pdf_pages(pdf_path, workers))
+
+
+# ============================================================
+# OCR (스캔된 페이지)
+# ============================================================
+
+# OCR 작업자 프로세스의 EasyOCR 리더 (작업자마다 한 번만 생성)
+_ocr_reader = None
+
+
+def _init_ocr_worker():
+    """OCR 작업자 초기화: EasyOCR 모델을 한 번만 로드"""
+    global _ocr_reader
+    import easyocr
+    _ocr_reader = easyocr.Reader(OCR_LANGUAGES, gpu=False)
+
+
+def _ocr_page_image(png_bytes: bytes) -> str:
+    """렌더링된 페이지 이미지(PNG) 인식 (OCR 작업자에서 실행)"""
+    import io
+    import numpy as np
+    from PIL import Image
+
+    if _ocr_reader is None:
+        _init_ocr_worker()
+    img_array = np.array(Image.open(io.BytesIO(png_bytes)))
+    results = _ocr_reader.readtext(img_array)
+    return "\n".join([text_result[1] for text_result in results])
+
+
+_ocr_pool: Optional[ProcessPoolExecutor] = None
+
+
+def get_ocr_pool() -> ProcessPoolExecutor:
+    """
+    프로세스 공유 OCR 작업자 풀
+
+    작업자는 시작할 때 EasyOCR 리더를 만들고 프로세스가 끝날 때까지 재사용합니다.
+    """
+    global _ocr_pool
+    if _ocr_pool is None:
+        with _pool_lock:
+            if _ocr_pool is None:
+                _ocr_pool = ProcessPoolExecutor(
+                    max_workers=int(os.getenv('OCR_WORKERS', 1)),
+                    initializer=_init_ocr_worker
+                )
+    return _ocr_pool
+
+
+def _reset_ocr_pool():
+    global _ocr_pool
+    with _pool_lock:
+        if _ocr_pool is not None:
+            _ocr_pool.shutdown(wait=False)
+            _ocr_pool = None
+
+
+def _reset_pools_after_fork():
+    """fork된 작업자 프로세스 (gunicorn)는 부모의 프로세스 풀을 쓰지 않고 새로 생성"""
+    global _pool, _ocr_pool, _pool_lock
+    _pool = None
+    _ocr_pool = None
+    _pool_lock = threading.Lock()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_pools_after_fork)
+
+
+def ocr_available() -> bool:
+    """OCR 패키지 (EasyOCR, PyMuPDF) 설치 여부"""
+    return all(importlib.util.find_spec(name) is not None for name in ('easyocr', 'fitz'))
+
+
+def find_empty_pages(pages: List[str]) -> List[int]:
+    """텍스트 레이어가 비어 있는 페이지 번호 (0부터)"""
+    return [page_num for page_num, text in enumerate(pages)
+            if len(text.strip()) < OCR_EMPTY_PAGE_CHARS]
+
+
+def ocr_pdf_pages(pdf_path: str, page_numbers: List[int], dpi: Optional[int] = None,
+                  max_pages: Optional[int] = None) -> Dict[int, str]:
+    """
+    지정한 페이지만 OCR
+
+    현재 프로세스에서 페이지를 렌더링하는 동안 OCR 작업자가 앞 페이지를 인식합니다.
+    렌더링이 인식보다 너무 앞서지 않도록 대기 중인 페이지 수를 제한합니다.
+
+    Args:
+        pdf_path: PDF 파일 경로
+        page_numbers: OCR할 페이지 번호 목록 (0부터)
+        dpi: 렌더링 해상도 (기본: OCR_DPI 또는 300)
+        max_pages: 문서당 OCR 최대 페이지 수 (기본: OCR_MAX_PAGES 또는 50)
+
+    Returns:
+        페이지 번호 → 인식된 텍스트
+    """
+    import fitz  # PyMuPDF
+    if not ocr_available():
+        # 작업자 초기화에서 실패하면 풀 전체가 깨지므로 미리 확인
+        raise ImportError("No module named 'easyocr'")
+
+    if dpi is None:
+        dpi = int(os.getenv('OCR_DPI', 300))
+    if max_pages is None:
+        max_pages = int(os.getenv('OCR_MAX_PAGES', 50))
+
+    targets = page_numbers[:max_pages]
+    if len(page_numbers) > len(targets):
+        print(f"   ⚠️ OCR 페이지 한도 초과: {len(page_numbers)}페이지 중 {len(targets)}페이지만 처리")
+    if not targets:
+        return {}
+
+    pool = get_ocr_pool()
+    max_in_flight = max(2, 2 * int(os.getenv('OCR_WORKERS', 1)))
+    results: Dict[int, str] = {}
+    in_flight = deque()
+
+    print(f"   📄 {len(targets)}페이지 OCR 처리 중 (dpi={dpi})...")
+    try:
+        with fitz.open(pdf_path) as doc:
+            for done, page_num in enumerate(targets, 1):
+                if page_num >= len(doc):
+                    break
+                png_bytes = doc[page_num].get_pixmap(dpi=dpi).tobytes("png")
+                in_flight.append((page_num, pool.submit(_ocr_page_image, png_bytes)))
+
+                while len(in_flight) >= max_in_flight:
+                    finished_page, future = in_flight.popleft()
+                    results[finished_page] = future.result()
+
+                if done % 5 == 0:
+                    print(f"   진행 중: {done}/{len(targets)} 페이지")
+
+        while in_flight:
+            finished_page, future = in_flight.popleft()
+            results[finished_page] = future.result()
+    except BrokenProcessPool:
+        _reset_ocr_pool()
+        raise
+
+    return results
+
+
+def extract_pdf_text_with_ocr(pdf_path: str, pages: Optional[List[str]] = None,
+                              dpi: Optional[int] = None, max_pages: Optional[int] = None) -> str:
+    """
+    PDF 텍스트 추출 (텍스트 레이어가 비어 있는 페이지만 OCR)
+
+    Args:
+        pdf_path: PDF 파일 경로
+        pages: 이미 추출한 페이지별 텍스트 (없으면 추출)
+        dpi: OCR 렌더링 해상도
+        max_pages: 문서당 OCR 최대 페이지 수
+    """
+    if pages is None:
+        pages = extract_pdf_pages(pdf_path)
+    if not pages:
+        # 텍스트 추출 라이브러리가 없거나 읽지 못한 경우 PyMuPDF로 페이지 수 확인
+        import fitz
+        with fitz.open(pdf_path) as doc:
+            pages = [''] * len(doc)
+
+    empty_pages = find_empty_pages(pages)
+    if not empty_pages:
+        return join_pages(pages)
+
+    pages = list(pages)
+    for page_num, text in ocr_pdf_pages(pdf_path, empty_pages, dpi, max_pages).items():
+        if len(text.strip()) > len(pages[page_num].strip()):
+            pages[page_num] = text
+    return join_pages(pages)
@@ -16,21 +16,9 @@ if sys.platform == 'win32':
     except:
         pass
 
-# PDF 라이브러리 import (여러 옵션 지원)
-try:
-    import pdfplumber
-    PDF_LIBRARY = "pdfplumber"
-    print("[OK] pdfplumber 사용")
-except ImportError:
-    try:
-        import PyPDF2
-        PDF_LIBRARY = "PyPDF2"
-        print("[OK] PyPDF2 사용")
-    except ImportError:
-        print("[ERROR] PDF 라이브러리가 설치되지 않았습니다.")
-        print("설치: pip install pdfplumber")
-        print("또는: pip install PyPDF2")
-        sys.exit(1)
+# 공용 PDF 추출 엔진 (프로젝트 루트의 pdf_extraction.py)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from pdf_extraction import extract_pdf_text
 
 # 요트 매핑 정보
 YACHT_MAPPING = {
@@ -214,43 +202,9 @@ PART_PATTERNS = {
 }
 
 
-def extract_text_pdfplumber(pdf_path: Path) -> str:
-    """pdfplumber를 사용하여 PDF에서 텍스트 추출"""
-    try:
-        text = ""
-        with pdfplumber.open(pdf_path) as pdf:
-            for page in pdf.pages:
-                page_text = page.extract_text()
-                if page_text:
-                    text += page_text + "\n"
-        return text
-    except Exception as e:
-        print(f"      [ERROR] pdfplumber 오류: {e}")
-        return ""
-
-
-def extract_text_pypdf2(pdf_path: Path) -> str:
-    """PyPDF2를 사용하여 PDF에서 텍스트 추출"""
-    try:
-        text = ""
-        with open(pdf_path, 'rb') as file:
-            reader = PyPDF2.PdfReader(file)
-            for page in reader.pages:
-                page_text = page.extract_text()
-                if page_text:
-                    text += page_text + "\n"
-        return text
-    except Exception as e:
-        print(f"      [ERROR] PyPDF2 오류: {e}")
-        return ""
-
-
 def extract_text_from_pdf(pdf_path: Path) -> str:
-    """PDF에서 텍스트 추출 (사용 가능한 라이브러리 사용)"""
-    if PDF_LIBRARY == "pdfplumber":
-        return extract_text_pdfplumber(pdf_path)
-    else:
-        return extract_text_pypdf2(pdf_path)
+    """PDF에서 텍스트 추출 (공용 추출 엔진: 페이지 단위 병렬 추출)"""
+    return extract_pdf_text(str(pdf_path))
 
 
 def extract_specs(text: str, spec_patterns: List[str]) -> List[str]:
@@ -0,0 +1,440 @@
+"""
+HooAah Yacht - 검색 인덱스 (SQLite FTS5, BM25)
+요트 스펙 / 부품 / 매뉴얼 본문을 작은 조각(chunk)으로 나눠 색인하고,
+질문과 관련된 조각만 골라 Gemini 프롬프트에 넣기 위한 모듈
+
+기존 방식:
+    시스템 프롬프트에 yacht_specifications.json 앞 5,000자 + 부품 JSON 앞 3,000자를 매번 포함
+    → 대부분의 요트 데이터는 모델이 보지 못하고, 질문마다 같은 내용을 다시 전송
+
+새 방식:
+- index_catalog(): 카탈로그 스냅샷의 스펙/부품을 요트·섹션 단위 조각으로 색인
+  (카탈로그 버전이 바뀐 경우에만 다시 색인)
+- index_manual(): 업로드/등록된 매뉴얼 본문을 조각으로 색인 (같은 본문은 한 번만)
+- search() / build_context(): 질문과 관련된 상위 k개 조각만 반환 (BM25 순위)
+
+사용법:
+    index = get_shared_search_index()
+    index.index_catalog(catalog)
+    context = index.build_context("OCEANIS 46.1 엔진 출력", yacht_id="oceanis-46.1")
+
+환경 변수:
+    SEARCH_INDEX_PATH: 인덱스 SQLite 파일 (기본: data/search.db)
+
+명령줄 (data/yachtpdf의 매뉴얼 색인):
+    python search_index.py index-manuals [pdf_dir]
+"""
+
+import os
+import re
+import sys
+import sqlite3
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from document_cache import text_sha256
+
+
+DEFAULT_DB_PATH = os.getenv('SEARCH_INDEX_PATH', os.path.join('data', 'search.db'))
+
+# 조각 최대 길이 (문자)
+CHUNK_CHARS = 1200
+
+# 프롬프트에 넣는 관련 자료 기본값
+DEFAULT_TOP_K = 6
+DEFAULT_CONTEXT_CHARS = 6000
+
+# 조각 종류
+KIND_SPEC = 'spec'
+KIND_PART = 'part'
+KIND_MANUAL = 'manual'
+
+# 스펙 조각에서 제외하는 요트 항목 (제목/식별 정보)
+_SPEC_SKIP_KEYS = {'id', 'name', 'schemaVersion', 'updatedAt'}
+
+# 한국어 질문 → 영문 데이터 검색어 (데이터 대부분이 영문 매뉴얼 기반)
+QUERY_SYNONYMS = {
+    '엔진': ['engine', 'propulsion'],
+    '출력': ['power'],
+    '돛': ['sail', 'sails'],
+    '세일': ['sail', 'sails'],
+    '면적': ['area'],
+    '치수': ['dimensions'],
+    '크기': ['dimensions', 'loa'],
+    '길이': ['length', 'loa'],
+    '전장': ['loa'],
+    '폭': ['beam'],
+    '흘수': ['draft', 'draught'],
+    '배수량': ['displacement'],
+    '무게': ['weight', 'displacement'],
+    '마스트': ['mast'],
+    '돛대': ['mast'],
+    '선체': ['hull'],
+    '갑판': ['deck'],
+    '킬': ['keel'],
+    '방향타': ['rudder'],
+    '정비': ['maintenance', 'service'],
+    '점검': ['inspection', 'check'],
+    '주기': ['interval'],
+    '부품': ['parts'],
+    '연료': ['fuel'],
+    '물탱크': ['water', 'tank'],
+    '탱크': ['tank'],
+    '배터리': ['battery'],
+    '전기': ['electrical'],
+    '닻': ['anchor'],
+    '앵커': ['anchor'],
+    '윈치': ['winch'],
+    '펌프': ['pump'],
+    '필터': ['filter'],
+    '오일': ['oil'],
+    '냉각': ['cooling'],
+    '선실': ['cabin'],
+    '화장실': ['head', 'toilet'],
+    '리깅': ['rigging'],
+}
+
+# 한국어 조사 (검색어 끝에서 제거)
+_KOREAN_PARTICLES = ('에서는', '으로는', '에서', '으로', '은', '는', '이', '가', '을', '를', '의',
+                     '에', '로', '와', '과', '도', '만', '랑')
+
+_TOKEN_RE = re.compile(r'[0-9A-Za-z가-힣]+(?:\.[0-9]+)?')
+
+
+def _strip_particle(token: str) -> str:
+    """끝의 조사 제거 (단, "길이"의 "이"처럼 용어의 일부라 자르면 용어가 사라지는 경우는 그대로)"""
+    for particle in _KOREAN_PARTICLES:
+        if token.endswith(particle) and len(token) > len(particle):
+            stem = token[:-len(particle)]
+            if all(word in stem for word in QUERY_SYNONYMS if word in token):
+                return stem
+            return token
+    return token
+
+
+def query_terms(question: str) -> List[str]:
+    """질문 → FTS 검색어 목록 (소문자, 조사 제거, 한국어 용어는 영문 검색어 추가)"""
+    terms: List[str] = []
+    for token in _TOKEN_RE.findall(question.lower()):
+        if re.search(r'[가-힣]', token):
+            token = _strip_particle(token)
+            for word, synonyms in QUERY_SYNONYMS.items():
+                if word in token:
+                    terms.extend(synonyms)
+        terms.append(token)
+    # 순서 유지 중복 제거
+    return list(dict.fromkeys(term for term in terms if term))
+
+
+def _fts_query(terms: Iterable[str]) -> str:
+    # 각 검색어를 따옴표로 감싸 FTS 문법 문자로 해석되지 않도록 함
+    return ' OR '.join('"' + term.replace('"', '""') + '"' for term in terms)
+
+
+def _flatten(value: Any, prefix: str = '') -> List[str]:
+    """중첩 dict/list → "key.sub: value" 줄 목록 (빈 값, _로 시작하는 메타 항목 제외)"""
+    lines: List[str] = []
+    if isinstance(value, dict):
+        for key, item in value.items():
+            if str(key).startswith('_'):
+                continue
+            lines.extend(_flatten(item, f"{prefix}.{key}" if prefix else str(key)))
+    elif isinstance(value, list):
+        for item in value:
+            lines.extend(_flatten(item, prefix))
+    elif value not in (None, '', [], {}):
+        lines.append(f"{prefix}: {value}" if prefix else str(value))
+    return lines
+
+
+def split_chunks(lines: Iterable[str], max_chars: int = CHUNK_CHARS) -> List[str]:
+    """줄 목록을 max_chars 이하의 조각으로 묶음 (너무 긴 줄은 잘라서 나눔)"""
+    chunks: List[str] = []
+    current: List[str] = []
+    size = 0
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+        while len(line) > max_chars:
+            chunks.append(line[:max_chars])
+            line = line[max_chars:]
+        if size + len(line) + 1 > max_chars and current:
+            chunks.append('\n'.join(current))
+            current, size = [], 0
+        current.append(line)
+        size += len(line) + 1
+    if current:
+        chunks.append('\n'.join(current))
+    return chunks
+
+
+class SearchIndex:
+    """SQLite FTS5 기반 요트 자료 검색 인덱스"""
+
+    def __init__(self, db_path: str = DEFAULT_DB_PATH):
+        """
+        Args:
+            db_path: 인덱스 SQLite 파일 경로
+        """
+        self.db_path = db_path
+        self._local = threading.local()
+        self._write_lock = threading.Lock()
+
+        db_dir = os.path.dirname(self.db_path)
+        if db_dir:
+            os.makedirs(db_dir, exist_ok=True)
+        self._init_db()
+
+    # ============================================================
+    # 색인
+    # ============================================================
+
+    def index_catalog(self, catalog) -> bool:
+        """
+        카탈로그 스냅샷의 스펙/부품 색인 (이미 같은 버전을 색인했으면 건너뜀)
+
+        Args:
+            catalog: yacht_catalog.YachtCatalog
+
+        Returns:
+            다시 색인했으면 True
+        """
+        if self._get_meta('catalog_version') == catalog.version:
+            return False
+        with self._write_lock:
+            if self._get_meta('catalog_version') == catalog.version:
+                return False
+            rows = list(self._catalog_chunks(catalog))
+            conn = self._conn()
+            with conn:
+                conn.execute("DELETE FROM chunk WHERE kind IN (?, ?)", (KIND_SPEC, KIND_PART))
+                conn.executemany(
+                    "INSERT INTO chunk (yacht_id, kind, source, title, body) VALUES (?, ?, ?, ?, ?)", rows
+                )
+                self._set_meta(conn, 'catalog_version', catalog.version)
+        print(f"🔎 검색 인덱스 갱신: 스펙/부품 조각 {len(rows)}개")
+        return True
+
+    @staticmethod
+    def _catalog_chunks(catalog) -> Iterable[Tuple[str, str, str, str, str]]:
+        for yacht in catalog.yachts:
+            yacht_id = yacht.get('id') or ''
+            name = yacht.get('name', '')
+            # 단일 값 항목 (제조사, 문서 종류 등)은 overview 조각 하나로 묶음
+            overview = []
+            for section, value in yacht.items():
+                if section in _SPEC_SKIP_KEYS:
+                    continue
+                if not isinstance(value, (dict, list)):
+                    overview.extend(_flatten(value, section))
+                    continue
+                for body in split_chunks(_flatten(value, section)):
+                    yield yacht_id, KIND_SPEC, section, f"{name} {section}", body
+            for body in split_chunks(overview):
+                yield yacht_id, KIND_SPEC, 'overview', f"{name} overview", body
+
+            for category, parts in catalog.get_parts_by_category(yacht_id).items():
+                lines = []
+                for part in parts:
+                    if isinstance(part, dict):
+                        lines.append(' / '.join(_flatten(part)))
+                for body in split_chunks(lines):
+                    yield yacht_id, KIND_PART, category, f"{name} parts {category}", body
+
+    def index_manual(self, yacht_id: str, yacht_name: str, text: str, source: Optional[str] = None) -> int:
+        """
+        매뉴얼 본문 색인 (같은 본문이 이미 색인되어 있으면 건너뜀)
+
+        Args:
+            yacht_id: 요트 ID
+            yacht_name: 요트 이름 (조각 제목에 사용)
+            text: 매뉴얼 본문 (추출된 텍스트)
+            source: 자료 식별자 (기본: 본문 SHA-256)
+
+        Returns:
+            색인한 조각 수
+        """
+        if not text or not text.strip():
+            return 0
+        source = source or text_sha256(text)
+        conn = self._conn()
+        with self._write_lock:
+            exists = conn.execute(
+                "SELECT 1 FROM chunk WHERE kind = ? AND yacht_id = ? AND source = ? LIMIT 1",
+                (KIND_MANUAL, yacht_id, source)
+            ).fetchone()
+            if exists:
+                return 0
+            chunks = split_chunks(text.splitlines())
+            with conn:
+                conn.execute("DELETE FROM chunk WHERE kind = ? AND yacht_id = ?", (KIND_MANUAL, yacht_id))
+                conn.executemany(
+                    "INSERT INTO chunk (yacht_id, kind, source, title, body) VALUES (?, ?, ?, ?, ?)",
+                    [(yacht_id, KIND_MANUAL, source, f"{yacht_name} manual", body) for body in chunks]
+                )
+        print(f"🔎 매뉴얼 색인 완료: {yacht_name} (조각 {len(chunks)}개)")
+        return len(chunks)
+
+    # ============================================================
+    # 검색
+    # ============================================================
+
+    def search(self, question: str, limit: int = DEFAULT_TOP_K, yacht_id: Optional[str] = None) -> List[Dict]:
+        """
+        질문과 관련된 조각 검색 (BM25 점수 순, 제목 일치에 가중치)
+
+        Args:
+            question: 사용자 질문
+            limit: 최대 조각 수
+            yacht_id: 특정 요트로 한정 (None이면 전체)
+        """
+        terms = query_terms(question)
+        if not terms:
+            return []
+        sql = ("SELECT yacht_id, kind, source, title, body, bm25(chunk, 0.0, 0.0, 0.0, 2.0, 1.0) AS score "
+               "FROM chunk WHERE chunk MATCH ?")
+        params: List[Any] = [_fts_query(terms)]
+        if yacht_id:
+            sql += " AND yacht_id = ?"
+            params.append(yacht_id)
+        sql += " ORDER BY score LIMIT ?"
+        params.append(limit)
+        try:
+            rows = self._conn().execute(sql, params).fetchall()
+        except sqlite3.OperationalError as e:
+            print(f"⚠️ 검색 실패: {e}")
+            return []
+        return [{"yachtId": row[0], "kind": row[1], "source": row[2], "title": row[3],
+                 "text": row[4], "score": row[5]} for row in rows]
+
+    def build_context(self, question: str, yacht_id: Optional[str] = None, limit: int = DEFAULT_TOP_K,
+                      max_chars: int = DEFAULT_CONTEXT_CHARS) -> str:
+        """
+        프롬프트에 넣을 관련 자료 텍스트 (없으면 빈 문자열)
+
+        특정 요트의 자료가 부족하면 전체 요트에서 나머지를 채웁니다.
+        """
+        results = self.search(question, limit, yacht_id) if yacht_id else []
+        if len(results) < limit:
+            seen = {(r["title"], r["text"]) for r in results}
+            for result in self.search(question, limit):
+                if (result["title"], result["text"]) not in seen and len(results) < limit:
+                    results.append(result)
+
+        sections = []
+        total = 0
+        for result in results:
+            section = f"[{result['title']}]\n{result['text']}"
+            if total + len(section) > max_chars:
+                break
+            sections.append(section)
+            total += len(section)
+        return "\n\n".join(sections)
+
+    def count(self, kind: Optional[str] = None) -> int:
+        """색인된 조각 수"""
+        if kind:
+            row = self._conn().execute("SELECT COUNT(*) FROM chunk WHERE kind = ?", (kind,)).fetchone()
+        else:
+            row = self._conn().execute("SELECT COUNT(*) FROM chunk").fetchone()
+        return row[0]
+
+    # ============================================================
+    # SQLite
+    # ============================================================
+
+    def _conn(self) -> sqlite3.Connection:
+        """스레드별 연결"""
+        conn = getattr(self._local, 'conn', None)
+        # fork로 물려받은 연결은 부모 프로세스와 공유되므로 쓰지 않음 (gunicorn 작업자)
+        if conn is None or self._local.pid != os.getpid():
+            conn = sqlite3.connect(self.db_path, timeout=30)
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    def _init_db(self):
+        conn = self._conn()
+        conn.execute("PRAGMA journal_mode=WAL")
+        with conn:
+            conn.execute("""
+                CREATE VIRTUAL TABLE IF NOT EXISTS chunk USING fts5(
+                    yacht_id UNINDEXED,
+                    kind UNINDEXED,
+                    source UNINDEXED,
+                    title,
+                    body,
+                    tokenize = 'unicode61 remove_diacritics 2'
+                )
+            """)
+            conn.execute("CREATE TABLE IF NOT EXISTS index_meta (key TEXT PRIMARY KEY, value TEXT)")
+
+    def _get_meta(self, key: str) -> Optional[str]:
+        row = self._conn().execute("SELECT value FROM index_meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    @staticmethod
+    def _set_meta(conn: sqlite3.Connection, key: str, value: str):
+        conn.execute("INSERT OR REPLACE INTO index_meta (key, value) VALUES (?, ?)", (key, value))
+
+
+_shared_index: Optional[SearchIndex] = None
+_shared_index_lock = threading.Lock()
+
+
+def get_shared_search_index(db_path: str = DEFAULT_DB_PATH) -> Optional[SearchIndex]:
+    """
+    프로세스 공유 검색 인덱스
+
+    SQLite에 FTS5가 없는 환경이면 None을 반환합니다 (호출하는 쪽은 검색 없이 동작).
+    """
+    global _shared_index
+    if _shared_index is None:
+        with _shared_index_lock:
+            if _shared_index is None:
+                try:
+                    _shared_index = SearchIndex(db_path)
+                except sqlite3.Error as e:
+                    print(f"⚠️ 검색 인덱스를 사용할 수 없습니다: {e}")
+                    return None
+    return _shared_index
+
+
+def index_manual_directory(pdf_dir: str, index: SearchIndex, catalog) -> int:
+    """
+    매뉴얼 PDF 폴더 색인 (yacht_specifications.json의 manualPDF로 요트와 연결)
+
+    Returns:
+        색인한 매뉴얼 수
+    """
+    from pdf_extraction import extract_pdf_text
+
+    indexed = 0
+    for yacht in catalog.yachts:
+        manual = yacht.get('manualPDF')
+        if not manual:
+            continue
+        pdf_path = os.path.join(pdf_dir, manual)
+        if not os.path.exists(pdf_path):
+            continue
+        print(f"📄 {yacht.get('name', '')}: {manual}")
+        text = extract_pdf_text(pdf_path)
+        if index.index_manual(yacht.get('id', ''), yacht.get('name', ''), text):
+            indexed += 1
+    return indexed
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2 or sys.argv[1] != 'index-manuals':
+        print("사용법: python search_index.py index-manuals [pdf_dir]")
+        sys.exit(1)
+
+    from yacht_catalog import get_shared_catalog_store
+
+    catalog = get_shared_catalog_store().get()
+    search_index = SearchIndex()
+    search_index.index_catalog(catalog)
+    count = index_manual_directory(sys.argv[2] if len(sys.argv) > 2 else os.path.join('data', 'yachtpdf'),
+                                   search_index, catalog)
+    print(f"✅ 매뉴얼 {count}개 색인 완료 (전체 조각 {search_index.count()}개)")
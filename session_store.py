@@ -0,0 +1,255 @@
+"""
+HooAah Yacht - 챗봇 세션 저장소
+세션별 챗봇 인스턴스를 제한된 개수만 메모리에 유지하는 세션 관리자
+
+특징:
+- 최대 세션 수 초과 시 가장 오래 사용하지 않은 세션부터 제거 (LRU)
+- 일정 시간 사용하지 않은 세션 제거 (idle TTL)
+- 세션별 대화 기록 개수 제한
+- 제거된 세션의 대화 기록은 SQLite 파일로 내려쓰기 (spillover)
+  → 세션이 메모리에서 제거된 뒤에도 /api/chat/history 조회 가능
+  → 같은 session_id로 다시 대화하면 기록을 복원
+- 공유 모드 (shared=True): 대화가 끝날 때마다 기록을 SQLite에 저장하고, 조회할 때
+  다른 프로세스가 더 새 기록을 저장했으면 다시 읽음
+  → 여러 작업자 프로세스 (gunicorn) 중 어디로 요청이 가도 같은 대화를 이어감
+
+사용법:
+    store = SessionStore(lambda: UnifiedYachtChatbot(mode="api"))
+    chatbot = store.get(session_id)
+    chatbot.chat(message)
+    store.save(session_id)   # 공유 모드에서 다른 작업자 프로세스에 기록 공유
+    history = store.get_history(session_id)
+"""
+
+import os
+import json
+import time
+import sqlite3
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional
+
+
+DEFAULT_SPILL_PATH = os.path.join('data', 'chat_sessions.db')
+
+
+class SessionStore:
+    """LRU + idle TTL 기반 챗봇 세션 저장소"""
+
+    def __init__(self, factory: Callable[[], Any], max_sessions: int = 200,
+                 idle_ttl: float = 1800, max_history: int = 100,
+                 spill_path: Optional[str] = DEFAULT_SPILL_PATH,
+                 spill_ttl: float = 7 * 24 * 3600, shared: bool = False):
+        """
+        Args:
+            factory: 새 챗봇 인스턴스 생성 함수 (chat_history 속성 필요)
+            max_sessions: 메모리에 유지할 최대 세션 수
+            idle_ttl: 세션 유휴 만료 시간 (초)
+            max_history: 세션별 최대 대화 기록 개수
+            spill_path: 제거된 세션 기록을 저장할 SQLite 파일 (None이면 저장 안 함)
+            spill_ttl: 내려쓴 기록 보관 기간 (초)
+            shared: 여러 프로세스가 같은 SQLite 파일로 기록을 공유 (spill_path 필요)
+        """
+        self.factory = factory
+        self.max_sessions = max_sessions
+        self.idle_ttl = idle_ttl
+        self.max_history = max_history
+        self.spill_path = spill_path
+        self.spill_ttl = spill_ttl
+        self.shared = shared and bool(spill_path)
+
+        # session_id -> [챗봇, 마지막 사용 시각, 저장된 기록의 updated_at], 오래된 순서로 정렬
+        self._sessions: "OrderedDict[str, List[Any]]" = OrderedDict()
+        self._lock = threading.RLock()
+
+        if self.spill_path:
+            self._init_spill_db()
+
+    # ============================================================
+    # 세션 조회
+    # ============================================================
+
+    def get(self, session_id: str) -> Any:
+        """세션 챗봇 반환 (없으면 생성, 내려쓴 기록이 있으면 복원)"""
+        with self._lock:
+            now = time.monotonic()
+            self._evict_idle(now)
+
+            entry = self._sessions.get(session_id)
+            if entry is None:
+                chatbot = self.factory()
+                spilled, updated_at = self._load_spilled(session_id)
+                if spilled:
+                    chatbot.chat_history = spilled
+                entry = [chatbot, now, updated_at]
+                self._sessions[session_id] = entry
+                self._evict_overflow()
+            else:
+                entry[1] = now
+                self._sessions.move_to_end(session_id)
+                if self.shared:
+                    self._sync(session_id, entry)
+
+            self._trim_history(entry[0])
+            return entry[0]
+
+    def peek(self, session_id: str) -> Optional[Any]:
+        """메모리에 있는 세션 챗봇 반환 (없어도 생성하지 않음)"""
+        with self._lock:
+            entry = self._sessions.get(session_id)
+            return entry[0] if entry else None
+
+    def __contains__(self, session_id: str) -> bool:
+        with self._lock:
+            return session_id in self._sessions
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._sessions)
+
+    def get_history(self, session_id: str) -> List[Dict]:
+        """대화 기록 반환 (메모리에 없으면 내려쓴 기록 조회)"""
+        with self._lock:
+            entry = self._sessions.get(session_id)
+            if entry is not None:
+                if self.shared:
+                    self._sync(session_id, entry)
+                self._trim_history(entry[0])
+                return entry[0].get_history()
+        return self._load_spilled_history(session_id)
+
+    def save(self, session_id: str):
+        """대화 기록을 SQLite에 저장 (공유 모드에서만, 대화가 끝날 때마다 호출)"""
+        if not self.shared:
+            return
+        with self._lock:
+            entry = self._sessions.get(session_id)
+            if entry is None:
+                return
+            self._trim_history(entry[0])
+            updated_at = self._spill_history(session_id, entry[0].chat_history)
+            if updated_at is not None:
+                entry[2] = updated_at
+
+    def _sync(self, session_id: str, entry: List[Any]):
+        """다른 프로세스가 저장한 기록이 더 새것이면 메모리 기록을 교체"""
+        try:
+            updated_at = self._spilled_updated_at(session_id)
+        except sqlite3.Error as e:
+            print(f"⚠️ 세션 기록 조회 실패 ({session_id}): {e}")
+            return
+        if updated_at == entry[2]:
+            return
+        if updated_at is None:
+            # 다른 프로세스에서 기록 초기화
+            entry[0].clear_history()
+        else:
+            entry[0].chat_history = self._load_spilled_history(session_id)
+        entry[2] = updated_at
+
+    def clear(self, session_id: str):
+        """세션 대화 기록 초기화 (메모리 + 내려쓴 기록)"""
+        with self._lock:
+            entry = self._sessions.get(session_id)
+            if entry is not None:
+                entry[0].clear_history()
+                entry[2] = None
+        self._delete_spilled_history(session_id)
+
+    # ============================================================
+    # 제거 (eviction)
+    # ============================================================
+
+    def _evict_idle(self, now: float):
+        """유휴 시간이 지난 세션 제거 (오래된 순서로 확인)"""
+        while self._sessions:
+            session_id, entry = next(iter(self._sessions.items()))
+            if now - entry[1] < self.idle_ttl:
+                break
+            self._evict(session_id)
+
+    def _evict_overflow(self):
+        """최대 세션 수를 넘으면 가장 오래된 세션 제거"""
+        while len(self._sessions) > self.max_sessions:
+            session_id = next(iter(self._sessions))
+            self._evict(session_id)
+
+    def _evict(self, session_id: str):
+        chatbot = self._sessions.pop(session_id)[0]
+        self._trim_history(chatbot)
+        self._spill_history(session_id, chatbot.chat_history)
+
+    def _trim_history(self, chatbot: Any):
+        history = chatbot.chat_history
+        if self.max_history and len(history) > self.max_history:
+            del history[:len(history) - self.max_history]
+
+    # ============================================================
+    # SQLite 내려쓰기 (spillover)
+    # ============================================================
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.spill_path, timeout=10)
+
+    def _init_spill_db(self):
+        spill_dir = os.path.dirname(self.spill_path)
+        if spill_dir:
+            os.makedirs(spill_dir, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS chat_session (
+                    session_id TEXT PRIMARY KEY,
+                    history TEXT NOT NULL,
+                    updated_at REAL NOT NULL
+                )
+            """)
+
+    def _spill_history(self, session_id: str, history: List[Dict]) -> Optional[float]:
+        """기록 저장 후 저장 시각 반환 (실패하면 None)"""
+        if not self.spill_path:
+            return None
+        try:
+            now = time.time()
+            with self._connect() as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO chat_session (session_id, history, updated_at) VALUES (?, ?, ?)",
+                    (session_id, json.dumps(history, ensure_ascii=False, separators=(',', ':')), now)
+                )
+                conn.execute("DELETE FROM chat_session WHERE updated_at < ?", (now - self.spill_ttl,))
+        except sqlite3.Error as e:
+            print(f"⚠️ 세션 기록 저장 실패 ({session_id}): {e}")
+            return None
+        return now
+
+    def _load_spilled(self, session_id: str):
+        """(내려쓴 기록, 저장 시각) 반환 (없으면 ([], None))"""
+        if not self.spill_path:
+            return [], None
+        try:
+            with self._connect() as conn:
+                row = conn.execute(
+                    "SELECT history, updated_at FROM chat_session WHERE session_id = ?", (session_id,)
+                ).fetchone()
+        except sqlite3.Error as e:
+            print(f"⚠️ 세션 기록 조회 실패 ({session_id}): {e}")
+            return [], None
+        return (json.loads(row[0]), row[1]) if row else ([], None)
+
+    def _load_spilled_history(self, session_id: str) -> List[Dict]:
+        return self._load_spilled(session_id)[0]
+
+    def _spilled_updated_at(self, session_id: str) -> Optional[float]:
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT updated_at FROM chat_session WHERE session_id = ?", (session_id,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def _delete_spilled_history(self, session_id: str):
+        if not self.spill_path:
+            return
+        try:
+            with self._connect() as conn:
+                conn.execute("DELETE FROM chat_session WHERE session_id = ?", (session_id,))
+        except sqlite3.Error as e:
+            print(f"⚠️ 세션 기록 삭제 실패 ({session_id}): {e}")
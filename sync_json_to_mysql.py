@@ -2,16 +2,30 @@
 """
 JSON 데이터를 MySQL 데이터베이스와 동기화
 yacht_specifications.json → MySQL yacht 테이블
+
+바뀐 요트만 반영 (yacht_sync.YachtSyncEngine):
+- 요트별 지문을 yacht_sync_state 테이블에 저장하고 비교
+- 새 요트/바뀐 요트만 INSERT ... ON DUPLICATE KEY UPDATE로 묶어 한 트랜잭션에 반영
+
+사용법:
+    python sync_json_to_mysql.py              # 바뀐 요트만 동기화
+    python sync_json_to_mysql.py --dry-run    # 반영할 요트 수만 확인
+    python sync_json_to_mysql.py --force      # 지문과 무관하게 전체 다시 쓰기
+    python sync_json_to_mysql.py --prune      # JSON에서 사라진 요트 삭제
 """
 
 import sys
 import json
 import os
+import argparse
 from pathlib import Path
 from datetime import datetime
 import pymysql
 from dotenv import load_dotenv
 
+from yacht_db_connector import FULLTEXT_INDEX, NORMALIZED_NAME_EXPR, ensure_yacht_search_indexes
+from yacht_sync import YachtSyncEngine
+
 if sys.platform == 'win32':
     try:
         sys.stdout.reconfigure(encoding='utf-8')
@@ -102,7 +116,7 @@ def create_yacht_table_if_not_exists(connection):
     """yacht 테이블이 없으면 생성"""
     try:
         with connection.cursor() as cursor:
-            cursor.execute("""
+            cursor.execute(f"""
                 CREATE TABLE IF NOT EXISTS yacht (
                     id BIGINT NOT NULL AUTO_INCREMENT,
                     yacht_id VARCHAR(100) UNIQUE,
@@ -119,9 +133,13 @@ def create_yacht_table_if_not_exists(connection):
                     official_website VARCHAR(500),
                     created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
                     updated_at DATETIME DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+                    normalized_name VARCHAR(255) AS ({NORMALIZED_NAME_EXPR}) STORED,
                     PRIMARY KEY (id),
                     INDEX idx_yacht_id (yacht_id),
-                    INDEX idx_name (name)
+                    INDEX idx_name (name),
+                    INDEX idx_normalized_name (normalized_name),
+                    INDEX idx_created_id (created_at, id),
+                    FULLTEXT INDEX {FULLTEXT_INDEX} (name, manufacturer)
                 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_general_ci
             """)
             connection.commit()
@@ -132,131 +150,8 @@ def create_yacht_table_if_not_exists(connection):
         return False
 
 
-def extract_dimension_value(dimension_data):
-    """치수 데이터에서 숫자 추출"""
-    if not dimension_data:
-        return None
-    
-    if isinstance(dimension_data, dict):
-        value = dimension_data.get('value')
-        if value:
-            return float(value) if isinstance(value, (int, float)) else None
-    
-    if isinstance(dimension_data, str):
-        # "14.60m" → 14.60
-        import re
-        match = re.search(r'(\d+\.?\d*)', dimension_data)
-        if match:
-            return float(match.group(1))
-    
-    return None
-
-
-def sync_yacht_to_mysql(connection, yacht):
-    """요트 데이터를 MySQL에 동기화"""
-    try:
-        yacht_id = yacht.get('id', '')
-        yacht_name = yacht.get('name', '')
-        
-        if not yacht_id or not yacht_name:
-            print(f"⚠️ ID 또는 이름 없음: {yacht}")
-            return False
-        
-        # yachtSpecs에서 데이터 추출
-        yacht_specs = yacht.get('yachtSpecs', {})
-        standard = yacht_specs.get('standard', {})
-        dimensions = standard.get('dimensions', {})
-        engine = standard.get('engine', {})
-        sail_area_data = standard.get('sailArea', {})
-        
-        # 치수 추출
-        loa = extract_dimension_value(dimensions.get('LOA') or dimensions.get('loa'))
-        beam = extract_dimension_value(dimensions.get('Beam') or dimensions.get('beam'))
-        draft = extract_dimension_value(dimensions.get('Draft') or dimensions.get('draft'))
-        displacement = extract_dimension_value(dimensions.get('Displacement') or dimensions.get('displacement'))
-        
-        # 돛 면적 추출 (total 또는 mainsail)
-        sail_area = None
-        if isinstance(sail_area_data, dict):
-            total = sail_area_data.get('total') or sail_area_data.get('totalSailArea')
-            mainsail = sail_area_data.get('mainsail') or sail_area_data.get('mainSailArea')
-            sail_area = extract_dimension_value(total or mainsail)
-        
-        # 엔진 파워 추출
-        engine_power = None
-        if isinstance(engine, dict):
-            engine_power = engine.get('power') or engine.get('Power')
-        
-        with connection.cursor() as cursor:
-            # 기존 요트 확인
-            cursor.execute("SELECT id FROM yacht WHERE yacht_id = %s", (yacht_id,))
-            existing = cursor.fetchone()
-            
-            if existing:
-                # 업데이트
-                cursor.execute("""
-                    UPDATE yacht SET
-                        name = %s,
-                        manufacturer = %s,
-                        yacht_type = %s,
-                        length_overall = %s,
-                        beam = %s,
-                        draft = %s,
-                        displacement = %s,
-                        sail_area = %s,
-                        engine_power = %s,
-                        manual_pdf = %s,
-                        updated_at = NOW()
-                    WHERE yacht_id = %s
-                """, (
-                    yacht_name,
-                    yacht.get('manufacturer', ''),
-                    yacht.get('type', ''),
-                    loa,
-                    beam,
-                    draft,
-                    displacement,
-                    sail_area,
-                    engine_power,
-                    yacht.get('manualPDF', ''),
-                    yacht_id
-                ))
-                action = "업데이트"
-            else:
-                # 삽입
-                cursor.execute("""
-                    INSERT INTO yacht (
-                        yacht_id, name, manufacturer, yacht_type,
-                        length_overall, beam, draft, displacement,
-                        sail_area, engine_power, manual_pdf
-                    ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                """, (
-                    yacht_id,
-                    yacht_name,
-                    yacht.get('manufacturer', ''),
-                    yacht.get('type', ''),
-                    loa,
-                    beam,
-                    draft,
-                    displacement,
-                    sail_area,
-                    engine_power,
-                    yacht.get('manualPDF', '')
-                ))
-                action = "추가"
-            
-            connection.commit()
-            print(f"  ✅ {yacht_name} ({yacht_id}) - {action} 완료")
-            return True
-            
-    except Exception as e:
-        print(f"  ❌ {yacht.get('name', 'Unknown')} 동기화 실패: {e}")
-        connection.rollback()
-        return False
-
-
-def sync_all_yachts():
-    """모든 요트 데이터 동기화"""
+def sync_all_yachts(force: bool = False, prune: bool = False, dry_run: bool = False):
+    """모든 요트 데이터 동기화 (바뀐 요트만 반영)"""
     print("\n" + "="*80)
     print("🔄 JSON → MySQL 동기화 시작")
     print("="*80)
@@ -279,23 +174,27 @@ def sync_all_yachts():
                 return
             check_yacht_table(connection)
         
-        # 4. 데이터 동기화
+        # 이름 접두어/FULLTEXT 검색, keyset 페이지 인덱스 (기존 테이블에 없으면 추가)
+        for statement in ensure_yacht_search_indexes(connection):
+            print(f"🔧 {statement}")
+        
+        # 4. 데이터 동기화 (지문 비교 → 바뀐 요트만 일괄 upsert, 한 트랜잭션)
         print(f"\n🔄 {len(yachts)}개 요트 동기화 중...")
         print("-" * 80)
         
-        success_count = 0
-        fail_count = 0
-        
-        for yacht in yachts:
-            if sync_yacht_to_mysql(connection, yacht):
-                success_count += 1
-            else:
-                fail_count += 1
+        engine = YachtSyncEngine(connection)
+        engine.ensure_state_table()
+        stats = engine.sync(yachts, force=force, prune=prune, dry_run=dry_run)
         
         print("-" * 80)
-        print(f"\n📊 동기화 완료:")
-        print(f"  ✅ 성공: {success_count}개")
-        print(f"  ❌ 실패: {fail_count}개")
+        print(f"\n📊 동기화 {'계획 (dry-run)' if dry_run else '완료'}:")
+        print(f"  ➕ 추가: {stats['inserted']}개")
+        print(f"  🔁 업데이트: {stats['updated']}개")
+        print(f"  ⏭️  변경 없음: {stats['unchanged']}개")
+        print(f"  ⚠️ ID/이름 없음 또는 중복: {stats['invalid']}개")
+        if stats['removed']:
+            action = "삭제" if prune and not dry_run else "JSON에 없음 (--prune으로 삭제)"
+            print(f"  🗑️ {action}: {stats['removed']}개")
         
         # 5. 결과 확인
         with connection.cursor() as cursor:
@@ -386,9 +285,15 @@ def verify_sync():
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='yacht_specifications.json → MySQL 증분 동기화')
+    parser.add_argument('--force', action='store_true', help='지문과 무관하게 전체 다시 쓰기')
+    parser.add_argument('--prune', action='store_true', help='JSON에서 사라진 요트를 MySQL에서도 삭제')
+    parser.add_argument('--dry-run', action='store_true', help='반영할 요트 수만 계산')
+    args = parser.parse_args()
+    
     try:
         # 동기화 실행
-        sync_all_yachts()
+        sync_all_yachts(force=args.force, prune=args.prune, dry_run=args.dry_run)
         
         # 검증
         verify_sync()
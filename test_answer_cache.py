@@ -0,0 +1,126 @@
+"""
+정형 답변 캐시 테스트 스크립트
+같은 요트/답변 종류는 한 번만 만들고, 요트 데이터가 바뀌면 다시 만드는지 확인
+"""
+
+import os
+import json
+import threading
+
+from answer_cache import AnswerCache, get_shared_answer_cache
+from catalog_db import CatalogDatabase
+from chatbot_unified import UnifiedYachtChatbot
+from test_llm_cache import temporary_shared_stores
+from yacht_catalog import CatalogStore, YachtCatalog
+
+
+def test_cache_hit_and_version_change():
+    """같은 버전은 재사용, 버전이 바뀌거나 삭제되면 다시 생성"""
+    print("🧪 캐시 적중/버전 변경 테스트")
+    cache = AnswerCache()
+    calls = []
+
+    def build():
+        calls.append(1)
+        return f"answer {len(calls)}"
+
+    assert cache.get_or_build("farr-40", "engine", "v1", build) == "answer 1"
+    assert cache.get_or_build("farr-40", "engine", "v1", build) == "answer 1"
+    assert cache.get_or_build("farr-40", "engine", "v2", build) == "answer 2"
+    assert cache.stats() == {"entries": 1, "hits": 1, "misses": 2}
+
+    cache.get_or_build("tp52", "engine", "v1", build)
+    assert cache.invalidate("farr-40") == 1
+    assert cache.get_or_build("farr-40", "engine", "v2", build) == "answer 4"
+    assert cache.get_or_build("tp52", "engine", "v1", build) == "answer 3"
+    print("✅ 통과")
+
+
+def test_lru_eviction():
+    """항목 수가 한도를 넘으면 오래 사용하지 않은 항목부터 삭제"""
+    print("🧪 LRU 삭제 테스트")
+    cache = AnswerCache(max_entries=2)
+    cache.get_or_build("a", "engine", "v1", lambda: "a")
+    cache.get_or_build("b", "engine", "v1", lambda: "b")
+    cache.get_or_build("a", "engine", "v1", lambda: "unused")
+    cache.get_or_build("c", "engine", "v1", lambda: "c")
+
+    assert len(cache) == 2
+    assert cache.get_or_build("a", "engine", "v1", lambda: "rebuilt") == "a"
+    assert cache.get_or_build("b", "engine", "v1", lambda: "rebuilt") == "rebuilt"
+    print("✅ 통과")
+
+
+def test_warm_counts_only_its_own_builds():
+    """미리 생성 중 다른 스레드가 만든 답변은 생성 수에 포함하지 않음"""
+    print("🧪 미리 생성 개수 테스트")
+    cache = AnswerCache()
+
+    def build(yacht_id):
+        # 요청 스레드가 동시에 다른 요트 답변을 만듦 (공유 misses 증가)
+        request = threading.Thread(target=cache.get_or_build, args=("tp52", "engine", "v1", lambda: "tp52"))
+        request.start()
+        request.join()
+        return yacht_id
+
+    assert cache.warm([("farr-40", "v1")], {"engine": build}) == 1
+    assert cache.stats()["misses"] == 2
+    assert cache.warm([("farr-40", "v1")], {"engine": build}) == 0
+    print("✅ 통과")
+
+
+def test_yacht_version_is_per_yacht():
+    """다른 요트가 바뀌어도 요트 데이터 버전은 그대로"""
+    print("🧪 요트 단위 버전 테스트")
+    first = YachtCatalog({"yachts": [{"id": "a", "name": "A"}, {"id": "b", "name": "B"}]}, {}, ("x",))
+    second = YachtCatalog({"yachts": [{"id": "a", "name": "A"}, {"id": "b", "name": "B", "type": "racer"}]},
+                          {}, ("y",))
+
+    assert first.version != second.version
+    assert first.yacht_version("a") == second.yacht_version("a")
+    assert first.yacht_version("b") != second.yacht_version("b")
+    print("✅ 통과")
+
+
+def test_chatbot_answers_are_shared_and_warmed():
+    """서버 시작 시 미리 만든 답변을 모든 세션이 재사용 (JSON / SQLite 카탈로그 모두)"""
+    print("🧪 챗봇 답변 공유 테스트")
+    for backend in ('json', 'sqlite'):
+        with temporary_shared_stores(prefix='answer_cache_') as data_dir:
+            _check_answers_shared(data_dir, backend)
+    print("✅ 통과")
+
+
+def _check_answers_shared(data_dir, backend):
+    yacht_id = f"answer-cache-{backend}"
+    with open(os.path.join(data_dir, 'yacht_specifications.json'), 'w', encoding='utf-8') as f:
+        json.dump({"yachts": [{"id": yacht_id, "name": "Cache 40",
+                               "yachtSpecs": {"standard": {"engine": {"type": "Volvo D1-20"}}}}]}, f)
+    database = CatalogDatabase(os.path.join(data_dir, 'catalog.db')) if backend == 'sqlite' else None
+    store = CatalogStore(data_dir=data_dir, check_interval=0, database=database)
+
+    first = UnifiedYachtChatbot(mode="api", catalog_store=store)
+    assert first.warm_answer_cache() > 0, backend
+    assert first.warm_answer_cache() == 0, backend
+
+    second = UnifiedYachtChatbot(mode="api", catalog_store=store)
+    calls = []
+    original = second._format_yacht_engine_info
+    second._format_yacht_engine_info = lambda yacht: calls.append(1) or original(yacht)
+
+    answer = second.chat("Cache 40 엔진")
+    assert "Volvo D1-20" in answer
+    assert calls == [], backend
+
+    # 등록으로 해당 요트 답변이 삭제되면 다시 생성
+    get_shared_answer_cache().invalidate(yacht_id)
+    assert second.chat("Cache 40 엔진") == answer
+    assert calls == [1], backend
+
+
+if __name__ == "__main__":
+    test_cache_hit_and_version_change()
+    test_lru_eviction()
+    test_warm_counts_only_its_own_builds()
+    test_yacht_version_is_per_yacht()
+    test_chatbot_answers_are_shared_and_warmed()
@@ -0,0 +1,171 @@
+"""
+일괄 분석 엔진 테스트 스크립트
+추출/분석 동시 처리, 체크포인트, 변경 없는 파일 건너뛰기 확인
+"""
+
+import os
+import time
+import tempfile
+import threading
+
+from batch_runner import (
+    MANIFEST_FILE, STATUS_DONE, STATUS_FAILED, STATUS_SKIPPED, BatchManifest, BatchRunner, RateLimiter, summarize
+)
+
+
+class StandInPipeline:
+    """파일 내용을 텍스트로 쓰는 추출기 + 동시 실행 수를 기록하는 분석기"""
+
+    def __init__(self, delay=0.0, fail_on=()):
+        self.delay = delay
+        self.fail_on = set(fail_on)
+        self.analyzed = []
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def extract(self, path):
+        with open(path, 'r', encoding='utf-8') as f:
+            return f.read()
+
+    def analyze(self, path, text):
+        with self._lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+            self.analyzed.append(os.path.basename(path))
+        time.sleep(self.delay)
+        with self._lock:
+            self.active -= 1
+        if os.path.basename(path) in self.fail_on:
+            return {"error": "JSON 파싱 실패"}
+        return {"documentInfo": {"yachtModel": os.path.basename(path)},
+                "parts": [{"id": "part-1"}, {"id": "part-2"}]}
+
+
+def _make_pdfs(names, short=()):
+    pdf_dir = tempfile.mkdtemp(prefix='batch_runner_')
+    paths = []
+    for name in names:
+        path = os.path.join(pdf_dir, name)
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write("short" if name in short else f"{name} manual text " * 20)
+        paths.append(path)
+    return pdf_dir, paths
+
+
+def _make_runner(pdf_dir, pipeline, version="v1"):
+    return BatchRunner(extract=pipeline.extract, analyze=pipeline.analyze,
+                       output_dir=os.path.join(pdf_dir, 'results'), version=version,
+                       extract_workers=2, analyze_workers=4, rate_per_minute=0)
+
+
+def test_pipeline_runs_concurrently_in_order():
+    """분석은 동시에 실행되고 결과는 입력 순서대로"""
+    print("🧪 동시 처리 테스트")
+    names = [f"yacht-{i}.pdf" for i in range(6)]
+    pdf_dir, paths = _make_pdfs(names)
+    pipeline = StandInPipeline(delay=0.05)
+
+    runner = _make_runner(pdf_dir, pipeline)
+    outcomes = runner.run(paths)
+
+    assert [o["fileName"] for o in outcomes] == names
+    assert all(o["status"] == STATUS_DONE and o["ids"] == 2 for o in outcomes)
+    assert pipeline.max_active > 1
+    assert os.path.exists(runner.result_path('yacht-0.pdf'))
+    print("✅ 통과")
+
+
+def test_rerun_skips_unchanged_and_retries_failures():
+    """다시 실행하면 성공한 파일은 건너뛰고, 실패/변경된 파일만 다시 분석"""
+    print("🧪 체크포인트 재실행 테스트")
+    pdf_dir, paths = _make_pdfs(["a.pdf", "b.pdf", "c.pdf", "scan.pdf"], short=("scan.pdf",))
+
+    first = StandInPipeline(fail_on=("b.pdf",))
+    outcomes = _make_runner(pdf_dir, first).run(paths)
+    assert summarize(outcomes) == {STATUS_DONE: 2, STATUS_SKIPPED: 0, STATUS_FAILED: 2}
+    assert sorted(first.analyzed) == ["a.pdf", "b.pdf", "c.pdf"]
+
+    manifest = BatchManifest(os.path.join(pdf_dir, 'results', MANIFEST_FILE)).files()
+    assert manifest["a.pdf"]["status"] == STATUS_DONE
+    assert manifest["b.pdf"]["status"] == STATUS_FAILED
+    assert "텍스트 추출 실패" in manifest["scan.pdf"]["error"]
+
+    # c.pdf 내용 변경
+    with open(paths[2], 'a', encoding='utf-8') as f:
+        f.write(" revised")
+    second = StandInPipeline()
+    outcomes = _make_runner(pdf_dir, second).run(paths)
+    assert [o["status"] for o in outcomes] == [STATUS_SKIPPED, STATUS_DONE, STATUS_DONE, STATUS_FAILED]
+    assert outcomes[0]["result"]["documentInfo"]["yachtModel"] == "a.pdf"
+    assert sorted(second.analyzed) == ["b.pdf", "c.pdf"]
+
+    # 분석 버전이 바뀌면 모두 다시 분석
+    third = StandInPipeline()
+    _make_runner(pdf_dir, third, version="v2").run(paths)
+    assert sorted(third.analyzed) == ["a.pdf", "b.pdf", "c.pdf"]
+    print("✅ 통과")
+
+
+def test_unwritable_result_is_recorded_as_failure():
+    """결과를 저장하지 못한 파일은 실패로 기록하고 나머지는 계속 처리"""
+    print("🧪 결과 저장 실패 테스트")
+    pdf_dir, paths = _make_pdfs(["a.pdf", "b.pdf"])
+    pipeline = StandInPipeline()
+
+    def analyze(path, text):
+        result = pipeline.analyze(path, text)
+        if path.endswith("b.pdf"):
+            result["raw"] = object()  # JSON으로 직렬화할 수 없음
+        return result
+
+    runner = _make_runner(pdf_dir, pipeline)
+    runner.analyze = analyze
+    outcomes = runner.run(paths)
+    assert [o["status"] for o in outcomes] == [STATUS_DONE, STATUS_FAILED]
+    assert "결과 저장 오류" in outcomes[1]["error"]
+    manifest = BatchManifest(os.path.join(pdf_dir, 'results', MANIFEST_FILE)).files()
+    assert manifest["b.pdf"]["status"] == STATUS_FAILED
+    assert not os.path.exists(runner.result_path('b.pdf'))
+    print("✅ 통과")
+
+
+def test_result_names_do_not_collide():
+    """확장자/대소문자만 다른 파일과 manifest.pdf도 서로의 결과나 매니페스트를 덮어쓰지 않음"""
+    print("🧪 결과 파일 이름 충돌 테스트")
+    names = ["A.pdf", "A.PDF", "manifest.pdf", "_manifest.pdf"]
+    pdf_dir, paths = _make_pdfs(names)
+    runner = _make_runner(pdf_dir, StandInPipeline())
+    assert summarize(runner.run(paths))[STATUS_DONE] == 4
+
+    result_files = {runner.result_path(name) for name in names}
+    assert len(result_files) == 4
+    assert len({path.lower() for path in result_files}) == 4
+    assert os.path.join(pdf_dir, 'results', MANIFEST_FILE) not in result_files
+    manifest = BatchManifest(os.path.join(pdf_dir, 'results', MANIFEST_FILE)).files()
+    assert sorted(manifest) == sorted(names)
+
+    rerun = StandInPipeline()
+    outcomes = _make_runner(pdf_dir, rerun).run(paths)
+    assert [o["result"]["documentInfo"]["yachtModel"] for o in outcomes] == names
+    assert rerun.analyzed == []
+    print("✅ 통과")
+
+
+def test_rate_limiter_spaces_calls():
+    """분당 호출 수 제한은 호출 시작 간격을 고르게 유지"""
+    print("🧪 호출 간격 제한 테스트")
+    limiter = RateLimiter(per_minute=1200)  # 0.05초 간격
+    started = time.monotonic()
+    for _ in range(4):
+        limiter.acquire()
+    assert time.monotonic() - started >= 0.14
+    print("✅ 통과")
+
+
+if __name__ == "__main__":
+    test_pipeline_runs_concurrently_in_order()
+    test_rerun_skips_unchanged_and_retries_failures()
+    test_unwritable_result_is_recorded_as_failure()
+    test_result_names_do_not_collide()
+    test_rate_limiter_spaces_calls()
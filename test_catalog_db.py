@@ -0,0 +1,197 @@
+"""
+SQLite 요트 카탈로그 테스트 스크립트
+API 키나 서버 없이 catalog_db 모듈만 테스트
+"""
+
+import os
+import json
+import time
+import tempfile
+
+import sqlite3
+
+from catalog_db import CatalogDatabase, open_catalog
+from yacht_catalog import CatalogStore, DatabaseCatalog
+
+
+def _write_json(path, data):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False)
+
+
+SPECS = {
+    "schemaVersion": "5.0",
+    "lastUpdated": "2025-11-21",
+    "totalYachts": 2,
+    "yachts": [
+        {"id": "j70", "name": "J/70", "manufacturer": "J Boats", "manualPDF": "j70.pdf",
+         "yachtSpecs": {"standard": {"dimensions": {"LOA": "6.93m", "Beam": "2.25m"}}}},
+        {"id": "farr-40", "name": "Farr 40", "manufacturer": "Farr",
+         "yachtSpecs": {"standard": {"dimensions": None}}},
+    ]
+}
+
+PARTS_APP_DATA = {
+    "schemaVersion": "5.0",
+    "yachts": [
+        {"id": "j70", "name": "J/70", "parts": [
+            {"id": "part-engine-01", "name": "Engine", "category": "Propulsion", "interval": 12},
+            {"id": "part-sail-01", "name": "Mainsail", "category": "Sails", "interval": "6개월"},
+            {"id": "part-hull-01", "name": "Hull", "category": "Hull", "interval": None},
+        ]},
+        {"id": "farr-40", "name": "Farr 40", "parts": []},
+    ]
+}
+
+PARTS_DATABASE = {
+    "schemaVersion": "5.0",
+    "yachts": [
+        {"id": "j70", "name": "J/70", "totalParts": 1, "parts": [
+            {"id": "part-engine-01", "name": "Engine", "specifications": {"power": "4HP"}}
+        ]},
+        {"id": "farr-40", "name": "Farr 40", "parts": {"Rigging": {"physicalParts": []}}},
+    ]
+}
+
+MANUAL_RESOURCES = {
+    "schemaVersion": "5.0",
+    "totalResources": 1,
+    "resources": [{"yachtModel": "J/70", "manualPDF": "j70.pdf", "documentType": "Owner's Manual"}],
+    "yachts": [{"id": "j70", "name": "J/70", "downloadLinks": []}],
+}
+
+
+def _make_data_dir():
+    data_dir = tempfile.mkdtemp(prefix='catalog_db_')
+    _write_json(os.path.join(data_dir, 'yacht_specifications.json'), SPECS)
+    _write_json(os.path.join(data_dir, 'yacht_parts_app_data.json'), PARTS_APP_DATA)
+    _write_json(os.path.join(data_dir, 'yacht_parts_database.json'), PARTS_DATABASE)
+    _write_json(os.path.join(data_dir, 'yacht_manual_resources.json'), MANUAL_RESOURCES)
+    return data_dir
+
+
+def test_export_reproduces_json():
+    """가져온 뒤 내보내면 원본 JSON과 같은 내용/키 순서"""
+    print("🧪 가져오기/내보내기 왕복 테스트")
+    data_dir = _make_data_dir()
+    db = CatalogDatabase(os.path.join(data_dir, 'catalog.db'))
+    counts = db.import_json(data_dir)
+    assert counts["yacht"] == 2
+    assert counts["maintenance_item"] == 2
+
+    for name, original in [('yacht_specifications.json', SPECS),
+                           ('yacht_parts_app_data.json', PARTS_APP_DATA),
+                           ('yacht_parts_database.json', PARTS_DATABASE),
+                           ('yacht_manual_resources.json', MANUAL_RESOURCES)]:
+        assert json.dumps(db.export_json(name), ensure_ascii=False) == json.dumps(original, ensure_ascii=False), name
+
+    out_dir = tempfile.mkdtemp(prefix='catalog_export_')
+    assert len(db.export_all(out_dir)) == 4
+    with open(os.path.join(out_dir, 'yacht_specifications.json'), encoding='utf-8') as f:
+        assert json.load(f) == SPECS
+    print("✅ 통과")
+
+
+def test_per_yacht_queries():
+    """요트 단위 조회 (ID/이름 인덱스)"""
+    print("🧪 요트 단위 조회 테스트")
+    data_dir = _make_data_dir()
+    db = CatalogDatabase(os.path.join(data_dir, 'catalog.db'))
+    db.sync(data_dir)
+
+    assert [y["name"] for y in db.list_yachts()] == ["J/70", "Farr 40"]
+    assert db.find_yacht("j70")["id"] == "j70"
+    assert db.get_yacht_id("FARR-40") == "farr-40"
+    assert db.get_yacht("tp52") is None
+    assert [p["name"] for p in db.get_parts("j70")] == ["Engine", "Mainsail", "Hull"]
+    assert db.get_parts("j70", source='yacht_parts_database.json')[0]["specifications"] == {"power": "4HP"}
+    assert db.get_parts("farr-40", source='yacht_parts_database.json') == {"Rigging": {"physicalParts": []}}
+    assert db.get_dimensions("j70") == {"LOA": "6.93m", "Beam": "2.25m"}
+    assert db.get_dimensions("farr-40") == {}
+    assert db.get_parts_by_name("J 70") == db.get_parts("j70")
+    assert [e["name"] for e in db.list_parts_entries('yacht_parts_app_data.json')] == ["J/70", "Farr 40"]
+
+    items = db.get_maintenance_items("j70")
+    assert [(i["name"], i["interval"]) for i in items] == [("Engine", 12), ("Mainsail", 6)]
+    assert [r.get("documentType") for r in db.get_manual_resources("j70")] == ["Owner's Manual", None]
+    print("✅ 통과")
+
+
+def test_sync_only_when_json_changes():
+    """JSON이 바뀐 경우에만 다시 가져옴, 깨진 JSON이면 기존 데이터 유지"""
+    print("🧪 변경 감지 테스트")
+    data_dir = _make_data_dir()
+    db = CatalogDatabase(os.path.join(data_dir, 'catalog.db'))
+    assert db.sync(data_dir) is True
+    assert db.sync(data_dir) is False
+
+    time.sleep(0.01)
+    specs = json.loads(json.dumps(SPECS))
+    specs["yachts"].append({"id": "tp52", "name": "TP52"})
+    _write_json(os.path.join(data_dir, 'yacht_specifications.json'), specs)
+    assert db.sync(data_dir) is True
+    assert db.get_yacht("tp52")["name"] == "TP52"
+
+    with open(os.path.join(data_dir, 'yacht_specifications.json'), 'w', encoding='utf-8') as f:
+        f.write('{"yachts": [')
+    try:
+        db.sync(data_dir)
+        assert False, "깨진 JSON은 예외가 발생해야 함"
+    except json.JSONDecodeError:
+        pass
+    assert db.get_yacht("tp52") is not None
+    print("✅ 통과")
+
+
+def test_catalog_store_with_database():
+    """CatalogStore가 SQLite 카탈로그 스냅샷을 만들고, 조회는 해당 요트 행만 읽음"""
+    print("🧪 SQLite 백엔드 카탈로그 테스트")
+    data_dir = _make_data_dir()
+    db = CatalogDatabase(os.path.join(data_dir, 'catalog.db'))
+    catalog = CatalogStore(data_dir=data_dir, check_interval=0, database=db).get()
+    assert isinstance(catalog, DatabaseCatalog)
+
+    # 로드 시에는 요약 목록만 (전체 문서는 만들지 않음)
+    assert catalog.yacht_names() == ["J/70", "Farr 40"]
+    assert catalog.name_matcher.match("j70 크기") == "J/70"
+    assert [y["id"] for y in catalog.list_page(10, prefix="farr")[0]] == ["farr-40"]
+    assert catalog.find_yacht("J70") is catalog.get_yacht("j70")
+    assert catalog.get_yacht_id("FARR-40") == "farr-40"
+    assert [p["name"] for p in catalog.get_parts("j70")] == ["Engine", "Mainsail", "Hull"]
+    assert catalog.get_parts_by_name("j 70") == catalog.get_parts("j70")
+    assert list(catalog.get_parts_by_category("j70")) == ["Propulsion", "Sails", "Hull"]
+    assert catalog.get_dimensions("j70") == {"LOA": "6.93m", "Beam": "2.25m"}
+    assert catalog.find_yacht("TP52") is None and catalog.get_parts("tp52") == []
+    assert 'yacht_data' not in catalog._memo and 'find_yacht:tp52' not in catalog._memo
+
+    assert catalog.yacht_data == SPECS
+    assert catalog.parts_data == PARTS_APP_DATA
+    assert catalog.yachts[0] == SPECS["yachts"][0]
+    print("✅ 통과")
+
+
+def test_old_schema_is_rebuilt():
+    """이름 인덱스가 없는 이전 형식의 catalog.db는 지우고 다시 가져옴"""
+    print("🧪 이전 형식 카탈로그 재구성 테스트")
+    data_dir = _make_data_dir()
+    conn = sqlite3.connect(os.path.join(data_dir, 'catalog.db'))
+    conn.executescript("""
+        CREATE TABLE catalog_meta (key TEXT PRIMARY KEY, value TEXT);
+        CREATE TABLE parts_entry (source TEXT NOT NULL, position INTEGER NOT NULL, yacht_id TEXT,
+                                  name TEXT, document TEXT NOT NULL, PRIMARY KEY (source, position));
+        INSERT INTO catalog_meta VALUES ('source_signature', 'old');
+    """)
+    conn.close()
+
+    db = open_catalog(data_dir)
+    assert db.get_meta('source_signature') != 'old'
+    assert [p["name"] for p in db.get_parts_by_name("J/70")] == ["Engine", "Mainsail", "Hull"]
+    print("✅ 통과")
+
+
+if __name__ == "__main__":
+    test_export_reproduces_json()
+    test_per_yacht_queries()
+    test_sync_only_when_json_changes()
+    test_catalog_store_with_database()
+    test_old_schema_is_rebuilt()
@@ -0,0 +1,55 @@
+"""
+스트리밍 채팅 테스트 스크립트
+Gemini 대신 조각 단위로 응답하는 로컬 모델로 chat_stream 이벤트 확인
+"""
+
+from test_llm_cache import StandInModel, temporary_chatbot
+
+YACHTS = [{"id": "farr-40", "name": "Farr 40", "dimensions": {"loa": "12.41 m"}}]
+
+
+def _make_chatbot(chunks):
+    return temporary_chatbot(YACHTS, model=StandInModel(chunks), prefix='chat_stream_')
+
+
+def test_ai_answer_streams_deltas():
+    """AI 응답은 조각 단위 delta 이벤트 후 done"""
+    print("🧪 AI 응답 스트리밍 테스트")
+    with _make_chatbot(["  요트는 ", "바람으로 ", "움직입니다. "]) as chatbot:
+        events = list(chatbot.chat_stream("요트는 어떻게 움직여?"))
+
+        assert [e["event"] for e in events] == ["delta", "delta", "delta", "done"]
+        assert events[0]["text"] == "요트는 "
+        assert events[-1]["text"] == "요트는 바람으로 움직입니다."
+        assert chatbot.chat_history[-1]["content"] == "요트는 바람으로 움직입니다."
+        # 비스트리밍 응답과 같은 결과
+        assert chatbot.chat("요트는 어떻게 움직여?") == events[-1]["text"]
+    print("✅ 통과")
+
+
+def test_postprocessed_answer_is_replaced():
+    """후처리로 응답이 바뀌면 replace 이벤트"""
+    print("🧪 응답 대체 테스트")
+    with _make_chatbot(["PDF 파일을 ", "업로드해주세요"]) as chatbot:
+        events = list(chatbot.chat_stream("문서 있는데 어떻게 해?"))
+
+        assert [e["event"] for e in events] == ["delta", "delta", "replace", "done"]
+        assert events[-1]["text"] == events[-2]["text"] == chatbot._suggest_pdf_upload()
+    print("✅ 통과")
+
+
+def test_local_answer_is_single_event():
+    """AI를 거치지 않는 응답은 done 이벤트 하나"""
+    print("🧪 빠른 응답 테스트")
+    with _make_chatbot(["사용되지 않음"]) as chatbot:
+        events = list(chatbot.chat_stream("/help"))
+
+        assert [e["event"] for e in events] == ["done"]
+        assert events[0]["text"] == chatbot._get_help()
+    print("✅ 통과")
+
+
+if __name__ == "__main__":
+    test_ai_answer_streams_deltas()
+    test_postprocessed_answer_is_replaced()
+    test_local_answer_is_single_event()
@@ -0,0 +1,175 @@
+"""
+DB 연결 풀 테스트 스크립트
+MySQL 없이 로컬 대체 연결로 최대 크기, ping 재연결, 유휴 만료, 롤백 확인
+"""
+
+import os
+import time
+import shutil
+import sqlite3
+import tempfile
+import threading
+
+from db_pool import ConnectionPool, PoolClosed, PoolExhausted
+
+
+class StandInConnection:
+    """ping/commit/rollback 호출을 기록하는 로컬 연결"""
+
+    def __init__(self):
+        self.alive = True
+        self.closed = False
+        self.commits = 0
+        self.rollbacks = 0
+
+    def ping(self, reconnect=False):
+        if not self.alive:
+            raise ConnectionError("MySQL server has gone away")
+
+    def cursor(self):
+        return type('Cursor', (), {"close": lambda self: None, "execute": lambda self, *args: None})()
+
+    def commit(self):
+        self.commits += 1
+
+    def rollback(self):
+        self.rollbacks += 1
+
+    def close(self):
+        self.closed = True
+
+
+def test_reuse_and_max_size():
+    """반납한 연결은 재사용하고, 최대 수를 넘으면 기다렸다가 PoolExhausted"""
+    print("🧪 연결 재사용/최대 크기 테스트")
+    pool = ConnectionPool(StandInConnection, max_size=2, checkout_timeout=0.1)
+    with pool.connection() as first:
+        pass
+    with pool.connection() as second:
+        assert second is first
+
+    release = threading.Event()
+    holders = [threading.Thread(target=lambda: _hold(pool, release)) for _ in range(2)]
+    for holder in holders:
+        holder.start()
+    while pool.stats()["idle"]:
+        time.sleep(0.01)
+    time.sleep(0.05)
+    try:
+        with pool.connection():
+            assert False, "PoolExhausted가 발생해야 합니다"
+    except PoolExhausted:
+        pass
+    release.set()
+    for holder in holders:
+        holder.join()
+
+    stats = pool.stats()
+    assert (stats["open"], stats["created"]) == (2, 2)
+    assert stats["waits"] >= 1
+    print("✅ 통과")
+
+
+def _hold(pool, release):
+    with pool.connection():
+        release.wait(5)
+
+
+def test_broken_and_idle_connections_are_replaced():
+    """끊긴 연결 (ping 실패)과 오래 쉰 연결은 닫고 새로 연결"""
+    print("🧪 ping/유휴 재연결 테스트")
+    pool = ConnectionPool(StandInConnection, max_size=1, max_idle=0.05)
+    with pool.connection() as conn:
+        pass
+    conn.alive = False
+    with pool.connection() as replaced:
+        assert replaced is not conn
+    assert conn.closed and pool.stats()["broken"] == 1
+
+    time.sleep(0.1)
+    with pool.connection() as fresh:
+        assert fresh is not replaced
+    assert replaced.closed and pool.stats()["recycled"] == 1
+    assert pool.stats()["open"] == 1
+    print("✅ 통과")
+
+
+def test_cursor_commits_or_rolls_back():
+    """커서 컨텍스트: 정상 종료 시 커밋, 예외 시 롤백 후 연결 반납"""
+    print("🧪 커서 커밋/롤백 테스트")
+    pool = ConnectionPool(StandInConnection, max_size=1)
+    with pool.cursor(commit=True) as cursor:
+        cursor.execute("INSERT ...")
+    try:
+        with pool.cursor(commit=True) as cursor:
+            raise ValueError("bad row")
+    except ValueError:
+        pass
+
+    with pool.connection() as conn:
+        # 반납할 때마다 롤백 (커밋 후 1번 + 예외 1번)
+        assert (conn.commits, conn.rollbacks) == (1, 2)
+    assert pool.stats()["created"] == 1
+    print("✅ 통과")
+
+
+def test_close_closes_connections_in_use():
+    """close() 뒤 반납된 사용 중 연결도 닫고, 이후 꺼내기는 PoolClosed"""
+    print("🧪 풀 닫기 테스트")
+    pool = ConnectionPool(StandInConnection, max_size=2)
+    with pool.connection() as in_use:
+        with pool.connection() as idle:
+            pass
+        pool.close()
+        assert idle.closed and not in_use.closed
+    assert in_use.closed
+    assert (pool.stats()["open"], pool.stats()["idle"]) == (0, 0)
+    try:
+        with pool.connection():
+            assert False, "PoolClosed가 발생해야 합니다"
+    except PoolClosed:
+        pass
+    print("✅ 통과")
+
+
+class SnapshotConnection(sqlite3.Connection):
+    """MySQL (autocommit 꺼짐)처럼 첫 쿼리에서 트랜잭션을 시작해 스냅샷을 잡는 SQLite 연결"""
+
+    def cursor(self, *args):
+        if not self.in_transaction:
+            self.execute("BEGIN")
+        return super().cursor(*args)
+
+
+def test_read_sees_commits_from_other_connections():
+    """읽기만 하고 반납한 연결도 다음 사용 때 다른 연결이 커밋한 행을 봄"""
+    print("🧪 반납 시 스냅샷 해제 테스트")
+    path = os.path.join(tempfile.mkdtemp(prefix='db_pool_'), 'pool.db')
+    writer = sqlite3.connect(path, isolation_level=None)
+    writer.execute("PRAGMA journal_mode=WAL")
+    writer.execute("CREATE TABLE yacht (id TEXT)")
+
+    pool = ConnectionPool(lambda: sqlite3.connect(path, isolation_level=None, factory=SnapshotConnection,
+                                                  check_same_thread=False), max_size=1)
+    try:
+        with pool.cursor() as cursor:
+            cursor.execute("SELECT COUNT(*) FROM yacht")
+            assert cursor.fetchone()[0] == 0
+        writer.execute("INSERT INTO yacht VALUES ('farr-40')")
+        with pool.cursor() as cursor:
+            cursor.execute("SELECT COUNT(*) FROM yacht")
+            assert cursor.fetchone()[0] == 1
+        assert pool.stats()["created"] == 1
+    finally:
+        pool.close()
+        writer.close()
+        shutil.rmtree(os.path.dirname(path), ignore_errors=True)
+    print("✅ 통과")
+
+
+if __name__ == "__main__":
+    test_reuse_and_max_size()
+    test_broken_and_idle_connections_are_replaced()
+    test_cursor_commits_or_rolls_back()
+    test_close_closes_connections_in_use()
+    test_read_sees_commits_from_other_connections()
@@ -0,0 +1,172 @@
+"""
+문서 처리 캐시 테스트 스크립트
+API 키나 OCR 패키지 없이 document_cache 모듈만 테스트
+"""
+
+import os
+import json
+import tempfile
+
+import document_cache
+from document_cache import DocumentAnalysisCache, DocumentTextCache
+from test_llm_cache import StandInModel
+
+
+def _write_file(path, content):
+    with open(path, 'wb') as f:
+        f.write(content)
+
+
+def test_text_cache_skips_repeat_extraction():
+    """같은 내용의 파일은 경로가 달라도 다시 추출하지 않음"""
+    print("🧪 텍스트 캐시 테스트")
+    work_dir = tempfile.mkdtemp(prefix='document_cache_')
+    cache = DocumentTextCache(cache_dir=os.path.join(work_dir, 'cache'), max_bytes=1024 * 1024)
+
+    first = os.path.join(work_dir, 'manual.pdf')
+    second = os.path.join(work_dir, 'manual_copy.pdf')
+    _write_file(first, b'%PDF-1.4 same bytes')
+    _write_file(second, b'%PDF-1.4 same bytes')
+
+    calls = []
+
+    def extract(path):
+        calls.append(path)
+        return "Farr 40 owner's manual " * 10
+
+    text = cache.get_or_extract(first, "1", extract)
+    assert cache.get_or_extract(second, "1", extract) == text
+    assert len(calls) == 1
+
+    # 추출기 버전이 바뀌면 다시 추출
+    cache.get_or_extract(first, "2", extract)
+    assert len(calls) == 2
+
+    # 너무 짧은 결과 (추출 실패)는 캐시하지 않음
+    other = os.path.join(work_dir, 'scanned.pdf')
+    _write_file(other, b'%PDF-1.4 scanned')
+    cache.get_or_extract(other, "1", lambda path: calls.append(path) or "")
+    cache.get_or_extract(other, "1", lambda path: calls.append(path) or "")
+    assert len(calls) == 4
+    print("✅ 통과")
+
+
+def test_text_cache_only_falls_back_on_cache_errors():
+    """캐시 읽기 오류는 직접 추출로 대체, 추출기 오류는 한 번만 실행하고 전달"""
+    print("🧪 텍스트 캐시 오류 처리 테스트")
+    work_dir = tempfile.mkdtemp(prefix='document_cache_')
+    path = os.path.join(work_dir, 'manual.pdf')
+    _write_file(path, b'%PDF-1.4 bytes')
+    calls = []
+
+    class BrokenCache(DocumentTextCache):
+        def _read(self, key):
+            raise PermissionError("cache disk")
+
+    broken = BrokenCache(cache_dir=os.path.join(work_dir, 'broken'), max_bytes=1024)
+    assert broken.get_or_extract(path, "1", lambda p: calls.append(p) or "text") == "text"
+    assert len(calls) == 1
+
+    def failing_extract(p):
+        calls.append(p)
+        raise OSError("corrupt document")
+
+    cache = DocumentTextCache(cache_dir=os.path.join(work_dir, 'cache'), max_bytes=1024)
+    try:
+        cache.get_or_extract(path, "1", failing_extract)
+        assert False, "OSError가 발생해야 합니다"
+    except OSError as e:
+        assert "corrupt" in str(e)
+    assert len(calls) == 2
+    print("✅ 통과")
+
+
+def test_text_cache_evicts_least_recently_used():
+    """최대 크기를 넘으면 가장 오래 사용하지 않은 항목부터 삭제"""
+    print("🧪 텍스트 캐시 크기 제한 테스트")
+    cache_dir = tempfile.mkdtemp(prefix='document_cache_')
+    cache = DocumentTextCache(cache_dir=cache_dir, max_bytes=250)
+
+    cache.put('a', 'a' * 100)
+    cache.put('b', 'b' * 100)
+    os.utime(cache._path('a'), (1, 1))
+    os.utime(cache._path('b'), (2, 2))
+    assert cache.get('a') is not None   # 'a'를 최근 사용으로 갱신
+
+    cache.put('c', 'c' * 100)
+
+    assert cache.get('b') is None
+    assert cache.get('a') == 'a' * 100
+    assert cache.get('c') == 'c' * 100
+    print("✅ 통과")
+
+
+def test_analysis_cache_versions_and_modes():
+    """프롬프트 템플릿이 바뀌면 조회되지 않고, purge_stale로 삭제"""
+    print("🧪 분석 캐시 버전/모드 테스트")
+    cache_dir = tempfile.mkdtemp(prefix='analysis_cache_')
+    v1 = DocumentAnalysisCache('v1', cache_dir=cache_dir, max_bytes=1024 * 1024)
+    v1.put("manual text", {"ok": True})
+    assert v1.get("manual text") == {"ok": True}
+
+    v2 = DocumentAnalysisCache('v2', cache_dir=cache_dir, max_bytes=1024 * 1024)
+    assert v2.get("manual text") is None
+    assert v2.purge_stale() == 1
+    assert v1.get("manual text") is None
+
+    # replay 모드는 읽기만, off 모드는 아무것도 하지 않음
+    v2.put("manual text", {"ok": 2})
+    replay = DocumentAnalysisCache('v2', cache_dir=cache_dir, max_bytes=1024 * 1024, mode='replay')
+    replay.put("other text", {"ok": 3})
+    assert replay.get("manual text") == {"ok": 2}
+    assert replay.get("other text") is None
+    off = DocumentAnalysisCache('v2', cache_dir=cache_dir, max_bytes=1024 * 1024, mode='off')
+    assert off.get("manual text") is None
+    print("✅ 통과")
+
+
+def test_chatbot_analysis_replays_offline():
+    """같은 문서는 한 번만 모델을 호출하고, replay 모드에서는 모델 없이 재생"""
+    print("🧪 챗봇 문서 분석 캐시 테스트")
+    import chatbot_unified
+    from yacht_catalog import CatalogStore
+
+    work_dir = tempfile.mkdtemp(prefix='analysis_cache_')
+    version = chatbot_unified.DOCUMENT_ANALYSIS_PROMPT_VERSION
+    document_cache._shared_analysis_caches[version] = DocumentAnalysisCache(
+        version, cache_dir=os.path.join(work_dir, 'cache'), max_bytes=1024 * 1024, mode='readwrite'
+    )
+    try:
+        chatbot = chatbot_unified.UnifiedYachtChatbot(
+            mode="cli", catalog_store=CatalogStore(data_dir=work_dir, check_interval=0)
+        )
+        chatbot.model = StandInModel("```json\n" + json.dumps({"documentInfo": {"yachtName": "Farr 40"}}) + "\n```")
+        chatbot.has_gemini = True
+
+        manual = os.path.join(work_dir, 'manual.pdf')
+        with open(manual, 'wb') as f:
+            f.write(b'%PDF-1.4')
+
+        first = chatbot._analyze_document_directly(manual, "Farr 40 manual text")
+        second = chatbot._analyze_document_directly(manual, "Farr 40 manual text")
+        assert first["documentInfo"] == second["documentInfo"] == {"yachtName": "Farr 40"}
+        assert second["fileInfo"]["fileName"] == "manual.pdf"
+        assert chatbot.model.calls == 1
+
+        # replay: API 키/모델 없이 캐시만 사용
+        document_cache._shared_analysis_caches[version].mode = 'replay'
+        chatbot.has_gemini = False
+        assert chatbot._analyze_document_directly(manual, "Farr 40 manual text")["documentInfo"]
+        assert "error" in chatbot._analyze_document_directly(manual, "unknown manual")
+        assert chatbot.model.calls == 1
+    finally:
+        document_cache._shared_analysis_caches.pop(version, None)
+    print("✅ 통과")
+
+
+if __name__ == "__main__":
+    test_text_cache_skips_repeat_extraction()
+    test_text_cache_only_falls_back_on_cache_errors()
+    test_text_cache_evicts_least_recently_used()
+    test_analysis_cache_versions_and_modes()
+    test_chatbot_analysis_replays_offline()
@@ -0,0 +1,163 @@
+"""
+Gemini 호출 래퍼 테스트 스크립트
+로컬 대체 모델로 재시도, 시간 제한, 요청 병합, 요청 한도 확인
+"""
+
+import time
+import threading
+
+from gemini_client import GeminiClient, GeminiError, GeminiTimeoutError, TokenBucket, is_retryable
+
+
+class ResourceExhausted(Exception):
+    """google.api_core.exceptions.ResourceExhausted (429)와 같은 이름의 로컬 예외"""
+
+
+class FakeModel:
+    """지정한 횟수만큼 실패한 뒤 응답하는 로컬 모델"""
+
+    def __init__(self, failures=(), delay=0.0):
+        self.failures = list(failures)
+        self.delay = delay
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def generate_content(self, prompt, stream=False):
+        with self._lock:
+            self.calls += 1
+            failure = self.failures.pop(0) if self.failures else None
+        time.sleep(self.delay)
+        if failure is not None:
+            raise failure
+        return type('Response', (), {"text": f"응답: {prompt}"})()
+
+
+def _client(model, key, **kwargs):
+    kwargs.setdefault('timeout', 0)
+    return GeminiClient(model, api_key=key, sleep=lambda seconds: None, **kwargs)
+
+
+def test_retries_quota_errors_with_backoff():
+    """한도 초과는 재시도, 그 외 오류는 바로 전달"""
+    print("🧪 재시도 테스트")
+    model = FakeModel(failures=[ResourceExhausted("429 quota"), ConnectionError("reset")])
+    client = _client(model, "retry-key")
+    assert client.generate_content("안녕").text == "응답: 안녕"
+    assert model.calls == 3
+    stats = client.stats()
+    assert (stats["retries"], stats["succeeded"], stats["failed"]) == (2, 1, 0)
+
+    # 재시도 횟수를 넘으면 GeminiError (원인 예외 유지)
+    model = FakeModel(failures=[ResourceExhausted("429")] * 5)
+    try:
+        _client(model, "retry-key-2", max_retries=2).generate_content("안녕")
+        assert False, "GeminiError가 발생해야 합니다"
+    except GeminiError as e:
+        assert isinstance(e.__cause__, ResourceExhausted)
+    assert model.calls == 3
+
+    # 재시도해도 소용없는 오류
+    model = FakeModel(failures=[ValueError("bad prompt")])
+    try:
+        _client(model, "retry-key-3").generate_content("안녕")
+        assert False, "ValueError가 발생해야 합니다"
+    except ValueError:
+        pass
+    assert model.calls == 1
+    assert not is_retryable(ValueError()) and is_retryable(ResourceExhausted())
+    print("✅ 통과")
+
+
+class DeadlineExceeded(Exception):
+    """google.api_core.exceptions.DeadlineExceeded (504)와 같은 이름의 로컬 예외"""
+
+
+class SdkModel:
+    """request_options를 받는 모델 (GenerativeModel과 같은 인자), 받은 시간 제한을 기록"""
+
+    def __init__(self, fail_with=None):
+        self.fail_with = fail_with
+        self.options = []
+
+    def generate_content(self, prompt, stream=False, request_options=None):
+        self.options.append(request_options)
+        if self.fail_with is not None:
+            raise self.fail_with
+        return type('Response', (), {"text": f"응답: {prompt}"})()
+
+
+def test_timeout():
+    """응답이 늦으면 GeminiTimeoutError, 시간 초과는 재시도하지 않음"""
+    print("🧪 시간 제한 테스트")
+    model = FakeModel(delay=0.3)
+    client = _client(model, "timeout-key", timeout=0.05, max_retries=3)
+    try:
+        client.generate_content("느린 질문")
+        assert False, "GeminiTimeoutError가 발생해야 합니다"
+    except GeminiTimeoutError:
+        pass
+    assert model.calls == 1
+    stats = client.stats()
+    assert (stats["timeouts"], stats["retries"]) == (1, 0)
+    print("✅ 통과")
+
+
+def test_timeout_is_passed_to_sdk():
+    """SDK 모델은 스레드 풀 없이 request_options로 시간 제한 전달, DeadlineExceeded는 재시도 안 함"""
+    print("🧪 SDK 시간 제한 전달 테스트")
+    model = SdkModel()
+    client = _client(model, "sdk-timeout-key", timeout=30)
+    client.generate_content("빠른 질문")
+    client.generate_content("옵션 유지", request_options={"retry": None})
+    assert model.options == [{"timeout": 30}, {"retry": None, "timeout": 30}]
+
+    model = SdkModel(fail_with=DeadlineExceeded("504 Deadline Exceeded"))
+    client = _client(model, "sdk-timeout-key-2", timeout=30, max_retries=3)
+    try:
+        client.generate_content("느린 질문")
+        assert False, "GeminiTimeoutError가 발생해야 합니다"
+    except GeminiTimeoutError as e:
+        assert isinstance(e.__cause__, DeadlineExceeded)
+    assert len(model.options) == 1
+    print("✅ 통과")
+
+
+def test_identical_inflight_prompts_are_coalesced():
+    """같은 프롬프트가 동시에 들어오면 모델은 한 번만 호출"""
+    print("🧪 요청 병합 테스트")
+    model = FakeModel(delay=0.2)
+    clients = [_client(model, "coalesce-key") for _ in range(4)]
+    answers = []
+    threads = [threading.Thread(target=lambda c=c: answers.append(c.generate_content("Farr 40 분석").text))
+               for c in clients]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert answers == ["응답: Farr 40 분석"] * 4
+    assert model.calls == 1
+    assert clients[0].stats()["coalesced"] == 3
+    # 끝난 요청은 병합 대상에서 빠짐
+    clients[0].generate_content("Farr 40 분석")
+    assert model.calls == 2
+    print("✅ 통과")
+
+
+def test_token_bucket_limits_rate():
+    """버스트를 다 쓰면 채워지는 속도만큼 대기"""
+    print("🧪 토큰 버킷 테스트")
+    bucket = TokenBucket(rate_per_minute=1200, burst=2)  # 초당 20개
+    started = time.monotonic()
+    waits = [bucket.acquire() for _ in range(4)]
+    assert waits[:2] == [0.0, 0.0]
+    assert time.monotonic() - started >= 0.09
+    print("✅ 통과")
+
+
+if __name__ == "__main__":
+    test_retries_quota_errors_with_backoff()
+    test_timeout()
+    test_timeout_is_passed_to_sdk()
+    test_identical_inflight_prompts_are_coalesced()
+    test_token_bucket_limits_rate()
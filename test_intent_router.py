@@ -0,0 +1,70 @@
+"""
+의도 분류기 테스트 스크립트
+키워드 점수로 의도를 확정하는지, 모호한 요청만 Gemini로 넘기는지 확인
+"""
+
+from intent_router import IntentRouter, get_intent_router
+from test_llm_cache import temporary_chatbot
+
+YACHTS = [{"id": "farr-40", "name": "Farr 40", "manufacturer": "Farr Yacht Design",
+           "yachtSpecs": {"standard": {"dimensions": {"beam": "4.02 m"}}}}]
+
+
+def test_confident_and_ambiguous_intents():
+    """강한 키워드는 확정, 약한 키워드만 있거나 여러 의도가 비슷하면 모호"""
+    print("🧪 의도 확정/모호 판정 테스트")
+    router = get_intent_router()
+
+    assert router.route("요트 목록 보여줘").intent == 'list'
+    assert router.route("사용법 알려줘").intent == 'help'
+    assert router.route("PDF 올리고 싶어").intent == 'upload'
+    assert router.route("Farr 40 분석해줘").intent == 'analysis'
+
+    # 약한 키워드 하나씩 (문서=1, 어떻게=1) → 모호
+    route = router.route("문서 있는데 어떻게 해?")
+    assert route.intent is None
+    assert route.scores == {'upload': 1, 'help': 1}
+    # 키워드 없음
+    assert router.route("요트는 바람으로 움직여?").intent is None
+    # 강한 키워드끼리 경합 (사용법=2, pdf=2) → 모호
+    assert router.route("pdf 사용법").intent is None
+    # 키워드 기반 응답은 점수와 관계없이 우선순위대로
+    assert IntentRouter.first_general_intent(router.route("pdf 사용법")) == 'help'
+    print("✅ 통과")
+
+
+def test_yacht_question_priority():
+    """요트 질문은 표의 순서대로 하나만 선택"""
+    print("🧪 요트 질문 우선순위 테스트")
+    router = get_intent_router()
+
+    assert router.route("Farr 40 폭이랑 엔진").yacht_question == 'beam'
+    assert router.route("Farr 40 부품 몇 개야").yacht_question == 'parts_count'
+    assert router.route("Farr 40 컴포넌트").yacht_question == 'parts_list'
+    assert router.route("Farr 40 정보").yacht_question == 'basic_info'
+    assert router.route("부품 추가할래").registration == 'parts_registration'
+    assert router.route("새 요트 등록하고 싶어").registration == 'registration'
+    assert router.route("안녕").yacht_question is None
+    print("✅ 통과")
+
+
+def test_routine_turns_skip_model():
+    """일상적인 요청은 모델 호출 없이 응답, 모호한 요청만 모델 호출"""
+    print("🧪 AI 호출 생략 테스트")
+    with temporary_chatbot(YACHTS, prefix='intent_router_') as chatbot:
+        assert chatbot.chat("요트 목록 보여줘") == chatbot._list_yachts()
+        assert chatbot.chat("사용법 알려줘") == chatbot._get_help()
+        assert chatbot.chat("PDF 업로드 하려고") == chatbot._suggest_pdf_upload()
+        assert "4.02 m" in chatbot.chat("Farr 40 폭")
+        assert "Farr Yacht Design" in chatbot.chat("Farr 40 제조사")
+        assert chatbot.model.calls == 0
+
+        chatbot.chat("문서 있는데 어떻게 해?")
+        assert chatbot.model.calls > 0
+    print("✅ 통과")
+
+
+if __name__ == "__main__":
+    test_confident_and_ambiguous_intents()
+    test_yacht_question_priority()
+    test_routine_turns_skip_model()
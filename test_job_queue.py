@@ -0,0 +1,134 @@
+"""
+문서 처리 작업 큐 테스트 스크립트
+API 키나 PDF 없이 job_queue 모듈만 테스트
+"""
+
+import os
+import time
+import tempfile
+import threading
+
+from job_queue import JobQueue, JobQueueFull
+
+
+def _db_path():
+    return os.path.join(tempfile.mkdtemp(prefix='job_queue_'), 'jobs.db')
+
+
+def _wait(jobs, job_id, timeout=5):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        job = jobs.get(job_id)
+        if job["status"] in ("succeeded", "failed"):
+            return job
+        time.sleep(0.01)
+    raise AssertionError(f"작업이 끝나지 않음: {jobs.get(job_id)}")
+
+
+def test_submit_returns_immediately_and_reports_progress():
+    """submit은 즉시 반환하고, 진행 단계와 결과가 저장됨"""
+    print("🧪 작업 제출/진행 테스트")
+    release = threading.Event()
+
+    def handler(job, payload):
+        job.progress('extracting', payload["filename"])
+        release.wait(5)
+        job.progress('analyzing')
+        return {"success": True, "yachtName": "Farr 40"}
+
+    jobs = JobQueue(db_path=_db_path(), workers=1)
+    jobs.register('register', handler)
+    job_id = jobs.submit('register', {"filename": "manual.pdf"})
+    assert jobs.get(job_id)["status"] in ("queued", "running")
+
+    events = []
+    reader = threading.Thread(target=lambda: events.extend(e for e in jobs.events(job_id) if e))
+    reader.start()
+    release.set()
+    job = _wait(jobs, job_id)
+    reader.join(5)
+
+    assert job["status"] == "succeeded"
+    assert job["result"] == {"success": True, "yachtName": "Farr 40"}
+    assert events[-1]["status"] == "succeeded"
+    print("✅ 통과")
+
+
+def test_failures_are_recorded():
+    """success=False 결과와 예외는 실패로 기록"""
+    print("🧪 작업 실패 기록 테스트")
+    jobs = JobQueue(db_path=_db_path(), workers=1)
+    jobs.register('bad_result', lambda job, payload: {"success": False, "error": "텍스트 추출 실패"})
+    jobs.register('crash', lambda job, payload: 1 / 0)
+
+    assert _wait(jobs, jobs.submit('bad_result', {}))["error"] == "텍스트 추출 실패"
+    assert _wait(jobs, jobs.submit('crash', {}))["status"] == "failed"
+    print("✅ 통과")
+
+
+def test_unfinished_jobs_resume_after_restart():
+    """재시작 전 끝나지 않은 작업은 새 큐에서 다시 처리"""
+    print("🧪 재시작 후 작업 재개 테스트")
+    db_path = _db_path()
+    blocked = threading.Event()
+    first = JobQueue(db_path=db_path, workers=1)
+    first.register('register', lambda job, payload: blocked.wait(5) and None)
+    job_id = first.submit('register', {"filename": "manual.pdf"})
+
+    restarted = JobQueue(db_path=db_path, workers=1)
+    restarted.register('register', lambda job, payload: {"success": True, "filename": payload["filename"]})
+    restarted.start()
+    job = _wait(restarted, job_id)
+    blocked.set()
+
+    assert job["result"] == {"success": True, "filename": "manual.pdf"}
+    print("✅ 통과")
+
+
+def test_job_runs_once_across_workers():
+    """같은 SQLite 파일을 쓰는 여러 작업자 프로세스 중 한 곳에서만 실행"""
+    print("🧪 작업자 간 중복 실행 방지 테스트")
+    db_path = _db_path()
+    runs = []
+    queues = [JobQueue(db_path=db_path, workers=1) for _ in range(2)]
+    for jobs in queues:
+        jobs.register('register', lambda job, payload, jobs=jobs: runs.append(jobs) or {"success": True})
+
+    # fork된 작업자처럼 같은 작업 ID가 두 큐의 대기열에 모두 들어간 상황
+    job_id = queues[0].submit('register', {})
+    queues[1]._pending.put_nowait(job_id)
+    queues[1].start()
+    _wait(queues[0], job_id)
+    time.sleep(0.1)
+
+    assert len(runs) == 1
+    print("✅ 통과")
+
+
+def test_bounded_queue():
+    """대기 작업 수를 넘으면 JobQueueFull"""
+    print("🧪 대기열 제한 테스트")
+    release = threading.Event()
+    jobs = JobQueue(db_path=_db_path(), workers=1, max_pending=1)
+    jobs.register('slow', lambda job, payload: release.wait(5) and {"success": True})
+
+    running = jobs.submit('slow', {})
+    while jobs.get(running)["status"] != "running":
+        time.sleep(0.01)
+    jobs.submit('slow', {})
+    try:
+        jobs.submit('slow', {})
+        raise AssertionError("JobQueueFull이 발생해야 함")
+    except JobQueueFull:
+        pass
+    finally:
+        release.set()
+    print("✅ 통과")
+
+
+if __name__ == "__main__":
+    test_submit_returns_immediately_and_reports_progress()
+    test_failures_are_recorded()
+    test_unfinished_jobs_resume_after_restart()
+    test_job_runs_once_across_workers()
+    test_bounded_queue()
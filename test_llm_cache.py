@@ -0,0 +1,149 @@
+"""
+LLM 응답 캐시 테스트 스크립트
+정규화된 질문 + 요트 ID + 카탈로그 버전으로 응답을 재사용하는지 확인
+"""
+
+import os
+import json
+import time
+import shutil
+import tempfile
+from contextlib import contextmanager
+
+import llm_cache
+import search_index
+from chatbot_unified import UnifiedYachtChatbot
+from llm_cache import LLMResponseCache, normalize_question
+from search_index import SearchIndex
+from yacht_catalog import CatalogStore
+
+
+@contextmanager
+def temporary_shared_stores(prefix='chatbot_test_'):
+    """
+    공유 LLM 응답 캐시/검색 인덱스를 임시 폴더로 교체 (data/의 실제 파일에 쓰지 않음)
+
+    임시 폴더 경로를 넘겨주고 (요트 JSON 등 테스트 데이터도 여기에 저장), 끝나면 폴더째 삭제
+    """
+    work_dir = tempfile.mkdtemp(prefix=prefix)
+    saved = (llm_cache._shared_cache, search_index._shared_index)
+    llm_cache._shared_cache = LLMResponseCache(os.path.join(work_dir, 'llm_cache.db'))
+    search_index._shared_index = SearchIndex(os.path.join(work_dir, 'search.db'))
+    try:
+        yield work_dir
+    finally:
+        llm_cache._shared_cache, search_index._shared_index = saved
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+class StandInModel:
+    """
+    Gemini 대신 쓰는 로컬 모델 (호출 횟수를 셈)
+
+    reply: 고정 응답 문자열 또는 조각 목록 (stream=True면 조각 단위로 응답),
+           없으면 호출마다 다른 "모델 응답 N"
+    """
+
+    def __init__(self, reply=None):
+        self.calls = 0
+        self.reply = reply
+
+    def generate_content(self, prompt, stream=False):
+        self.calls += 1
+        if self.reply is None:
+            chunks = [f"모델 응답 {self.calls}"]
+        elif isinstance(self.reply, str):
+            chunks = [self.reply]
+        else:
+            chunks = list(self.reply)
+        if stream:
+            return iter([type('Chunk', (), {"text": text})() for text in chunks])
+        return type('Response', (), {"text": "".join(chunks)})()
+
+
+@contextmanager
+def temporary_chatbot(yachts, model=None, prefix='chatbot_test_'):
+    """임시 카탈로그 (yacht_specifications.json = yachts)와 로컬 모델을 쓰는 챗봇"""
+    with temporary_shared_stores(prefix=prefix) as data_dir:
+        with open(os.path.join(data_dir, 'yacht_specifications.json'), 'w', encoding='utf-8') as f:
+            json.dump({"yachts": yachts}, f)
+        chatbot = UnifiedYachtChatbot(mode="api", catalog_store=CatalogStore(data_dir=data_dir, check_interval=0))
+        chatbot.model = model or StandInModel()
+        chatbot.has_gemini = True
+        yield chatbot
+
+
+@contextmanager
+def _temporary_cache(**kwargs):
+    work_dir = tempfile.mkdtemp(prefix='llm_cache_')
+    try:
+        yield LLMResponseCache(os.path.join(work_dir, 'llm_cache.db'), **kwargs)
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+def test_normalized_key_and_version():
+    """표현이 조금 다른 같은 질문은 적중, 카탈로그 버전이 다르면 실패"""
+    print("🧪 질문 정규화/버전 테스트")
+    assert normalize_question("Farr 40 분석해줘?") == normalize_question("farr40  분석해줘")
+    with _temporary_cache() as cache:
+        cache.put('intent', "TP52 정비 주기 알려줘", "tp52", "v1", "정비 주기 답변")
+        assert cache.get('intent', "tp52 정비주기 알려줘!", "tp52", "v1") == "정비 주기 답변"
+        assert cache.get('intent', "TP52 정비 주기 알려줘", "tp52", "v2") is None
+        assert cache.get('intent', "TP52 정비 주기 알려줘", "farr-40", "v1") is None
+        assert cache.get('analysis', "TP52 정비 주기 알려줘", "tp52", "v1") is None
+
+        stats = cache.stats()
+        assert (stats["hits"], stats["misses"], stats["entries"]) == (1, 3, 1)
+        assert stats["hitRate"] == 0.25
+    print("✅ 통과")
+
+
+def test_ttl_and_eviction():
+    """만료된 항목은 사용하지 않고, 한도를 넘으면 오래 사용하지 않은 항목부터 삭제"""
+    print("🧪 TTL/크기 제한 테스트")
+    with _temporary_cache(ttl=0.05) as cache:
+        cache.put('intent', "q", None, "v1", "answer")
+        time.sleep(0.1)
+        assert cache.get('intent', "q", None, "v1") is None
+        assert cache.stats()["expired"] == 1
+
+    with _temporary_cache(max_entries=2) as cache:
+        cache.put('intent', "a", None, "v1", "A")
+        cache.put('intent', "b", None, "v1", "B")
+        time.sleep(0.01)
+        cache.get('intent', "a", None, "v1")
+        cache.put('intent', "c", None, "v1", "C")
+        assert cache.get('intent', "a", None, "v1") == "A"
+        assert cache.get('intent', "b", None, "v1") is None
+        assert cache.stats()["evicted"] == 1
+    print("✅ 통과")
+
+
+def test_analysis_is_generated_once():
+    """같은 요트 분석은 다른 세션/표현이어도 모델을 한 번만 호출"""
+    print("🧪 요트 분석 캐시 테스트")
+    with temporary_shared_stores(prefix='llm_cache_chat_') as data_dir:
+        with open(os.path.join(data_dir, 'yacht_specifications.json'), 'w', encoding='utf-8') as f:
+            json.dump({"yachts": [{"id": "llm-cache-40", "name": "LLM Cache 40", "type": "racer"}]}, f)
+        store = CatalogStore(data_dir=data_dir, check_interval=0)
+
+        def make_chatbot():
+            chatbot = UnifiedYachtChatbot(mode="api", catalog_store=store)
+            chatbot.model = StandInModel()
+            chatbot.has_gemini = True
+            return chatbot
+
+        first, second = make_chatbot(), make_chatbot()
+        answer = first.chat("LLM Cache 40 분석해줘")
+        assert "모델 응답 1" in answer
+        assert second.chat("llm cache 40 상세 분석 부탁해") == answer
+        assert (first.model.calls, second.model.calls) == (1, 0)
+        assert llm_cache._shared_cache.db_path.startswith(data_dir)
+    print("✅ 통과")
+
+
+if __name__ == "__main__":
+    test_normalized_key_and_version()
+    test_ttl_and_eviction()
+    test_analysis_is_generated_once()
@@ -0,0 +1,173 @@
+"""
+매뉴얼 분할 분석 테스트 스크립트
+API 키 없이 manual_analysis 모듈과 챗봇 분석 경로 테스트
+"""
+
+import os
+import json
+import time
+import tempfile
+import threading
+
+import document_cache
+import manual_analysis
+from document_cache import DocumentAnalysisCache
+from manual_analysis import analyze_chunks, merge_analysis_results, split_manual_text
+
+
+def test_split_on_section_boundaries():
+    """조각은 max_chars 이하, 섹션 제목 앞에서 자름"""
+    print("🧪 본문 분할 테스트")
+    sections = []
+    for number in range(1, 9):
+        body = "\n".join(f"Line {i} of section {number} with some text." for i in range(12))
+        sections.append(f"{number}. SECTION {number}\n{body}")
+    text = "\n\n".join(sections)
+
+    chunks = split_manual_text(text, max_chars=1200)
+    assert len(chunks) > 1
+    assert all(len(chunk) <= 1200 for chunk in chunks)
+    assert all(chunk.splitlines()[0].endswith(f"SECTION {chunk[0]}") for chunk in chunks)
+    # 내용 손실 없음
+    assert [line for chunk in chunks for line in chunk.splitlines() if line.strip()] == \
+           [line for line in text.splitlines() if line.strip()]
+
+    assert split_manual_text("short manual", max_chars=1200) == ["short manual"]
+    assert split_manual_text("x" * 2500, max_chars=1000) == ["x" * 1000, "x" * 1000, "x" * 500]
+    print("✅ 통과")
+
+
+def test_merge_dedupes_by_id_and_confidence():
+    """id 기준 병합, 값이 다르면 _confidence_* 높은 쪽 채택"""
+    print("🧪 부분 결과 병합 테스트")
+    first = {
+        "documentInfo": {"yachtName": "Farr 40", "manufacturer": None},
+        "detailedDimensions": {"LOA": "12.4m", "_confidence_LOA": "low"},
+        "parts": [{"id": "deck-winch-01", "name": "Winch", "specifications": {"model": None}}],
+    }
+    second = {
+        "documentInfo": {"yachtName": "Farr 40", "manufacturer": "Farr Yacht Design"},
+        "detailedDimensions": {"LOA": "12.41m", "_confidence_LOA": "high", "beam": "4.02m"},
+        "parts": [
+            {"id": "deck-winch-01", "name": "Winch", "specifications": {"model": "Harken 46"}},
+            {"id": "ext-hull-01", "name": "Hull"},
+        ],
+        "maintenance": ["Check keel bolts"],
+    }
+    failed = {"error": "JSON 파싱 실패", "rawResponse": "..."}
+
+    merged = merge_analysis_results([first, failed, second, {"maintenance": ["Check keel bolts"]}])
+    assert merged["documentInfo"] == {"yachtName": "Farr 40", "manufacturer": "Farr Yacht Design"}
+    assert merged["detailedDimensions"] == {"LOA": "12.41m", "_confidence_LOA": "high", "beam": "4.02m"}
+    assert [p["id"] for p in merged["parts"]] == ["deck-winch-01", "ext-hull-01"]
+    assert merged["parts"][0]["specifications"] == {"model": "Harken 46"}
+    assert merged["maintenance"] == ["Check keel bolts"]
+    assert "error" not in merged and "rawResponse" not in merged
+
+    # 신뢰도가 같거나 낮으면 앞 조각 유지
+    kept = merge_analysis_results([
+        {"engine": {"power": "27HP", "_confidence_power": "high"}},
+        {"engine": {"power": "30HP", "_confidence_power": "medium"}},
+    ])
+    assert kept["engine"] == {"power": "27HP", "_confidence_power": "high"}
+    assert merge_analysis_results([failed]) == {}
+    print("✅ 통과")
+
+
+def test_analyze_chunks_bounded_parallelism():
+    """동시 분석 수 제한, 결과 순서 유지, 예외는 error로 변환"""
+    print("🧪 조각 동시 분석 테스트")
+    active = []
+    peak = []
+    lock = threading.Lock()
+
+    def analyze(chunk):
+        with lock:
+            active.append(chunk)
+            peak.append(len(active))
+        time.sleep(0.05)
+        with lock:
+            active.remove(chunk)
+        if chunk == "bad":
+            raise ValueError("boom")
+        return {"chunk": chunk}
+
+    chunks = ["a", "b", "bad", "c", "d", "e"]
+    results = analyze_chunks(chunks, analyze, workers=3)
+
+    assert [r.get("chunk") for r in results] == ["a", "b", None, "c", "d", "e"]
+    assert results[2] == {"error": "boom"}
+    # 동시에 실행되되 workers개를 넘지 않음
+    assert 1 < max(peak) <= 3
+    print("✅ 통과")
+
+
+class ChunkModel:
+    """조각 내용에 따라 다른 부분 결과를 돌려주는 로컬 모델"""
+
+    def __init__(self):
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def generate_content(self, prompt):
+        with self._lock:
+            self.calls += 1
+        result = {"documentInfo": {"yachtName": "Farr 40"}, "parts": []}
+        if "ENGINE SECTION" in prompt:
+            result["parts"].append({"id": "eng-main-01", "name": "Engine", "_confidence_name": "high"})
+        if "RIGGING SECTION" in prompt:
+            result["parts"].append({"id": "rig-mast-01", "name": "Mast"})
+        response = type('Response', (), {})()
+        response.text = json.dumps(result)
+        return response
+
+
+def test_chatbot_analyzes_whole_manual():
+    """긴 매뉴얼은 조각별로 분석해 뒤쪽 섹션 부품까지 포함"""
+    print("🧪 챗봇 분할 분석 테스트")
+    import chatbot_unified
+    from yacht_catalog import CatalogStore
+
+    work_dir = tempfile.mkdtemp(prefix='manual_analysis_')
+    version = chatbot_unified.DOCUMENT_ANALYSIS_PROMPT_VERSION
+    document_cache._shared_analysis_caches[version] = DocumentAnalysisCache(
+        version, cache_dir=os.path.join(work_dir, 'cache'), max_bytes=1024 * 1024, mode='readwrite'
+    )
+    chunk_chars = manual_analysis.DEFAULT_CHUNK_CHARS
+    manual_analysis.DEFAULT_CHUNK_CHARS = 2000
+    try:
+        chatbot = chatbot_unified.UnifiedYachtChatbot(
+            mode="cli", catalog_store=CatalogStore(data_dir=work_dir, check_interval=0)
+        )
+        chatbot.model = ChunkModel()
+        chatbot.has_gemini = True
+
+        manual = os.path.join(work_dir, 'manual.pdf')
+        with open(manual, 'wb') as f:
+            f.write(b'%PDF-1.4')
+
+        filler = "\n".join(f"General information line {i}." for i in range(60))
+        text = f"1. ENGINE SECTION\n{filler}\n\n2. RIGGING SECTION\n{filler}"
+        result = chatbot._analyze_document_directly(manual, text)
+
+        assert "error" not in result
+        assert [p["id"] for p in result["parts"]] == ["eng-main-01", "rig-mast-01"]
+        assert result["analysisChunks"]["failed"] == 0
+        assert result["analysisChunks"]["total"] == chatbot.model.calls > 1
+        assert result["fileInfo"]["fileName"] == "manual.pdf"
+
+        # 조각별 결과가 캐시되어 다시 분석하면 모델을 호출하지 않음
+        calls = chatbot.model.calls
+        assert chatbot._analyze_document_directly(manual, text)["parts"] == result["parts"]
+        assert chatbot.model.calls == calls
+    finally:
+        manual_analysis.DEFAULT_CHUNK_CHARS = chunk_chars
+        document_cache._shared_analysis_caches.pop(version, None)
+    print("✅ 통과")
+
+
+if __name__ == "__main__":
+    test_split_on_section_boundaries()
+    test_merge_dedupes_by_id_and_confidence()
+    test_analyze_chunks_bounded_parallelism()
+    test_chatbot_analyzes_whole_manual()
@@ -0,0 +1,246 @@
+"""
+Notion 동기화 엔진 테스트 스크립트
+로컬 HTTP 스텁 서버로 전체 페이지 읽기, 해시 비교, 429 재시도, 생성 중복 방지, 병렬 upsert 확인
+"""
+
+import json
+import threading
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from notion_sync import NotionClient, NotionError, NotionSyncEngine, RateLimiter, properties_hash, property_value
+from update_notion import part_properties
+
+
+class NotionStub:
+    """Notion API 흉내 (databases/{id}/query, pages 생성/수정, 지정 횟수만큼 429 / 생성 후 500)"""
+
+    def __init__(self, page_size=100, rate_limited=0, failed_creates=0):
+        self.pages = {}
+        self.page_size = page_size
+        self.rate_limited = rate_limited
+        self.failed_creates = failed_creates
+        self.calls = {"query": 0, "create": 0, "update": 0}
+        self.lock = threading.Lock()
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def do_POST(self):
+                stub.handle(self, 'POST')
+
+            def do_PATCH(self):
+                stub.handle(self, 'PATCH')
+
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}/v1"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def add(self, properties):
+        """Notion이 돌려주는 형태 (type, plain_text 포함)로 페이지 저장"""
+        page_id = str(uuid.uuid4())
+        self.pages[page_id] = {"id": page_id, "archived": False, "properties": _as_response(properties)}
+        return page_id
+
+    def handle(self, request, method):
+        body = json.loads(request.rfile.read(int(request.headers.get('Content-Length', 0))) or b'{}')
+        with self.lock:
+            if self.rate_limited:
+                self.rate_limited -= 1
+                return self.reply(request, 429, {"code": "rate_limited"}, {"Retry-After": "0"})
+            path = request.path[len('/v1/'):]
+            if method == 'POST' and path.endswith('/query'):
+                self.calls["query"] += 1
+                ids = [i for i in self.pages if _matches(self.pages[i], body.get('filter'))]  # 생성 순서
+                start = ids.index(body['start_cursor']) if body.get('start_cursor') else 0
+                size = min(body.get('page_size', 100), self.page_size)
+                chunk = ids[start:start + size]
+                more = start + size < len(ids)
+                return self.reply(request, 200, {"results": [self.pages[i] for i in chunk], "has_more": more,
+                                                 "next_cursor": ids[start + size] if more else None})
+            if method == 'POST' and path == 'pages':
+                self.calls["create"] += 1
+                page_id = self.add(body['properties'])
+                if self.failed_creates:
+                    # 만들어 놓고 응답만 실패 (게이트웨이 오류 등)
+                    self.failed_creates -= 1
+                    return self.reply(request, 500, {"code": "internal_server_error"})
+                return self.reply(request, 200, self.pages[page_id])
+            page = self.pages.get(path[len('pages/'):])
+            if page is None:
+                return self.reply(request, 404, {"code": "object_not_found"})
+            self.calls["update"] += 1
+            if body.get('archived'):
+                page['archived'] = True
+            page['properties'].update(_as_response(body.get('properties', {})))
+            return self.reply(request, 200, page)
+
+    def reply(self, request, status, body, headers=None):
+        data = json.dumps(body).encode('utf-8')
+        request.send_response(status)
+        for name, value in (headers or {}).items():
+            request.send_header(name, value)
+        request.send_header('Content-Type', 'application/json')
+        request.send_header('Content-Length', str(len(data)))
+        request.end_headers()
+        request.wfile.write(data)
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+def _as_response(properties):
+    response = {}
+    for name, prop in properties.items():
+        prop = json.loads(json.dumps(prop))
+        kind = next(iter(prop))
+        if kind in ('title', 'rich_text'):
+            prop[kind] = [dict(item, plain_text=item['text']['content'], annotations={})
+                          for item in prop[kind] if item['text']['content']]
+        response[name] = dict(prop, id=name[:4], type=kind)
+    return response
+
+
+def _matches(page, filter):
+    """equals 조건 (and로 묶인 것 포함)만 지원"""
+    if not filter:
+        return True
+    conditions = filter.get('and', [filter])
+    return all(property_value(page['properties'].get(condition['property'])) ==
+               next(value['equals'] for kind, value in condition.items() if kind != 'property')
+               for condition in conditions)
+
+
+def _record(index, model='A'):
+    return {
+        'ID': {'rich_text': [{'text': {'content': f'yacht-{index:03d}'}}]},
+        'Name': {'title': [{'text': {'content': f'Yacht {index}'}}]},
+        'Model': {'rich_text': [{'text': {'content': model}}]},
+        'LOA (m)': {'number': 12.0},
+    }
+
+
+def _engine(stub, **kwargs):
+    client = NotionClient('test-key', base_url=stub.url, rate_per_second=0, sleep=lambda seconds: None)
+    return NotionSyncEngine(client, 'db', key=('ID',), **kwargs)
+
+
+def test_full_read_past_first_page():
+    """100개 넘는 데이터베이스도 끝까지 읽어 중복 생성하지 않음"""
+    print("🧪 전체 페이지 읽기 테스트")
+    stub = NotionStub(page_size=100)
+    try:
+        for index in range(250):
+            stub.add(_record(index))
+        engine = _engine(stub, workers=4)
+        stats = engine.sync([_record(index) for index in range(260)])
+        assert stub.calls["query"] == 3
+        assert (stats["created"], stats["updated"], stats["unchanged"]) == (10, 0, 250)
+        assert len(stub.pages) == 260
+    finally:
+        stub.close()
+    print("✅ 통과")
+
+
+def test_hash_diff_updates_only_changed_pages():
+    """바뀐 페이지만 수정, 중복/사라진 페이지는 prune에서 아카이브"""
+    print("🧪 해시 비교 테스트")
+    stub = NotionStub()
+    try:
+        for index in range(5):
+            stub.add(_record(index))
+        duplicate = stub.add(_record(0))
+        records = [_record(index, model='B' if index == 2 else 'A') for index in range(4)]
+        assert properties_hash(_record(0)) == properties_hash(_as_response(_record(0)), _record(0))
+
+        stats = _engine(stub).sync(records, prune=True)
+        assert (stats["updated"], stats["unchanged"], stats["archived"]) == (1, 3, 2)
+        assert stub.pages[duplicate]["archived"]
+        assert stub.calls == {"query": 1, "create": 0, "update": 3}
+
+        # 다시 실행하면 쓰기 없음
+        stats = _engine(stub).sync(records)
+        assert (stats["created"], stats["updated"], stats["unchanged"]) == (0, 0, 4)
+        assert stub.calls["update"] == 3
+    finally:
+        stub.close()
+    print("✅ 통과")
+
+
+def test_rate_limited_requests_are_retried():
+    """429는 Retry-After 뒤 재시도, 4xx는 바로 NotionError"""
+    print("🧪 429 재시도 테스트")
+    stub = NotionStub(rate_limited=3)
+    try:
+        engine = _engine(stub)
+        stats = engine.sync([_record(index) for index in range(3)])
+        assert stats["created"] == 3 and stats["failed"] == 0
+        assert engine.client.stats()["rateLimited"] == 3
+
+        try:
+            engine.client.request('PATCH', 'pages/missing', {})
+            assert False, "NotionError가 발생해야 합니다"
+        except NotionError:
+            pass
+    finally:
+        stub.close()
+    print("✅ 통과")
+
+
+def test_failed_create_is_not_duplicated():
+    """생성 응답이 5xx면 다시 보내지 않고 키로 조회 → 이미 만들어진 페이지를 씀"""
+    print("🧪 생성 중복 방지 테스트")
+    stub = NotionStub(failed_creates=2)
+    try:
+        engine = _engine(stub)
+        stats = engine.sync([_record(index) for index in range(3)])
+        assert (stats["created"], stats["failed"]) == (3, 0)
+        assert stub.calls["create"] == 3 and len(stub.pages) == 3
+        assert engine.client.stats()["retries"] == 0
+    finally:
+        stub.close()
+    print("✅ 통과")
+
+
+def test_removed_interval_is_cleared():
+    """JSON에서 빠진 정비 주기는 None으로 보내 Notion 값도 지움"""
+    print("🧪 정비 주기 삭제 테스트")
+    stub = NotionStub()
+    try:
+        yacht = {"id": "farr-40", "name": "Farr 40"}
+        part = {"id": "part-engine-01", "name": "Engine", "category": "Engine", "interval": "12 months"}
+        engine = NotionSyncEngine(_engine(stub).client, 'db', key=('Yacht ID', 'Part ID'))
+        engine.sync([part_properties(yacht, part)])
+        page = next(iter(stub.pages.values()))
+        assert property_value(page["properties"]["Maintenance Interval"]) == 12
+
+        stats = engine.sync([part_properties(yacht, dict(part, interval=None))])
+        assert stats["updated"] == 1
+        assert property_value(page["properties"]["Maintenance Interval"]) is None
+        assert engine.sync([part_properties(yacht, dict(part, interval=None))])["unchanged"] == 1
+    finally:
+        stub.close()
+    print("✅ 통과")
+
+
+def test_rate_limiter_spaces_requests():
+    """초당 한도만큼 간격을 두고, pause 중에는 대기"""
+    print("🧪 요청 한도 테스트")
+    now = [0.0]
+    limiter = RateLimiter(4, clock=lambda: now[0], sleep=lambda seconds: None)
+    assert [limiter.acquire() for _ in range(3)] == [0.0, 0.25, 0.5]
+    limiter.pause(2.0)
+    assert limiter.acquire() == 2.0
+    print("✅ 통과")
+
+
+if __name__ == "__main__":
+    test_full_read_past_first_page()
+    test_hash_diff_updates_only_changed_pages()
+    test_rate_limited_requests_are_retried()
+    test_failed_create_is_not_duplicated()
+    test_removed_interval_is_cleared()
+    test_rate_limiter_spaces_requests()
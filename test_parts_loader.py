@@ -0,0 +1,104 @@
+"""
+부품/정비 항목 일괄 적재 테스트 스크립트
+MySQL 대신 SQLite 연결로 두 JSON 병합, 요트 단위 교체, 인덱스 조회 확인
+"""
+
+import sqlite3
+
+from parts_loader import PartsLoader, build_rows
+
+
+APP_DATA = {"yachts": [
+    {"id": "farr-40", "name": "Farr 40", "parts": [
+        {"id": "part-engine-01", "name": "Engine", "category": "Engine", "interval": 12},
+        {"id": "part-winch-01", "name": "Primary Winch", "category": "Deck", "interval": None},
+        {"name": "Impeller", "category": "Engine", "maintenanceInterval": 6, "model": "JMP 1"},
+    ]},
+]}
+
+PARTS_DATABASE = {"yachts": [
+    {"id": "farr-40", "name": "Farr 40", "parts": [
+        {"id": "part-engine-01", "name": "Engine", "category": "Engine", "manufacturer": "Volvo Penta",
+         "model": "D1-30", "specifications": {"power": "29hp"}, "interval": None,
+         "maintenanceDetails": {"oil": "매 100시간"}},
+        {"id": "part-winch-01", "name": "Primary Winch", "category": "Deck", "manufacturer": "Harken"},
+    ]},
+    {"id": "swan-41", "name": "Swan 41", "parts": {
+        "rigging": {
+            "physicalParts": [{"id": "part-mast-01", "name": "Mast"}],
+            "maintenanceItems": [{"name": "Rig Inspection", "interval": "24 months"}],
+        },
+    }},
+]}
+
+
+def _loader():
+    conn = sqlite3.connect(':memory:')
+    loader = PartsLoader(conn, batch_size=2)
+    loader.ensure_tables()
+    return conn, loader
+
+
+def test_build_rows_merges_both_files():
+    """부품 DB 사양 + 앱 데이터 주기 병합, ID 없는 부품과 카테고리 dict 형식 처리"""
+    print("🧪 JSON 병합 테스트")
+    rows = build_rows(APP_DATA, PARTS_DATABASE)
+    parts = {row[1]: row for row in rows["farr-40"]["parts"]}
+    assert set(parts) == {"part-engine-01", "part-winch-01", "part-impeller"}
+    engine = parts["part-engine-01"]
+    assert engine[4:7] == ("Volvo Penta", "D1-30", 12)
+    assert '"power":"29hp"' in engine[7]
+    assert parts["part-impeller"][6] == 6
+
+    maintenance = {row[2]: row for row in rows["farr-40"]["maintenance"]}
+    assert set(maintenance) == {"Engine", "Impeller"}
+    assert "매 100시간" in maintenance["Engine"][5]
+
+    swan = rows["swan-41"]
+    assert [(row[1], row[3]) for row in swan["parts"]] == [("part-mast-01", "rigging")]
+    assert [(row[2], row[4]) for row in swan["maintenance"]] == [("Rig Inspection", 24)]
+    print("✅ 통과")
+
+
+def test_load_replaces_per_yacht():
+    """다시 적재해도 중복 없음, 지정한 요트만 교체"""
+    print("🧪 요트 단위 교체 테스트")
+    conn, loader = _loader()
+    stats = loader.load(APP_DATA, PARTS_DATABASE)
+    assert stats == {"yachts": 2, "parts": 4, "maintenanceItems": 3}
+    loader.load(APP_DATA, PARTS_DATABASE)
+    assert conn.execute("SELECT COUNT(*) FROM part").fetchone()[0] == 4
+
+    # farr-40만 다시 적재 (부품 하나 제거) → swan-41은 그대로
+    trimmed = {"yachts": [dict(APP_DATA["yachts"][0], parts=APP_DATA["yachts"][0]["parts"][:1])]}
+    loader.load(trimmed, {"yachts": []}, yacht_ids=["farr-40"])
+    counts = dict(conn.execute("SELECT yacht_id, COUNT(*) FROM part GROUP BY yacht_id").fetchall())
+    assert counts == {"farr-40": 1, "swan-41": 1}
+
+    # 정비 주기 인덱스로 조회
+    plan = conn.execute("EXPLAIN QUERY PLAN SELECT * FROM maintenance_item "
+                        "WHERE yacht_id = ? AND interval_months <= ?", ("swan-41", 24)).fetchall()
+    assert any("idx_maintenance_yacht_interval" in row[-1] for row in plan)
+    print("✅ 통과")
+
+
+def test_failed_load_rolls_back():
+    """적재 중 오류가 나면 기존 행 유지"""
+    print("🧪 롤백 테스트")
+    conn, loader = _loader()
+    loader.load(APP_DATA, PARTS_DATABASE)
+    conn.execute("DROP TABLE maintenance_item")
+    conn.execute("CREATE TABLE maintenance_item (yacht_id TEXT)")  # 컬럼이 맞지 않음 → INSERT 실패
+    try:
+        loader.load(APP_DATA, PARTS_DATABASE)
+        assert False, "적재가 실패해야 합니다"
+    except sqlite3.OperationalError:
+        pass
+    assert conn.execute("SELECT COUNT(*) FROM part").fetchone()[0] == 4
+    print("✅ 통과")
+
+
+if __name__ == "__main__":
+    test_build_rows_merges_both_files()
+    test_load_replaces_per_yacht()
+    test_failed_load_rolls_back()
@@ -0,0 +1,105 @@
+"""
+PDF 텍스트 추출 엔진 테스트 스크립트
+PDF 라이브러리 대신 가짜 리더로 페이지 단위 추출 규칙 확인
+"""
+
+import types
+import tempfile
+
+import pdf_extraction
+
+
+class FakePage:
+    def __init__(self, text):
+        self.text = text
+
+    def extract_text(self):
+        return self.text
+
+
+def _install_fake_readers(pypdf2_pages, plumber_pages):
+    """PyPDF2 / pdfplumber를 페이지 텍스트 목록을 돌려주는 가짜 모듈로 교체"""
+    class FakeReader:
+        def __init__(self, file):
+            self.pages = [FakePage(text) for text in pypdf2_pages]
+
+    class FakePdf:
+        pages = [FakePage(text) for text in plumber_pages]
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            return False
+
+    pdf_extraction.PyPDF2 = types.SimpleNamespace(PdfReader=FakeReader)
+    pdf_extraction.pdfplumber = types.SimpleNamespace(open=lambda path: FakePdf())
+    pdf_extraction.HAS_PYPDF2 = True
+    pdf_extraction.HAS_PDFPLUMBER = True
+
+
+def test_per_page_fallback():
+    """PyPDF2 결과가 부족한 페이지만 pdfplumber 결과로 교체"""
+    print("🧪 페이지 단위 추출 테스트")
+    pdf_path = tempfile.mkstemp(suffix='.pdf')[1]
+    saved = (getattr(pdf_extraction, 'PyPDF2', None), getattr(pdf_extraction, 'pdfplumber', None),
+             pdf_extraction.HAS_PYPDF2, pdf_extraction.HAS_PDFPLUMBER)
+    try:
+        _install_fake_readers(
+            pypdf2_pages=["Engine maintenance every 200 hours", "", "x", "Rigging check before each race"],
+            plumber_pages=["ignored", "Sail plan and deck layout", "", "ignored"],
+        )
+        pages = pdf_extraction.extract_pdf_pages(pdf_path, workers=1)
+        assert pages == ["Engine maintenance every 200 hours", "Sail plan and deck layout",
+                         "x", "Rigging check before each race"]
+        assert pdf_extraction.join_pages(["a", "", "b"]) == "a\nb\n"
+    finally:
+        (pdf_extraction.PyPDF2, pdf_extraction.pdfplumber,
+         pdf_extraction.HAS_PYPDF2, pdf_extraction.HAS_PDFPLUMBER) = saved
+    print("✅ 통과")
+
+
+def test_shard_ranges_cover_all_pages():
+    """페이지 범위 분할이 빠짐없이 순서대로 모든 페이지를 포함"""
+    print("🧪 페이지 범위 분할 테스트")
+    for page_count in (1, 16, 17, 200, 333):
+        for workers in (1, 2, 8):
+            ranges = pdf_extraction._shard_ranges(page_count, workers)
+            covered = [page for start, end in ranges for page in range(start, end)]
+            assert covered == list(range(page_count))
+            assert all(end - start >= pdf_extraction.MIN_PAGES_PER_SHARD or end == page_count
+                       for start, end in ranges)
+    print("✅ 통과")
+
+
+def test_ocr_only_empty_pages():
+    """텍스트 레이어가 비어 있는 페이지만 OCR하고 결과를 제자리에 합침"""
+    print("🧪 빈 페이지 OCR 테스트")
+    pages = ["Engine maintenance every 200 hours", "", "12", "Rigging check before each race"]
+    assert pdf_extraction.find_empty_pages(pages) == [1, 2]
+
+    requested = []
+
+    def fake_ocr(pdf_path, page_numbers, dpi=None, max_pages=None):
+        requested.extend(page_numbers)
+        return {page_num: f"scanned page {page_num + 1} wiring diagram" for page_num in page_numbers}
+
+    original = pdf_extraction.ocr_pdf_pages
+    pdf_extraction.ocr_pdf_pages = fake_ocr
+    try:
+        text = pdf_extraction.extract_pdf_text_with_ocr("manual.pdf", pages)
+    finally:
+        pdf_extraction.ocr_pdf_pages = original
+
+    assert requested == [1, 2]
+    assert text.split("\n")[:4] == ["Engine maintenance every 200 hours",
+                                     "scanned page 2 wiring diagram",
+                                     "scanned page 3 wiring diagram",
+                                     "Rigging check before each race"]
+    print("✅ 통과")
+
+
+if __name__ == "__main__":
+    test_per_page_fallback()
+    test_shard_ranges_cover_all_pages()
+    test_ocr_only_empty_pages()
@@ -0,0 +1,94 @@
+"""
+검색 인덱스 테스트 스크립트
+API 키나 서버 없이 search_index 모듈만 테스트
+"""
+
+import os
+import tempfile
+
+from search_index import KIND_MANUAL, SearchIndex, query_terms, split_chunks
+from yacht_catalog import YachtCatalog
+
+
+def _make_catalog():
+    yacht_data = {"yachts": [
+        {"id": "j-70", "name": "J/70", "manufacturer": "J Boats",
+         "yachtSpecs": {"standard": {"dimensions": {"LOA": "6.93m", "Beam": "2.25m"},
+                                     "engine": {"type": "Outboard", "power": "4HP"}}}},
+        {"id": "farr-40", "name": "Farr 40", "manufacturer": "Farr",
+         "yachtSpecs": {"standard": {"dimensions": {"LOA": "12.41m"},
+                                     "engine": {"type": "Inboard", "power": "27HP"}}}},
+    ]}
+    parts_data = {"yachts": [
+        {"id": "farr-40", "name": "Farr 40", "parts": [
+            {"id": "part-pump-01", "name": "Bilge Pump", "category": "Plumbing", "interval": 6}
+        ]}
+    ]}
+    return YachtCatalog(yacht_data, parts_data, signature=(('test', 1, 1),))
+
+
+def _make_index():
+    return SearchIndex(os.path.join(tempfile.mkdtemp(prefix='search_index_'), 'search.db'))
+
+
+def test_query_terms():
+    """질문 → 검색어 (조사 제거, 한국어 용어 → 영문 검색어)"""
+    print("🧪 검색어 변환 테스트")
+    terms = query_terms("Farr 40 엔진은 몇 마력이야?")
+    assert "farr" in terms and "40" in terms
+    assert "엔진" in terms and "engine" in terms
+    assert query_terms("   ") == []
+    # 조사로 끝나는 용어는 자르지 않음 ("길이" ≠ "길" + "이")
+    assert query_terms("길이") == ["length", "loa", "길이"]
+    assert query_terms("길이가 얼마야")[:3] == ["length", "loa", "길이"]
+    print("✅ 통과")
+
+
+def test_search_catalog():
+    """요트 스펙/부품 검색, 요트 한정 검색"""
+    print("🧪 카탈로그 검색 테스트")
+    index = _make_index()
+    catalog = _make_catalog()
+    assert index.index_catalog(catalog) is True
+    assert index.index_catalog(catalog) is False
+
+    results = index.search("엔진 출력", yacht_id="farr-40")
+    assert results and all(r["yachtId"] == "farr-40" for r in results)
+    assert "27HP" in results[0]["text"]
+
+    results = index.search("bilge pump")
+    assert results[0]["kind"] == "part"
+    assert "Bilge Pump" in results[0]["text"]
+
+    context = index.build_context("J/70 dimensions", yacht_id="j-70", max_chars=2000)
+    assert context.startswith("[J/70")
+    assert "6.93m" in context
+    assert len(context) <= 2000
+    assert index.search("?!") == []
+    print("✅ 통과")
+
+
+def test_index_manual():
+    """매뉴얼 본문 색인 (같은 본문은 한 번만, 새 본문은 교체)"""
+    print("🧪 매뉴얼 색인 테스트")
+    index = _make_index()
+    manual = "\n".join(f"Section {i}: check the keel bolts every season." for i in range(100))
+
+    chunks = index.index_manual("j-70", "J/70", manual)
+    assert chunks == len(split_chunks(manual.splitlines()))
+    assert chunks > 1
+    assert index.index_manual("j-70", "J/70", manual) == 0
+
+    results = index.search("keel bolts", yacht_id="j-70")
+    assert results and results[0]["kind"] == KIND_MANUAL
+
+    index.index_manual("j-70", "J/70", "Rig tuning guide: shroud tension.")
+    assert index.count(KIND_MANUAL) == 1
+    assert index.search("keel bolts") == []
+    print("✅ 통과")
+
+
+if __name__ == "__main__":
+    test_query_terms()
+    test_search_catalog()
+    test_index_manual()
@@ -0,0 +1,110 @@
+"""
+챗봇 세션 저장소 테스트 스크립트
+API 키 없이 가짜 챗봇으로 LRU/TTL/기록 내려쓰기 동작 확인
+"""
+
+import os
+import time
+import tempfile
+
+from session_store import SessionStore
+
+
+class FakeChatbot:
+    """chat_history만 가진 테스트용 챗봇"""
+
+    def __init__(self):
+        self.chat_history = []
+
+    def chat(self, message):
+        self.chat_history.append({"role": "user", "content": message})
+        self.chat_history.append({"role": "assistant", "content": f"echo: {message}"})
+        return f"echo: {message}"
+
+    def get_history(self):
+        return self.chat_history
+
+    def clear_history(self):
+        self.chat_history = []
+
+
+def _make_store(**kwargs):
+    spill_path = os.path.join(tempfile.mkdtemp(prefix='session_store_'), 'sessions.db')
+    return SessionStore(FakeChatbot, spill_path=spill_path, **kwargs)
+
+
+def test_lru_eviction_spills_history():
+    """최대 세션 수 초과 시 오래된 세션 제거 후 기록은 조회 가능"""
+    print("🧪 LRU 제거 + 기록 내려쓰기 테스트")
+    store = _make_store(max_sessions=2)
+
+    store.get('a').chat('안녕')
+    store.get('b').chat('Farr 40 크기')
+    store.get('c').chat('TP52 정보')
+
+    assert len(store) == 2
+    assert 'a' not in store
+    assert [m['content'] for m in store.get_history('a')] == ['안녕', 'echo: 안녕']
+
+    # 같은 session_id로 돌아오면 기록 복원
+    restored = store.get('a')
+    assert len(restored.chat_history) == 2
+    print("✅ 통과")
+
+
+def test_idle_ttl_and_history_cap():
+    """유휴 세션 만료 및 대화 기록 개수 제한"""
+    print("🧪 유휴 만료 + 기록 제한 테스트")
+    store = _make_store(idle_ttl=0.05, max_history=4)
+
+    chatbot = store.get('a')
+    for i in range(5):
+        chatbot.chat(f"질문 {i}")
+    assert len(store.get('a').chat_history) == 4
+
+    time.sleep(0.1)
+    store.get('b')
+    assert 'a' not in store
+    assert len(store.get_history('a')) == 4
+    print("✅ 통과")
+
+
+def test_clear_removes_spilled_history():
+    """기록 초기화 시 내려쓴 기록도 삭제"""
+    print("🧪 기록 초기화 테스트")
+    store = _make_store(max_sessions=1)
+
+    store.get('a').chat('안녕')
+    store.get('b')
+    store.clear('a')
+
+    assert store.get_history('a') == []
+    print("✅ 통과")
+
+
+def test_shared_sessions_across_processes():
+    """공유 모드: 같은 SQLite 파일을 쓰는 다른 작업자 프로세스의 대화를 이어감"""
+    print("🧪 작업자 간 세션 공유 테스트")
+    spill_path = os.path.join(tempfile.mkdtemp(prefix='session_store_'), 'sessions.db')
+    worker_a = SessionStore(FakeChatbot, spill_path=spill_path, shared=True)
+    worker_b = SessionStore(FakeChatbot, spill_path=spill_path, shared=True)
+
+    worker_a.get('s').chat('안녕')
+    worker_a.save('s')
+    worker_b.get('s').chat('Farr 40 크기')
+    worker_b.save('s')
+
+    # 작업자 A의 메모리 기록은 더 새 기록으로 교체
+    assert [m['content'] for m in worker_a.get('s').chat_history if m['role'] == 'user'] == \
+        ['안녕', 'Farr 40 크기']
+
+    worker_b.clear('s')
+    assert worker_a.get_history('s') == []
+    print("✅ 통과")
+
+
+if __name__ == "__main__":
+    test_lru_eviction_spills_history()
+    test_idle_ttl_and_history_cap()
+    test_clear_removes_spilled_history()
+    test_shared_sessions_across_processes()
@@ -0,0 +1,188 @@
+"""
+공유 요트 카탈로그 테스트 스크립트
+API 키나 서버 없이 yacht_catalog 모듈만 테스트
+"""
+
+import os
+import json
+import time
+import tempfile
+
+from yacht_catalog import LIST_CURSOR_TYPES, CatalogStore, YachtCatalog, decode_cursor, encode_cursor
+from yacht_name_matcher import YachtNameMatcher
+
+
+def _write_json(path, data):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False)
+
+
+def _make_data_dir():
+    data_dir = tempfile.mkdtemp(prefix='yacht_catalog_')
+    _write_json(os.path.join(data_dir, 'yacht_specifications.json'), {
+        "yachts": [{"id": "farr-40", "name": "Farr 40", "manufacturer": "Farr"}]
+    })
+    _write_json(os.path.join(data_dir, 'yacht_parts_app_data.json'), {
+        "yachts": [{"id": "farr-40", "name": "Farr 40", "parts": [
+            {"id": "part-engine-01", "name": "Engine", "category": "Engine", "interval": 12}
+        ]}]
+    })
+    return data_dir
+
+
+def test_catalog_shared_between_sessions():
+    """같은 저장소를 쓰는 세션은 같은 스냅샷을 참조"""
+    print("🧪 카탈로그 공유 테스트")
+    store = CatalogStore(data_dir=_make_data_dir(), check_interval=0)
+
+    first = store.get()
+    second = store.get()
+
+    assert first is second
+    assert [y['name'] for y in first.yachts] == ["Farr 40"]
+
+    calls = []
+    prompt = first.memo('system_prompt', lambda: calls.append(1) or "prompt")
+    prompt_again = first.memo('system_prompt', lambda: calls.append(1) or "prompt")
+    assert prompt == prompt_again == "prompt"
+    assert len(calls) == 1
+    print("✅ 통과")
+
+
+def test_catalog_reloads_when_json_changes():
+    """data/*.json이 바뀌면 새 스냅샷으로 교체"""
+    print("🧪 카탈로그 자동 갱신 테스트")
+    data_dir = _make_data_dir()
+    store = CatalogStore(data_dir=data_dir, check_interval=0)
+    before = store.get()
+
+    time.sleep(0.01)
+    _write_json(os.path.join(data_dir, 'yacht_specifications.json'), {
+        "yachts": [
+            {"id": "farr-40", "name": "Farr 40"},
+            {"id": "tp52", "name": "TP52"}
+        ]
+    })
+    after = store.get()
+
+    assert after is not before
+    assert after.version != before.version
+    assert len(after.yachts) == 2
+    # 기존 스냅샷은 그대로 유지 (다른 요청이 아직 쓰고 있을 수 있음)
+    assert len(before.yachts) == 1
+    print("✅ 통과")
+
+
+def test_catalog_keeps_snapshot_on_broken_json():
+    """쓰는 도중의 깨진 JSON은 무시하고 기존 스냅샷 유지"""
+    print("🧪 깨진 JSON 처리 테스트")
+    data_dir = _make_data_dir()
+    store = CatalogStore(data_dir=data_dir, check_interval=0)
+    before = store.get()
+
+    with open(os.path.join(data_dir, 'yacht_specifications.json'), 'w', encoding='utf-8') as f:
+        f.write('{"yachts": [')
+
+    assert store.get() is before
+    print("✅ 통과")
+
+
+def test_name_matcher():
+    """요트 이름 인덱스: 정규화, 별칭, 숫자/문자 서명"""
+    print("🧪 요트 이름 매칭 테스트")
+    matcher = YachtNameMatcher([
+        {"id": "j-70", "name": "J/70"},
+        {"id": "farr-40", "name": "Farr 40"},
+        {"id": "x35-one-design", "name": "X–35 One Design"},
+        {"id": "tp52", "name": "TP52"},
+    ])
+
+    assert matcher.match("j70 크기 알려줘") == "J/70"
+    assert matcher.match("FARR-40 정비 주기") == "Farr 40"
+    assert matcher.match("farr 요트 40피트") == "Farr 40"
+    assert matcher.match("x35 one design 정보") == "X–35 One Design"
+    assert matcher.match("tp52랑 j70 비교") == "J/70"
+    assert matcher.match_all("tp52랑 j70 비교") == ["J/70", "TP52"]
+    assert matcher.match("요트 목록 보여줘") is None
+    print("✅ 통과")
+
+
+def test_chatbot_name_index_follows_edits():
+    """CLI 챗봇 이름 인덱스: 길이가 같아도 이름이 바뀌면 다시 구축, 항목은 하나만 유지"""
+    print("🧪 CLI 챗봇 이름 인덱스 테스트")
+    import chatbot
+
+    yachts = [{"name": "Farr 40"}, {"name": "TP52"}]
+    assert chatbot.get_yacht_by_name("farr 40 크기", yachts) is yachts[0]
+    yachts[0] = {"name": "Melges 32"}
+    assert chatbot.get_yacht_by_name("farr 40 크기", yachts) is None
+    assert chatbot.get_yacht_by_name("melges 32 크기", yachts) is yachts[0]
+
+    other = [{"name": "J/70"}]
+    assert chatbot.get_yacht_by_name("j 70", other) is other[0]
+    assert chatbot._name_index_cache[0] == ("J/70",)
+    print("✅ 통과")
+
+
+def test_lookup_indexes():
+    """ID/이름 → 요트, ID → 부품 조회 인덱스"""
+    print("🧪 조회 인덱스 테스트")
+    catalog = CatalogStore(data_dir=_make_data_dir(), check_interval=0).get()
+
+    assert catalog.get_yacht("farr-40")["name"] == "Farr 40"
+    assert catalog.find_yacht("FARR 40") is catalog.get_yacht("farr-40")
+    assert catalog.find_yacht("farr-40") is catalog.get_yacht("farr-40")
+    assert catalog.get_yacht_id("Farr 40") == "farr-40"
+    assert catalog.find_yacht("TP52") is None
+
+    assert [p["name"] for p in catalog.get_parts("farr-40")] == ["Engine"]
+    assert catalog.get_parts_by_name("farr 40") is catalog.get_parts("farr-40")
+    assert list(catalog.get_parts_by_category("farr-40")) == ["Engine"]
+    assert catalog.get_parts("tp52") == []
+    print("✅ 통과")
+
+
+def test_keyset_pages():
+    """이름순 페이지를 커서로 이어 받으면 빠짐/중복 없이 전체, 접두어는 정규화 후 비교"""
+    print("🧪 keyset 페이지 테스트")
+    yachts = [{"id": f"yacht-{i}", "name": f"Model {i:03d}"} for i in range(25)]
+    yachts += [{"id": "farr-40", "name": "Farr 40"}, {"id": "farr-45", "name": "FARR-45"}]
+    catalog = YachtCatalog({"yachts": yachts}, {})
+
+    seen, after = [], None
+    while True:
+        page, last_key = catalog.list_page(10, after=after)
+        seen += [yacht["id"] for yacht in page]
+        if last_key is None:
+            break
+        after = decode_cursor(encode_cursor(list(last_key)))
+    assert len(seen) == len(set(seen)) == 27
+    assert seen[:2] == ["farr-40", "farr-45"]
+
+    page, last_key = catalog.list_page(1, prefix="farr 4")
+    assert [y["id"] for y in page] == ["farr-40"] and last_key is not None
+    page, last_key = catalog.list_page(1, after=last_key, prefix="farr 4")
+    assert [y["id"] for y in page] == ["farr-45"] and last_key is None
+    assert catalog.list_page(10, prefix="tp52") == ([], None)
+    assert (catalog.count_prefix("farr 4"), catalog.count_prefix("tp52"), catalog.count_prefix()) == (2, 0, 27)
+
+    # 개수/타입이 맞지 않는 커서는 ValueError (API에서 400)
+    for cursor in ("not-a-cursor", encode_cursor([1, 2]), encode_cursor(["farr40"]),
+                   encode_cursor(["farr40", "farr-40", "x"])):
+        try:
+            decode_cursor(cursor, types=LIST_CURSOR_TYPES)
+            assert False, "ValueError가 발생해야 합니다"
+        except ValueError:
+            pass
+    assert decode_cursor(encode_cursor(["2024-01-01", 7]), types=(str, int)) == ["2024-01-01", 7]
+    print("✅ 통과")
+
+
+if __name__ == "__main__":
+    test_catalog_shared_between_sessions()
+    test_catalog_reloads_when_json_changes()
+    test_catalog_keeps_snapshot_on_broken_json()
+    test_name_matcher()
+    test_chatbot_name_index_follows_edits()
+    test_lookup_indexes()
+    test_keyset_pages()
@@ -0,0 +1,126 @@
+"""
+요트 등록 저장소 테스트 스크립트
+임시 data 디렉토리에서 등록 로그 기록 → JSON 파일 반영 확인
+"""
+
+import os
+import json
+import sqlite3
+import tempfile
+import threading
+
+from yacht_store import YachtRegistrationStore, build_registration_record
+
+
+def _record(yacht_id, name, parts=()):
+    registration_data = {
+        "id": yacht_id,
+        "basicInfo": {"id": yacht_id, "name": name, "manufacturer": "Farr", "manual": f"{name}.pdf"},
+        "specifications": {},
+    }
+    analysis_result = {
+        "documentInfo": {"yachtName": name},
+        "parts": [{"name": part, "category": "engine", "interval": 12} for part in parts],
+        "fileInfo": {"fileName": f"{name}.pdf"},
+    }
+    return build_registration_record(yacht_id, registration_data, analysis_result,
+                                     {"dimensions": {"loa": {"value": 12.4, "unit": "m", "display": "12.4m"}}})
+
+
+def _load(data_dir, name):
+    with open(os.path.join(data_dir, name), 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def test_registrations_materialize_into_json_views():
+    """등록 로그가 JSON 파일 6개에 반영되고, 같은 요트는 스펙이 갱신됨"""
+    print("🧪 JSON 반영 테스트")
+    data_dir = tempfile.mkdtemp(prefix='yacht_store_')
+    store = YachtRegistrationStore(data_dir=data_dir)
+
+    store.record(_record("farr-40", "Farr 40", ["Engine", "Impeller"]))
+    store.record(_record("farr-40", "Farr 40", ["Impeller", "Alternator"]))
+    store.record(_record("tp52", "TP52"))
+    assert store.pending_count() == 3
+    assert not os.path.exists(os.path.join(data_dir, 'yacht_specifications.json'))
+
+    store.materialize()
+    assert store.pending_count() == 0
+
+    specs = _load(data_dir, 'yacht_specifications.json')
+    assert [y["id"] for y in specs["yachts"]] == ["farr-40", "tp52"]
+    assert specs["yachts"][0]["dimensions"]["loa"]["value"] == 12.4
+
+    registered = _load(data_dir, 'registered_yachts.json')
+    assert registered["totalYachts"] == 3
+
+    # 부품 없는 등록(tp52)은 부품 파일에 추가되지 않음
+    app_data = _load(data_dir, 'yacht_parts_app_data.json')
+    assert [y["id"] for y in app_data["yachts"]] == ["farr-40"]
+    assert len(app_data["yachts"][0]["parts"]) == 4
+
+    extracted = _load(data_dir, 'extracted_yacht_parts.json')
+    assert [p["name"] for p in extracted["yachts"][0]["parts"]] == ["Engine", "Impeller", "Alternator"]
+
+    database = _load(data_dir, 'yacht_parts_database.json')
+    engine_ids = [p["id"] for p in database["yachts"][0]["parts"]["engine"]["physicalParts"]]
+    assert engine_ids == ["farr-40-engine-01", "farr-40-engine-02", "farr-40-engine-03", "farr-40-engine-04"]
+
+    # 다시 반영해도 중복되지 않음
+    assert store.materialize() == 0
+    assert _load(data_dir, 'registered_yachts.json')["totalYachts"] == 3
+    print("✅ 통과")
+
+
+def test_interrupted_materialize_does_not_duplicate():
+    """JSON 파일은 교체했지만 view_state 커밋 전에 중단된 경우, 다시 반영해도 중복 없음"""
+    print("🧪 중단 후 재반영 테스트")
+    data_dir = tempfile.mkdtemp(prefix='yacht_store_')
+    store = YachtRegistrationStore(data_dir=data_dir)
+    store.record(_record("farr-40", "Farr 40", ["Engine"]))
+    store.materialize()
+    before = {name: _load(data_dir, name) for name in os.listdir(data_dir) if name.endswith('.json')}
+
+    # 파일 교체 후 view_state 기록 전에 프로세스가 죽은 상태
+    with sqlite3.connect(os.path.join(data_dir, 'registrations.db')) as conn:
+        conn.execute("UPDATE view_state SET last_seq = 0")
+    assert store.materialize() == 0
+    assert {name: _load(data_dir, name) for name in before} == before
+    assert store.pending_count() == 0
+
+    # 새 등록은 그대로 반영
+    store.record(_record("tp52", "TP52", ["Keel"]))
+    store.materialize()
+    assert [y["id"] for y in _load(data_dir, 'yacht_parts_app_data.json')["yachts"]] == ["farr-40", "tp52"]
+    assert _load(data_dir, 'registered_yachts.json')["totalYachts"] == 2
+    print("✅ 통과")
+
+
+def test_concurrent_registrations_are_not_lost():
+    """동시 등록이 서로의 변경을 덮어쓰지 않음"""
+    print("🧪 동시 등록 테스트")
+    data_dir = tempfile.mkdtemp(prefix='yacht_store_')
+    store = YachtRegistrationStore(data_dir=data_dir, materialize_delay=0.01)
+    reloads = []
+
+    def register(index):
+        store.record(_record(f"yacht-{index}", f"Yacht {index}", ["Engine"]))
+        store.schedule_materialize(on_done=lambda: reloads.append(1))
+
+    threads = [threading.Thread(target=register, args=(index,)) for index in range(20)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    store.flush()
+
+    assert len(_load(data_dir, 'yacht_specifications.json')["yachts"]) == 20
+    assert len(_load(data_dir, 'yacht_parts_app_data.json')["yachts"]) == 20
+    assert reloads
+    print("✅ 통과")
+
+
+if __name__ == "__main__":
+    test_registrations_materialize_into_json_views()
+    test_interrupted_materialize_does_not_duplicate()
+    test_concurrent_registrations_are_not_lost()
@@ -0,0 +1,143 @@
+"""
+요트 JSON → DB 증분 동기화 테스트 스크립트
+MySQL 대신 SQLite 연결로 지문 비교, 일괄 upsert, 롤백 확인
+"""
+
+import sqlite3
+
+from yacht_sync import SQLITE, YachtSyncEngine, row_fingerprint, yacht_row
+
+
+class CountingConnection:
+    """실행한 SQL 문 수를 세는 sqlite3 연결 래퍼"""
+
+    def __init__(self):
+        self.conn = sqlite3.connect(':memory:')
+        self.statements = 0
+
+    def cursor(self):
+        connection = self
+        cursor = self.conn.cursor()
+
+        class CountingCursor:
+            def execute(self, sql, params=()):
+                connection.statements += 1
+                return cursor.execute(sql, params)
+
+            def executemany(self, sql, rows):
+                connection.statements += 1
+                return cursor.executemany(sql, rows)
+
+            def fetchall(self):
+                return cursor.fetchall()
+
+            def close(self):
+                cursor.close()
+
+        return CountingCursor()
+
+    def commit(self):
+        self.conn.commit()
+
+    def rollback(self):
+        self.conn.rollback()
+
+
+def _make_connection():
+    connection = CountingConnection()
+    connection.conn.execute("""
+        CREATE TABLE yacht (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            yacht_id VARCHAR(100) UNIQUE,
+            name VARCHAR(255) NOT NULL,
+            manufacturer VARCHAR(255),
+            yacht_type VARCHAR(100),
+            length_overall DECIMAL(10, 2),
+            beam DECIMAL(10, 2),
+            draft DECIMAL(10, 2),
+            displacement DECIMAL(10, 2),
+            sail_area DECIMAL(10, 2),
+            engine_power VARCHAR(100),
+            manual_pdf VARCHAR(255)
+        )
+    """)
+    return connection
+
+
+def _fleet(count):
+    return [{"id": f"yacht-{i}", "name": f"Yacht {i}", "manufacturer": "Farr", "type": "racer",
+             "yachtSpecs": {"standard": {"dimensions": {"LOA": {"value": 12.0 + i}, "beam": "3.9m"},
+                                         "engine": {"power": 30}}}}
+            for i in range(count)]
+
+
+def test_row_normalization():
+    """치수 문자열/딕셔너리 정규화, ID나 이름이 없으면 제외"""
+    print("🧪 레코드 정규화 테스트")
+    row = yacht_row(_fleet(1)[0])
+    assert (row['length_overall'], row['beam'], row['engine_power']) == (12.0, 3.9, '30')
+    assert yacht_row({"name": "No ID"}) is None
+    assert row_fingerprint(row) == row_fingerprint(dict(row))
+    assert row_fingerprint(row) != row_fingerprint(dict(row, beam=4.0))
+    print("✅ 통과")
+
+
+def test_only_changed_rows_are_written():
+    """두 번째 동기화는 바뀐 요트만 쓰고, 쿼리 수는 요트 수와 무관"""
+    print("🧪 증분 동기화 테스트")
+    connection = _make_connection()
+    engine = YachtSyncEngine(connection, dialect=SQLITE, batch_size=100)
+    engine.ensure_state_table()
+
+    yachts = _fleet(250)
+    stats = engine.sync(yachts)
+    assert (stats["inserted"], stats["updated"], stats["unchanged"]) == (250, 0, 0)
+    assert connection.conn.execute("SELECT COUNT(*) FROM yacht").fetchone()[0] == 250
+
+    # 변경 없음 → 지문 조회 한 번만
+    connection.statements = 0
+    stats = engine.sync(yachts)
+    assert (stats["inserted"], stats["updated"], stats["unchanged"]) == (0, 0, 250)
+    assert connection.statements == 1
+
+    # 한 척 변경 + 한 척 추가 + 중복 ID
+    yachts[7]["manufacturer"] = "Farr Yacht Design"
+    yachts.append({"id": "yacht-new", "name": "New Yacht"})
+    yachts.append({"id": "yacht-new", "name": "New Yacht (중복)"})
+    connection.statements = 0
+    stats = engine.sync(yachts)
+    assert (stats["inserted"], stats["updated"], stats["unchanged"], stats["invalid"]) == (1, 1, 249, 1)
+    assert connection.statements == 3   # 지문 조회 + yacht upsert + 지문 upsert
+    assert connection.conn.execute(
+        "SELECT manufacturer FROM yacht WHERE yacht_id = 'yacht-7'").fetchone()[0] == "Farr Yacht Design"
+
+    # JSON에서 사라진 요트는 prune일 때만 삭제
+    stats = engine.sync(yachts[1:], prune=True)
+    assert stats["removed"] == 1
+    assert connection.conn.execute("SELECT COUNT(*) FROM yacht WHERE yacht_id = 'yacht-0'").fetchone()[0] == 0
+    print("✅ 통과")
+
+
+def test_failed_sync_rolls_back():
+    """일부 batch가 실패하면 전체 롤백 (지문도 남지 않음)"""
+    print("🧪 트랜잭션 롤백 테스트")
+    connection = _make_connection()
+    engine = YachtSyncEngine(connection, dialect=SQLITE, batch_size=2)
+    engine.ensure_state_table()
+    yachts = _fleet(5)
+    connection.conn.execute("CREATE TRIGGER reject_yacht_3 BEFORE INSERT ON yacht "
+                            "WHEN NEW.yacht_id = 'yacht-3' BEGIN SELECT RAISE(ABORT, 'rejected'); END")
+    try:
+        engine.sync(yachts)
+        assert False, "DatabaseError가 발생해야 합니다"
+    except sqlite3.DatabaseError:
+        pass
+    assert connection.conn.execute("SELECT COUNT(*) FROM yacht").fetchone()[0] == 0
+    assert engine.load_fingerprints() == {}
+    print("✅ 통과")
+
+
+if __name__ == "__main__":
+    test_row_normalization()
+    test_only_changed_rows_are_written()
+    test_failed_sync_rolls_back()
@@ -1,14 +1,22 @@
 # -*- coding: utf-8 -*-
 """
 Notion API를 사용하여 기존 Notion 데이터베이스 업데이트
+- notion_sync: 전체 페이지 읽기 (next_cursor), Session 재사용, 초당 요청 한도 + 429 재시도,
+  속성 해시 비교로 바뀐 페이지만 병렬 생성/수정
+
+사용법:
+    python update_notion.py            # 바뀐 요트/부품만 반영
+    python update_notion.py --prune    # JSON에 없는 페이지와 중복 페이지 아카이브
 """
 
 import sys
 import os
 import json
-import requests
 from datetime import datetime
 
+from notion_sync import NotionClient, NotionError, NotionSyncEngine
+from parts_loader import flatten_parts
+
 if sys.platform == 'win32':
     try:
         sys.stdout.reconfigure(encoding='utf-8')
@@ -17,7 +25,6 @@ if sys.platform == 'win32':
 
 # Notion API 설정
 NOTION_API_KEY = os.getenv('NOTION_API_KEY', '')
-NOTION_VERSION = '2022-06-28'
 
 # Notion 데이터베이스 ID (환경변수 또는 직접 입력)
 DATABASE_IDS = {
@@ -28,11 +35,7 @@ DATABASE_IDS = {
     'yacht_manual_resources': os.getenv('NOTION_DB_MANUALS', '')
 }
 
-headers = {
-    'Authorization': f'Bearer {NOTION_API_KEY}',
-    'Content-Type': 'application/json',
-    'Notion-Version': NOTION_VERSION
-}
+_client = None
 
 
 def check_notion_setup():
@@ -101,180 +104,141 @@ def check_notion_setup():
     return True
 
 
+def get_notion_client():
+    """공유 NotionClient (Session 재사용, 요청 한도/재시도 적용)"""
+    global _client
+    if _client is None:
+        _client = NotionClient(NOTION_API_KEY)
+    return _client
+
+
 def query_database(database_id):
-    """Notion 데이터베이스 조회"""
-    url = f'https://api.notion.com/v1/databases/{database_id}/query'
-    response = requests.post(url, headers=headers)
-    
-    if response.status_code == 200:
-        return response.json()
-    else:
-        print(f"❌ 조회 실패: {response.status_code}")
-        print(response.text)
+    """Notion 데이터베이스 전체 조회 (100개 넘는 페이지도 next_cursor로 끝까지 읽음)"""
+    try:
+        return {'results': get_notion_client().query_all(database_id), 'has_more': False}
+    except NotionError as e:
+        print(f"❌ 조회 실패: {e}")
         return None
 
 
 def create_page(database_id, properties):
     """Notion 페이지 생성"""
-    url = 'https://api.notion.com/v1/pages'
-    data = {
-        'parent': {'database_id': database_id},
-        'properties': properties
-    }
-    
-    response = requests.post(url, headers=headers, json=data)
-    
-    if response.status_code == 200:
-        return response.json()
-    else:
-        print(f"❌ 생성 실패: {response.status_code}")
-        print(response.text)
+    try:
+        return get_notion_client().create_page(database_id, properties)
+    except NotionError as e:
+        print(f"❌ 생성 실패: {e}")
         return None
 
 
 def update_page(page_id, properties):
     """Notion 페이지 업데이트"""
-    url = f'https://api.notion.com/v1/pages/{page_id}'
-    data = {'properties': properties}
-    
-    response = requests.patch(url, headers=headers, json=data)
-    
-    if response.status_code == 200:
-        return response.json()
-    else:
-        print(f"❌ 업데이트 실패: {response.status_code}")
-        print(response.text)
+    try:
+        return get_notion_client().update_page(page_id, properties)
+    except NotionError as e:
+        print(f"❌ 업데이트 실패: {e}")
         return None
 
 
 def delete_page(page_id):
     """Notion 페이지 삭제 (아카이브)"""
-    url = f'https://api.notion.com/v1/pages/{page_id}'
-    data = {'archived': True}
+    try:
+        return get_notion_client().archive_page(page_id)
+    except NotionError as e:
+        print(f"❌ 삭제 실패: {e}")
+        return None
+
+
+def _text(value):
+    return {'rich_text': [{'text': {'content': str(value or '')}}]}
+
+
+def yacht_properties(yacht):
+    """요트 JSON → yacht_specifications 데이터베이스 속성"""
+    specs = (yacht.get('yachtSpecs') or {}).get('standard') or {}
+    dims = specs.get('dimensions') or {}
+    sail = specs.get('sailArea') or {}
+    engine = specs.get('engine') or {}
+    
+    return {
+        'ID': _text(yacht.get('id', '')),
+        'Name': {'title': [{'text': {'content': yacht.get('name', '')}}]},
+        'Manufacturer': _text(yacht.get('manufacturer', '')),
+        'Type': {'select': {'name': yacht.get('type') or 'Unknown'}},
+        'LOA (m)': {'number': extract_number(dims.get('LOA', ''))},
+        'Beam (m)': {'number': extract_number(dims.get('Beam', ''))},
+        'Draft (m)': {'number': extract_number(dims.get('Draft', ''))},
+        'Displacement (kg)': {'number': extract_number(dims.get('Displacement', ''))},
+        'Main Sail (m²)': {'number': extract_number(sail.get('mainsail', ''))},
+        'Jib Sail (m²)': {'number': extract_number(sail.get('jib', ''))},
+        'Engine Type': _text(engine.get('type', '') if isinstance(engine, dict) else ''),
+        'Manual PDF': {'url': yacht.get('manualPDF', '') or None}
+    }
+
+
+def part_properties(yacht, part):
+    """부품 JSON → yacht_parts_database 데이터베이스 속성"""
+    properties = {
+        'Part ID': _text(part.get('id', '')),
+        'Part Name': {'title': [{'text': {'content': part.get('name', '')}}]},
+        'Yacht ID': _text(yacht.get('id', '')),
+        'Yacht Name': _text(yacht.get('name', '')),
+        'Category': {'select': {'name': part.get('category') or 'Unknown'}},
+        'Manufacturer': _text(part.get('manufacturer', '')),
+        'Model': _text(part.get('model', '')),
+    }
     
-    response = requests.patch(url, headers=headers, json=data)
+    # 주기가 없어도 항상 보냄 (JSON에서 빠진 주기는 None으로 지워야 해시 비교에도 잡힘)
+    properties['Maintenance Interval'] = {'number': extract_number(part.get('interval')) or None}
     
-    if response.status_code == 200:
-        return response.json()
-    else:
-        print(f"❌ 삭제 실패: {response.status_code}")
-        print(response.text)
-        return None
+    return properties
+
 
+def _print_stats(stats):
+    print(f"   ✅ 생성: {stats['created']}개, 업데이트: {stats['updated']}개, "
+          f"변경 없음: {stats['unchanged']}개"
+          + (f", 아카이브: {stats['archived']}개" if stats['archived'] else "")
+          + (f", 실패: {stats['failed']}개" if stats['failed'] else ""))
 
-def update_yacht_specifications():
-    """yacht_specifications.json → Notion 업데이트"""
+
+def update_yacht_specifications(prune=False):
+    """yacht_specifications.json → Notion 업데이트 (바뀐 요트만)"""
     print("\n1️⃣ yacht_specifications.json 업데이트 중...")
     
-    database_id = DATABASE_IDS['yacht_specifications']
-    
     with open("data/yacht_specifications.json", 'r', encoding='utf-8') as f:
         data = json.load(f)
     
-    # 기존 데이터 조회
-    existing = query_database(database_id)
-    if not existing:
-        return
-    
-    existing_map = {}
-    for result in existing.get('results', []):
-        yacht_id = result['properties'].get('ID', {}).get('rich_text', [{}])[0].get('text', {}).get('content', '')
-        if yacht_id:
-            existing_map[yacht_id] = result['id']
-    
-    # 업데이트/생성
-    created = 0
-    updated = 0
-    
-    for yacht in data.get('yachts', []):
-        yacht_id = yacht.get('id', '')
-        specs = yacht.get('yachtSpecs', {}).get('standard', {})
-        dims = specs.get('dimensions', {})
-        sail = specs.get('sailArea', {})
-        engine = specs.get('engine', {})
-        
-        properties = {
-            'ID': {'rich_text': [{'text': {'content': yacht_id}}]},
-            'Name': {'title': [{'text': {'content': yacht.get('name', '')}}]},
-            'Manufacturer': {'rich_text': [{'text': {'content': yacht.get('manufacturer', '')}}]},
-            'Type': {'select': {'name': yacht.get('type', 'Unknown')}},
-            'LOA (m)': {'number': extract_number(dims.get('LOA', ''))},
-            'Beam (m)': {'number': extract_number(dims.get('Beam', ''))},
-            'Draft (m)': {'number': extract_number(dims.get('Draft', ''))},
-            'Displacement (kg)': {'number': extract_number(dims.get('Displacement', ''))},
-            'Main Sail (m²)': {'number': extract_number(sail.get('mainsail', ''))},
-            'Jib Sail (m²)': {'number': extract_number(sail.get('jib', ''))},
-            'Engine Type': {'rich_text': [{'text': {'content': engine.get('type', '')}}]},
-            'Manual PDF': {'url': yacht.get('manualPDF', '') or None}
-        }
-        
-        if yacht_id in existing_map:
-            # 업데이트
-            update_page(existing_map[yacht_id], properties)
-            updated += 1
-        else:
-            # 생성
-            create_page(database_id, properties)
-            created += 1
-    
-    print(f"   ✅ 생성: {created}개, 업데이트: {updated}개")
+    engine = NotionSyncEngine(get_notion_client(), DATABASE_IDS['yacht_specifications'], key=('ID',))
+    try:
+        stats = engine.sync([yacht_properties(yacht) for yacht in data.get('yachts', [])], prune=prune)
+    except NotionError as e:
+        print(f"❌ 조회 실패: {e}")
+        return None
+    _print_stats(stats)
+    return stats
 
 
-def update_yacht_parts_database():
-    """yacht_parts_database.json → Notion 업데이트"""
+def update_yacht_parts_database(prune=False):
+    """yacht_parts_database.json → Notion 업데이트 (바뀐 부품만)"""
     print("\n2️⃣ yacht_parts_database.json 업데이트 중...")
     
-    database_id = DATABASE_IDS['yacht_parts_database']
-    
     with open("data/yacht_parts_database.json", 'r', encoding='utf-8') as f:
         data = json.load(f)
     
-    # 기존 데이터 조회
-    existing = query_database(database_id)
-    if not existing:
-        return
-    
-    existing_map = {}
-    for result in existing.get('results', []):
-        part_id = result['properties'].get('Part ID', {}).get('rich_text', [{}])[0].get('text', {}).get('content', '')
-        if part_id:
-            existing_map[part_id] = result['id']
-    
-    # 업데이트/생성
-    created = 0
-    updated = 0
-    
+    # 부품 ID는 요트마다 겹칠 수 있으므로 (요트 ID, 부품 ID)로 식별
+    records = []
     for yacht in data.get('yachts', []):
-        yacht_id = yacht.get('id', '')
-        yacht_name = yacht.get('name', '')
-        
-        for part in yacht.get('parts', []):
-            part_id = part.get('id', '')
-            
-            properties = {
-                'Part ID': {'rich_text': [{'text': {'content': part_id}}]},
-                'Part Name': {'title': [{'text': {'content': part.get('name', '')}}]},
-                'Yacht ID': {'rich_text': [{'text': {'content': yacht_id}}]},
-                'Yacht Name': {'rich_text': [{'text': {'content': yacht_name}}]},
-                'Category': {'select': {'name': part.get('category', 'Unknown')}},
-                'Manufacturer': {'rich_text': [{'text': {'content': part.get('manufacturer', '')}}]},
-                'Model': {'rich_text': [{'text': {'content': part.get('model', '')}}]},
-            }
-            
-            interval = part.get('interval', '')
-            if interval:
-                interval_num = extract_number(interval)
-                if interval_num:
-                    properties['Maintenance Interval'] = {'number': interval_num}
-            
-            if part_id in existing_map:
-                update_page(existing_map[part_id], properties)
-                updated += 1
-            else:
-                create_page(database_id, properties)
-                created += 1
+        parts, _ = flatten_parts(yacht.get('parts'))
+        records.extend(part_properties(yacht, part) for part in parts)
     
-    print(f"   ✅ 생성: {created}개, 업데이트: {updated}개")
+    engine = NotionSyncEngine(get_notion_client(), DATABASE_IDS['yacht_parts_database'],
+                              key=('Yacht ID', 'Part ID'))
+    try:
+        stats = engine.sync(records, prune=prune)
+    except NotionError as e:
+        print(f"❌ 조회 실패: {e}")
+        return None
+    _print_stats(stats)
+    return stats
 
 
 def extract_number(text):
@@ -305,9 +269,9 @@ def setup_interactive():
         print("❌ API Key가 필요합니다.")
         return False
     
-    global NOTION_API_KEY
+    global NOTION_API_KEY, _client
     NOTION_API_KEY = api_key
-    headers['Authorization'] = f'Bearer {api_key}'
+    _client = None
     
     print()
     print("다음 데이터베이스 ID를 입력하세요:")
@@ -353,16 +317,18 @@ if __name__ == "__main__":
         else:
             sys.exit(1)
     
+    prune = '--prune' in sys.argv[1:]
+    
     print()
     print("업데이트를 시작합니다...")
     
     try:
         # 각 데이터베이스 업데이트
         if DATABASE_IDS['yacht_specifications']:
-            update_yacht_specifications()
+            update_yacht_specifications(prune=prune)
         
         if DATABASE_IDS['yacht_parts_database']:
-            update_yacht_parts_database()
+            update_yacht_parts_database(prune=prune)
         
         # 나머지 데이터베이스도 유사하게 추가 가능
         
@@ -0,0 +1,13 @@
+"""
+HooAah Yacht - WSGI 진입점 (운영 서버)
+
+사용법:
+    gunicorn -c gunicorn.conf.py wsgi:app
+
+GEMINI_API_KEY는 환경 변수 (.env 파일)에서 읽습니다.
+"""
+
+from chatbot_unified import create_app
+
+
+app = create_app()
@@ -0,0 +1,513 @@
+"""
+HooAah Yacht - 공유 요트 카탈로그
+프로세스 전체에서 한 번만 로드하여 모든 챗봇 세션이 참조로 공유하는 요트/부품 데이터
+
+특징:
+- data/*.json 파일을 한 번만 파싱 (세션마다 재파싱하지 않음)
+- 로드된 카탈로그는 읽기 전용 스냅샷 (세션에서 수정 금지)
+- data/*.json 변경 시 새 스냅샷을 만들어 원자적으로 교체
+- 파생 데이터 (시스템 프롬프트 등)는 스냅샷 단위로 메모이즈
+- 요트 단위 데이터 버전 (yacht_version): 요트별 답변 캐시 키
+- 요트 이름 매칭 인덱스는 스냅샷 로드 시 한 번만 구축
+- ID/이름 → 요트, ID → 부품 조회 인덱스 (O(1) 조회)
+- 이름순 keyset 페이지 (list_page): 정렬 키를 스냅샷당 한 번 만들고 이분 탐색
+- SQLite 카탈로그 백엔드 (catalog_db, DatabaseCatalog): JSON은 바뀐 경우에만 가져오고,
+  로드 시에는 요약 목록만 읽으며 요트 단위 조회는 필요한 행만 읽음
+  (CATALOG_BACKEND=json 이면 JSON 파일만 사용)
+
+사용법:
+    from yacht_catalog import get_shared_catalog_store
+
+    store = get_shared_catalog_store()
+    catalog = store.get()
+    yachts = catalog.yacht_data.get('yachts', [])
+"""
+
+import os
+import json
+import glob
+import time
+import base64
+import bisect
+import hashlib
+import sqlite3
+import threading
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from catalog_db import DEFAULT_DB_FILE, CatalogDatabase, yacht_dimensions
+from check_duplicate_yachts import normalize_yacht_name as normalize_list_name
+from yacht_name_matcher import YachtNameMatcher, normalize_yacht_name
+
+
+DEFAULT_DATA_DIR = 'data'
+
+# 카탈로그를 구성하는 파일
+YACHT_SPECS_FILE = 'yacht_specifications.json'
+PARTS_APP_DATA_FILE = 'yacht_parts_app_data.json'
+PARTS_DATABASE_FILE = 'yacht_parts_database.json'
+
+# list_page 커서 (정규화 이름, 요트 ID)의 항목 타입
+LIST_CURSOR_TYPES = (str, str)
+
+
+def load_yacht_data(data_dir: str = DEFAULT_DATA_DIR) -> Dict:
+    """요트 스펙 데이터 로드"""
+    try:
+        with open(os.path.join(data_dir, YACHT_SPECS_FILE), 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        print("⚠️ yacht_specifications.json 파일을 찾을 수 없습니다.")
+        return {"yachts": []}
+
+
+def load_parts_data(data_dir: str = DEFAULT_DATA_DIR) -> Dict:
+    """부품 데이터 로드 (interval 정보가 있는 yacht_parts_app_data.json 우선)"""
+    try:
+        # yacht_parts_app_data.json을 우선 로드 (interval 정보 포함)
+        with open(os.path.join(data_dir, PARTS_APP_DATA_FILE), 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        # fallback: yacht_parts_database.json
+        try:
+            with open(os.path.join(data_dir, PARTS_DATABASE_FILE), 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            print("⚠️ 부품 데이터 파일을 찾을 수 없습니다.")
+            return {"yachts": []}
+
+
+def encode_cursor(values: List[Any]) -> str:
+    """페이지 커서 (마지막 항목의 정렬 키)를 URL에 쓸 수 있는 문자열로 변환"""
+    encoded = json.dumps(values, ensure_ascii=False, separators=(',', ':'), default=str)
+    return base64.urlsafe_b64encode(encoded.encode('utf-8')).decode('ascii').rstrip('=')
+
+
+def decode_cursor(cursor: str, types: Optional[Tuple[type, ...]] = None) -> List[Any]:
+    """
+    encode_cursor의 역변환 (형식이 잘못되면 ValueError)
+
+    Args:
+        cursor: encode_cursor가 만든 문자열
+        types: 정렬 키 각 항목의 타입 (예: (str, int)), 개수와 타입이 다르면 ValueError
+    """
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')).decode('utf-8'))
+    except Exception as e:
+        raise ValueError(f"잘못된 페이지 커서: {cursor}") from e
+    if not isinstance(values, list):
+        raise ValueError(f"잘못된 페이지 커서: {cursor}")
+    if types is not None and (len(values) != len(types) or
+                              any(type(value) is not kind for value, kind in zip(values, types))):
+        raise ValueError(f"잘못된 페이지 커서: {cursor}")
+    return values
+
+
+def data_signature(data_dir: str = DEFAULT_DATA_DIR) -> Tuple:
+    """
+    data/*.json 파일들의 (이름, 수정시각, 크기) 서명
+
+    파일 내용을 읽지 않고 stat만 사용하므로 매 요청마다 호출해도 가볍습니다.
+    """
+    signature = []
+    for path in sorted(glob.glob(os.path.join(data_dir, '*.json'))):
+        try:
+            stat = os.stat(path)
+        except OSError:
+            continue
+        signature.append((os.path.basename(path), stat.st_mtime_ns, stat.st_size))
+    return tuple(signature)
+
+
+class YachtCatalog:
+    """
+    읽기 전용 요트 카탈로그 스냅샷
+
+    한 번 만들어진 스냅샷은 변경되지 않습니다. 데이터가 바뀌면
+    CatalogStore가 새 스냅샷을 만들어 통째로 교체합니다.
+    """
+
+    def __init__(self, yacht_data: Dict, parts_data: Dict, signature: Tuple = ()):
+        """
+        Args:
+            yacht_data: yacht_specifications.json 내용
+            parts_data: yacht_parts_app_data.json (또는 yacht_parts_database.json) 내용
+            signature: 로드 시점의 data/*.json 서명
+        """
+        self.yacht_data = yacht_data
+        self.parts_data = parts_data
+        self._init_snapshot(signature)
+
+        # 메시지 → 요트 이름 매칭 인덱스
+        self.name_matcher = YachtNameMatcher(self.yachts)
+
+        # 조회 인덱스 (같은 키가 여러 번 나오면 목록의 앞쪽이 우선)
+        self._yachts_by_id: Dict[str, Dict] = {}
+        self._ids_by_name: Dict[str, str] = {}
+        self._yachts_by_name: Dict[str, Dict] = {}
+        self._parts_by_id: Dict[str, Any] = {}
+        self._parts_by_name: Dict[str, Any] = {}
+        self._parts_by_category: Dict[str, Dict[str, List[Dict]]] = {}
+        self._build_indexes()
+
+    def _init_snapshot(self, signature: Tuple):
+        """스냅샷 공통 속성 (서명, 버전, 메모)"""
+        self.signature = signature
+        self.version = hashlib.sha1(repr(signature).encode('utf-8')).hexdigest()[:12]
+        self.loaded_at = time.time()
+        self._memo: Dict[str, Any] = {}
+        self._memo_lock = threading.Lock()
+
+    def _build_indexes(self):
+        for yacht in self.yachts:
+            yacht_id = yacht.get('id')
+            name = yacht.get('name', '')
+            if yacht_id:
+                self._yachts_by_id.setdefault(yacht_id, yacht)
+            for key in self._name_keys(name):
+                self._yachts_by_name.setdefault(key, yacht)
+                if yacht_id:
+                    self._ids_by_name.setdefault(key, yacht_id)
+
+        for entry in self.parts_data.get('yachts', []):
+            parts = entry.get('parts', [])
+            yacht_id = entry.get('id')
+            if yacht_id and yacht_id not in self._parts_by_id:
+                self._parts_by_id[yacht_id] = parts
+                self._parts_by_category[yacht_id] = self._group_by_category(parts)
+            for key in self._name_keys(entry.get('name', '')):
+                self._parts_by_name.setdefault(key, parts)
+
+    @staticmethod
+    def _name_keys(name: str) -> List[str]:
+        """이름 조회 키: 소문자 이름 + 정규화된 이름 (예: "J/70" → "j/70", "j70")"""
+        if not name:
+            return []
+        keys = [name.lower()]
+        normalized = normalize_yacht_name(name)
+        if normalized != keys[0]:
+            keys.append(normalized)
+        return keys
+
+    @staticmethod
+    def _group_by_category(parts: Any) -> Dict[str, List[Dict]]:
+        # yacht_parts_database.json 형식은 이미 카테고리별 dict
+        if isinstance(parts, dict):
+            return {category: value.get('physicalParts', []) if isinstance(value, dict) else value
+                    for category, value in parts.items()}
+        grouped: Dict[str, List[Dict]] = {}
+        for part in parts:
+            if isinstance(part, dict):
+                grouped.setdefault(part.get('category', '기타'), []).append(part)
+        return grouped
+
+    @property
+    def yachts(self) -> List[Dict]:
+        """요트 목록"""
+        return self.yacht_data.get('yachts', [])
+
+    @property
+    def summaries(self) -> List[Dict]:
+        """요트 목록 (id, name, manufacturer, type은 항상 포함, 목록 API/페이지용)"""
+        return self.yachts
+
+    def yacht_names(self) -> List[str]:
+        """요트 이름 목록 (카탈로그 순서)"""
+        return [yacht.get('name', '') for yacht in self.summaries]
+
+    # ============================================================
+    # 조회 (O(1))
+    # ============================================================
+
+    def get_yacht(self, yacht_id: str) -> Optional[Dict]:
+        """요트 ID로 스펙 조회"""
+        return self._yachts_by_id.get(yacht_id)
+
+    def find_yacht(self, name: str) -> Optional[Dict]:
+        """요트 이름으로 스펙 조회 (대소문자, 하이픈/공백/슬래시 무시)"""
+        for key in self._name_keys(name):
+            yacht = self._yachts_by_name.get(key)
+            if yacht is not None:
+                return yacht
+        return None
+
+    def get_yacht_id(self, name: str) -> Optional[str]:
+        """요트 이름으로 요트 ID 조회"""
+        for key in self._name_keys(name):
+            yacht_id = self._ids_by_name.get(key)
+            if yacht_id is not None:
+                return yacht_id
+        return None
+
+    def get_parts(self, yacht_id: str) -> List[Dict]:
+        """요트 ID로 부품 목록 조회"""
+        return self._parts_by_id.get(yacht_id, [])
+
+    def get_parts_by_name(self, name: str) -> List[Dict]:
+        """요트 이름으로 부품 목록 조회"""
+        for key in self._name_keys(name):
+            parts = self._parts_by_name.get(key)
+            if parts is not None:
+                return parts
+        return []
+
+    def get_parts_by_category(self, yacht_id: str) -> Dict[str, List[Dict]]:
+        """요트 ID로 카테고리별 부품 조회"""
+        return self._parts_by_category.get(yacht_id, {})
+
+    def get_dimensions(self, yacht_id: str, section: str = 'standard') -> Dict[str, str]:
+        """요트 치수 (section: standard = yachtSpecs.standard.dimensions, detailed = detailedDimensions)"""
+        return yacht_dimensions(self.get_yacht(yacht_id) or {}, section)
+
+    def list_page(self, limit: int, after: Optional[Tuple[str, str]] = None,
+                  prefix: str = '') -> Tuple[List[Dict], Optional[Tuple[str, str]]]:
+        """
+        이름순 keyset 페이지 (목록 크기와 무관하게 O(log n + limit))
+
+        Args:
+            limit: 페이지 크기
+            after: 이전 페이지 마지막 요트의 정렬 키 (정규화 이름, ID)
+            prefix: 이름 접두어 (정규화 후 비교, 예: "farr 4" → farr40, farr45)
+
+        Returns:
+            (요트 목록 (summaries 항목), 다음 페이지 정렬 키 또는 None)
+        """
+        keys, yachts = self._list_order()
+        prefix = normalize_list_name(prefix)
+        start = bisect.bisect_left(keys, (prefix,))
+        if after is not None:
+            start = max(start, bisect.bisect_right(keys, tuple(after)))
+        end = start
+        while end < len(keys) and end - start < limit and keys[end][0].startswith(prefix):
+            end += 1
+
+        has_more = end < len(keys) and keys[end][0].startswith(prefix)
+        return yachts[start:end], (keys[end - 1] if has_more and end > start else None)
+
+    def count_prefix(self, prefix: str = '') -> int:
+        """이름 접두어 (정규화 후 비교)에 맞는 요트 수 (list_page와 같은 기준)"""
+        keys, _ = self._list_order()
+        prefix = normalize_list_name(prefix)
+        start = bisect.bisect_left(keys, (prefix,))
+        end = start
+        while end < len(keys) and keys[end][0].startswith(prefix):
+            end += 1
+        return end - start
+
+    def _list_order(self) -> Tuple[List[Tuple[str, str]], List[Dict]]:
+        """이름순 정렬 키와 요트 목록 (스냅샷당 한 번)"""
+        def build():
+            order = sorted(((normalize_list_name(yacht.get('name', '')), yacht.get('id') or ''), yacht)
+                           for yacht in self.summaries if isinstance(yacht, dict))
+            return [key for key, _ in order], [yacht for _, yacht in order]
+        return self.memo('list_order', build)
+
+    def yacht_version(self, yacht_id: str) -> str:
+        """
+        요트 단위 데이터 버전 (스펙 + 부품 내용 해시)
+
+        카탈로그 전체 버전과 달리 다른 요트가 등록/수정되어도 바뀌지 않습니다.
+        """
+        def compute() -> str:
+            yacht = self.get_yacht(yacht_id) or {}
+            content = [yacht, self.get_parts(yacht_id), self.get_parts_by_name(yacht.get('name', ''))]
+            encoded = json.dumps(content, sort_keys=True, ensure_ascii=False, default=str)
+            return hashlib.sha1(encoded.encode('utf-8')).hexdigest()[:12]
+        return self.memo(f'yacht_version:{yacht_id}', compute)
+
+    def memo(self, key: str, factory: Callable[[], Any]) -> Any:
+        """
+        스냅샷 단위 메모이즈
+
+        카탈로그 내용에만 의존하는 파생 데이터 (시스템 프롬프트, JSON 직렬화 등)를
+        스냅샷당 한 번만 계산합니다. 카탈로그가 교체되면 자연스럽게 무효화됩니다.
+        """
+        try:
+            return self._memo[key]
+        except KeyError:
+            pass
+        value = factory()
+        with self._memo_lock:
+            return self._memo.setdefault(key, value)
+
+
+class DatabaseCatalog(YachtCatalog):
+    """
+    SQLite 카탈로그 (CatalogDatabase)를 읽는 스냅샷
+
+    로드 시에는 요약 목록 (list_yachts)만 읽어 이름 매칭/페이지 인덱스를 만들고,
+    요트 단위 조회 (get_yacht, find_yacht, get_parts, get_dimensions 등)는 해당 행만 읽어
+    스냅샷 안에 메모이즈합니다. 전체 문서 (yacht_data, parts_data, yachts)는 시스템 프롬프트처럼
+    전체가 필요한 곳에서 처음 쓸 때 한 번만 만듭니다.
+    """
+
+    def __init__(self, database: CatalogDatabase, signature: Tuple = ()):
+        """
+        Args:
+            database: 가져오기 (sync)를 마친 SQLite 카탈로그
+            signature: 로드 시점의 data/*.json 서명
+        """
+        self.database = database
+        self._init_snapshot(signature)
+        self._summaries = database.list_yachts()
+        self.name_matcher = YachtNameMatcher(self._summaries)
+
+    @property
+    def yacht_data(self) -> Dict:
+        return self.memo('yacht_data', self.database.load_yacht_data)
+
+    @property
+    def parts_data(self) -> Dict:
+        return self.memo('parts_data', self.database.load_parts_data)
+
+    @property
+    def summaries(self) -> List[Dict]:
+        return self._summaries
+
+    def get_yacht(self, yacht_id: str) -> Optional[Dict]:
+        return self._lookup(f'yacht:{yacht_id}', lambda: self.database.get_yacht(yacht_id))
+
+    def find_yacht(self, name: str) -> Optional[Dict]:
+        yacht_id = self.get_yacht_id(name)
+        if yacht_id is not None:
+            return self.get_yacht(yacht_id)
+        return self._lookup(f'find_yacht:{normalize_yacht_name(name)}', lambda: self.database.find_yacht(name))
+
+    def get_yacht_id(self, name: str) -> Optional[str]:
+        return self._lookup(f'yacht_id:{normalize_yacht_name(name)}', lambda: self.database.get_yacht_id(name))
+
+    def get_parts(self, yacht_id: str) -> List[Dict]:
+        return self._lookup(f'parts:{yacht_id}', lambda: self.database.get_parts(yacht_id))
+
+    def get_parts_by_name(self, name: str) -> List[Dict]:
+        return self._lookup(f'parts_by_name:{normalize_yacht_name(name)}',
+                            lambda: self.database.get_parts_by_name(name))
+
+    def get_parts_by_category(self, yacht_id: str) -> Dict[str, List[Dict]]:
+        return self._lookup(f'parts_by_category:{yacht_id}',
+                            lambda: self._group_by_category(self.get_parts(yacht_id)))
+
+    def get_dimensions(self, yacht_id: str, section: str = 'standard') -> Dict[str, str]:
+        return self._lookup(f'dimensions:{section}:{yacht_id}',
+                            lambda: self.database.get_dimensions(yacht_id, section))
+
+    def _lookup(self, key: str, fetch: Callable[[], Any]) -> Any:
+        """찾은 결과만 메모이즈 (요청마다 다른 없는 ID/이름이 메모를 늘리지 않게)"""
+        try:
+            return self._memo[key]
+        except KeyError:
+            pass
+        value = fetch()
+        if not value:
+            return value
+        with self._memo_lock:
+            return self._memo.setdefault(key, value)
+
+
+def load_catalog(data_dir: str = DEFAULT_DATA_DIR, signature: Optional[Tuple] = None,
+                 database: Optional[CatalogDatabase] = None) -> YachtCatalog:
+    """
+    data 디렉토리에서 카탈로그 스냅샷 생성
+
+    database가 있으면 JSON이 바뀐 경우에만 SQLite로 가져오고, 스냅샷은 SQLite에서
+    필요한 행만 읽습니다 (DatabaseCatalog).
+    """
+    if signature is None:
+        signature = data_signature(data_dir)
+    if database is not None:
+        database.sync(data_dir)
+        return DatabaseCatalog(database, signature=signature)
+    return YachtCatalog(
+        yacht_data=load_yacht_data(data_dir),
+        parts_data=load_parts_data(data_dir),
+        signature=signature
+    )
+
+
+class CatalogStore:
+    """
+    현재 카탈로그 스냅샷을 보관하는 저장소
+
+    - get(): 현재 스냅샷 반환 (check_interval마다 파일 변경 여부 확인)
+    - reload(): 즉시 다시 로드 (요트 등록 직후 등)
+
+    다시 로드하는 도중 JSON이 깨져 있으면 (다른 프로세스가 쓰는 중 등)
+    기존 스냅샷을 그대로 유지합니다.
+    """
+
+    def __init__(self, data_dir: str = DEFAULT_DATA_DIR, check_interval: float = 2.0,
+                 database: Optional[CatalogDatabase] = None):
+        """
+        Args:
+            data_dir: JSON 데이터 디렉토리
+            check_interval: 파일 변경 확인 주기 (초)
+            database: SQLite 카탈로그 (None이면 JSON 파일만 사용)
+        """
+        self.data_dir = data_dir
+        self.check_interval = check_interval
+        self.database = database
+        self._catalog: Optional[YachtCatalog] = None
+        self._last_check = 0.0
+        self._lock = threading.Lock()
+
+    def get(self) -> YachtCatalog:
+        """현재 카탈로그 스냅샷 반환 (필요 시 다시 로드)"""
+        catalog = self._catalog
+        if catalog is not None and time.monotonic() - self._last_check < self.check_interval:
+            return catalog
+        return self._refresh(force=False)
+
+    def reload(self) -> YachtCatalog:
+        """파일 변경 여부와 관계없이 다시 로드"""
+        return self._refresh(force=True)
+
+    def _refresh(self, force: bool) -> YachtCatalog:
+        with self._lock:
+            self._last_check = time.monotonic()
+            signature = data_signature(self.data_dir)
+            current = self._catalog
+
+            if current is not None and not force and current.signature == signature:
+                return current
+
+            try:
+                catalog = load_catalog(self.data_dir, signature, self.database)
+            except sqlite3.Error as e:
+                # SQLite 카탈로그를 쓸 수 없으면 JSON 파일에서 직접 로드
+                print(f"⚠️ SQLite 카탈로그 사용 불가, JSON 파일에서 로드: {e}")
+                self.database = None
+                catalog = load_catalog(self.data_dir, signature)
+            except (json.JSONDecodeError, OSError) as e:
+                if current is None:
+                    raise
+                print(f"⚠️ 카탈로그 다시 로드 실패, 기존 데이터 유지: {e}")
+                return current
+
+            if current is not None:
+                print(f"🔄 요트 카탈로그 다시 로드 (version: {catalog.version})")
+            self._catalog = catalog
+            return catalog
+
+
+_shared_store: Optional[CatalogStore] = None
+_shared_store_lock = threading.Lock()
+
+
+def get_shared_catalog_store(data_dir: str = DEFAULT_DATA_DIR) -> CatalogStore:
+    """
+    프로세스 전체에서 공유하는 CatalogStore 반환
+
+    환경 변수 CATALOG_BACKEND: sqlite (기본, data/catalog.db) / json
+    """
+    global _shared_store
+    if _shared_store is None:
+        with _shared_store_lock:
+            if _shared_store is None:
+                database = None
+                if os.getenv('CATALOG_BACKEND', 'sqlite') == 'sqlite':
+                    try:
+                        database = CatalogDatabase(os.path.join(data_dir, DEFAULT_DB_FILE))
+                    except sqlite3.Error as e:
+                        print(f"⚠️ SQLite 카탈로그를 열 수 없어 JSON 파일을 사용합니다: {e}")
+                _shared_store = CatalogStore(data_dir=data_dir, database=database)
+    return _shared_store
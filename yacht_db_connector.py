@@ -3,15 +3,28 @@
 AI Chatbot과 MySQL DB 연결
 - JSON 파일 대신 DB에서 직접 요트 데이터 조회
 - 새로운 요트 등록 시 DB에 저장
+- 연결 풀 (db_pool.ConnectionPool): 여러 스레드가 제한된 수의 연결을 나눠 쓰고,
+  꺼낼 때 ping으로 끊긴 연결 (MySQL wait_timeout)을 걸러내 다시 연결
+- 목록은 keyset 페이지 (created_at, id), 이름 검색은 정규화 이름 접두어 인덱스,
+  본문 검색은 FULLTEXT (ensure_search_indexes로 인덱스 추가)
+- 부품/정비 항목은 part, maintenance_item 테이블 (parts_loader로 일괄 적재)
 """
 
 import sys
 import os
+import re
 import json
+import threading
 import pymysql
 from datetime import datetime
 from typing import Dict, List, Optional
 
+from db_pool import ConnectionPool, DEFAULT_POOL_SIZE
+from check_duplicate_yachts import normalize_yacht_name
+from yacht_catalog import decode_cursor, encode_cursor
+from yacht_sync import MYSQL
+from parts_loader import MAINTENANCE_TABLE, PART_TABLE, PartsLoader, load_json_files
+
 if sys.platform == 'win32':
     try:
         sys.stdout.reconfigure(encoding='utf-8')
@@ -19,12 +32,122 @@ if sys.platform == 'win32':
         pass
 
 
+# 정규화 이름 생성 컬럼 (check_duplicate_yachts.normalize_yacht_name과 같은 규칙:
+# 소문자 변환, 공백/하이픈/언더스코어 제거) → 접두어 검색이 인덱스를 사용
+NORMALIZED_NAME_EXPR = "LOWER(REPLACE(REPLACE(REPLACE(TRIM(name), '-', ''), ' ', ''), '_', ''))"
+
+# FULLTEXT 대상 컬럼 (테이블에 있는 컬럼만 사용)
+FULLTEXT_COLUMNS = ('name', 'manufacturer', 'description')
+FULLTEXT_INDEX = 'ft_yacht_search'
+
+# InnoDB FULLTEXT 기본 최소 토큰 길이 (innodb_ft_min_token_size)
+FULLTEXT_MIN_TOKEN = 3
+
+LIST_COLUMNS = """
+    id, name, available, capacity, location,
+    price_per_hour, description, thumbnail_path,
+    created_at, updated_at
+"""
+
+
+def _yacht_schema(cursor) -> Dict[str, List[str]]:
+    """yacht 테이블의 컬럼 목록과 인덱스별 컬럼 (information_schema)"""
+    cursor.execute("""
+        SELECT COLUMN_NAME AS column_name FROM information_schema.columns
+        WHERE table_schema = DATABASE() AND table_name = 'yacht'
+    """)
+    schema = {"columns": [row['column_name'] for row in cursor.fetchall()], "indexes": {}}
+    cursor.execute("""
+        SELECT INDEX_NAME AS index_name, COLUMN_NAME AS column_name FROM information_schema.statistics
+        WHERE table_schema = DATABASE() AND table_name = 'yacht'
+        ORDER BY INDEX_NAME, SEQ_IN_INDEX
+    """)
+    for row in cursor.fetchall():
+        schema["indexes"].setdefault(row['index_name'], []).append(row['column_name'])
+    return schema
+
+
+def ensure_yacht_search_indexes(connection) -> List[str]:
+    """
+    yacht 테이블에 검색/페이지 인덱스 추가 (이미 있으면 건너뜀)
+    
+    - normalized_name: 정규화 이름 생성 컬럼 + 인덱스 (접두어 검색)
+    - idx_created_id: (created_at, id) keyset 페이지
+    - ft_yacht_search: name/manufacturer/description FULLTEXT
+    
+    Returns:
+        실행한 ALTER 문 목록
+    """
+    with connection.cursor() as cursor:
+        schema = _yacht_schema(cursor)
+        columns, indexes = set(schema["columns"]), schema["indexes"]
+        
+        statements = []
+        if 'normalized_name' not in columns:
+            statements.append(
+                f"ALTER TABLE yacht ADD COLUMN normalized_name VARCHAR(255) AS ({NORMALIZED_NAME_EXPR}) STORED")
+        if 'idx_normalized_name' not in indexes:
+            statements.append("ALTER TABLE yacht ADD INDEX idx_normalized_name (normalized_name)")
+        if 'created_at' in columns and 'idx_created_id' not in indexes:
+            statements.append("ALTER TABLE yacht ADD INDEX idx_created_id (created_at, id)")
+        text_columns = [column for column in FULLTEXT_COLUMNS if column in columns]
+        if text_columns and FULLTEXT_INDEX not in indexes:
+            statements.append(f"ALTER TABLE yacht ADD FULLTEXT INDEX {FULLTEXT_INDEX} ({', '.join(text_columns)})")
+        
+        # InnoDB는 FULLTEXT 인덱스를 다른 변경과 함께 만들 수 없어 하나씩 실행
+        for statement in statements:
+            cursor.execute(statement)
+    connection.commit()
+    return statements
+
+
+def _available_to_bool(yachts: List[Dict]) -> List[Dict]:
+    """bit(1) → bool 변환"""
+    for yacht in yachts:
+        if yacht.get('available') is not None:
+            yacht['available'] = bool(yacht['available'])
+    return yachts
+
+
+def _decode_json_column(rows: List[Dict], column: str) -> List[Dict]:
+    """JSON 컬럼 (pymysql은 문자열로 반환)을 dict로 변환"""
+    for row in rows:
+        if isinstance(row.get(column), str):
+            try:
+                row[column] = json.loads(row[column])
+            except ValueError:
+                pass
+    return rows
+
+
+def _like_prefix(text: str) -> str:
+    """LIKE 접두어 패턴 (와일드카드 문자 이스케이프)"""
+    return text.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_') + '%'
+
+
+def fulltext_query(text: str) -> str:
+    """검색어 → BOOLEAN MODE 질의 (모든 단어 필수 + 접두어 일치, 짧은 단어 제외)"""
+    terms = [term for term in re.findall(r'\w+', text) if len(term) >= FULLTEXT_MIN_TOKEN]
+    return " ".join(f"+{term}*" for term in terms)
+
+
 class YachtDatabaseConnector:
     """MySQL DB와 AI Chatbot 연결"""
     
-    def __init__(self, host='localhost', port=3306, user='root', password='', database='yacht_db'):
+    # AI 분석 결과 저장용 INSERT (save_yacht_from_ai, save_yachts_from_ai)
+    INSERT_YACHT_SQL = """
+        INSERT INTO yacht (
+            name, available, capacity, description, 
+            location, price_per_hour, created_at, updated_at
+        ) VALUES (
+            %s, %s, %s, %s, %s, %s, %s, %s
+        )
+    """
+    
+    def __init__(self, host='localhost', port=3306, user='root', password='', database='yacht_db',
+                 pool_size: int = DEFAULT_POOL_SIZE):
         """
-        MySQL 연결 초기화
+        MySQL 연결 풀 초기화 (연결은 처음 사용할 때 생성)
         
         Args:
             host: DB 호스트
@@ -32,6 +155,7 @@ class YachtDatabaseConnector:
             user: DB 사용자
             password: DB 비밀번호
             database: DB 이름
+            pool_size: 최대 연결 수
         """
         self.connection_params = {
             'host': host,
@@ -40,14 +164,18 @@ class YachtDatabaseConnector:
             'password': password,
             'database': database,
             'charset': 'utf8mb4',
-            'cursorclass': pymysql.cursors.DictCursor
+            'cursorclass': pymysql.cursors.DictCursor,
+            'connect_timeout': 10,
+            'autocommit': False
         }
-        self.conn = None
+        self.pool = ConnectionPool(lambda: pymysql.connect(**self.connection_params), max_size=pool_size)
+        self._schema: Optional[Dict] = None
     
     def connect(self):
-        """DB 연결"""
+        """DB 연결 확인 (풀에서 연결을 하나 꺼내 봄)"""
         try:
-            self.conn = pymysql.connect(**self.connection_params)
+            with self.pool.connection():
+                pass
             print("✅ MySQL 연결 성공!")
             return True
         except Exception as e:
@@ -55,10 +183,9 @@ class YachtDatabaseConnector:
             return False
     
     def disconnect(self):
-        """DB 연결 해제"""
-        if self.conn:
-            self.conn.close()
-            print("🔌 MySQL 연결 종료")
+        """DB 연결 해제 (풀의 연결을 모두 닫음)"""
+        self.pool.close()
+        print("🔌 MySQL 연결 종료")
     
     # ============================================================
     # 1. 요트 조회
@@ -66,7 +193,7 @@ class YachtDatabaseConnector:
     
     def get_all_yachts(self) -> List[Dict]:
         """
-        DB에서 모든 요트 조회
+        DB에서 모든 요트 조회 (내보내기용, 화면 목록은 list_yachts 페이지 사용)
         
         Returns:
             요트 목록 [
@@ -82,16 +209,10 @@ class YachtDatabaseConnector:
                 }
             ]
         """
-        if not self.conn:
-            self.connect()
-        
         try:
-            with self.conn.cursor() as cursor:
-                sql = """
-                    SELECT 
-                        id, name, available, capacity, location, 
-                        price_per_hour, description, thumbnail_path,
-                        created_at, updated_at
+            with self.pool.cursor() as cursor:
+                sql = f"""
+                    SELECT {LIST_COLUMNS}
                     FROM yacht
                     ORDER BY created_at DESC
                 """
@@ -108,6 +229,47 @@ class YachtDatabaseConnector:
             print(f"❌ 요트 조회 실패: {e}")
             return []
     
+    def list_yachts(self, limit: int = 50, cursor: Optional[str] = None) -> Dict:
+        """
+        최신순 keyset 페이지 (OFFSET 없이 idx_created_id로 바로 다음 페이지 위치를 찾음)
+        
+        Args:
+            limit: 페이지 크기
+            cursor: 이전 페이지의 nextCursor (None이면 첫 페이지)
+        
+        Returns:
+            {"yachts": [...], "nextCursor": "..." 또는 None}
+        
+        Raises:
+            ValueError: 커서 형식이 잘못됨
+        """
+        where, params = "", []
+        if cursor:
+            created_at, last_id = decode_cursor(cursor, types=(str, int))
+            where = "WHERE created_at < %s OR (created_at = %s AND id < %s)"
+            params = [created_at, created_at, last_id]
+        
+        try:
+            with self.pool.cursor() as db_cursor:
+                db_cursor.execute(f"""
+                    SELECT {LIST_COLUMNS}
+                    FROM yacht
+                    {where}
+                    ORDER BY created_at DESC, id DESC
+                    LIMIT %s
+                """, (*params, limit + 1))
+                yachts = _available_to_bool(list(db_cursor.fetchall()))
+        except Exception as e:
+            print(f"❌ 요트 조회 실패: {e}")
+            return {"yachts": [], "nextCursor": None}
+        
+        next_cursor = None
+        if len(yachts) > limit:
+            yachts = yachts[:limit]
+            last = yachts[-1]
+            next_cursor = encode_cursor([str(last['created_at']), last['id']])
+        return {"yachts": yachts, "nextCursor": next_cursor}
+    
     def get_yacht_by_id(self, yacht_id: int) -> Optional[Dict]:
         """
         특정 요트 조회
@@ -118,11 +280,8 @@ class YachtDatabaseConnector:
         Returns:
             요트 정보 또는 None
         """
-        if not self.conn:
-            self.connect()
-        
         try:
-            with self.conn.cursor() as cursor:
+            with self.pool.cursor() as cursor:
                 sql = "SELECT * FROM yacht WHERE id = %s"
                 cursor.execute(sql, (yacht_id,))
                 yacht = cursor.fetchone()
@@ -135,34 +294,75 @@ class YachtDatabaseConnector:
             print(f"❌ 요트 조회 실패: {e}")
             return None
     
-    def search_yachts_by_name(self, name: str) -> List[Dict]:
+    def search_yachts_by_name(self, name: str, limit: int = 50) -> List[Dict]:
         """
         이름으로 요트 검색
         
+        normalized_name 컬럼이 있으면 정규화 이름 접두어로 인덱스 검색
+        ("farr 4" → Farr 40, Farr 45), 없으면 부분 일치 LIKE (전체 스캔)
+        
         Args:
-            name: 검색할 요트 이름 (부분 일치)
+            name: 검색할 요트 이름
+            limit: 최대 결과 수
         
         Returns:
             요트 목록
         """
-        if not self.conn:
-            self.connect()
+        try:
+            schema = self._get_schema()
+            with self.pool.cursor() as cursor:
+                if 'normalized_name' in schema["columns"]:
+                    sql = "SELECT * FROM yacht WHERE normalized_name LIKE %s ORDER BY normalized_name LIMIT %s"
+                    cursor.execute(sql, (_like_prefix(normalize_yacht_name(name)), limit))
+                else:
+                    sql = "SELECT * FROM yacht WHERE name LIKE %s LIMIT %s"
+                    cursor.execute(sql, (f'%{name}%', limit))
+                return _available_to_bool(list(cursor.fetchall()))
+        except Exception as e:
+            print(f"❌ 요트 검색 실패: {e}")
+            return []
+    
+    def fulltext_search(self, query: str, limit: int = 50) -> List[Dict]:
+        """
+        이름/제조사/설명 FULLTEXT 검색 (관련도순)
         
+        FULLTEXT 인덱스가 없거나 검색어가 너무 짧으면 이름 접두어 검색으로 대체합니다.
+        """
+        boolean_query = fulltext_query(query)
         try:
-            with self.conn.cursor() as cursor:
-                sql = "SELECT * FROM yacht WHERE name LIKE %s"
-                cursor.execute(sql, (f'%{name}%',))
-                yachts = cursor.fetchall()
-                
-                for yacht in yachts:
-                    if 'available' in yacht and yacht['available'] is not None:
-                        yacht['available'] = bool(yacht['available'])
-                
-                return yachts
+            text_columns = self._get_schema()["indexes"].get(FULLTEXT_INDEX)
+            if not text_columns or not boolean_query:
+                return self.search_yachts_by_name(query, limit=limit)
+            match = f"MATCH({', '.join(text_columns)}) AGAINST (%s IN BOOLEAN MODE)"
+            with self.pool.cursor() as cursor:
+                cursor.execute(f"""
+                    SELECT {LIST_COLUMNS}, {match} AS score
+                    FROM yacht
+                    WHERE {match}
+                    ORDER BY score DESC, id DESC
+                    LIMIT %s
+                """, (boolean_query, boolean_query, limit))
+                return _available_to_bool(list(cursor.fetchall()))
         except Exception as e:
             print(f"❌ 요트 검색 실패: {e}")
             return []
     
+    def ensure_search_indexes(self) -> List[str]:
+        """검색/페이지 인덱스 추가 (ensure_yacht_search_indexes), 실행한 ALTER 문 반환"""
+        with self.pool.connection() as conn:
+            statements = ensure_yacht_search_indexes(conn)
+        self._schema = None
+        for statement in statements:
+            print(f"🔧 {statement}")
+        return statements
+    
+    def _get_schema(self) -> Dict:
+        """yacht 테이블 컬럼/인덱스 (처음 한 번만 조회)"""
+        if self._schema is None:
+            with self.pool.cursor() as cursor:
+                self._schema = _yacht_schema(cursor)
+        return self._schema
+    
     # ============================================================
     # 2. AI 분석 결과 → DB 저장
     # ============================================================
@@ -183,46 +383,58 @@ class YachtDatabaseConnector:
         Returns:
             생성된 yacht ID 또는 None
         """
-        if not self.conn:
-            self.connect()
-        
         try:
-            with self.conn.cursor() as cursor:
-                # description 생성 (제조사 + 스펙 요약)
-                description = self._create_description_from_specs(yacht_data)
-                
-                sql = """
-                    INSERT INTO yacht (
-                        name, available, capacity, description, 
-                        location, price_per_hour, created_at, updated_at
-                    ) VALUES (
-                        %s, %s, %s, %s, %s, %s, %s, %s
-                    )
-                """
-                
-                now = datetime.now()
-                cursor.execute(sql, (
-                    yacht_data.get('name', 'Unknown Yacht'),
-                    True,  # available (기본값: 예약 가능)
-                    yacht_data.get('specifications', {}).get('accommodations', {}).get('berths', None),
-                    description,
-                    yacht_data.get('location', ''),  # 위치 정보 없으면 빈 문자열
-                    None,  # price_per_hour (나중에 수동 설정)
-                    now,
-                    now
-                ))
-                
-                self.conn.commit()
+            # 정상 종료 시 커밋, 예외 시 풀이 롤백
+            with self.pool.cursor(commit=True) as cursor:
+                cursor.execute(self.INSERT_YACHT_SQL, self._yacht_insert_values(yacht_data, datetime.now()))
                 yacht_id = cursor.lastrowid
-                
-                print(f"✅ 요트 저장 완료! ID: {yacht_id}, Name: {yacht_data.get('name')}")
-                return yacht_id
+            
+            print(f"✅ 요트 저장 완료! ID: {yacht_id}, Name: {yacht_data.get('name')}")
+            return yacht_id
                 
         except Exception as e:
             print(f"❌ 요트 저장 실패: {e}")
-            self.conn.rollback()
             return None
     
+    def save_yachts_from_ai(self, yachts: List[Dict]) -> int:
+        """
+        여러 요트를 한 번에 저장 (executemany, 한 트랜잭션)
+        
+        Returns:
+            저장한 요트 수 (실패 시 0, 전체 롤백)
+        """
+        if not yachts:
+            return 0
+        
+        try:
+            now = datetime.now()
+            with self.pool.cursor(commit=True) as cursor:
+                cursor.executemany(self.INSERT_YACHT_SQL,
+                                   [self._yacht_insert_values(yacht, now) for yacht in yachts])
+            return len(yachts)
+        except Exception as e:
+            print(f"❌ 요트 일괄 저장 실패: {e}")
+            return 0
+    
+    def _yacht_insert_values(self, yacht_data: Dict, now: datetime) -> tuple:
+        """INSERT_YACHT_SQL 파라미터 (description은 제조사 + 스펙 요약)"""
+        return (
+            yacht_data.get('name', 'Unknown Yacht'),
+            True,  # available (기본값: 예약 가능)
+            (yacht_data.get('specifications') or {}).get('accommodations', {}).get('berths', None),
+            self._create_description_from_specs(yacht_data),
+            yacht_data.get('location', ''),  # 위치 정보 없으면 빈 문자열
+            None,  # price_per_hour (나중에 수동 설정)
+            now,
+            now
+        )
+    
+    def _existing_yacht_names(self) -> set:
+        """DB에 있는 요트 이름 (소문자, 한 번의 조회)"""
+        with self.pool.cursor() as cursor:
+            cursor.execute("SELECT name FROM yacht")
+            return {(row['name'] or '').strip().lower() for row in cursor.fetchall()}
+    
     def _create_description_from_specs(self, yacht_data: Dict) -> str:
         """AI 분석 결과에서 description 생성"""
         parts = []
@@ -269,22 +481,22 @@ class YachtDatabaseConnector:
         yachts = data.get('yachts', [])
         print(f"📊 총 {len(yachts)}개 요트 발견")
         
-        success_count = 0
+        # 기존 이름은 한 번에 조회해 비교 (요트마다 LIKE 검색하지 않음)
+        existing_names = self._existing_yacht_names()
+        new_yachts = []
         skip_count = 0
         
         for yacht in yachts:
-            # 이미 DB에 있는지 확인
-            existing = self.search_yachts_by_name(yacht.get('name', ''))
-            
-            if existing:
+            name_key = (yacht.get('name') or '').strip().lower()
+            if not name_key or name_key in existing_names:
                 print(f"⏭️  스킵: {yacht.get('name')} (이미 존재)")
                 skip_count += 1
                 continue
-            
-            # DB에 저장
-            yacht_id = self.save_yacht_from_ai(yacht)
-            if yacht_id:
-                success_count += 1
+            existing_names.add(name_key)
+            new_yachts.append(yacht)
+        
+        # 새 요트만 한 트랜잭션으로 저장
+        success_count = self.save_yachts_from_ai(new_yachts)
         
         print()
         print("=" * 80)
@@ -320,6 +532,130 @@ class YachtDatabaseConnector:
         
         print(f"✅ DB 데이터를 JSON으로 내보냄: {output_file}")
         print(f"   총 {len(yachts)}개 요트")
+    
+    # ============================================================
+    # 4. 부품 / 정비 항목 (part, maintenance_item 테이블)
+    # ============================================================
+    
+    def load_parts_from_json(self, data_dir: str = 'data') -> Dict[str, int]:
+        """
+        부품 JSON (yacht_parts_app_data.json, yacht_parts_database.json)을
+        part, maintenance_item 테이블에 일괄 적재 (요트 단위 교체)
+        
+        Returns:
+            {"yachts", "parts", "maintenanceItems"}
+        """
+        app_data, parts_database = load_json_files(data_dir)
+        with self.pool.connection() as conn:
+            loader = PartsLoader(conn, dialect=MYSQL)
+            loader.ensure_tables()
+            stats = loader.load(app_data, parts_database)
+        print(f"✅ 부품 적재 완료: 요트 {stats['yachts']}척, 부품 {stats['parts']}개, "
+              f"정비 항목 {stats['maintenanceItems']}개")
+        return stats
+    
+    def get_parts(self, yacht_id: str, category: Optional[str] = None) -> List[Dict]:
+        """
+        요트 부품 조회 (yacht_id, category 인덱스 사용)
+        
+        Args:
+            yacht_id: 요트 ID (JSON의 요트 ID, 예: "farr-40")
+            category: 부품 카테고리 (None이면 전체)
+        
+        Returns:
+            부품 목록 (specifications는 dict)
+        """
+        sql = f"SELECT * FROM {PART_TABLE} WHERE yacht_id = %s"
+        params: list = [yacht_id]
+        if category:
+            sql += " AND category = %s"
+            params.append(category)
+        sql += " ORDER BY category, id"
+        try:
+            with self.pool.cursor() as cursor:
+                cursor.execute(sql, params)
+                return _decode_json_column(list(cursor.fetchall()), 'specifications')
+        except Exception as e:
+            print(f"❌ 부품 조회 실패: {e}")
+            return []
+    
+    def get_part_categories(self, yacht_id: str) -> Dict[str, int]:
+        """요트 부품 카테고리별 개수 ({"Engine": 12, ...})"""
+        try:
+            with self.pool.cursor() as cursor:
+                cursor.execute(f"""
+                    SELECT category, COUNT(*) AS count
+                    FROM {PART_TABLE}
+                    WHERE yacht_id = %s
+                    GROUP BY category
+                    ORDER BY category
+                """, (yacht_id,))
+                return {row['category'] or '': row['count'] for row in cursor.fetchall()}
+        except Exception as e:
+            print(f"❌ 부품 카테고리 조회 실패: {e}")
+            return {}
+    
+    def get_maintenance_items(self, yacht_id: Optional[str] = None, within_months: Optional[int] = None,
+                              category: Optional[str] = None, limit: int = 200) -> List[Dict]:
+        """
+        정비 항목 조회 (정비 주기 짧은 순)
+        
+        Args:
+            yacht_id: 요트 ID (None이면 전체 요트)
+            within_months: 정비 주기가 이 값 이하인 항목만 (예: 6 → 6개월마다 정비하는 항목)
+            category: 카테고리 (None이면 전체)
+            limit: 최대 결과 수
+        
+        Returns:
+            정비 항목 목록 (details는 dict)
+        """
+        conditions, params = [], []
+        if yacht_id:
+            conditions.append("yacht_id = %s")
+            params.append(yacht_id)
+        if within_months is not None:
+            conditions.append("interval_months <= %s")
+            params.append(within_months)
+        if category:
+            conditions.append("category = %s")
+            params.append(category)
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        try:
+            with self.pool.cursor() as cursor:
+                cursor.execute(f"""
+                    SELECT * FROM {MAINTENANCE_TABLE}
+                    {where}
+                    ORDER BY interval_months IS NULL, interval_months, id
+                    LIMIT %s
+                """, params + [limit])
+                return _decode_json_column(list(cursor.fetchall()), 'details')
+        except Exception as e:
+            print(f"❌ 정비 항목 조회 실패: {e}")
+            return []
+
+
+_shared_connector: Optional[YachtDatabaseConnector] = None
+_shared_connector_lock = threading.Lock()
+
+
+def get_shared_db_connector() -> YachtDatabaseConnector:
+    """
+    프로세스 공유 커넥터 (환경 변수 DB_HOST/DB_PORT/DB_USER/DB_PASSWORD/DB_NAME)
+    
+    API 서버의 모든 요청 스레드가 하나의 연결 풀을 사용합니다.
+    """
+    global _shared_connector
+    if _shared_connector is None:
+        with _shared_connector_lock:
+            if _shared_connector is None:
+                _shared_connector = YachtDatabaseConnector(
+                    host=os.getenv('DB_HOST', 'localhost'),
+                    port=int(os.getenv('DB_PORT', 3306)),
+                    user=os.getenv('DB_USER', 'root'),
+                    password=os.getenv('DB_PASSWORD', ''),
+                    database=os.getenv('DB_NAME', 'HooYah')
+                )
+    return _shared_connector
 
 
 # ============================================================
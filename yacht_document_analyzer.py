@@ -10,17 +10,13 @@ from pathlib import Path
 from typing import Dict, List, Optional
 import base64
 
-# PDF 텍스트 추출을 위한 라이브러리
-try:
-    import PyPDF2
-    HAS_PYPDF2 = True
-except ImportError:
-    HAS_PYPDF2 = False
-    try:
-        import pdfplumber
-        HAS_PDFPLUMBER = True
-    except ImportError:
-        HAS_PDFPLUMBER = False
+# PDF 텍스트 추출 (PyPDF2 / pdfplumber, 페이지 단위 병렬 추출)
+from pdf_extraction import extract_pdf_text
+from batch_runner import STATUS_FAILED, BatchRunner
+from gemini_client import GeminiClient
+
+# 분석 프롬프트 버전 (프롬프트를 바꾸면 올려서 일괄 분석 체크포인트를 무효화)
+ANALYSIS_VERSION = "1"
 
 class YachtDocumentAnalyzer:
     def __init__(self, api_key: str = None):
@@ -56,6 +52,9 @@ class YachtDocumentAnalyzer:
                 print(f"❌ 모델 초기화 실패: {e2}")
                 raise
         
+        # 요청 한도 / 재시도 / 시간 제한 / 요청 병합 (같은 API 키의 모든 인스턴스가 공유)
+        self.model = GeminiClient(self.model, api_key=api_key)
+        
         print("✅ HooAah Yacht Document Analyzer가 준비되었습니다!")
     
     def _extract_text_from_pdf(self, pdf_path: str) -> str:
@@ -68,39 +67,17 @@ class YachtDocumentAnalyzer:
         Returns:
             추출된 텍스트
         """
-        text = ""
-        
-        if HAS_PYPDF2:
-            try:
-                with open(pdf_path, 'rb') as file:
-                    pdf_reader = PyPDF2.PdfReader(file)
-                    for page in pdf_reader.pages:
-                        text += page.extract_text() + "\n"
-                return text
-            except Exception as e:
-                print(f"⚠️ PyPDF2로 텍스트 추출 실패: {e}")
-        
-        if HAS_PDFPLUMBER:
-            try:
-                with pdfplumber.open(pdf_path) as pdf:
-                    for page in pdf.pages:
-                        page_text = page.extract_text()
-                        if page_text:
-                            text += page_text + "\n"
-                return text
-            except Exception as e:
-                print(f"⚠️ pdfplumber로 텍스트 추출 실패: {e}")
-        
-        # 텍스트 추출 실패
-        return ""
+        return extract_pdf_text(pdf_path)
     
-    def analyze_pdf(self, pdf_path: str, use_file_upload: bool = False) -> Dict:
+    def analyze_pdf(self, pdf_path: str, use_file_upload: bool = False,
+                    extracted_text: Optional[str] = None) -> Dict:
         """
         PDF 문서 분석
         
         Args:
             pdf_path: PDF 파일 경로
             use_file_upload: True면 파일 업로드 방식, False면 텍스트 추출 방식
+            extracted_text: 이미 추출한 텍스트 (있으면 다시 추출하지 않음)
             
         Returns:
             분석 결과 딕셔너리
@@ -237,8 +214,9 @@ JSON 형식으로만 응답해주세요. 다른 설명은 필요 없습니다.""
             # 방법 2: 텍스트 추출 방식 (fallback)
             if not use_file_upload:
                 # PDF에서 텍스트 추출
-                print("📝 PDF에서 텍스트 추출 중...")
-                extracted_text = self._extract_text_from_pdf(pdf_path)
+                if extracted_text is None:
+                    print("📝 PDF에서 텍스트 추출 중...")
+                    extracted_text = self._extract_text_from_pdf(pdf_path)
                 
                 if not extracted_text or len(extracted_text.strip()) < 100:
                     return {
@@ -392,12 +370,16 @@ JSON 형식으로만 응답해주세요. 다른 설명은 필요 없습니다.""
             print(f"❌ 분석 실패: {e}")
             return error_result
     
-    def analyze_multiple_pdfs(self, pdf_directory: str) -> List[Dict]:
+    def analyze_multiple_pdfs(self, pdf_directory: str, force: bool = False) -> List[Dict]:
         """
         여러 PDF 파일 일괄 분석
         
+        추출/분석을 batch_runner로 동시에 처리하고, 파일별 결과는
+        analysis_results/document_analyzer에 체크포인트합니다 (변경 없는 파일은 건너뜀).
+        
         Args:
             pdf_directory: PDF 파일이 있는 디렉토리 경로
+            force: True면 이전 결과와 관계없이 모두 다시 분석
             
         Returns:
             분석 결과 리스트
@@ -414,23 +396,26 @@ JSON 형식으로만 응답해주세요. 다른 설명은 필요 없습니다.""
         
         print(f"\n📚 총 {len(pdf_files)}개의 PDF 파일을 분석합니다.\n")
         
+        runner = BatchRunner(
+            extract=self._extract_text_from_pdf,
+            analyze=lambda path, text: self.analyze_pdf(path, extracted_text=text),
+            output_dir=os.path.join("analysis_results", "document_analyzer"),
+            version=ANALYSIS_VERSION
+        )
+        
         results = []
-        for i, pdf_file in enumerate(pdf_files, 1):
-            print(f"\n[{i}/{len(pdf_files)}] {pdf_file.name}")
-            print("=" * 60)
-            
-            try:
-                result = self.analyze_pdf(str(pdf_file))
-                results.append(result)
-            except Exception as e:
-                print(f"❌ {pdf_file.name} 분석 실패: {e}")
+        for outcome in runner.run([str(pdf_file) for pdf_file in sorted(pdf_files)], force=force):
+            if outcome["status"] == STATUS_FAILED:
+                print(f"❌ {outcome['fileName']} 분석 실패: {outcome['error']}")
                 results.append({
-                    "error": str(e),
+                    "error": outcome["error"],
                     "fileInfo": {
-                        "fileName": pdf_file.name,
-                        "filePath": str(pdf_file)
+                        "fileName": outcome["fileName"],
+                        "filePath": outcome["path"]
                     }
                 })
+            else:
+                results.append(outcome["result"])
         
         return results
     
@@ -0,0 +1,158 @@
+"""
+HooAah Yacht - 요트 이름 매칭 인덱스
+메시지에서 요트 이름을 한 번의 스캔으로 찾는 다중 패턴 매처 (Aho–Corasick)
+
+카탈로그 로드 시 한 번만 구축:
+- 정규화된 요트 이름 (하이픈, 공백, 언더스코어, 슬래시 제거)
+- 별칭 (요트 ID 등, 예: "j-70" → "j70" → "J/70")
+- 숫자/문자 서명 (예: "farr40" → 숫자 "40" + 문자 "farr")
+
+메시지마다 요트 수(N)만큼 정규식을 돌리는 대신 메시지 길이에 비례하는
+시간으로 매칭합니다.
+"""
+
+import re
+from collections import deque
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+
+_SEPARATORS = re.compile(r'[-_\s/]+')
+_DIGITS = re.compile(r'\d+')
+
+
+def normalize_yacht_name(text: str) -> str:
+    """소문자 변환 후 하이픈, 공백, 언더스코어, 슬래시 제거 (예: "J/70" → "j70")"""
+    return _SEPARATORS.sub('', text.lower())
+
+
+class AhoCorasick:
+    """
+    다중 문자열 검색 오토마톤
+
+    패턴마다 값(value)을 붙여 두고, 텍스트를 한 번 훑어서
+    텍스트에 부분 문자열로 포함된 모든 패턴의 값을 돌려줍니다.
+    """
+
+    def __init__(self, patterns: Iterable[Tuple[str, object]] = ()):
+        """
+        Args:
+            patterns: (패턴 문자열, 값) 목록
+        """
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[Set[object]] = [set()]
+        for pattern, value in patterns:
+            self._add(pattern, value)
+        self._build()
+
+    def _add(self, pattern: str, value: object):
+        if not pattern:
+            return
+        state = 0
+        for char in pattern:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append(set())
+            state = next_state
+        self._output[state].add(value)
+
+    def _build(self):
+        """실패 링크 구성 (BFS)"""
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fail = self._fail[state]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[next_state] = self._goto[fail].get(char, 0)
+                self._output[next_state] |= self._output[self._fail[next_state]]
+
+    def search(self, text: str) -> Set[object]:
+        """텍스트에 포함된 모든 패턴의 값 집합"""
+        found: Set[object] = set()
+        state = 0
+        goto = self._goto
+        fail = self._fail
+        output = self._output
+        for char in text:
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if output[state]:
+                found |= output[state]
+        return found
+
+
+class YachtNameMatcher:
+    """
+    요트 이름 인덱스
+
+    UnifiedYachtChatbot._extract_yacht_name_from_message의 기존 규칙을 그대로 따릅니다:
+    1. 정규화된 요트 이름(또는 별칭)이 정규화된 메시지에 포함되면 매칭
+    2. 요트 이름의 첫 숫자와 메시지의 첫 숫자가 같고,
+       요트 이름의 문자 부분이 메시지의 문자 부분에 포함되면 매칭
+    여러 요트가 매칭되면 카탈로그 순서상 가장 앞의 요트를 반환합니다.
+    """
+
+    def __init__(self, yachts: List[Dict]):
+        """
+        Args:
+            yachts: 카탈로그의 요트 목록 (name, id 필드 사용)
+        """
+        self.names: List[str] = []
+        name_patterns = []
+        letter_patterns = []
+        # 첫 숫자 → 해당 숫자로 시작하는 요트 인덱스 집합
+        self._by_first_number: Dict[str, Set[int]] = {}
+
+        for yacht in yachts:
+            name = yacht.get('name', '')
+            if not name:
+                continue
+            index = len(self.names)
+            self.names.append(name)
+
+            normalized = normalize_yacht_name(name)
+            name_patterns.append((normalized, index))
+
+            # 별칭: 요트 ID (예: "x35-one-design" → "x35onedesign")
+            yacht_id = yacht.get('id')
+            if yacht_id:
+                alias = normalize_yacht_name(yacht_id)
+                if alias != normalized:
+                    name_patterns.append((alias, index))
+
+            # 숫자/문자 서명
+            numbers = _DIGITS.findall(normalized)
+            letters = _DIGITS.sub('', normalized)
+            if numbers and letters:
+                self._by_first_number.setdefault(numbers[0], set()).add(index)
+                letter_patterns.append((letters, index))
+
+        self._name_automaton = AhoCorasick(name_patterns)
+        self._letter_automaton = AhoCorasick(letter_patterns)
+
+    def match_all(self, message: str) -> List[str]:
+        """메시지에 언급된 모든 요트 이름 (카탈로그 순서)"""
+        normalized = normalize_yacht_name(message)
+        matched = set(self._name_automaton.search(normalized))
+
+        first_number = _DIGITS.search(normalized)
+        if first_number:
+            candidates = self._by_first_number.get(first_number.group(0))
+            if candidates:
+                letters = _DIGITS.sub('', normalized)
+                matched |= candidates & self._letter_automaton.search(letters)
+
+        return [self.names[index] for index in sorted(matched)]
+
+    def match(self, message: str) -> Optional[str]:
+        """메시지에 언급된 첫 번째 요트 이름 (없으면 None)"""
+        names = self.match_all(message)
+        return names[0] if names else None
@@ -0,0 +1,550 @@
+"""
+HooAah Yacht - 요트 등록 저장소
+요트 등록을 SQLite 로그에 한 번만 기록하고, data/*.json 파일은 나중에 한꺼번에 갱신
+
+기존 방식 (등록 1건마다):
+    JSON 파일 6개를 각각 전체 로드 → 수정 → 전체 다시 쓰기 (잠금 없음)
+    → 업로드가 겹치면 한쪽 변경이 사라짐
+
+새 방식:
+- record(): 등록 1건을 SQLite 로그(data/registrations.db)에 추가 (원자적 커밋, 한 번의 쓰기)
+- materialize(): 아직 반영되지 않은 등록들을 모아 JSON 파일마다 한 번만 로드/저장
+  - 파일 잠금으로 여러 프로세스가 동시에 갱신하지 않음
+  - 임시 파일에 쓴 뒤 교체 (읽는 쪽이 쓰다 만 파일을 보지 않음)
+  - 파일별로 반영한 마지막 등록 번호를 로그 (view_state)와 JSON 파일 안 (_registrationSeq)에 기록
+    → 파일을 교체한 뒤 로그에 기록하기 전에 중단되어도 같은 등록을 두 번 반영하지 않고 이어서 반영
+- schedule_materialize(): 짧게 기다렸다가 반영 (연속 등록을 한 번의 갱신으로 묶음)
+
+JSON 파일 (Flutter 앱 / 스크립트가 읽는 형식은 그대로 유지):
+    yacht_specifications.json, registered_yachts.json, yacht_parts_database.json,
+    extracted_yacht_parts_detailed.json, extracted_yacht_parts.json, yacht_parts_app_data.json
+"""
+
+import os
+import json
+import time
+import sqlite3
+import tempfile
+import threading
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Tuple
+
+
+DEFAULT_DATA_DIR = 'data'
+LOG_FILE = 'registrations.db'
+LOCK_FILE = '.registrations.lock'
+
+SPECIFICATIONS_VIEW = 'yacht_specifications.json'
+REGISTERED_YACHTS_VIEW = 'registered_yachts.json'
+PARTS_DATABASE_VIEW = 'yacht_parts_database.json'
+PARTS_DETAILED_VIEW = 'extracted_yacht_parts_detailed.json'
+EXTRACTED_PARTS_VIEW = 'extracted_yacht_parts.json'
+PARTS_APP_DATA_VIEW = 'yacht_parts_app_data.json'
+
+# JSON 파일에 반영된 마지막 등록 번호 (파일 교체와 view_state 커밋 사이 중단 대비)
+SEQ_KEY = '_registrationSeq'
+
+
+class FileLock:
+    """프로세스 간 배타적 파일 잠금 (POSIX: fcntl, Windows: msvcrt)"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = None
+
+    def __enter__(self):
+        self._file = open(self.path, 'a+')
+        if os.name == 'nt':
+            import msvcrt
+            self._file.seek(0)
+            msvcrt.locking(self._file.fileno(), msvcrt.LK_LOCK, 1)
+        else:
+            import fcntl
+            fcntl.flock(self._file.fileno(), fcntl.LOCK_EX)
+        return self
+
+    def __exit__(self, *exc):
+        try:
+            if os.name == 'nt':
+                import msvcrt
+                self._file.seek(0)
+                msvcrt.locking(self._file.fileno(), msvcrt.LK_UNLCK, 1)
+            else:
+                import fcntl
+                fcntl.flock(self._file.fileno(), fcntl.LOCK_UN)
+        finally:
+            self._file.close()
+            self._file = None
+        return False
+
+
+def write_json_atomic(path: str, data, indent: Optional[int] = 2):
+    """임시 파일에 쓴 뒤 교체"""
+    directory = os.path.dirname(path) or '.'
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.' + os.path.basename(path), suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=indent)
+        os.replace(tmp_path, path)
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+# ============================================================
+# JSON 파일별 반영 규칙 (기존 UnifiedYachtChatbot._add_to_* 와 동일)
+# ============================================================
+
+def _find_entry(data: Dict, yacht_id: str) -> Optional[Dict]:
+    for yacht in data.get("yachts", []):
+        if isinstance(yacht, dict) and yacht.get("id") == yacht_id:
+            return yacht
+    return None
+
+
+def _category_key(category: str) -> str:
+    if category in ["rigging", "rig"]:
+        return "rigging"
+    elif category in ["sails", "sail"]:
+        return "sails"
+    elif category in ["engine", "motor"]:
+        return "engine"
+    elif category in ["hull", "deck"]:
+        return "hull"
+    elif category in ["electrical", "electric", "electronics"]:
+        return "electrical"
+    elif category in ["plumbing", "water"]:
+        return "plumbing"
+    return "rigging"
+
+
+def _empty_specifications(record: Dict) -> Dict:
+    return {
+        "version": "1.0",
+        "description": "요트 상세 스펙 데이터베이스",
+        "lastUpdated": record["registeredDate"],
+        "yachts": []
+    }
+
+
+def _apply_specifications(data: Dict, record: Dict):
+    basic_info = record["registrationData"].get("basicInfo", {})
+    yacht_id = record["yachtId"]
+    fields = {
+        "id": yacht_id,
+        "name": basic_info.get("name", ""),
+        "manufacturer": basic_info.get("manufacturer", ""),
+        "type": basic_info.get("type", ""),
+        "manual": basic_info.get("manual", ""),
+        **record["specFields"]
+    }
+
+    existing = _find_entry(data, yacht_id)
+    if existing is not None:
+        # 기존 요트 업데이트
+        existing.update(fields)
+    else:
+        # 새 요트 추가
+        data["yachts"].append(fields)
+    data["lastUpdated"] = record["registeredDate"]
+
+
+def _empty_registered_yachts(record: Dict) -> Dict:
+    return {
+        "schemaVersion": "5.0",
+        "description": "사용자가 등록한 요트 목록 (chatbot_unified.py로 등록)",
+        "lastUpdated": record["registeredDate"],
+        "totalYachts": 0,
+        "yachts": []
+    }
+
+
+def _apply_registered_yachts(data: Dict, record: Dict):
+    analysis = record["analysis"]
+    data["yachts"].append({
+        "id": record["yachtId"],
+        "registrationDate": record["registeredAt"],
+        "source": "PDF Upload",
+        "pdfFile": analysis.get("pdfFile", ""),
+        "registrationData": record["registrationData"],
+        "analysisResult": {
+            "documentInfo": analysis.get("documentInfo", {}),
+            "partsCount": analysis.get("partsCount", 0),
+            "analysisStatus": analysis.get("analysisStatus", "success")
+        }
+    })
+    data["totalYachts"] = len(data["yachts"])
+    data["lastUpdated"] = record["registeredDate"]
+
+
+def _apply_parts_database(data: Dict, record: Dict):
+    yacht_id = record["yachtId"]
+    yacht_entry = _find_entry(data, yacht_id)
+    if not yacht_entry:
+        yacht_entry = {
+            "id": yacht_id,
+            "name": record["yachtName"],
+            "manufacturer": record["manufacturer"],
+            "type": "",
+            "length": None,
+            "officialWebsite": None,
+            "manualPDF": record["manualPdf"],
+            "dimensions": {},
+            "parts": {
+                "rigging": {"physicalParts": [], "maintenanceItems": []},
+                "sails": {"physicalParts": [], "maintenanceItems": []},
+                "engine": {"physicalParts": [], "maintenanceItems": []},
+                "hull": {"physicalParts": [], "maintenanceItems": []},
+                "electrical": {"physicalParts": [], "maintenanceItems": []},
+                "plumbing": {"physicalParts": [], "maintenanceItems": []}
+            }
+        }
+        data["yachts"].append(yacht_entry)
+
+    parts_dict = yacht_entry.get("parts", {})
+    for part in record["parts"]:
+        category = part.get("category", "rigging").lower()
+        name = part.get("name", "")
+        if not name:
+            continue
+        cat_key = _category_key(category)
+        if cat_key not in parts_dict:
+            parts_dict[cat_key] = {"physicalParts": [], "maintenanceItems": []}
+
+        parts_dict[cat_key]["physicalParts"].append({
+            "id": f"{yacht_id}-{cat_key}-{len(parts_dict[cat_key]['physicalParts']) + 1:02d}",
+            "category": category.capitalize(),
+            "name": name,
+            "partNumber": part.get("model", ""),
+            "manufacturer": part.get("manufacturer", ""),
+            "maintenanceInterval": f"{part.get('interval', 12)}개월" if part.get("interval") else "Annual inspection"
+        })
+
+
+def _apply_parts_detailed(data: Dict, record: Dict):
+    yacht_entry = _find_entry(data, record["yachtId"])
+    if not yacht_entry:
+        yacht_entry = {
+            "id": record["yachtId"],
+            "name": record["yachtName"],
+            "manufacturer": record["manufacturer"],
+            "manualPDF": record["manualPdf"],
+            "parts": {
+                "rigging": [], "sails": [], "engine": [],
+                "hull": [], "electrical": [], "plumbing": []
+            }
+        }
+        data["yachts"].append(yacht_entry)
+
+    parts_dict = yacht_entry.get("parts", {})
+    for part in record["parts"]:
+        category = part.get("category", "rigging").lower()
+        name = part.get("name", "")
+        if not name:
+            continue
+        cat_key = _category_key(category)
+        if cat_key not in parts_dict:
+            parts_dict[cat_key] = []
+
+        parts_dict[cat_key].append({
+            "name": name,
+            "description": f"{record['manufacturer']} {record['yachtName']} - {name}",
+            "specifications": [
+                part.get("model", ""),
+                part.get("manufacturer", ""),
+                f"Interval: {part.get('interval', 'N/A')} months" if part.get("interval") else ""
+            ]
+        })
+
+
+def _apply_extracted_parts(data: Dict, record: Dict):
+    if not isinstance(data.get("yachts"), list):
+        data["yachts"] = []
+
+    yacht_entry = _find_entry(data, record["yachtId"])
+    if not yacht_entry:
+        yacht_entry = {
+            "id": record["yachtId"],
+            "name": record["yachtName"],
+            "manufacturer": record["manufacturer"],
+            "parts": []
+        }
+        data["yachts"].append(yacht_entry)
+
+    # 기존 부품 이름은 다시 추가하지 않음 (중복 방지)
+    existing_parts = yacht_entry.setdefault("parts", [])
+    existing_part_names = {p.get("name", "") for p in existing_parts if isinstance(p, dict)}
+    for part in record["parts"]:
+        if not isinstance(part, dict):
+            continue
+        name = part.get("name", "")
+        if not name or name in existing_part_names:
+            continue
+        existing_parts.append({
+            "name": name,
+            "manufacturer": part.get("manufacturer", ""),
+            "model": part.get("model", ""),
+            "category": part.get("category", "rigging"),
+            "interval": part.get("interval")
+        })
+        existing_part_names.add(name)
+
+
+def _apply_parts_app_data(data: Dict, record: Dict):
+    yacht_entry = _find_entry(data, record["yachtId"])
+    if not yacht_entry:
+        yacht_entry = {
+            "id": record["yachtId"],
+            "name": record["yachtName"],
+            "manufacturer": record["manufacturer"],
+            "parts": []
+        }
+        data["yachts"].append(yacht_entry)
+
+    for part in record["parts"]:
+        name = part.get("name", "")
+        if not name:
+            continue
+        yacht_entry["parts"].append({
+            "name": name,
+            "manufacturer": part.get("manufacturer", ""),
+            "model": part.get("model", ""),
+            "category": part.get("category", "rigging"),
+            "maintenanceInterval": part.get("interval", 12)
+        })
+
+
+def _empty_yacht_list(record: Dict) -> Dict:
+    return {"yachts": []}
+
+
+# 파일명 → (빈 파일 초기값, 반영 함수, 부품이 있는 등록만 반영 여부)
+VIEWS = {
+    SPECIFICATIONS_VIEW: (_empty_specifications, _apply_specifications, False),
+    REGISTERED_YACHTS_VIEW: (_empty_registered_yachts, _apply_registered_yachts, False),
+    PARTS_DATABASE_VIEW: (_empty_yacht_list, _apply_parts_database, True),
+    PARTS_DETAILED_VIEW: (_empty_yacht_list, _apply_parts_detailed, True),
+    EXTRACTED_PARTS_VIEW: (_empty_yacht_list, _apply_extracted_parts, True),
+    PARTS_APP_DATA_VIEW: (_empty_yacht_list, _apply_parts_app_data, True),
+}
+
+
+def build_registration_record(yacht_id: str, registration_data: Dict, analysis_result: Dict,
+                              spec_fields: Dict) -> Dict:
+    """
+    로그에 저장할 등록 레코드 생성
+
+    Args:
+        yacht_id: 요트 ID
+        registration_data: 등록 데이터 (basicInfo, specifications, parts)
+        analysis_result: AI 분석 결과
+        spec_fields: yacht_specifications.json 형식으로 변환한 스펙
+    """
+    now = datetime.now()
+    basic_info = registration_data.get("basicInfo", {})
+    return {
+        "yachtId": yacht_id,
+        "yachtName": basic_info.get("name", ""),
+        "manufacturer": basic_info.get("manufacturer", ""),
+        "manualPdf": basic_info.get("manual", ""),
+        "registeredAt": now.isoformat(),
+        "registeredDate": now.strftime("%Y-%m-%d"),
+        "registrationData": registration_data,
+        "specFields": spec_fields,
+        "analysis": {
+            "pdfFile": analysis_result.get("fileInfo", {}).get("fileName", ""),
+            "documentInfo": analysis_result.get("documentInfo", {}),
+            "partsCount": len(analysis_result.get("parts", [])),
+            "analysisStatus": "success" if "error" not in analysis_result else "error"
+        },
+        "parts": analysis_result.get("parts", []),
+    }
+
+
+class YachtRegistrationStore:
+    """요트 등록 로그 (SQLite) + JSON 파일 지연 갱신"""
+
+    def __init__(self, data_dir: str = DEFAULT_DATA_DIR, materialize_delay: float = 0.5):
+        """
+        Args:
+            data_dir: JSON 파일 디렉토리
+            materialize_delay: schedule_materialize() 후 JSON 갱신까지 기다리는 시간 (초)
+        """
+        self.data_dir = data_dir
+        self.log_path = os.path.join(data_dir, LOG_FILE)
+        self.lock_path = os.path.join(data_dir, LOCK_FILE)
+        self.materialize_delay = materialize_delay
+
+        self._lock = threading.RLock()
+        self._timer: Optional[threading.Timer] = None
+        self._callbacks: List[Callable[[], None]] = []
+
+        os.makedirs(self.data_dir, exist_ok=True)
+        self._init_db()
+
+    # ============================================================
+    # 기록
+    # ============================================================
+
+    def record(self, record: Dict) -> int:
+        """등록 1건을 로그에 추가 (커밋되면 내구성 보장), 등록 번호 반환"""
+        with self._connect() as conn:
+            cursor = conn.execute(
+                "INSERT INTO registration (yacht_id, record, created_at) VALUES (?, ?, ?)",
+                (record["yachtId"], json.dumps(record, ensure_ascii=False), time.time())
+            )
+            return cursor.lastrowid
+
+    def pending_count(self) -> int:
+        """JSON 파일에 아직 반영되지 않은 등록 수"""
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT COUNT(*) FROM registration WHERE seq > "
+                "(SELECT COALESCE(MIN(last_seq), 0) FROM view_state)"
+            ).fetchone()
+        return row[0]
+
+    # ============================================================
+    # JSON 파일 갱신
+    # ============================================================
+
+    def materialize(self) -> int:
+        """
+        아직 반영되지 않은 등록을 JSON 파일에 반영
+
+        Returns:
+            갱신한 JSON 파일 수
+        """
+        updated = 0
+        with self._lock, FileLock(self.lock_path):
+            with self._connect() as conn:
+                last_seqs = dict(conn.execute("SELECT view, last_seq FROM view_state").fetchall())
+                min_seq = min(last_seqs.get(view, 0) for view in VIEWS)
+                rows = conn.execute(
+                    "SELECT seq, record FROM registration WHERE seq > ? ORDER BY seq", (min_seq,)
+                ).fetchall()
+            if not rows:
+                return 0
+            records = [(seq, json.loads(payload)) for seq, payload in rows]
+
+            for view, (empty, apply, parts_only) in VIEWS.items():
+                last_seq = last_seqs.get(view, 0)
+                pending = [(seq, record) for seq, record in records if seq > last_seq]
+                if not pending:
+                    continue
+                target_seq = records[-1][0]
+                applicable = [(seq, record) for seq, record in pending if record["parts"] or not parts_only]
+                if applicable and self._materialize_view(view, empty, apply, applicable, target_seq):
+                    updated += 1
+                with self._connect() as conn:
+                    conn.execute(
+                        "INSERT OR REPLACE INTO view_state (view, last_seq) VALUES (?, ?)",
+                        (view, target_seq)
+                    )
+        if updated:
+            print(f"💾 JSON 파일 {updated}개 갱신 (등록 {len(records)}건 반영)")
+        return updated
+
+    def _materialize_view(self, view: str, empty: Callable, apply: Callable,
+                          records: List[Tuple[int, Dict]], target_seq: int) -> bool:
+        """파일에 아직 반영되지 않은 (SEQ_KEY보다 큰) 등록만 반영, 파일을 썼으면 True"""
+        path = os.path.join(self.data_dir, view)
+        if os.path.exists(path):
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            # 리스트 형식 파일 (extracted_yacht_parts.json 구버전 등)
+            if isinstance(data, list):
+                data = {"yachts": data}
+            elif not isinstance(data, dict):
+                data = empty(records[0][1])
+            data.setdefault("yachts", [])
+        else:
+            data = empty(records[0][1])
+
+        applied_seq = data.get(SEQ_KEY, 0)
+        records = [record for seq, record in records if seq > applied_seq]
+        if not records:
+            return False
+        for record in records:
+            apply(data, record)
+        data[SEQ_KEY] = target_seq
+        write_json_atomic(path, data)
+        return True
+
+    def schedule_materialize(self, on_done: Optional[Callable[[], None]] = None):
+        """
+        잠시 후 JSON 파일 갱신 (그 사이 들어온 등록은 한 번에 반영)
+
+        Args:
+            on_done: 갱신 후 호출할 함수 (카탈로그 다시 로드 등)
+        """
+        with self._lock:
+            if on_done is not None and on_done not in self._callbacks:
+                self._callbacks.append(on_done)
+            if self._timer is not None:
+                return
+            self._timer = threading.Timer(self.materialize_delay, self.flush)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def flush(self):
+        """예약된 갱신을 기다리지 않고 바로 반영"""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            callbacks, self._callbacks = self._callbacks, []
+            try:
+                self.materialize()
+            except Exception as e:
+                print(f"⚠️ JSON 파일 갱신 실패 (등록 로그는 보존됨, 다음에 다시 반영): {e}")
+            for callback in callbacks:
+                callback()
+
+    # ============================================================
+    # SQLite
+    # ============================================================
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.log_path, timeout=30)
+
+    def _init_db(self):
+        with self._connect() as conn:
+            # WAL: 커밋마다 로그 파일 하나만 동기화, 기록 중에도 읽기 가능
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS registration (
+                    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+                    yacht_id TEXT NOT NULL,
+                    record TEXT NOT NULL,
+                    created_at REAL NOT NULL
+                )
+            """)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS view_state (
+                    view TEXT PRIMARY KEY,
+                    last_seq INTEGER NOT NULL
+                )
+            """)
+            # 처음 사용하는 로그면 기존 JSON 파일은 이미 최신 상태
+            for view in VIEWS:
+                conn.execute("INSERT OR IGNORE INTO view_state (view, last_seq) VALUES (?, 0)", (view,))
+
+
+_shared_store: Optional[YachtRegistrationStore] = None
+_shared_store_lock = threading.Lock()
+
+
+def get_shared_registration_store(data_dir: str = DEFAULT_DATA_DIR) -> YachtRegistrationStore:
+    """프로세스 공유 등록 저장소 (처음 만들 때 이전에 반영하지 못한 등록을 반영)"""
+    global _shared_store
+    if _shared_store is None:
+        with _shared_store_lock:
+            if _shared_store is None:
+                store = YachtRegistrationStore(data_dir=data_dir)
+                store.flush()
+                import atexit
+                atexit.register(store.flush)
+                _shared_store = store
+    return _shared_store
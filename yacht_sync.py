@@ -0,0 +1,283 @@
+"""
+HooAah Yacht - 요트 JSON → DB 증분 동기화 엔진
+yacht_specifications.json의 요트를 DB yacht 테이블에 반영하되 바뀐 요트만 씀
+
+동작:
+1. 요트마다 DB 컬럼 값으로 정규화한 레코드의 지문 (SHA-1) 계산
+2. 지문 테이블 (yacht_sync_state)을 한 번에 읽어 비교 → 새 요트/바뀐 요트만 골라냄
+3. 바뀐 요트를 batch_size개씩 묶어 upsert (MySQL: INSERT ... ON DUPLICATE KEY UPDATE)
+   하고 지문도 함께 갱신, 전체를 한 트랜잭션으로 커밋 (실패 시 롤백)
+
+→ 전체 동기화 비용이 요트 수가 아니라 바뀐 요트 수에 비례
+→ DB-API 연결이면 무엇이든 사용 (pymysql, 테스트용 sqlite3)
+
+사용법:
+    engine = YachtSyncEngine(connection)        # pymysql 또는 sqlite3 연결
+    engine.ensure_state_table()
+    stats = engine.sync(yachts)                 # {"inserted": 1, "updated": 2, "unchanged": 97, ...}
+
+환경 변수:
+    YACHT_SYNC_BATCH_SIZE: upsert 한 번에 보낼 요트 수 (기본: 500)
+"""
+
+import os
+import re
+import json
+import sqlite3
+import hashlib
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+
+DEFAULT_BATCH_SIZE = int(os.getenv('YACHT_SYNC_BATCH_SIZE', 500))
+
+# 레코드 정규화 규칙이 바뀌면 올려서 전체를 다시 동기화
+SYNC_VERSION = "1"
+
+YACHT_TABLE = 'yacht'
+STATE_TABLE = 'yacht_sync_state'
+
+# yacht 테이블에 쓰는 컬럼 (yacht_id가 upsert 키)
+YACHT_COLUMNS = (
+    'yacht_id', 'name', 'manufacturer', 'yacht_type',
+    'length_overall', 'beam', 'draft', 'displacement',
+    'sail_area', 'engine_power', 'manual_pdf',
+)
+
+
+# ============================================================
+# 레코드 정규화
+# ============================================================
+
+def extract_dimension_value(dimension_data) -> Optional[float]:
+    """치수 데이터에서 숫자 추출 ({"value": 14.6} 또는 "14.60m" → 14.6)"""
+    if not dimension_data:
+        return None
+
+    if isinstance(dimension_data, dict):
+        value = dimension_data.get('value')
+        if value:
+            return float(value) if isinstance(value, (int, float)) else None
+
+    if isinstance(dimension_data, str):
+        match = re.search(r'(\d+\.?\d*)', dimension_data)
+        if match:
+            return float(match.group(1))
+
+    return None
+
+
+def yacht_row(yacht: Dict) -> Optional[Dict[str, Any]]:
+    """요트 JSON을 yacht 테이블 컬럼 값으로 변환 (ID나 이름이 없으면 None)"""
+    yacht_id = yacht.get('id', '')
+    yacht_name = yacht.get('name', '')
+    if not yacht_id or not yacht_name:
+        return None
+
+    standard = (yacht.get('yachtSpecs') or {}).get('standard') or {}
+    dimensions = standard.get('dimensions') or {}
+    engine = standard.get('engine') or {}
+    sail_area_data = standard.get('sailArea') or {}
+
+    # 돛 면적 (total 또는 mainsail)
+    sail_area = None
+    if isinstance(sail_area_data, dict):
+        total = sail_area_data.get('total') or sail_area_data.get('totalSailArea')
+        mainsail = sail_area_data.get('mainsail') or sail_area_data.get('mainSailArea')
+        sail_area = extract_dimension_value(total or mainsail)
+
+    engine_power = None
+    if isinstance(engine, dict):
+        engine_power = engine.get('power') or engine.get('Power')
+
+    return {
+        'yacht_id': yacht_id,
+        'name': yacht_name,
+        'manufacturer': yacht.get('manufacturer', ''),
+        'yacht_type': yacht.get('type', ''),
+        'length_overall': extract_dimension_value(dimensions.get('LOA') or dimensions.get('loa')),
+        'beam': extract_dimension_value(dimensions.get('Beam') or dimensions.get('beam')),
+        'draft': extract_dimension_value(dimensions.get('Draft') or dimensions.get('draft')),
+        'displacement': extract_dimension_value(dimensions.get('Displacement') or dimensions.get('displacement')),
+        'sail_area': sail_area,
+        'engine_power': str(engine_power) if engine_power is not None else None,
+        'manual_pdf': yacht.get('manualPDF', ''),
+    }
+
+
+def row_fingerprint(row: Dict[str, Any]) -> str:
+    """정규화된 레코드의 지문 (컬럼 값이 같으면 같은 지문)"""
+    payload = json.dumps([SYNC_VERSION, [row[column] for column in YACHT_COLUMNS]],
+                         ensure_ascii=False, separators=(',', ':'))
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+
+
+# ============================================================
+# SQL 방언 (MySQL / SQLite)
+# ============================================================
+
+class SyncDialect:
+    """upsert 문법과 파라미터 표기 차이"""
+
+    def __init__(self, name: str, placeholder: str):
+        self.name = name
+        self.placeholder = placeholder
+
+    def upsert(self, table: str, columns: Tuple[str, ...], key: str) -> str:
+        """키가 이미 있으면 나머지 컬럼을 갱신하는 INSERT 문"""
+        values = ", ".join([self.placeholder] * len(columns))
+        updates = [column for column in columns if column != key]
+        sql = f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({values})"
+        if self.name == 'mysql':
+            # pymysql executemany가 여러 행을 한 INSERT로 묶어 전송
+            return sql + " ON DUPLICATE KEY UPDATE " + ", ".join(
+                f"{column} = VALUES({column})" for column in updates)
+        return sql + f" ON CONFLICT({key}) DO UPDATE SET " + ", ".join(
+            f"{column} = excluded.{column}" for column in updates)
+
+    def state_table_ddl(self) -> str:
+        suffix = " ENGINE=InnoDB DEFAULT CHARSET=utf8mb4" if self.name == 'mysql' else ""
+        return f"""
+            CREATE TABLE IF NOT EXISTS {STATE_TABLE} (
+                yacht_id VARCHAR(100) NOT NULL PRIMARY KEY,
+                fingerprint CHAR(40) NOT NULL,
+                synced_at DATETIME NOT NULL
+            ){suffix}
+        """
+
+
+MYSQL = SyncDialect('mysql', '%s')
+SQLITE = SyncDialect('sqlite', '?')
+
+
+def dialect_for(connection) -> SyncDialect:
+    """연결 종류로 방언 선택 (sqlite3 외에는 MySQL)"""
+    return SQLITE if isinstance(connection, sqlite3.Connection) else MYSQL
+
+
+def _row_values(row) -> Tuple:
+    # pymysql DictCursor는 dict, sqlite3는 tuple
+    return tuple(row.values()) if isinstance(row, dict) else tuple(row)
+
+
+# ============================================================
+# 동기화 엔진
+# ============================================================
+
+class YachtSyncEngine:
+    """지문 비교로 바뀐 요트만 일괄 upsert하는 동기화 엔진"""
+
+    def __init__(self, connection, dialect: Optional[SyncDialect] = None,
+                 batch_size: int = DEFAULT_BATCH_SIZE):
+        """
+        Args:
+            connection: DB-API 연결 (pymysql 또는 sqlite3)
+            dialect: SQL 방언 (None이면 연결 종류로 선택)
+            batch_size: upsert 한 번에 보낼 요트 수
+        """
+        self.connection = connection
+        self.dialect = dialect or dialect_for(connection)
+        self.batch_size = max(1, batch_size)
+
+    def ensure_state_table(self):
+        """지문 테이블이 없으면 생성"""
+        cursor = self.connection.cursor()
+        try:
+            cursor.execute(self.dialect.state_table_ddl())
+        finally:
+            cursor.close()
+        self.connection.commit()
+
+    def load_fingerprints(self) -> Dict[str, str]:
+        """저장된 지문 전체 (yacht_id → 지문)"""
+        cursor = self.connection.cursor()
+        try:
+            cursor.execute(f"SELECT yacht_id, fingerprint FROM {STATE_TABLE}")
+            return dict(_row_values(row) for row in cursor.fetchall())
+        finally:
+            cursor.close()
+
+    def plan(self, yachts: Iterable[Dict], force: bool = False) -> Dict[str, Any]:
+        """
+        바뀐 요트 계산 (DB에는 쓰지 않음)
+
+        Returns:
+            {"changes": [(row, fingerprint, is_new)], "unchanged": n, "invalid": n, "removed": [yacht_id]}
+        """
+        stored = self.load_fingerprints()
+        changes: List[Tuple[Dict, str, bool]] = []
+        seen = set()
+        unchanged = invalid = 0
+
+        for yacht in yachts:
+            row = yacht_row(yacht)
+            if row is None or row['yacht_id'] in seen:
+                # ID/이름 없음 또는 같은 ID 중복 (앞의 요트 우선)
+                invalid += 1
+                continue
+            seen.add(row['yacht_id'])
+            fingerprint = row_fingerprint(row)
+            previous = stored.get(row['yacht_id'])
+            if previous == fingerprint and not force:
+                unchanged += 1
+                continue
+            changes.append((row, fingerprint, previous is None))
+
+        return {
+            "changes": changes,
+            "unchanged": unchanged,
+            "invalid": invalid,
+            "removed": sorted(set(stored) - seen),
+        }
+
+    def sync(self, yachts: Iterable[Dict], force: bool = False, prune: bool = False,
+             dry_run: bool = False) -> Dict[str, int]:
+        """
+        바뀐 요트만 반영 (한 트랜잭션)
+
+        Args:
+            yachts: 요트 JSON 목록
+            force: 지문이 같아도 모두 다시 씀 (DB를 직접 수정한 경우)
+            prune: JSON에서 사라진 요트를 yacht 테이블에서도 삭제
+            dry_run: 계산만 하고 쓰지 않음
+
+        Returns:
+            {"total", "inserted", "updated", "unchanged", "invalid", "removed"}
+        """
+        plan = self.plan(yachts, force=force)
+        changes = plan["changes"]
+        stats = {
+            "total": len(changes) + plan["unchanged"] + plan["invalid"],
+            "inserted": sum(1 for _, _, is_new in changes if is_new),
+            "updated": sum(1 for _, _, is_new in changes if not is_new),
+            "unchanged": plan["unchanged"],
+            "invalid": plan["invalid"],
+            "removed": len(plan["removed"]),
+        }
+        if dry_run or (not changes and not (prune and plan["removed"])):
+            return stats
+
+        synced_at = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        yacht_sql = self.dialect.upsert(YACHT_TABLE, YACHT_COLUMNS, 'yacht_id')
+        state_sql = self.dialect.upsert(STATE_TABLE, ('yacht_id', 'fingerprint', 'synced_at'), 'yacht_id')
+
+        cursor = self.connection.cursor()
+        try:
+            for start in range(0, len(changes), self.batch_size):
+                batch = changes[start:start + self.batch_size]
+                cursor.executemany(yacht_sql, [tuple(row[column] for column in YACHT_COLUMNS)
+                                               for row, _, _ in batch])
+                cursor.executemany(state_sql, [(row['yacht_id'], fingerprint, synced_at)
+                                               for row, fingerprint, _ in batch])
+            if prune and plan["removed"]:
+                placeholder = self.dialect.placeholder
+                removed = [(yacht_id,) for yacht_id in plan["removed"]]
+                cursor.executemany(f"DELETE FROM {YACHT_TABLE} WHERE yacht_id = {placeholder}", removed)
+                cursor.executemany(f"DELETE FROM {STATE_TABLE} WHERE yacht_id = {placeholder}", removed)
+            self.connection.commit()
+        except Exception:
+            self.connection.rollback()
+            raise
+        finally:
+            cursor.close()
+        return stats